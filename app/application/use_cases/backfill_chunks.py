@@ -0,0 +1,86 @@
+"""
+本文のチャンクのバックフィルユースケース
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Executor
+from uuid import UUID
+
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import split_into_chunks
+
+
+class BackfillChunksUseCase:
+    """
+    本文のチャンクのバックフィルユースケース
+
+    チャンクが未作成のLLM応答をID順にバッチで読み込み、
+    バッチ単位で並列に分割して保存します。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        executor: Executor | None = None,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            executor: 本文を分割するエグゼキューター（省略時は逐次処理）
+            workers: エグゼキューターのワーカー数（タスクの分割単位の決定に使用）
+        """
+        self.llm_response_repository = llm_response_repository
+        self.executor = executor
+        self.workers = max(1, workers)
+
+    def execute(
+        self,
+        batch_size: int = 500,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """
+        チャンクが未作成のLLM応答すべてにチャンクを保存します。
+
+        Args:
+            batch_size: 1バッチあたりの件数
+            on_progress: バッチ完了ごとに (処理件数, 保存件数) で呼ばれるコールバック
+
+        Returns:
+            チャンクを保存したLLM応答の件数
+        """
+        processed = 0
+        updated = 0
+        after_id: UUID | None = None
+        while True:
+            batch = self.llm_response_repository.list_missing_chunks(
+                limit=batch_size, after_id=after_id
+            )
+            if not batch:
+                break
+
+            contents = [content_md for _, content_md in batch]
+            if self.executor is None:
+                chunks = [split_into_chunks(content_md) for content_md in contents]
+            else:
+                # ワーカーあたり数回に分けて送り、プロセス間通信の回数を抑える
+                chunksize = max(1, len(contents) // (self.workers * 4))
+                chunks = list(
+                    self.executor.map(split_into_chunks, contents, chunksize=chunksize)
+                )
+            updated += self.llm_response_repository.add_chunks_if_missing(
+                [
+                    (response_id, response_chunks)
+                    for (response_id, _), response_chunks in zip(
+                        batch, chunks, strict=True
+                    )
+                ]
+            )
+
+            processed += len(batch)
+            after_id = batch[-1][0]
+            if on_progress is not None:
+                on_progress(processed, updated)
+        return updated
@@ -0,0 +1,88 @@
+"""
+本文の統計情報バックフィルユースケース
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Executor
+from uuid import UUID
+
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_stats import compute_content_stats
+
+
+class BackfillContentStatsUseCase:
+    """
+    本文の統計情報バックフィルユースケース
+
+    統計情報が未算出のLLM応答をID順にバッチで読み込み、
+    バッチ単位で並列に算出して設定します。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        executor: Executor | None = None,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            executor: 統計情報を算出するエグゼキューター（省略時は逐次処理）
+            workers: エグゼキューターのワーカー数（タスクの分割単位の決定に使用）
+        """
+        self.llm_response_repository = llm_response_repository
+        self.executor = executor
+        self.workers = max(1, workers)
+
+    def execute(
+        self,
+        batch_size: int = 500,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """
+        統計情報が未算出のLLM応答すべてに統計情報を設定します。
+
+        Args:
+            batch_size: 1バッチあたりの件数
+            on_progress: バッチ完了ごとに (処理件数, 設定件数) で呼ばれるコールバック
+
+        Returns:
+            統計情報を設定した件数
+        """
+        processed = 0
+        updated = 0
+        after_id: UUID | None = None
+        while True:
+            batch = self.llm_response_repository.list_missing_stats(
+                limit=batch_size, after_id=after_id
+            )
+            if not batch:
+                break
+
+            contents = [content_md for _, content_md in batch]
+            if self.executor is None:
+                stats = [compute_content_stats(content_md) for content_md in contents]
+            else:
+                # ワーカーあたり数回に分けて送り、プロセス間通信の回数を抑える
+                chunksize = max(1, len(contents) // (self.workers * 4))
+                stats = list(
+                    self.executor.map(
+                        compute_content_stats, contents, chunksize=chunksize
+                    )
+                )
+            updated += self.llm_response_repository.set_stats_if_missing(
+                [
+                    (response_id, response_stats)
+                    for (response_id, _), response_stats in zip(
+                        batch, stats, strict=True
+                    )
+                ]
+            )
+
+            processed += len(batch)
+            after_id = batch[-1][0]
+            if on_progress is not None:
+                on_progress(processed, updated)
+        return updated
@@ -0,0 +1,126 @@
+"""
+LLM応答一括取得ユースケース
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from app.domain.models.llm_response import LLMResponse
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+
+
+@dataclass(slots=True)
+class BatchGetResult:
+    """
+    一括取得の結果
+
+    Attributes:
+        items: 取得できたLLM応答（リクエストのID順）。フィールド指定時は辞書
+        missing: 存在しなかったID（リクエストのID順）
+    """
+
+    items: list[LLMResponse] | list[dict[str, Any]] = field(default_factory=list)
+    missing: list[UUID] = field(default_factory=list)
+
+
+class BatchGetResponsesUseCase:
+    """
+    LLM応答一括取得ユースケース
+
+    複数のIDに対応するLLM応答を1回の問い合わせでまとめて取得します。
+    """
+
+    def __init__(self, llm_response_repository: LLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    def execute(
+        self, response_ids: Sequence[UUID], fields: Sequence[str] | None = None
+    ) -> BatchGetResult:
+        """
+        LLM応答を一括取得します。
+
+        重複したIDは最初の1件のみを対象とし、結果はリクエストのID順に並べます。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+            fields: 取得するフィールド名（Noneの場合はすべてのフィールド）
+
+        Returns:
+            取得できたLLM応答と、存在しなかったIDのリスト
+        """
+        ordered_ids = list(dict.fromkeys(response_ids))
+        if fields:
+            found = self.llm_response_repository.get_many_projection(
+                ordered_ids, fields
+            )
+        else:
+            found = self.llm_response_repository.get_many(ordered_ids)
+        return _collect(ordered_ids, found)
+
+
+class AsyncBatchGetResponsesUseCase:
+    """
+    LLM応答一括取得ユースケース（非同期版）
+
+    BatchGetResponsesUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(
+        self, response_ids: Sequence[UUID], fields: Sequence[str] | None = None
+    ) -> BatchGetResult:
+        """
+        LLM応答を一括取得します。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+            fields: 取得するフィールド名（Noneの場合はすべてのフィールド）
+
+        Returns:
+            取得できたLLM応答と、存在しなかったIDのリスト
+        """
+        ordered_ids = list(dict.fromkeys(response_ids))
+        if fields:
+            found = await self.llm_response_repository.get_many_projection(
+                ordered_ids, fields
+            )
+        else:
+            found = await self.llm_response_repository.get_many(ordered_ids)
+        return _collect(ordered_ids, found)
+
+
+def _collect(ordered_ids: list[UUID], found: dict[UUID, Any]) -> BatchGetResult:
+    """
+    取得結果をリクエストのID順に並べ、存在しなかったIDを振り分けます。
+
+    Args:
+        ordered_ids: 重複を除いたリクエストのIDリスト
+        found: IDをキーとする取得結果
+
+    Returns:
+        一括取得の結果
+    """
+    result = BatchGetResult()
+    for response_id in ordered_ids:
+        if response_id in found:
+            result.items.append(found[response_id])
+        else:
+            result.missing.append(response_id)
+    return result
@@ -5,6 +5,9 @@ from __future__ import annotations
 """
 
 from app.domain.models.category import Category
+from app.domain.repositories.async_category_repository import (
+    AsyncCategoryRepository,
+)
 from app.domain.repositories.category_repository import CategoryRepository
 
 
@@ -40,3 +43,32 @@ class CreateCategoryUseCase:
         created_category = self.category_repository.create(category)
 
         return created_category
+
+
+class AsyncCreateCategoryUseCase:
+    """
+    カテゴリ作成ユースケース（非同期版）
+
+    CreateCategoryUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepository):
+        """
+        Args:
+            category_repository: 非同期カテゴリリポジトリ
+        """
+        self.category_repository = category_repository
+
+    async def execute(self, name: str, description: str | None = None) -> Category:
+        """
+        カテゴリを作成します。
+
+        Args:
+            name: カテゴリ名
+            description: カテゴリの説明
+
+        Returns:
+            作成されたカテゴリエンティティ
+        """
+        category = Category(name=name, description=description)
+        return await self.category_repository.create(category)
@@ -7,7 +7,13 @@ from __future__ import annotations
 from uuid import UUID
 
 from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
 from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import split_into_chunks
+from app.domain.services.content_hash import compute_content_hash
+from app.domain.services.content_stats import compute_content_stats
 
 
 class CreateResponseUseCase:
@@ -61,9 +67,69 @@ class CreateResponseUseCase:
             category_id=category_id,
             tags=tags if tags else [],
             summary=summary,
+            stats=compute_content_stats(content_md),
+            content_hash=compute_content_hash(content_md),
+            chunks=split_into_chunks(content_md),
         )
 
         # リポジトリに永続化
         created_response = self.llm_response_repository.create(llm_response)
 
         return created_response
+
+
+class AsyncCreateResponseUseCase:
+    """
+    LLM応答作成ユースケース（非同期版）
+
+    CreateResponseUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(
+        self,
+        title: str,
+        prompt: str,
+        content_md: str,
+        model: str,
+        provider: LLMProvider,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        summary: str | None = None,
+    ) -> LLMResponse:
+        """
+        LLM応答を作成します。
+
+        Args:
+            title: 応答のタイトル
+            prompt: LLMへの入力プロンプト
+            content_md: 応答内容（Markdown形式）
+            model: 使用したモデル名
+            provider: LLMプロバイダー
+            category_id: 所属カテゴリのID
+            tags: タグのリスト
+            summary: 応答の要約
+
+        Returns:
+            作成されたLLM応答エンティティ
+        """
+        llm_response = LLMResponse(
+            title=title,
+            prompt=prompt,
+            content_md=content_md,
+            model=model,
+            provider=provider,
+            category_id=category_id,
+            tags=tags if tags else [],
+            summary=summary,
+            stats=compute_content_stats(content_md),
+            content_hash=compute_content_hash(content_md),
+            chunks=split_into_chunks(content_md),
+        )
+        return await self.llm_response_repository.create(llm_response)
@@ -0,0 +1,236 @@
+"""
+会話エクスポートの取り込みユースケース
+
+LLMプロバイダーの会話エクスポートを会話ごとに読み込み、アシスタントの発話を
+LLM応答として一定件数ずつ1つのトランザクションで作成します。
+本文のハッシュが既存のLLM応答（または同じ取り込みの先の発話）と一致する
+発話は作成しません。
+
+バッチを保存するたびに取り込み済みの位置を記録するため、中断された取り込みは
+その位置から再開できます。LLM応答の作成と位置の記録は別のコミットですが、
+その間で中断された場合も、再開時に同じ発話は本文のハッシュで重複として
+除かれるため、二重に作成されることはありません。
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.models.conversation_import import (
+    ConversationImport,
+    ExportedTurn,
+    ExportFormat,
+    ImportStatus,
+)
+from app.domain.models.llm_response import LLMResponse
+from app.domain.ports.conversation_export import ConversationExportReader
+from app.domain.repositories.conversation_import_repository import (
+    ConversationImportRepository,
+)
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import split_into_chunks
+from app.domain.services.content_hash import compute_content_hash
+from app.domain.services.content_stats import compute_content_stats
+
+
+class ImportConversationsUseCase:
+    """
+    会話エクスポートの取り込みユースケース
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        import_repository: ConversationImportRepository,
+        reader: ConversationExportReader,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            import_repository: 取り込みリポジトリ
+            reader: 会話エクスポートのリーダー
+        """
+        self.llm_response_repository = llm_response_repository
+        self.import_repository = import_repository
+        self.reader = reader
+
+    def start(
+        self,
+        source_path: str,
+        source_bytes: int,
+        export_format: ExportFormat | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        queued: bool = False,
+        delete_source: bool = False,
+        resume: bool = True,
+    ) -> ConversationImport:
+        """
+        取り込みを登録します。
+
+        Args:
+            source_path: エクスポートファイルのパス
+            source_bytes: エクスポートファイルのバイト数
+            export_format: エクスポートの形式（None の場合は実行時に判別する）
+            category_id: 作成するLLM応答の所属カテゴリのID
+            tags: 作成するLLM応答に付けるタグのリスト
+            queued: ジョブとして実行する（実行待ちで登録する）かどうか
+            delete_source: 完了後にエクスポートファイルを削除するかどうか
+            resume: 同じファイルの完了していない取り込みがあれば、それを返すかどうか
+
+        Returns:
+            登録した（または再開する）取り込みエンティティ
+        """
+        if resume:
+            existing = self.import_repository.find_resumable(source_path, source_bytes)
+            if existing is not None:
+                return existing
+        return self.import_repository.create(
+            ConversationImport(
+                source_path=source_path,
+                source_bytes=source_bytes,
+                format=export_format,
+                category_id=category_id,
+                tags=tags if tags else [],
+                delete_source=delete_source,
+                status=ImportStatus.QUEUED if queued else ImportStatus.RUNNING,
+            )
+        )
+
+    def execute(
+        self,
+        conversation_import: ConversationImport,
+        batch_size: int = 500,
+        max_seconds: float | None = None,
+        on_progress: Callable[[ConversationImport], None] | None = None,
+    ) -> ConversationImport:
+        """
+        取り込みを、記録された位置から実行します。
+
+        Args:
+            conversation_import: 実行する取り込みエンティティ
+            batch_size: 1トランザクションで作成するLLM応答の目安の件数
+                （会話の途中では区切らないため、超える場合がある）
+            max_seconds: 実行する最大秒数。過ぎた場合はバッチの保存後に
+                中断する（状態は実行中のまま）
+            on_progress: バッチの保存ごとに取り込みエンティティで呼ばれるコールバック
+
+        Returns:
+            更新された取り込みエンティティ
+
+        Raises:
+            ConversationExportError: エクスポートファイルの形式が正しくない場合
+                （状態は失敗になり、再実行すると記録された位置から再開する）
+        """
+        run = conversation_import
+        started = time.monotonic()
+        try:
+            if run.format is None:
+                run.format = self.reader.detect_format(run.source_path)
+            run.status = ImportStatus.RUNNING
+            run.last_error = None
+            self.import_repository.update(run)
+
+            # 会話が1つもないエクスポートは形式が判別できず、取り込むものもない
+            if run.format is not None:
+                pending: list[ExportedTurn] = []
+                conversations = 0
+                for turns, offset in self.reader.read(
+                    run.source_path, run.format, run.byte_offset
+                ):
+                    pending.extend(turns)
+                    conversations += 1
+                    if len(pending) < batch_size:
+                        continue
+                    self._save_batch(run, pending, conversations, offset)
+                    pending = []
+                    conversations = 0
+                    if on_progress is not None:
+                        on_progress(run)
+                    if (
+                        max_seconds is not None
+                        and time.monotonic() - started >= max_seconds
+                    ):
+                        return run
+                if conversations:
+                    self._save_batch(run, pending, conversations, offset)
+
+            run.status = ImportStatus.COMPLETED
+            run.completed_at = datetime.now()
+            self.import_repository.update(run)
+            if on_progress is not None:
+                on_progress(run)
+            return run
+        except Exception as e:
+            run.status = ImportStatus.FAILED
+            run.last_error = f"{type(e).__name__}: {e}"
+            self.import_repository.update(run)
+            raise
+
+    def _save_batch(
+        self,
+        run: ConversationImport,
+        turns: list[ExportedTurn],
+        conversations: int,
+        offset: int,
+    ) -> None:
+        """
+        バッチの発話のうち重複していないものをLLM応答として作成し、位置を記録します。
+
+        Args:
+            run: 実行中の取り込みエンティティ
+            turns: バッチに含まれる発話
+            conversations: バッチに含まれる会話の数
+            offset: バッチの最後の会話の終わりの位置
+        """
+        hashes = [compute_content_hash(turn.content_md) for turn in turns]
+        seen = self.llm_response_repository.find_content_hashes(hashes)
+        responses: list[LLMResponse] = []
+        for turn, content_hash in zip(turns, hashes, strict=True):
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
+            responses.append(self._to_response(run, turn, content_hash))
+        self.llm_response_repository.create_many(responses)
+
+        run.byte_offset = offset
+        run.conversation_count += conversations
+        run.imported_count += len(responses)
+        run.duplicate_count += len(turns) - len(responses)
+        self.import_repository.update(run)
+
+    @staticmethod
+    def _to_response(
+        run: ConversationImport, turn: ExportedTurn, content_hash: str
+    ) -> LLMResponse:
+        """
+        発話からLLM応答エンティティを作成します。
+
+        作成日時にはエクスポートに記録された発話の日時を使用します。
+
+        Args:
+            run: 実行中の取り込みエンティティ
+            turn: 発話
+            content_hash: 発話の本文のハッシュ
+
+        Returns:
+            作成前のLLM応答エンティティ
+        """
+        created_at = turn.created_at or datetime.now()
+        return LLMResponse(
+            title=turn.title,
+            prompt=turn.prompt,
+            content_md=turn.content_md,
+            model=turn.model,
+            provider=turn.provider,
+            category_id=run.category_id,
+            tags=list(run.tags),
+            stats=compute_content_stats(turn.content_md),
+            content_hash=content_hash,
+            chunks=split_into_chunks(turn.content_md),
+            created_at=created_at,
+            updated_at=created_at,
+        )
@@ -4,7 +4,10 @@
 from __future__ import annotations
 """
 
-from app.domain.models.category import Category
+from app.domain.models.category import CategoryWithStats
+from app.domain.repositories.async_category_repository import (
+    AsyncCategoryRepository,
+)
 from app.domain.repositories.category_repository import CategoryRepository
 
 
@@ -12,7 +15,8 @@ class ListCategoriesUseCase:
     """
     カテゴリ一覧取得ユースケース
 
-    カテゴリの一覧をページネーション付きで取得します。
+    カテゴリの一覧を、所属するLLM応答の集計値付き・ページネーション付きで
+    取得します。
     """
 
     def __init__(self, category_repository: CategoryRepository):
@@ -22,15 +26,53 @@ class ListCategoriesUseCase:
         """
         self.category_repository = category_repository
 
-    def execute(self, skip: int = 0, limit: int = 100) -> list[Category]:
+    def execute(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
         """
         カテゴリ一覧を取得します。
 
         Args:
             skip: スキップする件数
             limit: 取得する最大件数
+            top_tags_limit: カテゴリごとに返す上位タグの最大数
 
         Returns:
-            カテゴリエンティティのリスト
+            集計値付きカテゴリエンティティのリスト
         """
-        return self.category_repository.list(skip=skip, limit=limit)
+        return self.category_repository.list_with_stats(
+            skip=skip, limit=limit, top_tags_limit=top_tags_limit
+        )
+
+
+class AsyncListCategoriesUseCase:
+    """
+    カテゴリ一覧取得ユースケース（非同期版）
+
+    ListCategoriesUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepository):
+        """
+        Args:
+            category_repository: 非同期カテゴリリポジトリ
+        """
+        self.category_repository = category_repository
+
+    async def execute(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
+        """
+        カテゴリ一覧を取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+            top_tags_limit: カテゴリごとに返す上位タグの最大数
+
+        Returns:
+            集計値付きカテゴリエンティティのリスト
+        """
+        return await self.category_repository.list_with_stats(
+            skip=skip, limit=limit, top_tags_limit=top_tags_limit
+        )
@@ -0,0 +1,119 @@
+"""
+変更通知一覧ユースケース
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.models.change import ChangeOperation, EntityType
+from app.domain.repositories.change_repository import ChangeRepository
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+
+
+@dataclass(slots=True)
+class ChangeNotification:
+    """
+    クライアントへ通知する変更
+
+    Attributes:
+        seq: 変更シーケンス番号（通知のIDとして使用する）
+        entity_type: エンティティの種類
+        entity_id: エンティティのID
+        operation: 変更操作
+        changed_at: 変更日時
+        category_id: LLM応答の所属カテゴリのID（フィルタリング用）
+        tags: LLM応答のタグ（フィルタリング用）
+    """
+
+    seq: int
+    entity_type: EntityType
+    entity_id: UUID
+    operation: ChangeOperation
+    changed_at: datetime
+    category_id: UUID | None = None
+    tags: list[str] = field(default_factory=list)
+
+    def matches(self, category_id: UUID | None, tags: list[str]) -> bool:
+        """
+        通知がフィルタ条件に一致するかを判定します。
+
+        条件は検索APIと同じく、カテゴリの一致とすべてのタグを含むことです。
+        削除の通知はエンティティの属性が残っていないため、常に一致とみなします。
+        カテゴリの通知は、タグの条件がなくカテゴリの条件が自身の場合に一致します。
+
+        Args:
+            category_id: カテゴリIDの条件（Noneの場合は条件なし）
+            tags: タグの条件（空の場合は条件なし）
+
+        Returns:
+            条件に一致する場合True
+        """
+        if self.operation is ChangeOperation.DELETED:
+            return True
+        if self.entity_type is EntityType.CATEGORY:
+            return not tags and category_id in (None, self.entity_id)
+        if category_id is not None and self.category_id != category_id:
+            return False
+        return all(tag in self.tags for tag in tags)
+
+
+class ListChangeNotificationsUseCase:
+    """
+    変更通知一覧ユースケース
+
+    変更記録に、フィルタリングに必要なLLM応答の属性を付けて返します。
+    """
+
+    def __init__(
+        self,
+        change_repository: ChangeRepository,
+        llm_response_repository: LLMResponseRepository,
+    ):
+        """
+        Args:
+            change_repository: 変更記録リポジトリ
+            llm_response_repository: LLM応答リポジトリ
+        """
+        self.change_repository = change_repository
+        self.llm_response_repository = llm_response_repository
+
+    def execute(self, since: int, limit: int = 500) -> list[ChangeNotification]:
+        """
+        指定したシーケンス番号より後の変更通知を、シーケンス番号順に取得します。
+
+        Args:
+            since: このシーケンス番号より後の変更を取得する
+            limit: 取得する最大件数
+
+        Returns:
+            変更通知のリスト
+        """
+        changes = self.change_repository.list_since(since, limit)
+        attributes = self.llm_response_repository.get_many_projection(
+            [
+                change.entity_id
+                for change in changes
+                if change.entity_type is EntityType.RESPONSE and not change.deleted
+            ],
+            ["category", "tags"],
+        )
+
+        notifications = []
+        for change in changes:
+            notification = ChangeNotification(
+                seq=change.seq,
+                entity_type=change.entity_type,
+                entity_id=change.entity_id,
+                operation=change.operation,
+                changed_at=change.changed_at,
+            )
+            projection = attributes.get(change.entity_id)
+            if projection is not None:
+                category = projection["category"]
+                notification.category_id = category.id if category else None
+                notification.tags = projection["tags"]
+            notifications.append(notification)
+        return notifications
@@ -4,7 +4,13 @@ LLM応答一覧取得ユースケース
 from __future__ import annotations
 """
 
+from collections.abc import Sequence
+from typing import Any
+
 from app.domain.models.llm_response import LLMResponse
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
 from app.domain.repositories.llm_response_repository import LLMResponseRepository
 
 
@@ -34,3 +40,67 @@ class ListResponsesUseCase:
             LLM応答エンティティのリスト
         """
         return self.llm_response_repository.list(skip=skip, limit=limit)
+
+    def execute_with_fields(
+        self, fields: Sequence[str], skip: int = 0, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        指定フィールドのみのLLM応答一覧を取得します。
+
+        Args:
+            fields: 取得するフィールド名
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            フィールド名をキーとする辞書のリスト
+        """
+        return self.llm_response_repository.search_projection(
+            fields=fields, skip=skip, limit=limit
+        )
+
+
+class AsyncListResponsesUseCase:
+    """
+    LLM応答一覧取得ユースケース（非同期版）
+
+    ListResponsesUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(self, skip: int = 0, limit: int = 100) -> list[LLMResponse]:
+        """
+        LLM応答一覧を取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            LLM応答エンティティのリスト
+        """
+        return await self.llm_response_repository.list(skip=skip, limit=limit)
+
+    async def execute_with_fields(
+        self, fields: Sequence[str], skip: int = 0, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        指定フィールドのみのLLM応答一覧を取得します。
+
+        Args:
+            fields: 取得するフィールド名
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            フィールド名をキーとする辞書のリスト
+        """
+        return await self.llm_response_repository.search_projection(
+            fields=fields, skip=skip, limit=limit
+        )
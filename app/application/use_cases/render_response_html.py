@@ -0,0 +1,94 @@
+"""
+LLM応答HTML変換ユースケース
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+from app.domain.ports.markdown_renderer import MarkdownRenderer
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+
+
+class RenderResponseHtmlUseCase:
+    """
+    LLM応答HTML変換ユースケース
+
+    LLM応答の Markdown をサーバー側で HTML に変換します。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        markdown_renderer: MarkdownRenderer,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            markdown_renderer: Markdownレンダラー
+        """
+        self.llm_response_repository = llm_response_repository
+        self.markdown_renderer = markdown_renderer
+
+    def execute(self, response_id: UUID) -> str | None:
+        """
+        LLM応答を HTML に変換します。
+
+        Args:
+            response_id: 変換するLLM応答のID
+
+        Returns:
+            HTML 文字列。LLM応答が存在しない場合はNone
+        """
+        # 変換に必要な本文のみを読み込む
+        projection = self.llm_response_repository.get_projection(
+            response_id, ["content_md"]
+        )
+        if projection is None:
+            return None
+        return self.markdown_renderer.render(projection["content_md"])
+
+
+class AsyncRenderResponseHtmlUseCase:
+    """
+    LLM応答HTML変換ユースケース（非同期版）
+
+    本文の読み込みは非同期リポジトリで行い、CPUを使う変換は
+    イベントループを止めないようにワーカースレッドで行います。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: AsyncLLMResponseRepository,
+        markdown_renderer: MarkdownRenderer,
+    ):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+            markdown_renderer: Markdownレンダラー
+        """
+        self.llm_response_repository = llm_response_repository
+        self.markdown_renderer = markdown_renderer
+
+    async def execute(self, response_id: UUID) -> str | None:
+        """
+        LLM応答を HTML に変換します。
+
+        Args:
+            response_id: 変換するLLM応答のID
+
+        Returns:
+            HTML 文字列。LLM応答が存在しない場合はNone
+        """
+        projection = await self.llm_response_repository.get_projection(
+            response_id, ["content_md"]
+        )
+        if projection is None:
+            return None
+        return await asyncio.to_thread(
+            self.markdown_renderer.render, projection["content_md"]
+        )
@@ -0,0 +1,223 @@
+"""
+LLM応答セクション取得・検索ユースケース
+
+本文を見出し・コードブロックの境界で分割したチャンクを「セクション」として
+一覧・取得・検索します。本文全体を読み込まずに、必要な部分のみを返します。
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from uuid import UUID
+
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import make_snippet
+
+
+def _with_snippets(hits: list[ChunkSearchHit], query: str) -> list[ChunkSearchHit]:
+    """
+    検索結果に、検索語の前後を切り出したスニペットを設定します。
+
+    Args:
+        hits: チャンク単位の検索結果
+        query: 検索クエリ
+
+    Returns:
+        スニペットを設定した検索結果
+    """
+    return [
+        replace(hit, snippet=make_snippet(hit.chunk.content or "", query))
+        for hit in hits
+    ]
+
+
+class ListResponseSectionsUseCase:
+    """
+    LLM応答セクション一覧ユースケース
+
+    セクションの見出しと本文内の位置を、セクションの本文を含めずに取得します。
+    """
+
+    def __init__(self, llm_response_repository: LLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    def execute(self, response_id: UUID) -> list[ContentChunk] | None:
+        """
+        LLM応答のセクション一覧を取得します。
+
+        Args:
+            response_id: LLM応答のID
+
+        Returns:
+            本文を含まないセクションのリスト。LLM応答が存在しない場合はNone
+        """
+        return self.llm_response_repository.list_chunks(response_id)
+
+
+class GetResponseSectionUseCase:
+    """
+    LLM応答セクション取得ユースケース
+
+    指定した番号のセクションのみを取得します。
+    """
+
+    def __init__(self, llm_response_repository: LLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    def execute(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """
+        LLM応答のセクションを取得します。
+
+        Args:
+            response_id: LLM応答のID
+            position: セクションの番号（0 始まり）
+
+        Returns:
+            本文を含むセクション。存在しない場合はNone
+        """
+        return self.llm_response_repository.get_chunk(response_id, position)
+
+
+class SearchResponseSectionsUseCase:
+    """
+    LLM応答セクション検索ユースケース
+
+    検索語を含むセクションを、スニペット付きで返します。
+    """
+
+    def __init__(self, llm_response_repository: LLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    def execute(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """
+        セクション単位でLLM応答を検索します。
+
+        Args:
+            query: 検索クエリ（セクションの本文で検索）
+            category_id: カテゴリIDでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            スニペット付きのセクション単位の検索結果のリスト
+        """
+        hits = self.llm_response_repository.search_chunks(
+            query=query, category_id=category_id, skip=skip, limit=limit
+        )
+        return _with_snippets(hits, query)
+
+
+class AsyncListResponseSectionsUseCase:
+    """
+    LLM応答セクション一覧ユースケース（非同期版）
+
+    ListResponseSectionsUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(self, response_id: UUID) -> list[ContentChunk] | None:
+        """
+        LLM応答のセクション一覧を取得します。
+
+        Args:
+            response_id: LLM応答のID
+
+        Returns:
+            本文を含まないセクションのリスト。LLM応答が存在しない場合はNone
+        """
+        return await self.llm_response_repository.list_chunks(response_id)
+
+
+class AsyncGetResponseSectionUseCase:
+    """
+    LLM応答セクション取得ユースケース（非同期版）
+
+    GetResponseSectionUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """
+        LLM応答のセクションを取得します。
+
+        Args:
+            response_id: LLM応答のID
+            position: セクションの番号（0 始まり）
+
+        Returns:
+            本文を含むセクション。存在しない場合はNone
+        """
+        return await self.llm_response_repository.get_chunk(response_id, position)
+
+
+class AsyncSearchResponseSectionsUseCase:
+    """
+    LLM応答セクション検索ユースケース（非同期版）
+
+    SearchResponseSectionsUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """
+        セクション単位でLLM応答を検索します。
+
+        Args:
+            query: 検索クエリ（セクションの本文で検索）
+            category_id: カテゴリIDでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            スニペット付きのセクション単位の検索結果のリスト
+        """
+        hits = await self.llm_response_repository.search_chunks(
+            query=query, category_id=category_id, skip=skip, limit=limit
+        )
+        return _with_snippets(hits, query)
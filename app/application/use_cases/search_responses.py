@@ -4,9 +4,19 @@ LLM応答検索ユースケース
 from __future__ import annotations
 """
 
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
+from app.domain.models.content_stats import (
+    ContentStatsFilter,
+    ResponseSortKey,
+    SortOrder,
+)
 from app.domain.models.llm_response import LLMResponse
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
 from app.domain.repositories.llm_response_repository import LLMResponseRepository
 
 
@@ -31,6 +41,9 @@ class SearchResponsesUseCase:
         tags: list[str] | None = None,
         skip: int = 0,
         limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
     ) -> list[LLMResponse]:
         """
         LLM応答を検索します。
@@ -41,6 +54,9 @@ class SearchResponsesUseCase:
             tags: タグでフィルタ
             skip: スキップする件数
             limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
 
         Returns:
             検索条件に合致するLLM応答エンティティのリスト
@@ -51,4 +67,142 @@ class SearchResponsesUseCase:
             tags=tags,
             skip=skip,
             limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
+        )
+
+    def execute_with_fields(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """
+        LLM応答を検索し、指定フィールドのみを取得します。
+
+        Args:
+            fields: 取得するフィールド名
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            検索条件に合致するLLM応答の、フィールド名をキーとする辞書のリスト
+        """
+        return self.llm_response_repository.search_projection(
+            fields=fields,
+            query=query,
+            category_id=category_id,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
+        )
+
+
+class AsyncSearchResponsesUseCase:
+    """
+    LLM応答検索ユースケース（非同期版）
+
+    SearchResponsesUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(
+        self,
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[LLMResponse]:
+        """
+        LLM応答を検索します。
+
+        Args:
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            検索条件に合致するLLM応答エンティティのリスト
+        """
+        return await self.llm_response_repository.search(
+            query=query,
+            category_id=category_id,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
+        )
+
+    async def execute_with_fields(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """
+        LLM応答を検索し、指定フィールドのみを取得します。
+
+        Args:
+            fields: 取得するフィールド名
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            検索条件に合致するLLM応答の、フィールド名をキーとする辞書のリスト
+        """
+        return await self.llm_response_repository.search_projection(
+            fields=fields,
+            query=query,
+            category_id=category_id,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
         )
@@ -0,0 +1,152 @@
+"""
+LLM応答要約ユースケース
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from uuid import UUID
+
+from app.domain.ports.summarizer import Summarizer
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+
+
+class SummarizeResponseUseCase:
+    """
+    LLM応答要約ユースケース
+
+    要約が未設定のLLM応答について、本文から要約を生成して設定します。
+    利用者が設定した要約は上書きしません。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        summarizer: Summarizer,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            summarizer: サマライザー
+        """
+        self.llm_response_repository = llm_response_repository
+        self.summarizer = summarizer
+
+    def execute(self, response_id: UUID) -> bool:
+        """
+        LLM応答の要約を生成して設定します。
+
+        Args:
+            response_id: 対象のLLM応答のID
+
+        Returns:
+            要約を設定した場合True、対象が存在しないか要約が設定済みの場合False
+        """
+        projection = self.llm_response_repository.get_projection(
+            response_id, ["content_md", "summary", "content_hash"]
+        )
+        if projection is None or projection["summary"]:
+            return False
+
+        summary = self.summarizer.summarize(projection["content_md"])
+        if not summary:
+            return False
+        # 要約の生成中に本文が更新された場合は、更新で登録されたジョブに任せる
+        return self.llm_response_repository.set_summary_if_empty(
+            response_id, summary, content_hash=projection["content_hash"]
+        )
+
+    def execute_many(self, response_ids: Sequence[UUID]) -> int:
+        """
+        複数のLLM応答の要約を、まとめて並列に生成して設定します。
+
+        Args:
+            response_ids: 対象のLLM応答のIDリスト
+
+        Returns:
+            要約を設定した件数
+        """
+        projections = self.llm_response_repository.get_many_projection(
+            response_ids, ["content_md", "summary", "content_hash"]
+        )
+        pending = [
+            projection
+            for projection in projections.values()
+            if not projection["summary"]
+        ]
+        if not pending:
+            return 0
+
+        summaries = self.summarizer.summarize_many(
+            [projection["content_md"] for projection in pending]
+        )
+        updated = 0
+        for projection, summary in zip(pending, summaries, strict=True):
+            if summary and self.llm_response_repository.set_summary_if_empty(
+                projection["id"], summary, content_hash=projection["content_hash"]
+            ):
+                updated += 1
+        return updated
+
+
+class BackfillSummariesUseCase:
+    """
+    要約バックフィルユースケース
+
+    要約が未設定のLLM応答をID順にバッチで読み込み、
+    バッチ単位で並列に要約を生成して設定します。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: LLMResponseRepository,
+        summarizer: Summarizer,
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            summarizer: サマライザー
+        """
+        self.llm_response_repository = llm_response_repository
+        self.summarizer = summarizer
+
+    def execute(
+        self,
+        batch_size: int = 200,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """
+        要約が未設定のLLM応答すべてに要約を設定します。
+
+        Args:
+            batch_size: 1バッチあたりの件数
+            on_progress: バッチ完了ごとに (処理件数, 設定件数) で呼ばれるコールバック
+
+        Returns:
+            要約を設定した件数
+        """
+        processed = 0
+        updated = 0
+        after_id: UUID | None = None
+        while True:
+            batch = self.llm_response_repository.list_missing_summary(
+                limit=batch_size, after_id=after_id
+            )
+            if not batch:
+                break
+
+            summaries = self.summarizer.summarize_many(
+                [content_md for _, content_md in batch]
+            )
+            for (response_id, _), summary in zip(batch, summaries, strict=True):
+                if summary and self.llm_response_repository.set_summary_if_empty(
+                    response_id, summary
+                ):
+                    updated += 1
+
+            processed += len(batch)
+            # 要約を生成できなかった応答も再取得しないよう、キーは最後のIDから進める
+            after_id = batch[-1][0]
+            if on_progress is not None:
+                on_progress(processed, updated)
+        return updated
@@ -0,0 +1,106 @@
+"""
+差分同期ユースケース
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from app.domain.models.category import Category
+from app.domain.models.change import Change, EntityType
+from app.domain.models.llm_response import LLMResponse
+from app.domain.repositories.category_repository import CategoryRepository
+from app.domain.repositories.change_repository import ChangeRepository
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+
+
+@dataclass(slots=True)
+class SyncPage:
+    """
+    差分同期の1ページ分の結果
+
+    Attributes:
+        responses: 作成・更新されたLLM応答（変更シーケンス順）
+        categories: 作成・更新されたカテゴリ（変更シーケンス順）
+        tombstones: 削除されたエンティティの変更記録（変更シーケンス順）
+        last_seq: このページに含まれる最後の変更シーケンス番号
+        has_more: 続きのページがあるか
+    """
+
+    responses: list[LLMResponse] = field(default_factory=list)
+    categories: list[Category] = field(default_factory=list)
+    tombstones: list[Change] = field(default_factory=list)
+    last_seq: int = 0
+    has_more: bool = False
+
+
+class SyncChangesUseCase:
+    """
+    差分同期ユースケース
+
+    指定した変更シーケンス番号より後に変更されたLLM応答・カテゴリと、
+    削除されたエンティティのトゥームストーンを返します。
+    """
+
+    def __init__(
+        self,
+        change_repository: ChangeRepository,
+        llm_response_repository: LLMResponseRepository,
+        category_repository: CategoryRepository,
+    ):
+        """
+        Args:
+            change_repository: 変更記録リポジトリ
+            llm_response_repository: LLM応答リポジトリ
+            category_repository: カテゴリリポジトリ
+        """
+        self.change_repository = change_repository
+        self.llm_response_repository = llm_response_repository
+        self.category_repository = category_repository
+
+    def execute(self, since: int, limit: int = 500) -> SyncPage:
+        """
+        変更の差分を1ページ分取得します。
+
+        各エンティティは変更記録が最新の1件のみのため、ページ内で重複しません。
+        変更記録の取得後に削除されたエンティティは結果から除外します
+        （削除のトゥームストーンが後続のページに含まれます）。
+
+        Args:
+            since: このシーケンス番号より後の変更を取得する（0の場合は全件）
+            limit: 1ページあたりの最大変更件数
+
+        Returns:
+            差分同期の1ページ分の結果
+        """
+        # 1件多く読み込んで続きの有無を判定する
+        changes = self.change_repository.list_since(since, limit + 1)
+        page = SyncPage(last_seq=since, has_more=len(changes) > limit)
+        changes = changes[:limit]
+        if not changes:
+            return page
+        page.last_seq = changes[-1].seq
+
+        upserts = [change for change in changes if not change.deleted]
+        page.tombstones = [change for change in changes if change.deleted]
+        responses = self.llm_response_repository.get_many(
+            [
+                change.entity_id
+                for change in upserts
+                if change.entity_type is EntityType.RESPONSE
+            ]
+        )
+        categories = self.category_repository.get_many(
+            [
+                change.entity_id
+                for change in upserts
+                if change.entity_type is EntityType.CATEGORY
+            ]
+        )
+        for change in upserts:
+            if change.entity_type is EntityType.RESPONSE:
+                if change.entity_id in responses:
+                    page.responses.append(responses[change.entity_id])
+            elif change.entity_id in categories:
+                page.categories.append(categories[change.entity_id])
+        return page
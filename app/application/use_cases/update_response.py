@@ -7,7 +7,13 @@ from __future__ import annotations
 from uuid import UUID
 
 from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
 from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import split_into_chunks
+from app.domain.services.content_hash import compute_content_hash
+from app.domain.services.content_stats import compute_content_stats
 
 
 class UpdateResponseUseCase:
@@ -69,8 +75,78 @@ class UpdateResponseUseCase:
             tags=tags,
             summary=summary,
         )
+        if content_md is not None:
+            # 本文が変わった場合のみ統計情報とチャンクを作り直す
+            existing_response.stats = compute_content_stats(content_md)
+            existing_response.content_hash = compute_content_hash(content_md)
+            existing_response.chunks = split_into_chunks(content_md)
 
         # リポジトリに永続化
         updated_response = self.llm_response_repository.update(existing_response)
 
         return updated_response
+
+
+class AsyncUpdateResponseUseCase:
+    """
+    LLM応答更新ユースケース（非同期版）
+
+    UpdateResponseUseCase と同じ処理を非同期リポジトリで行います。
+    """
+
+    def __init__(self, llm_response_repository: AsyncLLMResponseRepository):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+        """
+        self.llm_response_repository = llm_response_repository
+
+    async def execute(
+        self,
+        response_id: UUID,
+        title: str | None = None,
+        prompt: str | None = None,
+        content_md: str | None = None,
+        model: str | None = None,
+        provider: LLMProvider | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        summary: str | None = None,
+    ) -> LLMResponse | None:
+        """
+        LLM応答を更新します。
+
+        Args:
+            response_id: 更新するLLM応答のID
+            title: 新しいタイトル
+            prompt: 新しいプロンプト
+            content_md: 新しい応答内容
+            model: 新しいモデル名
+            provider: 新しいプロバイダー
+            category_id: 新しいカテゴリID
+            tags: 新しいタグリスト
+            summary: 新しい要約
+
+        Returns:
+            更新されたLLM応答エンティティ。存在しない場合はNone
+        """
+        existing_response = await self.llm_response_repository.get_by_id(response_id)
+        if not existing_response:
+            return None
+
+        existing_response.update(
+            title=title,
+            prompt=prompt,
+            content_md=content_md,
+            model=model,
+            provider=provider,
+            category_id=category_id,
+            tags=tags,
+            summary=summary,
+        )
+        if content_md is not None:
+            # 本文が変わった場合のみ統計情報とチャンクを作り直す
+            existing_response.stats = compute_content_stats(content_md)
+            existing_response.content_hash = compute_content_hash(content_md)
+            existing_response.chunks = split_into_chunks(content_md)
+        return await self.llm_response_repository.update(existing_response)
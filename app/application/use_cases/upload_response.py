@@ -0,0 +1,206 @@
+"""
+LLM応答アップロードユースケース
+
+本文ストレージに書き込み済みの本文から、LLM応答を作成します。
+統計情報とチャンクは本文ストレージから1行ずつ読み出しながら作成するため、
+本文全体をメモリに載せません。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.models.stored_content import StoredContent
+from app.domain.ports.content_storage import ContentStorage
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.services.content_chunker import iter_chunks
+from app.domain.services.content_stats import compute_content_stats_from_lines
+
+
+def _build_response(
+    storage: ContentStorage,
+    content: StoredContent,
+    title: str,
+    prompt: str,
+    model: str,
+    provider: LLMProvider,
+    category_id: UUID | None,
+    tags: list[str] | None,
+    summary: str | None,
+    materialize_chunks: bool = False,
+) -> LLMResponse:
+    """
+    本文ストレージの本文を参照するLLM応答エンティティを作成します。
+
+    本文は content_md には持たず、storage_path で参照します。チャンクは
+    （materialize_chunks を指定しない場合）リポジトリが保存するときに
+    本文ストレージから読み出して分割します。
+
+    Args:
+        storage: 本文ストレージ
+        content: 本文ストレージに書き込んだ本文
+        materialize_chunks: チャンクをここで分割してリストにするかどうか
+            （保存時に本文ストレージを読み出させない場合）
+        その他: UploadResponseUseCase.execute() と同じ
+
+    Returns:
+        作成前のLLM応答エンティティ
+    """
+    chunks = iter_chunks(storage.iter_lines(content.path))
+    return LLMResponse(
+        title=title,
+        prompt=prompt,
+        content_md="",
+        model=model,
+        provider=provider,
+        category_id=category_id,
+        tags=tags if tags else [],
+        summary=summary,
+        storage_path=content.path,
+        stats=compute_content_stats_from_lines(storage.iter_lines(content.path)),
+        content_hash=content.sha256,
+        chunks=list(chunks) if materialize_chunks else chunks,
+    )
+
+
+class UploadResponseUseCase:
+    """
+    LLM応答アップロードユースケース
+
+    本文ストレージに書き込み済みの本文から、新しいLLM応答を作成します。
+    """
+
+    def __init__(
+        self, llm_response_repository: LLMResponseRepository, storage: ContentStorage
+    ):
+        """
+        Args:
+            llm_response_repository: LLM応答リポジトリ
+            storage: 本文ストレージ
+        """
+        self.llm_response_repository = llm_response_repository
+        self.storage = storage
+
+    def execute(
+        self,
+        content: StoredContent,
+        title: str,
+        prompt: str,
+        model: str,
+        provider: LLMProvider,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        summary: str | None = None,
+    ) -> LLMResponse:
+        """
+        LLM応答を作成します。
+
+        作成に失敗した場合は、本文ストレージの本文を削除します。
+
+        Args:
+            content: 本文ストレージに書き込んだ本文
+            title: 応答のタイトル
+            prompt: LLMへの入力プロンプト
+            model: 使用したモデル名
+            provider: LLMプロバイダー
+            category_id: 所属カテゴリのID
+            tags: タグのリスト
+            summary: 応答の要約
+
+        Returns:
+            作成されたLLM応答エンティティ（content_md は空文字）
+        """
+        try:
+            llm_response = _build_response(
+                self.storage,
+                content,
+                title,
+                prompt,
+                model,
+                provider,
+                category_id,
+                tags,
+                summary,
+            )
+            return self.llm_response_repository.create(llm_response)
+        except BaseException:
+            self.storage.delete(content.path)
+            raise
+
+
+class AsyncUploadResponseUseCase:
+    """
+    LLM応答アップロードユースケース（非同期版）
+
+    UploadResponseUseCase と同じ処理を非同期リポジトリで行います。
+    本文ストレージの読み出し（統計情報とチャンクの作成）と削除は、
+    イベントループを止めないようワーカースレッドで行います。そのため
+    チャンクは保存前にリストにし、本文の大きさに比例したメモリを使います。
+    """
+
+    def __init__(
+        self,
+        llm_response_repository: AsyncLLMResponseRepository,
+        storage: ContentStorage,
+    ):
+        """
+        Args:
+            llm_response_repository: 非同期LLM応答リポジトリ
+            storage: 本文ストレージ
+        """
+        self.llm_response_repository = llm_response_repository
+        self.storage = storage
+
+    async def execute(
+        self,
+        content: StoredContent,
+        title: str,
+        prompt: str,
+        model: str,
+        provider: LLMProvider,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        summary: str | None = None,
+    ) -> LLMResponse:
+        """
+        LLM応答を作成します。
+
+        作成に失敗した場合は、本文ストレージの本文を削除します。
+
+        Args:
+            content: 本文ストレージに書き込んだ本文
+            title: 応答のタイトル
+            prompt: LLMへの入力プロンプト
+            model: 使用したモデル名
+            provider: LLMプロバイダー
+            category_id: 所属カテゴリのID
+            tags: タグのリスト
+            summary: 応答の要約
+
+        Returns:
+            作成されたLLM応答エンティティ（content_md は空文字）
+        """
+        try:
+            # チャンクもスレッドで分割しておき、保存時に本文ストレージを読ませない
+            llm_response = await asyncio.to_thread(
+                _build_response,
+                self.storage,
+                content,
+                title,
+                prompt,
+                model,
+                provider,
+                category_id,
+                tags,
+                summary,
+                materialize_chunks=True,
+            )
+            return await self.llm_response_repository.create(llm_response)
+        except BaseException:
+            await asyncio.to_thread(self.storage.delete, content.path)
+            raise
@@ -22,6 +22,36 @@ class Settings(BaseSettings):
     # データベース設定
     DATABASE_URL: str = "sqlite:///./llmoonclip.db"
 
+    # 読み取り専用エンジン（読み取りのユースケースで使用）
+    # 未指定の場合、SQLite では同じファイルを読み取り専用で開き、
+    # それ以外のDBでは書き込み用エンジンを共用する
+    DATABASE_READ_URL: str | None = None  # 読み取り用レプリカのURL
+    DATABASE_SPLIT_READS: bool = True  # false で読み書きとも同じエンジンを使用
+
+    # コネクションプール（接続待ちでスレッドが止まらないよう、
+    # スレッドプールの上限（40）とアドミッション制御の同時実行数の合計以上にする）
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    DATABASE_POOL_RECYCLE_SECONDS: int = -1  # 接続を作り直す間隔（-1で無効）
+    DATABASE_POOL_PRE_PING: bool = False  # 貸し出し前に接続の生存を確認する
+
+    # SQLite の接続ごとの PRAGMA（SQLite 以外では無視される）
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 読み取りと書き込みを並行させる
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL ではコミットごとの fsync を省略できる
+    SQLITE_MMAP_SIZE_BYTES: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KIB: int = 8 * 1024  # 接続ごとのページキャッシュ
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # ロック取得を待つ最大時間
+    SQLITE_TEMP_STORE: str = "MEMORY"  # ソートや一時テーブルをメモリ上に置く
+    SQLITE_FOREIGN_KEYS: bool = True
+
+    # 非同期データベースアクセス（AsyncSession と async def のエンドポイントを使用）
+    # 有効にするには非同期ドライバーが必要（uv sync --extra async）
+    # 本文ストレージの読み出し・削除はワーカースレッドで行う
+    DATABASE_ASYNC: bool = False
+    # 非同期エンジンのURL（未指定の場合は DATABASE_URL のドライバーを置き換えて使用）
+    ASYNC_DATABASE_URL: str | None = None
+
     # アプリケーション環境
     APP_ENV: Literal["development", "staging", "production"] = "development"
 
@@ -31,6 +61,66 @@ class Settings(BaseSettings):
     # ストレージパス（Markdownファイル保存先）
     STORAGE_PATH: Path = Path("./storage/markdown")
 
+    # 本文のアップロード（multipart/form-data）
+    # 本文は STORAGE_PATH/contents に少しずつ書き込むため、上限を大きくしても
+    # アップロードごとのメモリ使用量はほぼ一定
+    UPLOAD_MAX_BYTES: int = 64 * 1024 * 1024  # 本文の最大バイト数
+    UPLOAD_MAX_FIELD_BYTES: int = 1024 * 1024  # 本文以外のフィールドの合計の上限
+
+    # 会話エクスポートの取り込み（POST /api/v1/imports）
+    # アップロードされたファイルは STORAGE_PATH/imports に保存し、ジョブで取り込む
+    IMPORT_UPLOAD_MAX_BYTES: int = 8 * 1024 * 1024 * 1024
+    IMPORT_BATCH_SIZE: int = 500  # 1トランザクションで作成するLLM応答の件数
+    # 1回のジョブで取り込む秒数（続きは次のジョブで行うため、
+    # JOB_LEASE_SECONDS より短くする）
+    IMPORT_JOB_SLICE_SECONDS: float = 60.0
+
+    # 本文の版（リビジョン）の履歴
+    # 版は前の版との差分で保存し、この版数ごとに本文全体を保存する
+    # （過去の版の復元で適用する差分は、この版数未満に収まる）
+    REVISION_SNAPSHOT_INTERVAL: int = 10
+
+    # HTMLレンダリングキャッシュ（メモリ上に保持する最大件数、
+    # ディスクキャッシュの合計サイズの上限。超えた場合は最近使われていないものから削除）
+    HTML_CACHE_MAX_ENTRIES: int = 256
+    HTML_CACHE_MAX_DISK_BYTES: int = 256 * 1024 * 1024
+
+    # 要約の自動生成（要約の最大文字数、ワーカープロセス数）
+    SUMMARY_MAX_CHARS: int = 200
+    SUMMARY_WORKERS: int = 2
+
+    # バックグラウンドジョブキュー
+    JOB_WORKERS: int = 2  # このプロセスで起動するワーカースレッド数（0で無効）
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_BACKOFF_BASE_SECONDS: float = 2.0
+    JOB_BACKOFF_MAX_SECONDS: float = 600.0
+    JOB_LEASE_SECONDS: float = 300.0  # これを過ぎた実行中ジョブは再取得される
+    JOB_RETENTION_HOURS: float = 24.0  # 成功したジョブを保持する時間
+
+    # 変更通知（Server-Sent Events）
+    EVENTS_POLL_INTERVAL_SECONDS: float = 1.0  # 他ワーカーの変更を確認する間隔
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0  # 接続維持のコメントを送る間隔
+    EVENTS_QUEUE_SIZE: int = 1000  # 接続ごとの未送信通知の上限（超えたら切断）
+
+    # アドミッション制御（ルートクラスごとの同時実行数と待ち行列の長さ）
+    # 同時実行数の合計はスレッドプールのサイズ（既定40）未満にし、
+    # 検索や書き込みが集中しても読み取り用のスレッドが残るようにする
+    ADMISSION_SEARCH_CONCURRENCY: int = 4
+    ADMISSION_SEARCH_QUEUE: int = 16
+    ADMISSION_WRITE_CONCURRENCY: int = 4  # SQLiteは書き込みを直列化するため少なめ
+    ADMISSION_WRITE_QUEUE: int = 64
+    ADMISSION_READ_CONCURRENCY: int = 24
+    ADMISSION_READ_QUEUE: int = 256
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 5.0  # 待ち行列での最大待ち時間
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1  # 拒否時の Retry-After
+
+    # クエリの制限時間（秒、0で無制限）。超えたクエリは中断して 504 を返す
+    # QUERY_TIMEOUTS でエンドポイント名（関数名）ごとに上書きできる
+    # 例: QUERY_TIMEOUTS='{"search_responses": 5.0, "list_responses": 2.0}'
+    QUERY_TIMEOUT_SECONDS: float = 10.0
+    QUERY_TIMEOUTS: dict[str, float] = {"search_responses": 3.0}
+
     # pydantic-settings 設定
     model_config = SettingsConfigDict(
         env_file=".env",
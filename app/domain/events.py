@@ -0,0 +1,79 @@
+"""
+ドメインイベント
+
+リポジトリの書き込みで発生するイベントを定義します。
+イベントは書き込みと同じトランザクション内で発行されるため、購読者は
+派生データの更新やジョブの登録を書き込みと原子的に行えます。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.models.conversation_import import ConversationImport
+from app.domain.models.llm_response import LLMResponse
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResponseCreated:
+    """
+    LLM応答が作成されたことを表すイベント
+
+    Attributes:
+        response: 作成されたLLM応答
+    """
+
+    response: LLMResponse
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResponsesCreated:
+    """
+    複数のLLM応答が一括で作成されたことを表すイベント（会話の取り込みなど）
+
+    LLM応答ごとの LLMResponseCreated の代わりに、一括作成1回につき1回発行します。
+
+    Attributes:
+        responses: 作成されたLLM応答
+    """
+
+    responses: tuple[LLMResponse, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResponseUpdated:
+    """
+    LLM応答が更新されたことを表すイベント
+
+    Attributes:
+        response: 更新後のLLM応答
+        content_changed: 本文が変わったかどうか（タイトルやタグのみの更新ではFalse）
+    """
+
+    response: LLMResponse
+    content_changed: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResponseDeleted:
+    """
+    LLM応答が削除されたことを表すイベント
+
+    Attributes:
+        response_id: 削除されたLLM応答のID
+    """
+
+    response_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationImportQueued:
+    """
+    会話エクスポートの取り込みが実行待ちとして登録されたことを表すイベント
+
+    Attributes:
+        conversation_import: 登録された取り込み
+    """
+
+    conversation_import: ConversationImport
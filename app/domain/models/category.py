@@ -12,7 +12,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """
     カテゴリエンティティ
@@ -50,3 +50,22 @@ class Category:
     def __str__(self) -> str:
         """文字列表現"""
         return f"Category(id={self.id}, name={self.name})"
+
+
+@dataclass(slots=True)
+class CategoryWithStats(Category):
+    """
+    集計値付きカテゴリ
+
+    カテゴリ一覧（サイドバー等）の表示用に、所属するLLM応答の集計値を
+    あわせて保持する読み取りモデルです。
+
+    Attributes:
+        response_count: 所属するLLM応答の件数
+        last_activity_at: 所属するLLM応答の最終更新日時（応答がない場合はNone）
+        top_tags: 所属するLLM応答で使用頻度の高いタグ（多い順）
+    """
+
+    response_count: int = 0
+    last_activity_at: datetime | None = None
+    top_tags: list[str] = field(default_factory=list)
@@ -0,0 +1,60 @@
+"""
+ドメインモデル: Change
+
+差分同期のための変更記録を表すドメインエンティティ。
+フレームワークに依存しない純粋なPythonクラスとして実装。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+
+class EntityType(str, Enum):
+    """
+    変更を記録するエンティティの種類の列挙型
+    """
+
+    RESPONSE = "response"
+    CATEGORY = "category"
+
+
+class ChangeOperation(str, Enum):
+    """
+    最後に行われた変更操作の列挙型
+    """
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(slots=True)
+class Change:
+    """
+    変更記録エンティティ
+
+    エンティティごとに最新の変更のみを保持します。
+    削除されたエンティティの記録はトゥームストーン（削除の目印）として残ります。
+
+    Attributes:
+        entity_type: エンティティの種類
+        entity_id: エンティティのID
+        operation: 最後に行われた変更操作
+        seq: 変更シーケンス番号（書き込みのたびに単調増加する）
+        changed_at: 変更日時
+    """
+
+    entity_type: EntityType
+    entity_id: UUID
+    operation: ChangeOperation
+    seq: int
+    changed_at: datetime
+
+    @property
+    def deleted(self) -> bool:
+        """エンティティが削除されているかを返します。"""
+        return self.operation is ChangeOperation.DELETED
@@ -0,0 +1,54 @@
+"""
+ドメインモデル: ContentChunk
+
+LLM応答の本文（Markdown）を見出しとコードブロックの境界で分割した
+チャンク（セクション）と、チャンク単位の検索結果を表します。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ContentChunk:
+    """
+    本文のチャンク
+
+    チャンクは本文を先頭から隙間なく分割したもので、
+    content_md[start_offset:end_offset] が content と一致します。
+
+    Attributes:
+        position: 本文内でのチャンクの番号（0 始まり）
+        start_offset: 本文内の開始位置（文字単位）
+        end_offset: 本文内の終了位置（文字単位、この位置を含まない）
+        heading: チャンクが属する見出しの文字列（最初の見出しより前はNone）
+        heading_level: 見出しのレベル（1〜6。見出しがない場合はNone）
+        content: チャンクの Markdown 文字列（一覧取得時など、読み込まない場合はNone）
+    """
+
+    position: int
+    start_offset: int
+    end_offset: int
+    heading: str | None = None
+    heading_level: int | None = None
+    content: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkSearchHit:
+    """
+    チャンク単位の検索結果
+
+    Attributes:
+        response_id: チャンクを含むLLM応答のID
+        title: LLM応答のタイトル
+        chunk: 検索条件に合致したチャンク
+        snippet: 合致した箇所の前後を切り出した文字列
+    """
+
+    response_id: UUID
+    title: str
+    chunk: ContentChunk
+    snippet: str = ""
@@ -0,0 +1,86 @@
+"""
+ドメインモデル: ContentStats
+
+LLM応答の本文（Markdown）から算出する統計情報を表す値オブジェクトと、
+検索時の絞り込み条件・並び順を定義します。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+@dataclass(frozen=True, slots=True)
+class ContentStats:
+    """
+    本文の統計情報
+
+    作成・更新時に一度だけ算出して保存し、長さやコードの有無での
+    絞り込み・並べ替えに使用します。
+
+    Attributes:
+        char_count: 文字数
+        byte_count: UTF-8 でのバイト数
+        token_estimate: 推定トークン数
+        code_block_count: フェンスで囲まれたコードブロックの数
+        code_languages: コードブロックの言語名（小文字・重複なし・出現順）
+        heading_count: 見出しの数
+        link_count: リンクの数（画像は含まない）
+    """
+
+    char_count: int
+    byte_count: int
+    token_estimate: int
+    code_block_count: int = 0
+    code_languages: list[str] = field(default_factory=list)
+    heading_count: int = 0
+    link_count: int = 0
+
+
+class ResponseSortKey(str, Enum):
+    """
+    LLM応答の検索結果の並べ替えキー
+    """
+
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    CHAR_COUNT = "char_count"
+    BYTE_COUNT = "byte_count"
+    TOKEN_ESTIMATE = "token_estimate"
+    HEADING_COUNT = "heading_count"
+    LINK_COUNT = "link_count"
+
+
+class SortOrder(str, Enum):
+    """
+    並び順
+    """
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+@dataclass(frozen=True, slots=True)
+class ContentStatsFilter:
+    """
+    本文の統計情報による絞り込み条件
+
+    None の条件は適用しません。統計情報が未算出の応答は、
+    いずれかの条件を指定すると結果に含まれません。
+
+    Attributes:
+        min_chars: 最小文字数
+        max_chars: 最大文字数
+        min_tokens: 最小推定トークン数
+        max_tokens: 最大推定トークン数
+        has_code: コードブロックの有無
+        code_language: コードブロックの言語名
+    """
+
+    min_chars: int | None = None
+    max_chars: int | None = None
+    min_tokens: int | None = None
+    max_tokens: int | None = None
+    has_code: bool | None = None
+    code_language: str | None = None
@@ -0,0 +1,114 @@
+"""
+ドメインモデル: ConversationImport
+
+LLMプロバイダーの会話エクスポート（ChatGPT・Claude・Gemini）からの
+取り込みを表すドメインエンティティ。
+フレームワークに依存しない純粋なPythonクラスとして実装。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from uuid import UUID, uuid4
+
+from app.domain.models.llm_response import LLMProvider
+
+
+class ExportFormat(str, Enum):
+    """
+    会話エクスポートの形式の列挙型
+    """
+
+    CHATGPT = "chatgpt"  # ChatGPT のデータエクスポートの conversations.json
+    CLAUDE = "claude"  # Claude のデータエクスポートの conversations.json
+    GEMINI = "gemini"  # Google Takeout の Gemini アプリのアクティビティ（JSON）
+
+
+class ImportStatus(str, Enum):
+    """
+    取り込みの状態の列挙型
+    """
+
+    QUEUED = "queued"  # 実行待ち（API で登録され、ジョブの実行を待っている）
+    RUNNING = "running"  # 実行中（中断された場合は続きから再開できる）
+    COMPLETED = "completed"  # 完了
+    FAILED = "failed"  # 失敗（再実行すると続きから再開する）
+
+
+@dataclass(frozen=True, slots=True)
+class ExportedTurn:
+    """
+    会話エクスポートから取り出したアシスタントの発話
+
+    Attributes:
+        title: 会話のタイトル
+        prompt: 発話の直前のユーザーの入力
+        content_md: 発話の内容（Markdown形式）
+        model: 使用したモデル名
+        provider: LLMプロバイダー
+        created_at: 発話の日時（エクスポートに含まれない場合はNone）
+    """
+
+    title: str
+    prompt: str
+    content_md: str
+    model: str
+    provider: LLMProvider
+    created_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class ConversationImport:
+    """
+    会話エクスポートの取り込みエンティティ
+
+    取り込み済みの位置（byte_offset）をバッチごとに記録し、中断された場合は
+    その位置から再開します。
+
+    Attributes:
+        id: 取り込みの一意識別子
+        source_path: 取り込むエクスポートファイルのパス
+        source_bytes: エクスポートファイルのバイト数
+        format: エクスポートの形式（None の場合は実行時に判別する）
+        category_id: 作成するLLM応答の所属カテゴリのID
+        tags: 作成するLLM応答に付けるタグのリスト
+        delete_source: 完了後にエクスポートファイルを削除するか
+            （API でアップロードされたファイルの場合）
+        status: 取り込みの状態
+        byte_offset: 取り込み済みの位置（ファイル先頭からのバイト数）
+        conversation_count: 処理した会話の数
+        imported_count: 作成したLLM応答の数
+        duplicate_count: 本文が重複していたため作成しなかった発話の数
+        last_error: 最後に発生したエラー
+        created_at: 登録日時
+        updated_at: 更新日時
+        completed_at: 完了日時
+    """
+
+    source_path: str
+    source_bytes: int
+    format: ExportFormat | None = None
+    category_id: UUID | None = None
+    tags: list[str] = field(default_factory=list)
+    delete_source: bool = False
+    status: ImportStatus = ImportStatus.QUEUED
+    byte_offset: int = 0
+    conversation_count: int = 0
+    imported_count: int = 0
+    duplicate_count: int = 0
+    last_error: str | None = None
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    completed_at: datetime | None = None
+
+    @property
+    def progress(self) -> float:
+        """取り込み済みの割合（0.0〜1.0、ファイル上の位置から算出）"""
+        if self.status is ImportStatus.COMPLETED:
+            return 1.0
+        if self.source_bytes <= 0:
+            return 0.0
+        return min(1.0, self.byte_offset / self.source_bytes)
@@ -0,0 +1,56 @@
+"""
+ドメインモデル: Job
+
+バックグラウンドで実行するジョブを表すドメインエンティティ。
+フレームワークに依存しない純粋なPythonクラスとして実装。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+
+class JobStatus(str, Enum):
+    """
+    ジョブの状態の列挙型
+    """
+
+    QUEUED = "queued"  # 実行待ち（再試行待ちを含む）
+    RUNNING = "running"  # 実行中
+    SUCCEEDED = "succeeded"  # 成功
+    FAILED = "failed"  # 再試行回数を使い切って失敗
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    ジョブエンティティ
+
+    Attributes:
+        id: ジョブID（登録順に採番される）
+        kind: ジョブの種類（実行するハンドラーの名前）
+        payload: ハンドラーに渡す引数
+        status: ジョブの状態
+        priority: 優先度（大きいほど先に実行される）
+        attempts: 実行を試みた回数
+        max_attempts: 最大試行回数
+        run_at: 実行可能になる日時（再試行時はバックオフ後の日時）
+        last_error: 最後に発生したエラー
+        created_at: 登録日時
+        updated_at: 更新日時
+    """
+
+    id: int
+    kind: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    priority: int = 0
+    attempts: int = 0
+    max_attempts: int = 5
+    run_at: datetime = field(default_factory=datetime.now)
+    last_error: str | None = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
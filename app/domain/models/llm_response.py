@@ -7,11 +7,16 @@ LLM応答を表すドメインエンティティ。
 フレームワークに依存しない純粋なPythonクラスとして実装。
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from app.domain.models.category import Category
+from app.domain.models.content_chunk import ContentChunk
+from app.domain.models.content_stats import ContentStats
+
 
 class LLMProvider(str, Enum):
     """
@@ -24,7 +29,16 @@ class LLMProvider(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+class SummarySource(str, Enum):
+    """
+    要約の設定元の列挙型
+    """
+
+    USER = "user"  # 利用者が設定した要約
+    AUTO = "auto"  # 本文から自動生成した要約
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """
     LLM応答エンティティ
@@ -41,10 +55,23 @@ class LLMResponse:
         category_id: 所属カテゴリのID
         tags: タグのリスト
         summary: 応答の要約
+        summary_source: 要約の設定元（要約が未設定の場合はNone。要約を指定して
+            作成した場合は利用者が設定したものとして扱う）
         storage_location: ストレージの種類（file, s3等）
-        storage_path: 実際のストレージパス
+        storage_path: 実際のストレージパス（設定されている場合、本文はDBではなく
+            本文ストレージに保存されている）
+        stats: 本文の統計情報（作成・更新時に算出する。未算出の場合はNone）
+        content_hash: 本文の SHA-256 ハッシュ（作成・本文の更新時に算出し、
+            重複の検出に使用する。未算出の場合はNone）
+        prompt_id: プロンプトのID（同じプロンプトのLLM応答で共通。作成・更新時に
+            リポジトリが設定する）
         created_at: 作成日時
         updated_at: 更新日時
+        category: 所属カテゴリの参照（読み取り時に埋め込まれる。永続化には
+            category_id を使用する）
+        chunks: 本文のチャンク（作成・本文の更新時に設定すると、本文と同時に
+            保存される。本文ストレージから読み出しながら分割する場合は
+            イテレーターを設定する。読み取り時は常にNone）
     """
 
     title: str
@@ -55,11 +82,24 @@ class LLMResponse:
     category_id: UUID | None = None
     tags: list[str] = field(default_factory=list)
     summary: str | None = None
+    summary_source: SummarySource | None = None
     storage_location: str = "file"
     storage_path: str | None = None
+    stats: ContentStats | None = None
+    content_hash: str | None = None
+    prompt_id: UUID | None = None
     id: UUID = field(default_factory=uuid4)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    category: Category | None = field(default=None, compare=False, repr=False)
+    chunks: Iterable[ContentChunk] | None = field(
+        default=None, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """要約の設定元が未指定の場合、指定された要約を利用者のものとします。"""
+        if self.summary and self.summary_source is None:
+            self.summary_source = SummarySource.USER
 
     def update(
         self,
@@ -75,6 +115,9 @@ class LLMResponse:
         """
         LLM応答情報を更新します。
 
+        本文が変わり、要約を指定しなかった場合、自動生成した要約は古い本文の
+        ものになるため破棄します（利用者が設定した要約は残します）。
+
         Args:
             title: 新しいタイトル
             prompt: 新しいプロンプト
@@ -85,22 +128,38 @@ class LLMResponse:
             tags: 新しいタグリスト
             summary: 新しい要約
         """
+        if (
+            summary is None
+            and content_md is not None
+            and content_md != self.content_md
+            and self.summary_source is SummarySource.AUTO
+        ):
+            self.summary = None
+            self.summary_source = None
         if title is not None:
             self.title = title
-        if prompt is not None:
+        if prompt is not None and prompt != self.prompt:
             self.prompt = prompt
+            # プロンプトの参照は保存時にリポジトリが設定し直す
+            self.prompt_id = None
         if content_md is not None:
             self.content_md = content_md
+            # 本文をDBに直接保存するため、本文ストレージの本文は参照しなくなる
+            self.storage_path = None
         if model is not None:
             self.model = model
         if provider is not None:
             self.provider = provider
         if category_id is not None:
+            if category_id != self.category_id:
+                # 埋め込み済みのカテゴリ参照は古くなるため破棄する
+                self.category = None
             self.category_id = category_id
         if tags is not None:
             self.tags = tags
         if summary is not None:
             self.summary = summary
+            self.summary_source = SummarySource.USER
         self.updated_at = datetime.now()
 
     def add_tag(self, tag: str) -> None:
@@ -0,0 +1,32 @@
+"""
+ドメインモデル: Prompt
+
+LLM応答の入力プロンプトを表します。同じ本文のプロンプトは1つのエンティティに
+まとめられ、複数のLLM応答（モデルの比較や再実行）から参照されます。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID, uuid4
+
+
+@dataclass(slots=True)
+class Prompt:
+    """
+    プロンプトエンティティ
+
+    Attributes:
+        text: プロンプトの本文
+        prompt_hash: 本文の SHA-256 ハッシュ（同じ本文のプロンプトの識別に使用する）
+        id: プロンプトの一意識別子
+        created_at: 作成日時（最初にこのプロンプトでLLM応答が作成された日時）
+        response_count: このプロンプトを参照するLLM応答の数（読み取り時に設定される）
+    """
+
+    text: str
+    prompt_hash: str
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=datetime.now)
+    response_count: int = 0
@@ -0,0 +1,41 @@
+"""
+ドメインモデル: ResponseRevision
+
+LLM応答の本文（Markdown）の版（リビジョン）を表します。本文を更新するたびに
+新しい版が追加され、過去の版の本文を取得できます。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseRevision:
+    """
+    LLM応答の本文の版
+
+    版は1から順に番号が振られ、最も大きい番号の版が現在の本文です。
+    本文を初めて更新したときに、更新前の本文が版 1 として記録されます。
+
+    Attributes:
+        response_id: LLM応答のID
+        number: 版の番号（1 始まり）
+        is_snapshot: 本文全体を保存した版かどうか（False の場合は前の版との差分）
+        content_hash: 本文の SHA-256 ハッシュ
+        char_count: 本文の文字数
+        stored_bytes: 保存している（圧縮後の）データのバイト数
+        created_at: この版の本文になった日時
+        content: 本文（一覧取得時など、復元しない場合はNone）
+    """
+
+    response_id: UUID
+    number: int
+    is_snapshot: bool
+    content_hash: str
+    char_count: int
+    stored_bytes: int
+    created_at: datetime
+    content: str | None = None
@@ -0,0 +1,26 @@
+"""
+ドメインモデル: StoredContent
+
+ストレージに書き込んだ本文の保存先と、書き込み時に算出したハッシュ・サイズを
+表します。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StoredContent:
+    """
+    ストレージに保存した本文
+
+    Attributes:
+        path: ストレージ内のパス（LLM応答の storage_path に設定する）
+        sha256: 本文（UTF-8 のバイト列）の SHA-256 ハッシュ（16進数）
+        byte_count: 本文のバイト数
+    """
+
+    path: str
+    sha256: str
+    byte_count: int
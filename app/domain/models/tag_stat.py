@@ -0,0 +1,37 @@
+"""
+ドメインモデル: TagStat
+
+タグごとの使用状況（タグを付けたLLM応答の数と最後に使われた日時）と、
+タグの一覧の並び順を定義します。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+@dataclass(frozen=True, slots=True)
+class TagStat:
+    """
+    タグの使用状況
+
+    Attributes:
+        tag: タグ
+        response_count: このタグを付けたLLM応答の数
+        last_used_at: このタグを最後にLLM応答に付けた日時
+    """
+
+    tag: str
+    response_count: int
+    last_used_at: datetime
+
+
+class TagSortKey(str, Enum):
+    """
+    タグの一覧の並べ替えキー
+    """
+
+    COUNT = "count"  # LLM応答の多い順
+    RECENT = "recent"  # 最後に使われた日時の新しい順
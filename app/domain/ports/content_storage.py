@@ -0,0 +1,133 @@
+"""
+ドメインポート: ContentStorage
+
+LLM応答の本文をデータベースの外に保存するストレージのインターフェイス（ポート）。
+大きな本文を全体をメモリに載せずに書き込み・読み出すために使用します。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from types import TracebackType
+
+from app.domain.models.stored_content import StoredContent
+
+
+class ContentTooLargeError(Exception):
+    """書き込んだ本文が上限のバイト数を超えたことを示す例外"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 本文の最大バイト数
+        """
+        super().__init__(f"本文が上限（{max_bytes} バイト）を超えています")
+        self.max_bytes = max_bytes
+
+
+class ContentWriter(ABC):
+    """
+    本文を少しずつ書き込むライターのインターフェイス
+
+    commit() するまで本文は確定しません。with 文で使用すると、
+    commit() せずに抜けた場合（例外の発生時を含む）に書き込みを破棄します。
+    """
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """
+        本文の続きを書き込みます。
+
+        Args:
+            data: UTF-8 でエンコードされた本文の一部
+
+        Raises:
+            ContentTooLargeError: 書き込んだ合計が上限を超えた場合
+        """
+        pass
+
+    @abstractmethod
+    def commit(self) -> StoredContent:
+        """
+        書き込みを確定します。
+
+        Returns:
+            保存した本文の保存先・ハッシュ・サイズ
+
+        Raises:
+            UnicodeDecodeError: 本文が UTF-8 として正しくない場合
+        """
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """書き込みを破棄します（確定済みの場合は何もしません）"""
+        pass
+
+    def __enter__(self) -> ContentWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.abort()
+
+
+class ContentStorage(ABC):
+    """
+    本文ストレージのインターフェイス
+    """
+
+    @abstractmethod
+    def open_writer(self, max_bytes: int) -> ContentWriter:
+        """
+        本文を書き込むライターを開きます。
+
+        Args:
+            max_bytes: 本文の最大バイト数
+
+        Returns:
+            本文のライター
+        """
+        pass
+
+    @abstractmethod
+    def iter_lines(self, path: str) -> Iterator[str]:
+        """
+        保存した本文を1行ずつ読み出します。
+
+        Args:
+            path: ストレージ内のパス
+
+        Yields:
+            改行文字を含む1行分の文字列
+        """
+        pass
+
+    @abstractmethod
+    def read_text(self, path: str) -> str:
+        """
+        保存した本文全体を読み出します。
+
+        Args:
+            path: ストレージ内のパス
+
+        Returns:
+            本文の文字列
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, path: str) -> None:
+        """
+        保存した本文を削除します（存在しない場合は何もしません）。
+
+        Args:
+            path: ストレージ内のパス
+        """
+        pass
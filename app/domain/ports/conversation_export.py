@@ -0,0 +1,63 @@
+"""
+ドメインポート: ConversationExportReader
+
+LLMプロバイダーの会話エクスポートを読み込むリーダーのインターフェイス（ポート）。
+数GBのエクスポートでもファイル全体をメモリに載せず、会話ごとに読み進めます。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from app.domain.models.conversation_import import ExportedTurn, ExportFormat
+
+
+class ConversationExportError(Exception):
+    """エクスポートファイルの形式が正しくないことを示す例外"""
+
+
+class ConversationExportReader(ABC):
+    """
+    会話エクスポートのリーダーのインターフェイス
+    """
+
+    @abstractmethod
+    def detect_format(self, path: str) -> ExportFormat | None:
+        """
+        エクスポートファイルの形式を、先頭の会話の内容から判別します。
+
+        Args:
+            path: エクスポートファイルのパス
+
+        Returns:
+            エクスポートの形式。会話が1つも含まれていない場合はNone
+
+        Raises:
+            ConversationExportError: 形式を判別できない場合
+        """
+        pass
+
+    @abstractmethod
+    def read(
+        self, path: str, export_format: ExportFormat, start_offset: int = 0
+    ) -> Iterator[tuple[list[ExportedTurn], int]]:
+        """
+        エクスポートファイルを会話ごとに読み込みます。
+
+        Args:
+            path: エクスポートファイルのパス
+            export_format: エクスポートの形式
+            start_offset: 読み込みを始める位置（以前に返された会話の終わりの位置。
+                0 の場合は先頭から）
+
+        Yields:
+            (会話に含まれるアシスタントの発話のリスト, 会話の終わりの位置) の組。
+            位置はファイル先頭からのバイト数で、start_offset に渡すと
+            次の会話から読み込みを再開できる
+
+        Raises:
+            ConversationExportError: ファイルの形式が正しくない場合
+        """
+        pass
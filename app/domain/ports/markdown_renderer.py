@@ -0,0 +1,31 @@
+"""
+ドメインポート: MarkdownRenderer
+
+Markdown を HTML に変換するレンダラーのインターフェイス（ポート）。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class MarkdownRenderer(ABC):
+    """
+    Markdownレンダラーのインターフェイス
+
+    LLM応答の Markdown をクライアントでそのまま表示できる HTML に変換します。
+    """
+
+    @abstractmethod
+    def render(self, content_md: str) -> str:
+        """
+        Markdown を HTML に変換します。
+
+        Args:
+            content_md: Markdown 文字列
+
+        Returns:
+            HTML 文字列
+        """
+        pass
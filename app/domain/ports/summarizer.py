@@ -0,0 +1,47 @@
+"""
+ドメインポート: Summarizer
+
+LLM応答の本文から要約を生成するサマライザーのインターフェイス（ポート）。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class Summarizer(ABC):
+    """
+    サマライザーのインターフェイス
+
+    一覧表示などで使用する短い要約を Markdown 本文から生成します。
+    """
+
+    @abstractmethod
+    def summarize(self, content_md: str) -> str:
+        """
+        Markdown 本文の要約を生成します。
+
+        Args:
+            content_md: Markdown 文字列
+
+        Returns:
+            要約文字列。要約できる文がない場合は空文字
+        """
+        pass
+
+    def summarize_many(self, contents: Sequence[str]) -> list[str]:
+        """
+        複数の本文の要約をまとめて生成します。
+
+        既定では1件ずつ summarize() を呼び出します。並列処理できる実装は
+        このメソッドを上書きします。
+
+        Args:
+            contents: Markdown 文字列のリスト
+
+        Returns:
+            contents と同じ順序の要約文字列のリスト
+        """
+        return [self.summarize(content_md) for content_md in contents]
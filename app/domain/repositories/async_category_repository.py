@@ -0,0 +1,120 @@
+"""
+ドメインリポジトリインターフェイス: AsyncCategoryRepository
+
+カテゴリの永続化を担当する非同期リポジトリのインターフェイス（ポート）。
+各操作の意味は CategoryRepository と同じで、コルーチンとして呼び出します。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.domain.models.category import Category, CategoryWithStats
+
+
+class AsyncCategoryRepository(ABC):
+    """
+    非同期カテゴリリポジトリのインターフェイス
+
+    async def のエンドポイントから、スレッドプールを介さずに使用します。
+    """
+
+    @abstractmethod
+    async def get_by_id(self, category_id: UUID) -> Category | None:
+        """
+        IDでカテゴリを取得します。
+
+        Args:
+            category_id: 取得するカテゴリのID
+
+        Returns:
+            カテゴリエンティティ。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, category_ids: Sequence[UUID]) -> dict[UUID, Category]:
+        """
+        複数のIDでカテゴリをまとめて取得します。
+
+        Args:
+            category_ids: 取得するカテゴリのIDリスト
+
+        Returns:
+            カテゴリIDをキー、カテゴリエンティティを値とする辞書
+            （存在しないIDは含まれない）
+        """
+        pass
+
+    @abstractmethod
+    async def list(self, skip: int = 0, limit: int = 100) -> list[Category]:
+        """
+        カテゴリのリストを取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            カテゴリエンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    async def list_with_stats(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
+        """
+        所属するLLM応答の集計値付きでカテゴリのリストを取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+            top_tags_limit: カテゴリごとに返す上位タグの最大数
+
+        Returns:
+            集計値付きカテゴリエンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    async def create(self, category: Category) -> Category:
+        """
+        カテゴリを作成します。
+
+        Args:
+            category: 作成するカテゴリエンティティ
+
+        Returns:
+            作成されたカテゴリエンティティ
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, category: Category) -> Category:
+        """
+        カテゴリを更新します。
+
+        Args:
+            category: 更新するカテゴリエンティティ
+
+        Returns:
+            更新されたカテゴリエンティティ
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, category_id: UUID) -> bool:
+        """
+        カテゴリを削除します。
+
+        Args:
+            category_id: 削除するカテゴリのID
+
+        Returns:
+            削除が成功した場合True、失敗した場合False
+        """
+        pass
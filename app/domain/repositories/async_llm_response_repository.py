@@ -0,0 +1,257 @@
+"""
+ドメインリポジトリインターフェイス: AsyncLLMResponseRepository
+
+LLM応答の永続化を担当する非同期リポジトリのインターフェイス（ポート）。
+各操作の意味は LLMResponseRepository と同じで、コルーチンとして呼び出します。
+実装はインフラストラクチャ層で行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.models.content_stats import (
+    ContentStatsFilter,
+    ResponseSortKey,
+    SortOrder,
+)
+from app.domain.models.llm_response import LLMResponse
+
+
+class AsyncLLMResponseRepository(ABC):
+    """
+    非同期LLM応答リポジトリのインターフェイス
+
+    async def のエンドポイントから、スレッドプールを介さずに使用します。
+    """
+
+    @abstractmethod
+    async def get_by_id(self, response_id: UUID) -> LLMResponse | None:
+        """
+        IDでLLM応答を取得します。
+
+        Args:
+            response_id: 取得するLLM応答のID
+
+        Returns:
+            LLM応答エンティティ。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, response_ids: Sequence[UUID]) -> dict[UUID, LLMResponse]:
+        """
+        複数のIDでLLM応答をまとめて取得します。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+
+        Returns:
+            IDをキーとするLLM応答エンティティの辞書（存在しないIDは含まない）
+        """
+        pass
+
+    @abstractmethod
+    async def list(self, skip: int = 0, limit: int = 100) -> list[LLMResponse]:
+        """
+        LLM応答のリストを取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            LLM応答エンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[LLMResponse]:
+        """
+        LLM応答を検索します。
+
+        Args:
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            検索条件に合致するLLM応答エンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    async def get_projection(
+        self, response_id: UUID, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """
+        IDでLLM応答の指定フィールドのみを取得します。
+
+        Args:
+            response_id: 取得するLLM応答のID
+            fields: 取得するフィールド名（LLMResponse の属性名）
+
+        Returns:
+            フィールド名をキーとする辞書。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    async def get_many_projection(
+        self, response_ids: Sequence[UUID], fields: Sequence[str]
+    ) -> dict[UUID, dict[str, Any]]:
+        """
+        複数のIDでLLM応答の指定フィールドのみをまとめて取得します。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+            fields: 取得するフィールド名（LLMResponse の属性名）
+
+        Returns:
+            IDをキーとする、フィールド名をキーとした辞書（存在しないIDは含まない）
+        """
+        pass
+
+    @abstractmethod
+    async def search_projection(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """
+        LLM応答を検索し、指定フィールドのみを取得します。
+
+        Args:
+            fields: 取得するフィールド名（LLMResponse の属性名）
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            フィールド名をキーとする辞書のリスト
+        """
+        pass
+
+    @abstractmethod
+    async def list_chunks(self, response_id: UUID) -> list[ContentChunk] | None:
+        """
+        LLM応答の本文のチャンク（セクション）の一覧を、位置順に取得します。
+
+        チャンクの本文（content）は読み込みません。
+
+        Args:
+            response_id: LLM応答のID
+
+        Returns:
+            本文を含まないチャンクのリスト。LLM応答が存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    async def get_chunk(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """
+        LLM応答の本文のチャンク（セクション）を1つ取得します。
+
+        Args:
+            response_id: LLM応答のID
+            position: チャンクの番号（0 始まり）
+
+        Returns:
+            本文を含むチャンク。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    async def search_chunks(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """
+        本文のチャンク単位でLLM応答を検索します。
+
+        検索語を含むチャンクを、LLM応答の作成日時の新しい順、
+        同じ応答の中ではチャンクの位置順に返します。
+
+        Args:
+            query: 検索クエリ（チャンクの本文で検索）
+            category_id: カテゴリIDでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            チャンク単位の検索結果のリスト（スニペットは空）
+        """
+        pass
+
+    @abstractmethod
+    async def create(self, response: LLMResponse) -> LLMResponse:
+        """
+        LLM応答を作成します。
+
+        Args:
+            response: 作成するLLM応答エンティティ
+
+        Returns:
+            作成されたLLM応答エンティティ
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, response: LLMResponse) -> LLMResponse:
+        """
+        LLM応答を更新します。
+
+        Args:
+            response: 更新するLLM応答エンティティ
+
+        Returns:
+            更新されたLLM応答エンティティ
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, response_id: UUID) -> bool:
+        """
+        LLM応答を削除します。
+
+        Args:
+            response_id: 削除するLLM応答のID
+
+        Returns:
+            削除が成功した場合True、失敗した場合False
+        """
+        pass
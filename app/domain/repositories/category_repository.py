@@ -8,9 +8,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
-from app.domain.models.category import Category
+from app.domain.models.category import Category, CategoryWithStats
 
 
 class CategoryRepository(ABC):
@@ -34,6 +35,20 @@ class CategoryRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, category_ids: Sequence[UUID]) -> dict[UUID, Category]:
+        """
+        複数のIDでカテゴリをまとめて取得します。
+
+        Args:
+            category_ids: 取得するカテゴリのIDリスト
+
+        Returns:
+            カテゴリIDをキー、カテゴリエンティティを値とする辞書
+            （存在しないIDは含まれない）
+        """
+        pass
+
     @abstractmethod
     def list(self, skip: int = 0, limit: int = 100) -> list[Category]:
         """
@@ -48,6 +63,26 @@ class CategoryRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_with_stats(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
+        """
+        所属するLLM応答の集計値付きでカテゴリのリストを取得します。
+
+        カテゴリごとに検索を繰り返す（N+1）のではなく、
+        集約クエリでまとめて集計することを想定しています。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+            top_tags_limit: カテゴリごとに返す上位タグの最大数
+
+        Returns:
+            集計値付きカテゴリエンティティのリスト
+        """
+        pass
+
     @abstractmethod
     def create(self, category: Category) -> Category:
         """
@@ -0,0 +1,42 @@
+"""
+ドメインリポジトリインターフェイス: ChangeRepository
+
+差分同期のための変更記録を参照するリポジトリのインターフェイス（ポート）。
+変更の記録は各リポジトリの書き込みと同じトランザクションで行われます。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from app.domain.models.change import Change
+
+
+class ChangeRepository(ABC):
+    """
+    変更記録リポジトリのインターフェイス
+    """
+
+    @abstractmethod
+    def list_since(self, since: int, limit: int = 500) -> list[Change]:
+        """
+        指定したシーケンス番号より後の変更を、シーケンス番号順に取得します。
+
+        Args:
+            since: このシーケンス番号より後の変更を取得する（0の場合は先頭から）
+            limit: 取得する最大件数
+
+        Returns:
+            変更記録のリスト
+        """
+        pass
+
+    @abstractmethod
+    def latest_seq(self) -> int:
+        """
+        最新の変更シーケンス番号を取得します。
+
+        Returns:
+            最新の変更シーケンス番号（変更がない場合は0）
+        """
+        pass
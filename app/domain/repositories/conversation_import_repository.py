@@ -0,0 +1,91 @@
+"""
+ドメインリポジトリインターフェイス: ConversationImportRepository
+
+会話エクスポートの取り込みの進捗を永続化するリポジトリのインターフェイス（ポート）。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.models.conversation_import import ConversationImport
+
+
+class ConversationImportRepository(ABC):
+    """
+    取り込みリポジトリの抽象基底クラス
+    """
+
+    @abstractmethod
+    def get_by_id(self, import_id: UUID) -> ConversationImport | None:
+        """
+        IDで取り込みを取得します。
+
+        Args:
+            import_id: 取り込みID
+
+        Returns:
+            取り込みエンティティ。見つからない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def list(self, skip: int = 0, limit: int = 100) -> list[ConversationImport]:
+        """
+        取り込みの一覧を新しい順に取得します。
+
+        Args:
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            取り込みエンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    def find_resumable(
+        self, source_path: str, source_bytes: int
+    ) -> ConversationImport | None:
+        """
+        同じエクスポートファイルの、完了していない最新の取り込みを取得します。
+
+        Args:
+            source_path: エクスポートファイルのパス
+            source_bytes: エクスポートファイルのバイト数（ファイルが置き換えられて
+                いないことの確認に使用）
+
+        Returns:
+            再開できる取り込みエンティティ。見つからない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def create(self, conversation_import: ConversationImport) -> ConversationImport:
+        """
+        取り込みを登録します。
+
+        状態が実行待ち（QUEUED）の場合は、ConversationImportQueued イベントを
+        発行します（購読者が取り込みを実行するジョブを登録する）。
+
+        Args:
+            conversation_import: 登録する取り込みエンティティ
+
+        Returns:
+            登録された取り込みエンティティ
+        """
+        pass
+
+    @abstractmethod
+    def update(self, conversation_import: ConversationImport) -> ConversationImport:
+        """
+        取り込みの状態と進捗を更新します。
+
+        Args:
+            conversation_import: 更新する取り込みエンティティ
+
+        Returns:
+            更新された取り込みエンティティ
+        """
+        pass
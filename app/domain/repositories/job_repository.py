@@ -0,0 +1,66 @@
+"""
+ドメインリポジトリインターフェイス: JobRepository
+
+ジョブの状態を参照・操作するリポジトリのインターフェイス（ポート）。
+ジョブの登録と実行はインフラストラクチャ層のジョブキューが行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from app.domain.models.job import Job, JobStatus
+
+
+class JobRepository(ABC):
+    """
+    ジョブリポジトリの抽象基底クラス
+    """
+
+    @abstractmethod
+    def get_by_id(self, job_id: int) -> Job | None:
+        """
+        IDでジョブを取得します。
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            ジョブエンティティ。見つからない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def list(
+        self,
+        status: JobStatus | None = None,
+        kind: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Job]:
+        """
+        ジョブの一覧を新しい順に取得します。
+
+        Args:
+            status: 状態でフィルタリング
+            kind: 種類でフィルタリング
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            ジョブエンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    def retry(self, job_id: int) -> Job | None:
+        """
+        失敗したジョブを試行回数をリセットして再登録します。
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            再登録したジョブ。見つからないか失敗状態でない場合はNone
+        """
+        pass
@@ -8,8 +8,17 @@ LLM応答の永続化を担当するリポジトリのインターフェイス
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.models.content_stats import (
+    ContentStats,
+    ContentStatsFilter,
+    ResponseSortKey,
+    SortOrder,
+)
 from app.domain.models.llm_response import LLMResponse
 
 
@@ -34,6 +43,19 @@ class LLMResponseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, response_ids: Sequence[UUID]) -> dict[UUID, LLMResponse]:
+        """
+        複数のIDでLLM応答をまとめて取得します。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+
+        Returns:
+            IDをキーとするLLM応答エンティティの辞書（存在しないIDは含まない）
+        """
+        pass
+
     @abstractmethod
     def list(self, skip: int = 0, limit: int = 100) -> list[LLMResponse]:
         """
@@ -56,6 +78,9 @@ class LLMResponseRepository(ABC):
         tags: list[str] | None = None,
         skip: int = 0,
         limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
     ) -> list[LLMResponse]:
         """
         LLM応答を検索します。
@@ -66,12 +91,312 @@ class LLMResponseRepository(ABC):
             tags: タグでフィルタ
             skip: スキップする件数
             limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
 
         Returns:
             検索条件に合致するLLM応答エンティティのリスト
         """
         pass
 
+    @abstractmethod
+    def get_projection(
+        self, response_id: UUID, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """
+        IDでLLM応答の指定フィールドのみを取得します。
+
+        指定されたフィールドに対応する列だけを読み込みます（id は常に含みます）。
+        "category" を指定した場合は所属カテゴリのエンティティを格納します。
+
+        Args:
+            response_id: 取得するLLM応答のID
+            fields: 取得するフィールド名（LLMResponse の属性名）
+
+        Returns:
+            フィールド名をキーとする辞書。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def get_many_projection(
+        self, response_ids: Sequence[UUID], fields: Sequence[str]
+    ) -> dict[UUID, dict[str, Any]]:
+        """
+        複数のIDでLLM応答の指定フィールドのみをまとめて取得します。
+
+        Args:
+            response_ids: 取得するLLM応答のIDリスト
+            fields: 取得するフィールド名（LLMResponse の属性名）
+
+        Returns:
+            IDをキーとする、フィールド名をキーとした辞書（存在しないIDは含まない）
+        """
+        pass
+
+    @abstractmethod
+    def search_projection(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """
+        LLM応答を検索し、指定フィールドのみを取得します。
+
+        検索条件は search() と同じです。条件をすべて省略すると list() と
+        同じ並び順の一覧になります。
+
+        Args:
+            fields: 取得するフィールド名（LLMResponse の属性名）
+            query: 検索クエリ（タイトル・プロンプト・内容で検索）
+            category_id: カテゴリIDでフィルタ
+            tags: タグでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+            stats_filter: 本文の統計情報でフィルタ
+            sort: 並べ替えキー
+            order: 並び順
+
+        Returns:
+            フィールド名をキーとする辞書のリスト
+        """
+        pass
+
+    @abstractmethod
+    def list_by_prompt(
+        self, prompt_id: UUID, skip: int = 0, limit: int = 100
+    ) -> list[LLMResponse]:
+        """
+        同じプロンプトのLLM応答を作成順に取得します。
+
+        Args:
+            prompt_id: プロンプトID
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            LLM応答エンティティのリスト
+        """
+        pass
+
+    @abstractmethod
+    def list_by_prompt_projection(
+        self,
+        prompt_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        同じプロンプトのLLM応答の指定フィールドのみを作成順に取得します。
+
+        Args:
+            prompt_id: プロンプトID
+            fields: 取得するフィールド名（LLMResponse の属性名）
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            フィールド名をキーとする辞書のリスト
+        """
+        pass
+
+    @abstractmethod
+    def list_missing_summary(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """
+        要約が未設定のLLM応答のIDと本文を、ID順に取得します。
+
+        Args:
+            limit: 取得する最大件数
+            after_id: このIDより後のものを取得する（キーセットページネーション）
+
+        Returns:
+            (ID, Markdown本文) のリスト
+        """
+        pass
+
+    @abstractmethod
+    def set_summary_if_empty(
+        self, response_id: UUID, summary: str, content_hash: str | None = None
+    ) -> bool:
+        """
+        要約が未設定の場合のみ、自動生成した要約を設定します。
+
+        利用者が設定した要約や、並行して更新された要約を上書きしないよう、
+        条件付きで1行だけを更新します。更新日時は変更しません。
+
+        Args:
+            response_id: 対象のLLM応答のID
+            summary: 設定する要約
+            content_hash: 要約の生成に使った本文のハッシュ（指定した場合、
+                要約の生成中に本文が更新されていれば設定しない）
+
+        Returns:
+            要約を設定した場合True、対象が存在しないか設定済みの場合False
+        """
+        pass
+
+    @abstractmethod
+    def list_missing_stats(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """
+        本文の統計情報が未算出のLLM応答のIDと本文を、ID順に取得します。
+
+        Args:
+            limit: 取得する最大件数
+            after_id: このIDより後のものを取得する（キーセットページネーション）
+
+        Returns:
+            (ID, Markdown本文) のリスト
+        """
+        pass
+
+    @abstractmethod
+    def set_stats_if_missing(
+        self, stats_by_id: Sequence[tuple[UUID, ContentStats]]
+    ) -> int:
+        """
+        本文の統計情報が未算出の場合のみ、統計情報をまとめて設定します。
+
+        並行して本文が更新された応答（更新時に統計情報が算出済みのもの）を
+        古い本文の統計情報で上書きしないよう、条件付きで更新します。
+        1回のトランザクションで設定し、更新日時は変更しません。
+
+        Args:
+            stats_by_id: (ID, 統計情報) のリスト
+
+        Returns:
+            統計情報を設定した件数
+        """
+        pass
+
+    @abstractmethod
+    def list_chunks(self, response_id: UUID) -> list[ContentChunk] | None:
+        """
+        LLM応答の本文のチャンク（セクション）の一覧を、位置順に取得します。
+
+        チャンクの本文（content）は読み込みません。
+
+        Args:
+            response_id: LLM応答のID
+
+        Returns:
+            本文を含まないチャンクのリスト。LLM応答が存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def get_chunk(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """
+        LLM応答の本文のチャンク（セクション）を1つ取得します。
+
+        Args:
+            response_id: LLM応答のID
+            position: チャンクの番号（0 始まり）
+
+        Returns:
+            本文を含むチャンク。存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def search_chunks(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """
+        本文のチャンク単位でLLM応答を検索します。
+
+        検索語を含むチャンクを、LLM応答の作成日時の新しい順、
+        同じ応答の中ではチャンクの位置順に返します。
+
+        Args:
+            query: 検索クエリ（チャンクの本文で検索）
+            category_id: カテゴリIDでフィルタ
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            チャンク単位の検索結果のリスト（スニペットは空）
+        """
+        pass
+
+    @abstractmethod
+    def list_missing_chunks(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """
+        本文のチャンクが未作成のLLM応答のIDと本文を、ID順に取得します。
+
+        本文が空のLLM応答は含みません。
+
+        Args:
+            limit: 取得する最大件数
+            after_id: このIDより後のものを取得する（キーセットページネーション）
+
+        Returns:
+            (ID, Markdown本文) のリスト
+        """
+        pass
+
+    @abstractmethod
+    def add_chunks_if_missing(
+        self, chunks_by_id: Sequence[tuple[UUID, list[ContentChunk]]]
+    ) -> int:
+        """
+        本文のチャンクが未作成の場合のみ、チャンクをまとめて保存します。
+
+        並行して本文が更新された応答（更新時にチャンクが作成済みのもの）を
+        古い本文のチャンクで上書きしないよう、チャンクのない応答のみに保存します。
+
+        Args:
+            chunks_by_id: (ID, チャンクのリスト) のリスト
+
+        Returns:
+            チャンクを保存したLLM応答の件数
+        """
+        pass
+
+    @abstractmethod
+    def find_content_hashes(self, content_hashes: Sequence[str]) -> set[str]:
+        """
+        指定した本文のハッシュのうち、既存のLLM応答の本文のものを返します。
+
+        Args:
+            content_hashes: 本文の SHA-256 ハッシュのリスト
+
+        Returns:
+            既存のLLM応答にあったハッシュの集合
+        """
+        pass
+
+    @abstractmethod
+    def create_many(self, responses: Sequence[LLMResponse]) -> int:
+        """
+        複数のLLM応答を1つのトランザクションで作成します。
+
+        Args:
+            responses: 作成するLLM応答エンティティのリスト
+
+        Returns:
+            作成した件数
+        """
+        pass
+
     @abstractmethod
     def create(self, response: LLMResponse) -> LLMResponse:
         """
@@ -0,0 +1,52 @@
+"""
+ドメインリポジトリインターフェイス: PromptRepository
+
+プロンプトを参照するリポジトリのインターフェイス（ポート）。
+プロンプトの作成と削除は、LLM応答の書き込みに合わせて
+LLMResponseRepository が同じトランザクションで行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.models.prompt import Prompt
+
+
+class PromptRepository(ABC):
+    """
+    プロンプトリポジトリの抽象基底クラス
+    """
+
+    @abstractmethod
+    def get_by_id(self, prompt_id: UUID) -> Prompt | None:
+        """
+        IDでプロンプトを取得します。
+
+        Args:
+            prompt_id: プロンプトID
+
+        Returns:
+            参照するLLM応答の数を設定したプロンプトエンティティ。
+            見つからない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def list(
+        self, min_responses: int = 1, skip: int = 0, limit: int = 100
+    ) -> list[Prompt]:
+        """
+        プロンプトの一覧を、参照するLLM応答の多い順に取得します。
+
+        Args:
+            min_responses: 参照するLLM応答の最小数（2 を指定すると、複数の応答を
+                比較できるプロンプトのみを取得する）
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            参照するLLM応答の数を設定したプロンプトエンティティのリスト
+        """
+        pass
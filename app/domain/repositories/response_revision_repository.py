@@ -0,0 +1,49 @@
+"""
+ドメインリポジトリインターフェイス: ResponseRevisionRepository
+
+LLM応答の本文の版（リビジョン）を参照するリポジトリのインターフェイス（ポート）。
+版の記録は、本文の更新に合わせて LLMResponseRepository が同じトランザクションで
+行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.models.response_revision import ResponseRevision
+
+
+class ResponseRevisionRepository(ABC):
+    """
+    LLM応答リビジョンリポジトリの抽象基底クラス
+    """
+
+    @abstractmethod
+    def list(self, response_id: UUID) -> list[ResponseRevision] | None:
+        """
+        LLM応答の本文の版の一覧を、番号順に取得します。
+
+        本文は復元しません。本文を一度も更新していないLLM応答では空のリストです。
+
+        Args:
+            response_id: LLM応答のID
+
+        Returns:
+            本文を含まない版のリスト。LLM応答が存在しない場合はNone
+        """
+        pass
+
+    @abstractmethod
+    def get(self, response_id: UUID, number: int) -> ResponseRevision | None:
+        """
+        LLM応答の本文の版を、本文を復元して取得します。
+
+        Args:
+            response_id: LLM応答のID
+            number: 版の番号
+
+        Returns:
+            本文を含む版。存在しない場合はNone
+        """
+        pass
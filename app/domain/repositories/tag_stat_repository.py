@@ -0,0 +1,52 @@
+"""
+ドメインリポジトリインターフェイス: TagStatRepository
+
+タグの使用状況を参照するリポジトリのインターフェイス（ポート）。
+使用状況の更新は、LLM応答の書き込みに合わせて LLMResponseRepository が
+同じトランザクションで行います。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from app.domain.models.tag_stat import TagSortKey, TagStat
+
+
+class TagStatRepository(ABC):
+    """
+    タグ統計リポジトリの抽象基底クラス
+    """
+
+    @abstractmethod
+    def list(
+        self, sort: TagSortKey = TagSortKey.COUNT, skip: int = 0, limit: int = 100
+    ) -> list[TagStat]:
+        """
+        タグの使用状況の一覧を取得します。
+
+        Args:
+            sort: 並べ替えキー
+            skip: スキップする件数
+            limit: 取得する最大件数
+
+        Returns:
+            タグの使用状況のリスト
+        """
+        pass
+
+    @abstractmethod
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[TagStat]:
+        """
+        指定した文字列で始まるタグを、LLM応答の多い順に取得します。
+
+        大文字と小文字は区別します。
+
+        Args:
+            prefix: タグの先頭の文字列
+            limit: 取得する最大件数
+
+        Returns:
+            タグの使用状況のリスト
+        """
+        pass
@@ -0,0 +1,239 @@
+"""
+ドメインサービス: 本文のチャンク分割
+
+Markdown 本文を、見出しごと・一定の長さごとのチャンクに分割します。
+フェンスで囲まれたコードブロックは途中で分割しません。
+外部ライブラリに依存せず、行単位の走査のみで処理します。
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from app.domain.models.content_chunk import ContentChunk
+from app.domain.services.content_stats import FENCE_PATTERN
+
+# 1チャンクの目安の最大文字数（見出しやコードブロックの途中では分割しない）
+MAX_CHUNK_CHARS = 4000
+
+# ATX 見出し（見出しの文字列と、末尾の閉じ # を除いた部分を取り出す）
+_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+
+
+@dataclass(slots=True)
+class _Block:
+    """分割できない単位（見出し行・コードブロック・段落）"""
+
+    start: int
+    text: str
+    heading: str | None = None
+    heading_level: int | None = None
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+class _Lines:
+    """1行先読みできる行のイテレーター"""
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._next: str | None = next(self._lines, None)
+
+    def peek(self) -> str | None:
+        """次の行を返します（読み進めません）。終端ではNone"""
+        return self._next
+
+    def pop(self) -> str:
+        """次の行を返して読み進めます"""
+        line = self._next
+        assert line is not None
+        self._next = next(self._lines, None)
+        return line
+
+
+def _blocks(lines: Iterable[str], max_chars: int) -> Iterator[_Block]:
+    """
+    本文を見出し行・コードブロック・段落のブロックに分けます。
+
+    段落は空行で区切り、後続の空行を含めます。max_chars を超える段落は
+    行ごとに（1行が超える場合は文字数で）さらに分けます。ブロックを作るたびに
+    返すため、コードブロック以外は段落が長くても全体をメモリに載せません。
+
+    Args:
+        lines: 改行文字を含む本文の各行
+        max_chars: 1チャンクの最大文字数
+
+    Yields:
+        本文を先頭から隙間なく覆うブロック
+    """
+    source = _Lines(lines)
+    position = 0
+    while (line := source.peek()) is not None:
+        fence = FENCE_PATTERN.match(line)
+        if fence:
+            # 閉じフェンス（同じ文字で同じ長さ以上、言語名なし）まで、または末尾まで
+            marker = fence.group(1)
+            parts = [source.pop()]
+            while source.peek() is not None:
+                parts.append(source.pop())
+                closing = FENCE_PATTERN.match(parts[-1])
+                if (
+                    closing
+                    and closing.group(1).startswith(marker)
+                    and not closing.group(2)
+                ):
+                    break
+            block = _Block(position, "".join(parts))
+            position = block.end
+            yield block
+            continue
+
+        heading = _HEADING.match(line.rstrip("\r\n"))
+        if heading:
+            source.pop()
+            yield _Block(
+                position,
+                line,
+                heading=(heading.group(2) or "").strip(),
+                heading_level=len(heading.group(1)),
+            )
+            position += len(line)
+            continue
+
+        # 段落: 次の見出し・コードブロック、または空行の後の本文の手前まで
+        # max_chars を超える場合は、行の境界（1行が超える場合は文字数）で分ける
+        seen_blank = False
+        piece: list[str] = []
+        size = 0
+        while (line := source.peek()) is not None:
+            if FENCE_PATTERN.match(line) or _HEADING.match(line.rstrip("\r\n")):
+                break
+            blank = not line.strip()
+            if seen_blank and not blank:
+                break
+            seen_blank = seen_blank or blank
+            source.pop()
+            if piece and size + len(line) > max_chars:
+                yield _Block(position, "".join(piece))
+                position += size
+                piece = []
+                size = 0
+            while len(line) > max_chars:
+                yield _Block(position, line[:max_chars])
+                position += max_chars
+                line = line[max_chars:]
+            piece.append(line)
+            size += len(line)
+        yield _Block(position, "".join(piece))
+        position += size
+
+
+def split_into_chunks(
+    content_md: str, max_chars: int = MAX_CHUNK_CHARS
+) -> list[ContentChunk]:
+    """
+    Markdown 本文をチャンクに分割します。
+
+    見出し行ごとに新しいチャンクを始め、見出しの下の本文が max_chars を
+    超える場合は、段落・コードブロックの境界で同じ見出しの続きのチャンクに
+    分けます。コードブロックは max_chars を超えても分割しません。
+
+    Args:
+        content_md: Markdown 文字列
+        max_chars: 1チャンクの最大文字数の目安
+
+    Returns:
+        本文を先頭から隙間なく覆うチャンクのリスト（本文が空の場合は空リスト）
+    """
+    return list(iter_chunks(content_md.splitlines(keepends=True), max_chars))
+
+
+def iter_chunks(
+    lines: Iterable[str], max_chars: int = MAX_CHUNK_CHARS
+) -> Iterator[ContentChunk]:
+    """
+    1行ずつ与えられた Markdown 本文を、split_into_chunks() と同じ規則で
+    チャンクに分割します。
+
+    チャンクを作るたびに返すため、本文全体をメモリに載せずに分割できます。
+
+    Args:
+        lines: 改行文字を含む本文の各行
+        max_chars: 1チャンクの最大文字数の目安
+
+    Yields:
+        本文を先頭から隙間なく覆うチャンク
+    """
+    position = 0
+    heading: str | None = None
+    heading_level: int | None = None
+    start = 0
+    parts: list[str] = []
+    size = 0
+    has_body = False
+
+    for block in _blocks(lines, max_chars):
+        starts_chunk = block.heading_level is not None or (
+            # 見出しだけのチャンクは作らず、本文が1ブロック以上ある場合に分ける
+            has_body and size + len(block.text) > max_chars
+        )
+        if starts_chunk and parts:
+            yield ContentChunk(
+                position=position,
+                start_offset=start,
+                end_offset=start + size,
+                heading=heading,
+                heading_level=heading_level,
+                content="".join(parts),
+            )
+            position += 1
+            parts = []
+            size = 0
+        if not parts:
+            start = block.start
+        if block.heading_level is not None:
+            heading = block.heading
+            heading_level = block.heading_level
+            has_body = False
+        else:
+            has_body = True
+        parts.append(block.text)
+        size += len(block.text)
+
+    if parts:
+        yield ContentChunk(
+            position=position,
+            start_offset=start,
+            end_offset=start + size,
+            heading=heading,
+            heading_level=heading_level,
+            content="".join(parts),
+        )
+
+
+def make_snippet(text: str, query: str, width: int = 160) -> str:
+    """
+    検索語の前後を切り出したスニペットを作成します。
+
+    Args:
+        text: 切り出す対象の文字列
+        query: 検索語（大文字・小文字を区別せずに探す）
+        width: スニペットの最大文字数
+
+    Returns:
+        検索語を中心に切り出した文字列。前後を省略した場合は「…」を付ける
+    """
+    found = text.lower().find(query.lower()) if query else -1
+    if found < 0:
+        found = 0
+    start = max(0, found - (width - len(query)) // 2)
+    end = min(len(text), start + width)
+    start = max(0, end - width)
+    snippet = " ".join(text[start:end].split())
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return f"{prefix}{snippet}{suffix}"
@@ -0,0 +1,60 @@
+"""
+ドメインサービス: 本文の差分
+
+2つの版の本文（Markdown）の行単位の差分を算出し、差分から本文を復元します。
+差分は「元の本文の行範囲をコピーする操作」と「文字列を挿入する操作」の
+リストで、元の本文から削除された行はどの操作にも含まれません。
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+# 差分の操作: [開始行, 終了行]（元の本文の行をコピー）または文字列（挿入）
+type DeltaOperation = list[int] | str
+
+
+def compute_delta(base: str, target: str) -> list[DeltaOperation]:
+    """
+    元の本文から新しい本文を作る差分を算出します。
+
+    Args:
+        base: 元の本文
+        target: 新しい本文
+
+    Returns:
+        差分の操作のリスト（apply_delta(base, 差分) が target と一致する）
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    matcher = SequenceMatcher(None, base_lines, target_lines)
+    delta: list[DeltaOperation] = []
+    for tag, base_start, base_end, target_start, target_end in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append([base_start, base_end])
+        elif target_start < target_end:
+            # 置換・挿入（削除のみの場合は何も追加しない）
+            delta.append("".join(target_lines[target_start:target_end]))
+    return delta
+
+
+def apply_delta(base: str, delta: list[DeltaOperation]) -> str:
+    """
+    元の本文に差分を適用し、新しい本文を復元します。
+
+    Args:
+        base: 元の本文（compute_delta() に渡したもの）
+        delta: compute_delta() が返した差分
+
+    Returns:
+        復元した本文
+    """
+    base_lines = base.splitlines(keepends=True)
+    parts: list[str] = []
+    for operation in delta:
+        if isinstance(operation, str):
+            parts.append(operation)
+        else:
+            start, end = operation
+            parts.extend(base_lines[start:end])
+    return "".join(parts)
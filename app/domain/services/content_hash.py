@@ -0,0 +1,24 @@
+"""
+本文のハッシュ算出サービス
+
+本文の重複を検出するための SHA-256 ハッシュを算出します。
+本文ストレージに保存した本文のハッシュ（StoredContent.sha256）と同じく、
+UTF-8 でエンコードしたバイト列のハッシュです。
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def compute_content_hash(content_md: str) -> str:
+    """
+    本文の SHA-256 ハッシュを算出します。
+
+    Args:
+        content_md: 本文（Markdown形式）
+
+    Returns:
+        16進数表記のハッシュ（64文字）
+    """
+    return hashlib.sha256(content_md.encode("utf-8")).hexdigest()
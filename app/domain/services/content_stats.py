@@ -0,0 +1,144 @@
+"""
+ドメインサービス: 本文の統計情報の算出
+
+Markdown 本文（または本文の各行）から ContentStats を算出します。
+外部ライブラリに依存せず、行単位の走査と正規表現のみで処理します。
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from app.domain.models.content_stats import ContentStats
+
+# コードフェンスの開始・終了行（``` または ~~~ を3文字以上、インデント3文字まで）
+FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)")
+# ATX 見出し（# から ###### まで）
+HEADING_PATTERN = re.compile(r"^ {0,3}#{1,6}(?:\s|$)")
+# インラインコード（中のリンク記法は数えない）
+_CODE_SPAN = re.compile(r"`[^`\n]*`")
+# インラインリンク [text](url)（画像 ![alt](src) は除く）と自動リンク <https://...>
+_LINK = re.compile(r"(?<!!)\[[^\]\n]*\]\([^)\s]+[^)]*\)|<https?://[^>\s]+>")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    テキストのトークン数を概算します。
+
+    英数字などの ASCII 文字は 4 文字で 1 トークン、日本語などの非 ASCII 文字は
+    1 文字で 1 トークンとして数えます（一般的なトークナイザーでの平均に近い値）。
+
+    Args:
+        text: 対象のテキスト
+
+    Returns:
+        推定トークン数
+    """
+    ascii_count = len(text.encode("ascii", "ignore"))
+    non_ascii_count = len(text) - ascii_count
+    return -(-ascii_count // 4) + non_ascii_count
+
+
+def _scan_structure(lines: Iterable[str]) -> dict[str, Any]:
+    """
+    本文の各行から、コードブロック・見出し・リンクを数えます。
+
+    見出しとリンクはコードブロックの外側のみを数えます。
+
+    Args:
+        lines: 本文の各行（改行文字の有無は問わない）
+
+    Returns:
+        ContentStats の code_block_count・code_languages・heading_count・
+        link_count の値
+    """
+    code_block_count = 0
+    languages: dict[str, None] = {}
+    heading_count = 0
+    link_count = 0
+    fence: str | None = None
+
+    for line in lines:
+        match = FENCE_PATTERN.match(line)
+        if fence is not None:
+            # 開始と同じ文字で、同じ長さ以上のフェンスのみが閉じる
+            if match and match.group(1).startswith(fence) and not match.group(2):
+                fence = None
+            continue
+        if match:
+            fence = match.group(1)
+            code_block_count += 1
+            language = match.group(2).strip("{}.").lower()
+            if language:
+                languages[language] = None
+            continue
+        if HEADING_PATTERN.match(line):
+            heading_count += 1
+        if "[" in line or "<" in line:
+            link_count += len(_LINK.findall(_CODE_SPAN.sub("", line)))
+
+    return {
+        "code_block_count": code_block_count,
+        "code_languages": list(languages),
+        "heading_count": heading_count,
+        "link_count": link_count,
+    }
+
+
+def compute_content_stats(content_md: str) -> ContentStats:
+    """
+    Markdown 本文の統計情報を算出します。
+
+    見出しとリンクはコードブロックの外側のみを数えます。
+
+    Args:
+        content_md: Markdown 文字列
+
+    Returns:
+        本文の統計情報
+    """
+    return ContentStats(
+        char_count=len(content_md),
+        byte_count=len(content_md.encode("utf-8")),
+        token_estimate=estimate_tokens(content_md),
+        **_scan_structure(content_md.splitlines()),
+    )
+
+
+def compute_content_stats_from_lines(lines: Iterable[str]) -> ContentStats:
+    """
+    1行ずつ与えられた Markdown 本文の統計情報を算出します。
+
+    本文全体をメモリに載せずに、ストレージから読み出しながら算出できます。
+    結果は各行を連結した本文に compute_content_stats() を適用した場合と同じです。
+
+    Args:
+        lines: 改行文字を含む本文の各行
+
+    Returns:
+        本文の統計情報
+    """
+    char_count = 0
+    byte_count = 0
+    ascii_count = 0
+
+    def measured() -> Iterator[str]:
+        nonlocal char_count, byte_count, ascii_count
+        for line in lines:
+            line_ascii = len(line.encode("ascii", "ignore"))
+            char_count += len(line)
+            ascii_count += line_ascii
+            byte_count += (
+                line_ascii if line_ascii == len(line) else len(line.encode("utf-8"))
+            )
+            yield line
+
+    structure = _scan_structure(measured())
+    return ContentStats(
+        char_count=char_count,
+        byte_count=byte_count,
+        token_estimate=-(-ascii_count // 4) + (char_count - ascii_count),
+        **structure,
+    )
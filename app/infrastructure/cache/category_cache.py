@@ -0,0 +1,97 @@
+"""
+カテゴリキャッシュモジュール
+
+件数が少なく更新頻度も低いカテゴリテーブルを、プロセス内メモリに
+まるごと保持するキャッシュを提供します。
+LLM応答の読み取り時にカテゴリ参照を追加クエリなしで埋め込むために使用します。
+他ワーカーでの変更は ChangeTracker の通知を受けて無効化します。
+"""
+
+from __future__ import annotations
+
+import threading
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.models.category import Category
+from app.infrastructure.cache.coherence import CATEGORIES_SCOPE, change_tracker
+from app.infrastructure.db.models import CategoryORM
+
+
+class CategoryCache:
+    """
+    プロセス内カテゴリキャッシュ
+
+    カテゴリ全件をIDをキーとした辞書で保持します。
+    無効化された後の最初の参照時に全件を再読み込みします。
+    """
+
+    def __init__(self) -> None:
+        """キャッシュを未ロード状態で初期化します。"""
+        self._lock = threading.Lock()
+        self._categories: dict[UUID, Category] | None = None
+
+    def load(self, db: Session) -> None:
+        """
+        カテゴリ全件をDBから読み込みます。
+
+        Args:
+            db: データベースセッション
+        """
+        with self._lock:
+            self._load(db)
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄し、次回参照時に再読み込みさせます。"""
+        with self._lock:
+            self._categories = None
+
+    def snapshot(self, db: Session) -> dict[UUID, Category]:
+        """
+        カテゴリ辞書を取得します。
+
+        未ロード（または無効化済み）の場合は全件を読み込みます。
+        返した辞書は置き換えられるだけで変更されないため、
+        呼び出し側はロックなしで参照できます。
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            カテゴリIDをキー、カテゴリエンティティを値とする辞書
+        """
+        categories = self._categories
+        if categories is not None:
+            return categories
+
+        with self._lock:
+            # ロック待ちの間に他スレッドが読み込んでいる可能性がある
+            if self._categories is None:
+                self._load(db)
+            return self._categories
+
+    def _load(self, db: Session) -> None:
+        """
+        ロック取得済みの状態でカテゴリ全件を読み込みます。
+
+        Args:
+            db: データベースセッション
+        """
+        categories = [
+            Category(
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in db.execute(select(CategoryORM.__table__))
+        ]
+        self._categories = {category.id: category for category in categories}
+
+
+# グローバルなカテゴリキャッシュインスタンス
+category_cache = CategoryCache()
+change_tracker.subscribe(CATEGORIES_SCOPE, category_cache.invalidate)
@@ -0,0 +1,103 @@
+"""
+キャッシュ整合性（コヒーレンス）モジュール
+
+複数の uvicorn ワーカーで動作する場合、各プロセスのインメモリキャッシュは
+他プロセスでの書き込みを知ることができません。
+このモジュールは change_versions テーブルにスコープごとの単調増加する
+バージョン番号を保持し、リポジトリの書き込みでインクリメントします。
+各プロセスはリクエストごとに1回だけバージョンを確認し、変化したスコープの
+購読者（キャッシュの無効化処理など）を呼び出します。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models import ChangeVersionORM
+
+logger = logging.getLogger(__name__)
+
+# 変更バージョンを管理するスコープ名
+CATEGORIES_SCOPE = "categories"
+LLM_RESPONSES_SCOPE = "llm_responses"
+
+
+class ChangeTracker:
+    """
+    変更バージョンの追跡と購読者への通知を行うクラス
+
+    書き込み側は bump() で同一トランザクション内にバージョンを進め、
+    読み取り側は sync() で最後に確認したバージョンと比較します。
+    """
+
+    def __init__(self) -> None:
+        """追跡状態を空で初期化します。"""
+        self._lock = threading.Lock()
+        self._seen: dict[str, int] = {}
+        self._subscribers: dict[str, list[Callable[[], None]]] = defaultdict(list)
+
+    def subscribe(self, scope: str, callback: Callable[[], None]) -> None:
+        """
+        スコープの変更通知を購読します。
+
+        Args:
+            scope: 購読するスコープ名
+            callback: 変更検知時に呼び出す関数（キャッシュの無効化など）
+        """
+        self._subscribers[scope].append(callback)
+
+    def bump(self, db: Session, scope: str) -> None:
+        """
+        スコープの変更バージョンをインクリメントします。
+
+        書き込みと同じトランザクション内で呼び出し、コミットは呼び出し側で行います。
+
+        Args:
+            db: データベースセッション
+            scope: 変更されたスコープ名
+        """
+        result = db.execute(
+            update(ChangeVersionORM)
+            .where(ChangeVersionORM.scope == scope)
+            .values(version=ChangeVersionORM.version + 1)
+        )
+        if result.rowcount == 0:
+            # 初回の書き込み時のみ行を作成する
+            db.add(ChangeVersionORM(scope=scope, version=1))
+            db.flush()
+
+    def sync(self, db: Session) -> None:
+        """
+        全スコープのバージョンを確認し、変化したスコープの購読者に通知します。
+
+        change_versions はスコープ数分の行しかないため、1回の SELECT で済みます。
+        リクエストの開始時（またはバックグラウンド処理の単位ごと）に1回呼び出します。
+
+        Args:
+            db: データベースセッション
+        """
+        versions = dict(
+            db.execute(select(ChangeVersionORM.scope, ChangeVersionORM.version)).all()
+        )
+
+        changed: list[str] = []
+        with self._lock:
+            for scope, version in versions.items():
+                if self._seen.get(scope, 0) != version:
+                    self._seen[scope] = version
+                    changed.append(scope)
+
+        for scope in changed:
+            logger.debug(f"変更を検知: scope={scope}, version={versions[scope]}")
+            for callback in self._subscribers.get(scope, []):
+                callback()
+
+
+# グローバルな変更追跡インスタンス
+change_tracker = ChangeTracker()
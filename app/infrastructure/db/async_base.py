@@ -0,0 +1,123 @@
+"""
+非同期データベース基盤モジュール
+
+SQLAlchemy の非同期エンジンとセッションを定義します。
+DATABASE_ASYNC=true の場合に使用します。
+非同期ドライバー（aiosqlite など）はオプション依存のため、このモジュールは
+非同期のエンドポイントを使用する場合にのみインポートします。
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config.settings import settings
+from app.infrastructure.db.deadline import install_query_deadlines
+from app.infrastructure.db.engine_profile import (
+    engine_options,
+    install_sqlite_pragmas,
+    read_url,
+)
+
+# 同期ドライバーから非同期ドライバーへの対応表
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    同期ドライバーのデータベースURLを非同期ドライバーのURLに変換します。
+
+    ドライバーが明示されている場合（例: sqlite+aiosqlite://）はそのまま返します。
+
+    Args:
+        url: データベースURL
+
+    Returns:
+        非同期ドライバーのデータベースURL
+    """
+    parsed = make_url(url)
+    if parsed.drivername not in _ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=_ASYNC_DRIVERS[parsed.drivername]).render_as_string(
+        hide_password=False
+    )
+
+
+# SQLAlchemy 非同期エンジンの作成
+_async_url = to_async_url(settings.ASYNC_DATABASE_URL or settings.DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    echo=settings.APP_ENV == "development",  # 開発環境ではSQLをログ出力
+    **engine_options(_async_url),
+)
+
+# SQLite の接続ごとの PRAGMA（WAL など）を適用する
+install_sqlite_pragmas(async_engine.sync_engine)
+
+# リクエスト単位のクエリ期限を適用する
+install_query_deadlines(async_engine.sync_engine)
+
+# 読み取り専用の非同期エンジンの作成（分離しない場合は書き込み用を共用する）
+_async_read_url = (
+    read_url(_async_url, settings.DATABASE_READ_URL)
+    if settings.DATABASE_SPLIT_READS
+    else None
+)
+if _async_read_url is None:
+    async_read_engine = async_engine
+else:
+    _async_read_url = to_async_url(_async_read_url)
+    async_read_engine = create_async_engine(
+        _async_read_url,
+        echo=settings.APP_ENV == "development",
+        **engine_options(_async_read_url),
+    )
+    install_sqlite_pragmas(async_read_engine.sync_engine, read_only=True)
+    install_query_deadlines(async_read_engine.sync_engine)
+
+# 非同期セッションファクトリの作成
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# 読み取り専用の非同期セッションファクトリの作成
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    非同期データベースセッションを取得するジェネレータ
+
+    FastAPIの依存関数として使用します。
+
+    Yields:
+        AsyncSession: 非同期データベースセッション
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    読み取り専用の非同期データベースセッションを取得するジェネレータ
+
+    書き込みを行わないリクエストで使用します。
+
+    Yields:
+        AsyncSession: 読み取り専用エンジンに接続した非同期データベースセッション
+    """
+    async with AsyncReadSessionLocal() as db:
+        yield db
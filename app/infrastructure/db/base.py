@@ -6,10 +6,20 @@ from __future__ import annotations
 SQLAlchemyのエンジン、セッション、ベースクラスを定義します。
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config.settings import settings
+from app.infrastructure.db.column_migration import add_missing_columns
+from app.infrastructure.db.deadline import install_query_deadlines
+from app.infrastructure.db.engine_profile import (
+    engine_options,
+    install_sqlite_pragmas,
+    read_url,
+)
+from app.infrastructure.db.prompt_migration import migrate_prompts
+from app.infrastructure.db.tag_stats_migration import migrate_tag_stats
+from app.infrastructure.db.uuid_migration import migrate_uuid_keys
 
 # SQLAlchemy エンジンの作成
 engine = create_engine(
@@ -18,7 +28,32 @@ engine = create_engine(
     connect_args={"check_same_thread": False}
     if "sqlite" in settings.DATABASE_URL
     else {},
+    **engine_options(settings.DATABASE_URL),
+)
+
+# SQLite の接続ごとの PRAGMA（WAL など）を適用する
+install_sqlite_pragmas(engine)
+
+# リクエスト単位のクエリ期限を適用する
+install_query_deadlines(engine)
+
+# 読み取り専用エンジンの作成（分離しない場合は書き込み用エンジンを共用する）
+_read_url = (
+    read_url(settings.DATABASE_URL, settings.DATABASE_READ_URL)
+    if settings.DATABASE_SPLIT_READS
+    else None
 )
+if _read_url is None:
+    read_engine = engine
+else:
+    read_engine = create_engine(
+        _read_url,
+        echo=settings.APP_ENV == "development",
+        connect_args={"check_same_thread": False} if "sqlite" in _read_url else {},
+        **engine_options(_read_url),
+    )
+    install_sqlite_pragmas(read_engine, read_only=True)
+    install_query_deadlines(read_engine)
 
 # セッションファクトリの作成
 SessionLocal = sessionmaker(
@@ -27,6 +62,13 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# 読み取り専用セッションファクトリの作成（読み取りのユースケースや変更通知で使用）
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine,
+)
+
 
 class Base(DeclarativeBase):
     """
@@ -54,11 +96,36 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """
+    読み取り専用のデータベースセッションを取得するジェネレータ
+
+    書き込みを行わないリクエストで使用します。
+
+    Yields:
+        Session: 読み取り専用エンジンに接続したデータベースセッション
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def init_db() -> None:
     """
     データベースを初期化します。
 
-    すべてのテーブルを作成します。
+    すべてのテーブルを作成し、既存のテーブルに不足している列を追加して、
+    文字列で保存された既存の UUID キーを 16 バイトの表現に、LLM応答ごとに
+    保存されたプロンプトを prompts テーブルに移行します。tag_stats テーブルを
+    新しく作成した場合は、既存のLLM応答のタグを集計して保存します。
     本番環境ではAlembicマイグレーションを使用することを推奨します。
     """
+    existing_tables = set(inspect(engine).get_table_names())
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine, Base.metadata)
+    migrate_uuid_keys(engine)
+    migrate_prompts(engine)
+    if "tag_stats" not in existing_tables:
+        migrate_tag_stats(engine)
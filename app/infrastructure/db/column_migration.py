@@ -0,0 +1,68 @@
+"""
+列追加の移行モジュール
+
+create_all() は既存のテーブルに列を追加しないため、モデルに追加された
+列のうちデータベースに存在しないものを ALTER TABLE で追加し、
+その列のインデックスを作成します。init_db() から呼び出され、
+追加する列がない場合は何もしません。
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def add_missing_columns(engine: Engine, metadata: MetaData) -> int:
+    """
+    既存のテーブルに不足している列とインデックスを追加します。
+
+    追加できるのは NULL を許可する列のみです（既存の行に値を設定できないため）。
+    NOT NULL の列が不足している場合は警告を出力して追加しません。
+
+    Args:
+        engine: 移行するデータベースのエンジン
+        metadata: テーブル定義を持つメタデータ
+
+    Returns:
+        追加した列の数
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    preparer = engine.dialect.identifier_preparer
+    added = 0
+    with engine.begin() as connection:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {info["name"] for info in inspector.get_columns(table.name)}
+            missing = [
+                column for column in table.columns if column.name not in existing
+            ]
+            if not missing:
+                continue
+            for column in missing:
+                if not column.nullable:
+                    logger.warning(
+                        "NOT NULL の列は自動で追加できません: "
+                        f"{table.name}.{column.name}"
+                    )
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                )
+                added += 1
+            # 追加した列のインデックスは create_all() では作成されない
+            names = {column.name for column in missing}
+            for index in table.indexes:
+                if names & {column.name for column in index.columns}:
+                    index.create(connection, checkfirst=True)
+    if added:
+        logger.info(f"不足していた列を追加しました: {added} 列")
+    return added
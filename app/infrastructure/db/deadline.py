@@ -0,0 +1,186 @@
+"""
+クエリ期限モジュール
+
+リクエスト単位のクエリの制限時間（期限）を管理し、期限切れや
+クライアントの切断時に実行中のクエリを中断します。
+
+期限はコンテキスト変数で保持するため、スレッドプールで実行される
+エンドポイントやリポジトリに引数で渡す必要はありません。
+SQLite では set_progress_handler で実行中のクエリを中断し、
+PostgreSQL / MySQL ではサーバー側のステートメントタイムアウトを設定します。
+いずれの場合も、期限切れ後に発行される文は実行前に拒否します。
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# SQLite の進捗ハンドラーを呼び出す間隔（仮想マシンの命令数）
+_PROGRESS_INTERVAL = 1000
+
+# ステートメントタイムアウトを設定した期限を記録する接続情報のキー
+_APPLIED_KEY = "query_deadline_applied"
+
+
+class QueryDeadlineExceededError(Exception):
+    """クエリが期限切れ、またはクライアントの切断で中断されたことを示す例外"""
+
+    def __init__(self, deadline: QueryDeadline) -> None:
+        """
+        Args:
+            deadline: 中断の原因となった期限
+        """
+        self.deadline = deadline
+        reason = (
+            "クライアントが切断しました"
+            if deadline.cancelled
+            else "制限時間を超えました"
+        )
+        super().__init__(
+            f"クエリを中断しました: {reason}（{deadline.timeout_seconds}秒）"
+        )
+
+
+class QueryDeadline:
+    """
+    1リクエストのクエリの期限
+
+    制限時間は最初の文の実行時から数えます。アドミッション制御の待ち行列で
+    待った時間や、クエリを発行するまでの処理の時間は含みません。
+    """
+
+    def __init__(self, timeout_seconds: float) -> None:
+        """
+        Args:
+            timeout_seconds: 制限時間（秒）
+        """
+        self.timeout_seconds = timeout_seconds
+        self.expires_at: float | None = None
+        self.cancelled = False
+
+    def start(self) -> None:
+        """期限の計測を開始します（開始済みの場合は何もしません）。"""
+        if self.expires_at is None:
+            self.expires_at = time.monotonic() + self.timeout_seconds
+
+    def cancel(self) -> None:
+        """期限を待たずにクエリを中断させます（クライアントの切断時など）。"""
+        self.cancelled = True
+
+    @property
+    def exceeded(self) -> bool:
+        """期限切れ、または中断済みかどうか"""
+        if self.cancelled:
+            return True
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def remaining_ms(self) -> int:
+        """残り時間（ミリ秒、最低1）"""
+        self.start()
+        return max(1, int((self.expires_at - time.monotonic()) * 1000))
+
+
+_current: ContextVar[QueryDeadline | None] = ContextVar("query_deadline", default=None)
+
+
+def set_query_deadline(deadline: QueryDeadline | None) -> None:
+    """
+    現在のコンテキストのクエリ期限を設定します。
+
+    以降にこのコンテキスト（コピーされたスレッドを含む）で実行されるクエリに適用されます。
+
+    Args:
+        deadline: クエリ期限（Noneで解除）
+    """
+    _current.set(deadline)
+
+
+def _interrupt_if_exceeded() -> int:
+    """SQLite の進捗ハンドラー（0以外を返すとクエリが中断される）"""
+    deadline = _current.get()
+    return 1 if deadline is not None and deadline.exceeded else 0
+
+
+def install_query_deadlines(engine: Engine) -> None:
+    """
+    エンジンにクエリ期限を適用するイベントを登録します。
+
+    Args:
+        engine: SQLAlchemy エンジン
+    """
+    dialect = engine.dialect.name
+
+    # 非同期ドライバー（aiosqlite）はドライバーのスレッドでクエリを実行するため、
+    # 進捗ハンドラーからリクエストの期限を参照できない（文の実行前にのみ確認する）
+    if dialect == "sqlite" and not engine.dialect.is_async:
+
+        @event.listens_for(engine, "connect")
+        def _set_progress_handler(dbapi_connection: Any, _record: Any) -> None:
+            dbapi_connection.set_progress_handler(
+                _interrupt_if_exceeded, _PROGRESS_INTERVAL
+            )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _check_deadline(conn, cursor, statement, parameters, context, executemany):
+        deadline = _current.get()
+        if deadline is None:
+            return
+        deadline.start()
+        if deadline.exceeded:
+            raise QueryDeadlineExceededError(deadline)
+        if (
+            dialect in ("postgresql", "mysql")
+            and conn.info.get(_APPLIED_KEY) is not deadline
+        ):
+            # 残り時間をサーバー側のタイムアウトとして設定する（期限ごとに1回）
+            if dialect == "postgresql":
+                cursor.execute(f"SET statement_timeout = {deadline.remaining_ms()}")
+            else:
+                cursor.execute(
+                    f"SET SESSION max_execution_time = {deadline.remaining_ms()}"
+                )
+            conn.info[_APPLIED_KEY] = deadline
+
+    if dialect in ("postgresql", "mysql"):
+
+        @event.listens_for(engine, "checkin")
+        def _reset_timeout(dbapi_connection: Any, record: Any) -> None:
+            # 期限を設定した接続は、プールに戻すときにタイムアウトを解除する
+            if record.info.pop(_APPLIED_KEY, None) is None:
+                return
+            cursor = dbapi_connection.cursor()
+            if dialect == "postgresql":
+                cursor.execute("SET statement_timeout = 0")
+            else:
+                cursor.execute("SET SESSION max_execution_time = 0")
+            cursor.close()
+
+
+def is_interrupted(error: BaseException) -> bool:
+    """
+    例外がクエリ期限による中断によるものかどうかを判定します。
+
+    Args:
+        error: 発生した例外（SQLAlchemy の DBAPIError を含む）
+
+    Returns:
+        現在の期限が切れている、または中断済みで、例外がクエリの中断を示す場合はTrue
+    """
+    deadline = _current.get()
+    if deadline is None or not deadline.exceeded:
+        return False
+    if isinstance(error, QueryDeadlineExceededError):
+        return True
+    # SQLite: "interrupted"、PostgreSQL: QueryCanceled、MySQL: 3024
+    orig = getattr(error, "orig", None)
+    message = str(orig or error).lower()
+    return (
+        "interrupted" in message
+        or "canceling statement" in message
+        or "maximum statement execution time" in message
+    )
@@ -0,0 +1,128 @@
+"""
+エンジンプロファイルモジュール
+
+設定値からエンジンのコネクションプールの引数を組み立て、
+SQLite の接続ごとの PRAGMA を適用します。
+
+既定では WAL モードで読み取りと書き込みを並行させ、synchronous=NORMAL で
+コミットごとの fsync を省略します（WAL では電源断時に直近のコミットが
+失われる可能性はありますが、データベースは破損しません）。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from app.config.settings import settings
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    """接続先がインメモリの SQLite かどうかを返します。"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def read_url(url: str, replica_url: str | None) -> str | None:
+    """
+    読み取り専用エンジンの接続先URLを返します。
+
+    レプリカのURLが指定されていればそれを使用します。未指定の場合、
+    ファイルの SQLite では同じファイルを mode=ro の URI 接続で開きます
+    （WAL では読み取り接続が書き込みにブロックされません）。
+    それ以外（インメモリの SQLite、レプリカのないサーバー型DB）は
+    書き込み用エンジンを共用するため None を返します。
+
+    Args:
+        url: 書き込み用のデータベースURL
+        replica_url: 読み取り用レプリカのデータベースURL
+
+    Returns:
+        読み取り専用エンジンのURL。分離しない場合はNone
+    """
+    if replica_url:
+        return replica_url
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or _is_sqlite_memory(url):
+        return None
+    database = parsed.database or ""
+    if not database.startswith("file:"):
+        database = f"file:{Path(database).resolve()}"
+    return parsed.set(
+        database=database, query={**parsed.query, "mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """
+    create_engine / create_async_engine に渡すプール関連の引数を返します。
+
+    インメモリの SQLite は接続ごとに別のデータベースになるため、
+    SQLAlchemy 既定の専用プールを使用し、プールの設定は渡しません。
+
+    Args:
+        url: データベースURL
+
+    Returns:
+        キーワード引数の辞書
+    """
+    if _is_sqlite_memory(url):
+        return {}
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+def _pragmas(read_only: bool) -> list[str]:
+    """設定値から、接続ごとに実行する PRAGMA 文を組み立てます。"""
+    # ジャーナルモードはファイルに保存されるため、書き込み用の接続でのみ設定する
+    journal_mode = (
+        [] if read_only else [f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}"]
+    )
+    return [
+        *journal_mode,
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE_BYTES:d}",
+        # 負の値はページ数ではなく KiB 単位の指定になる
+        f"PRAGMA cache_size={-settings.SQLITE_CACHE_SIZE_KIB:d}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS:d}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+        f"PRAGMA foreign_keys={'ON' if settings.SQLITE_FOREIGN_KEYS else 'OFF'}",
+    ]
+
+
+def install_sqlite_pragmas(engine: Engine, read_only: bool = False) -> None:
+    """
+    SQLite の新しい接続ごとに PRAGMA を適用するイベントを登録します。
+
+    SQLite 以外のエンジンでは何もしません。
+    非同期エンジンの場合は sync_engine を渡します。
+
+    Args:
+        engine: 対象のエンジン
+        read_only: 読み取り専用（mode=ro）のエンジンかどうか
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = _pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
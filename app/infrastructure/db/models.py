@@ -10,10 +10,23 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.db.base import Base
+from app.infrastructure.db.types import BinaryUUID
 
 
 class CategoryORM(Base):
@@ -23,7 +36,7 @@ class CategoryORM(Base):
 
     __tablename__ = "categories"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(BinaryUUID, primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
@@ -37,6 +50,23 @@ class CategoryORM(Base):
     )
 
 
+class PromptORM(Base):
+    """
+    プロンプトテーブルのORMモデル
+
+    同じプロンプトを複数のLLM応答（モデルの比較や再実行）で共有するため、
+    プロンプトの本文を1件ずつ保持し、LLM応答からは prompt_id で参照します。
+    本文の SHA-256 ハッシュの一意インデックスで、同じ本文の行を1つにします。
+    """
+
+    __tablename__ = "prompts"
+
+    id = Column(BinaryUUID, primary_key=True, default=uuid.uuid4)
+    prompt_hash = Column(String(64), nullable=False, unique=True, index=True)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
 class LLMResponseORM(Base):
     """
     LLM応答テーブルのORMモデル
@@ -44,17 +74,35 @@ class LLMResponseORM(Base):
 
     __tablename__ = "llm_responses"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(BinaryUUID, primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False, index=True)
-    prompt = Column(Text, nullable=False)
+    # プロンプトは prompts テーブルに保存する（既存のテーブルに列を追加できるよう
+    # NULL を許可するが、作成・移行後の行では常に設定される）
+    prompt_id = Column(BinaryUUID, ForeignKey("prompts.id"), nullable=True, index=True)
     content_md = Column(Text, nullable=False)
     model = Column(String(100), nullable=False)
     provider = Column(String(50), nullable=False)
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=True)
+    category_id = Column(
+        BinaryUUID, ForeignKey("categories.id"), nullable=True, index=True
+    )
     tags = Column(JSON, default=list, nullable=False)  # タグのリストをJSON形式で保存
     summary = Column(Text, nullable=True)
+    # 要約の設定元（"user" または "auto"。本文の更新時に自動生成した要約のみ
+    # 作り直す。列の追加前に設定された要約は NULL のため利用者のものとして扱う）。
+    # 自動生成した要約は、生成に使った本文の content_hash と一致する場合のみ保存する
+    summary_source = Column(String(16), nullable=True)
     storage_location = Column(String(50), default="file", nullable=False)
     storage_path = Column(String(500), nullable=True)
+    # 本文の統計情報（作成・更新時に算出する。既存の行はバックフィルまで NULL）
+    char_count = Column(Integer, nullable=True, index=True)
+    byte_count = Column(Integer, nullable=True, index=True)
+    token_estimate = Column(Integer, nullable=True, index=True)
+    code_block_count = Column(Integer, nullable=True, index=True)
+    code_languages = Column(JSON, nullable=True)
+    heading_count = Column(Integer, nullable=True, index=True)
+    link_count = Column(Integer, nullable=True, index=True)
+    # 本文の SHA-256 ハッシュ（重複の検出に使用。既存の行は NULL）
+    content_hash = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(
         DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
@@ -62,3 +110,164 @@ class LLMResponseORM(Base):
 
     # リレーション: 所属カテゴリ
     category = relationship("CategoryORM", back_populates="llm_responses")
+
+
+class ResponseChunkORM(Base):
+    """
+    LLM応答の本文チャンクテーブルのORMモデル
+
+    本文を見出し・コードブロックの境界で分割したチャンクを、本文内の位置
+    （文字単位のオフセット）とともに保持します。チャンク単位の検索と、
+    セクションごとの取得に使用します。本文の作成・更新と同じトランザクションで
+    作り直します。
+    """
+
+    __tablename__ = "response_chunks"
+
+    response_id = Column(
+        BinaryUUID,
+        ForeignKey("llm_responses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    position = Column(Integer, primary_key=True)
+    start_offset = Column(Integer, nullable=False)
+    end_offset = Column(Integer, nullable=False)
+    heading = Column(Text, nullable=True)
+    heading_level = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+
+
+class ResponseRevisionORM(Base):
+    """
+    LLM応答の本文の版（リビジョン）テーブルのORMモデル
+
+    本文を更新するたびに1行追加します。各版は前の版との行単位の差分として
+    圧縮して保存し、一定の版数ごとに本文全体（スナップショット）を保存します。
+    版の復元では、直前のスナップショットから差分を順に適用します。
+    """
+
+    __tablename__ = "response_revisions"
+
+    response_id = Column(
+        BinaryUUID,
+        ForeignKey("llm_responses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    number = Column(Integer, primary_key=True)
+    is_snapshot = Column(Boolean, nullable=False)
+    # スナップショットは本文、差分は差分の操作の JSON を zlib で圧縮したもの
+    data = Column(LargeBinary, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    char_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
+class TagStatORM(Base):
+    """
+    タグの統計テーブルのORMモデル
+
+    タグごとに、そのタグを付けたLLM応答の数と最後に使われた日時を保持します。
+    LLM応答の作成・更新・削除と同じトランザクションで更新し、タグの一覧や
+    補完を llm_responses の tags 列を走査せずに返します。
+    """
+
+    __tablename__ = "tag_stats"
+
+    tag = Column(String(255), primary_key=True)
+    response_count = Column(Integer, nullable=False, index=True)
+    last_used_at = Column(DateTime, nullable=False, index=True)
+
+
+class ChangeVersionORM(Base):
+    """
+    変更バージョンテーブルのORMモデル
+
+    スコープ（テーブル等）ごとに単調増加するバージョン番号を保持します。
+    書き込みのたびにインクリメントし、各ワーカープロセスのインメモリキャッシュが
+    他プロセスでの変更を検知するために使用します。
+    """
+
+    __tablename__ = "change_versions"
+
+    scope = Column(String(50), primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+
+
+class SyncChangeORM(Base):
+    """
+    変更記録テーブルのORMモデル
+
+    エンティティごとに最新の変更（操作とシーケンス番号）を1行で保持します。
+    削除されたエンティティの行はトゥームストーンとして残ります。
+    シーケンス番号の一意インデックスで、差分の取得を範囲スキャンで行います。
+    """
+
+    __tablename__ = "sync_changes"
+
+    entity_type = Column(String(20), primary_key=True)
+    entity_id = Column(BinaryUUID, primary_key=True)
+    operation = Column(String(10), nullable=False)
+    seq = Column(Integer, nullable=False, unique=True, index=True)
+    changed_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
+class JobORM(Base):
+    """
+    ジョブキューテーブルのORMモデル
+
+    バックグラウンドジョブを永続化し、プロセスの再起動後も実行を継続できるようにします。
+    実行中のジョブはリース期限（locked_until）を持ち、期限切れのものは
+    ワーカーの異常終了とみなして再取得されます。
+    """
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSON, default=dict, nullable=False)
+    status = Column(String(20), default="queued", nullable=False)
+    priority = Column(Integer, default=0, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    run_at = Column(DateTime, default=datetime.now, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    dedupe_key = Column(String(255), nullable=True, index=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(
+        DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
+    )
+
+    # 取り出し（状態 → 優先度 → 登録順）のための複合インデックス
+    __table_args__ = (Index("ix_jobs_dequeue", "status", "priority", "id"),)
+
+
+class ConversationImportORM(Base):
+    """
+    会話エクスポートの取り込みテーブルのORMモデル
+
+    取り込みの状態と、取り込み済みの位置（ファイル先頭からのバイト数）を
+    バッチごとに記録します。中断された取り込みはこの位置から再開します。
+    数GBのファイルの位置を保持するため、位置とサイズは BigInteger で保存します。
+    """
+
+    __tablename__ = "conversation_imports"
+
+    id = Column(BinaryUUID, primary_key=True, default=uuid.uuid4)
+    source_path = Column(String(1000), nullable=False, index=True)
+    source_bytes = Column(BigInteger, nullable=False)
+    format = Column(String(20), nullable=True)
+    category_id = Column(BinaryUUID, nullable=True)
+    tags = Column(JSON, default=list, nullable=False)
+    delete_source = Column(Boolean, default=False, nullable=False)
+    status = Column(String(20), default="queued", nullable=False)
+    byte_offset = Column(BigInteger, default=0, nullable=False)
+    conversation_count = Column(Integer, default=0, nullable=False)
+    imported_count = Column(Integer, default=0, nullable=False)
+    duplicate_count = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(
+        DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
+    )
+    completed_at = Column(DateTime, nullable=True)
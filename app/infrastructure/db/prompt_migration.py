@@ -0,0 +1,145 @@
+"""
+プロンプト移行モジュール
+
+LLM応答ごとにプロンプトの本文を llm_responses.prompt 列に保存していた
+既存のデータベースを、prompts テーブルへの参照（prompt_id）に移行し、
+prompt 列を削除します。init_db() から呼び出され、移行済みの場合は何もしません。
+
+列の削除には SQLite 3.35 以降が必要です。削除した列の領域は、
+VACUUM を実行するまでデータベースファイルに残ります。
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    DateTime,
+    String,
+    Text,
+    bindparam,
+    column,
+    insert,
+    inspect,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from app.domain.services.content_hash import compute_content_hash
+from app.infrastructure.db.types import BinaryUUID
+
+logger = logging.getLogger(__name__)
+
+# 移行に必要な列のみを定義する（モデル定義には prompt 列がないため）
+_RESPONSES = table(
+    "llm_responses",
+    column("id", BinaryUUID()),
+    column("prompt", Text()),
+    column("prompt_id", BinaryUUID()),
+)
+_PROMPTS = table(
+    "prompts",
+    column("id", BinaryUUID()),
+    column("prompt_hash", String()),
+    column("text", Text()),
+    column("created_at", DateTime()),
+)
+
+# 1回に移行するLLM応答の数（SQLiteのバインド変数上限 999 を下回るようにする）
+_BATCH_SIZE = 500
+
+
+def migrate_prompts(engine: Engine) -> int:
+    """
+    llm_responses.prompt 列のプロンプトを prompts テーブルに移し、列を削除します。
+
+    Args:
+        engine: 移行するデータベースのエンジン
+
+    Returns:
+        移行したLLM応答の件数
+    """
+    if "llm_responses" not in inspect(engine).get_table_names():
+        return 0
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            # 複数ワーカーの同時起動でも1つずつ移行するよう、書き込みロックを先に取る
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        # 先に移行した他のプロセスが列を削除している場合がある
+        columns = inspect(connection).get_columns("llm_responses")
+        if not any(info["name"] == "prompt" for info in columns):
+            return 0
+        migrated = _move_prompts(connection)
+        connection.exec_driver_sql("ALTER TABLE llm_responses DROP COLUMN prompt")
+    logger.info(f"プロンプトを prompts テーブルに移行しました: {migrated} 件")
+    return migrated
+
+
+def _move_prompts(connection: Connection) -> int:
+    """
+    prompt_id が未設定のLLM応答に、prompt 列の本文に対応するプロンプトを設定します。
+
+    Args:
+        connection: トランザクション中の接続
+
+    Returns:
+        プロンプトを設定したLLM応答の件数
+    """
+    pending = (
+        select(_RESPONSES.c.id, _RESPONSES.c.prompt)
+        .where(_RESPONSES.c.prompt_id.is_(None), _RESPONSES.c.prompt.is_not(None))
+        .limit(_BATCH_SIZE)
+    )
+    assign = (
+        update(_RESPONSES)
+        .where(_RESPONSES.c.id == bindparam("target_id"))
+        .values(prompt_id=bindparam("target_prompt_id"))
+    )
+    migrated = 0
+    while rows := connection.execute(pending).all():
+        prompt_ids = _intern(connection, {row.prompt for row in rows})
+        connection.execute(
+            assign,
+            [
+                {"target_id": row.id, "target_prompt_id": prompt_ids[row.prompt]}
+                for row in rows
+            ],
+        )
+        migrated += len(rows)
+    return migrated
+
+
+def _intern(connection: Connection, texts: set[str]) -> dict[str, UUID]:
+    """
+    プロンプトの本文から、対応するプロンプトのIDを返します（なければ作成します）。
+
+    Args:
+        connection: トランザクション中の接続
+        texts: プロンプトの本文
+
+    Returns:
+        本文をキーとする、プロンプトIDの辞書
+    """
+    # LLM応答の書き込み時（intern_prompts）と同じハッシュで識別する
+    text_of = {compute_content_hash(text): text for text in texts}
+    ids: dict[str, UUID] = dict(
+        connection.execute(
+            select(_PROMPTS.c.prompt_hash, _PROMPTS.c.id).where(
+                _PROMPTS.c.prompt_hash.in_(list(text_of))
+            )
+        ).all()
+    )
+    now = datetime.now()
+    rows = [
+        {"id": uuid4(), "prompt_hash": prompt_hash, "text": text, "created_at": now}
+        for prompt_hash, text in text_of.items()
+        if prompt_hash not in ids
+    ]
+    if rows:
+        connection.execute(insert(_PROMPTS), rows)
+        ids.update((row["prompt_hash"], row["id"]) for row in rows)
+    return {text_of[prompt_hash]: prompt_id for prompt_hash, prompt_id in ids.items()}
@@ -0,0 +1,88 @@
+"""
+タグ統計の移行モジュール
+
+tag_stats テーブルを追加する前のデータベースについて、既存のLLM応答の
+tags 列からタグごとの使用状況を集計して tag_stats テーブルに保存します。
+init_db() が tag_stats テーブルを作成したときに呼び出され、以降は
+LLM応答の書き込みと同じトランザクションで更新されます。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Integer,
+    String,
+    column,
+    insert,
+    select,
+    table,
+)
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 移行に必要な列のみを定義する（モデル定義に依存しないようにする）
+_RESPONSES = table(
+    "llm_responses",
+    column("tags", JSON()),
+    column("updated_at", DateTime()),
+)
+_TAG_STATS = table(
+    "tag_stats",
+    column("tag", String()),
+    column("response_count", Integer()),
+    column("last_used_at", DateTime()),
+)
+
+# 1回に読み込むLLM応答の行数
+_BATCH_SIZE = 1000
+
+
+def migrate_tag_stats(engine: Engine) -> int:
+    """
+    既存のLLM応答のタグを集計し、空の tag_stats テーブルに保存します。
+
+    Args:
+        engine: 移行するデータベースのエンジン
+
+    Returns:
+        保存したタグの数
+    """
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            # 複数ワーカーの同時起動でも1回だけ集計するよう、書き込みロックを先に取る
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        # 先に集計した他のプロセスが保存している場合がある
+        if connection.execute(select(_TAG_STATS.c.tag).limit(1)).first() is not None:
+            return 0
+        counts: Counter[str] = Counter()
+        last_used: dict[str, datetime] = {}
+        rows = connection.execution_options(yield_per=_BATCH_SIZE).execute(
+            select(_RESPONSES.c.tags, _RESPONSES.c.updated_at)
+        )
+        for tags, updated_at in rows:
+            for tag in set(tags or []):
+                counts[tag] += 1
+                if tag not in last_used or last_used[tag] < updated_at:
+                    last_used[tag] = updated_at
+        if counts:
+            connection.execute(
+                insert(_TAG_STATS),
+                [
+                    {
+                        "tag": tag,
+                        "response_count": count,
+                        "last_used_at": last_used[tag],
+                    }
+                    for tag, count in counts.items()
+                ],
+            )
+    if counts:
+        logger.info(f"タグの使用状況を集計しました: {len(counts)} 件")
+    return len(counts)
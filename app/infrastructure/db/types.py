@@ -0,0 +1,56 @@
+"""
+カスタム列型モジュール
+
+SQLAlchemy の列型のうち、このアプリケーション固有のものを定義します。
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BINARY, LargeBinary, Uuid
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID を 16 バイトで保存する列型
+
+    ネイティブの UUID 型を持つDB（PostgreSQL など）ではその型を使用し、
+    SQLite では 16 バイトの BLOB、MySQL では BINARY(16) として保存します。
+    36 文字の文字列で保存する場合に比べ、主キー・外部キーのインデックスが
+    半分以下になり、比較も短いバイト列で済みます。
+
+    バインド値には UUID のほか UUID 文字列も受け付け、読み取り時は常に
+    UUID を返します。
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        """DBごとの実際の列型を返します。"""
+        if dialect.supports_native_uuid:
+            return dialect.type_descriptor(Uuid(as_uuid=True))
+        if dialect.name in ("mysql", "mariadb"):
+            # BLOB 型は長さを指定しないと主キーにできないため固定長にする
+            return dialect.type_descriptor(BINARY(16))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        """UUID（または UUID 文字列）をDBに保存する値に変換します。"""
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value if dialect.supports_native_uuid else value.bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> UUID | None:
+        """DBから読み取った値を UUID に変換します。"""
+        if value is None or isinstance(value, UUID):
+            return value
+        if isinstance(value, bytes):
+            return UUID(bytes=value)
+        return UUID(value)
@@ -0,0 +1,144 @@
+"""
+UUID キー移行モジュール
+
+ID を 36 文字の文字列で保存していた既存のデータベースを、BinaryUUID 型
+（SQLite では 16 バイトの BLOB、PostgreSQL ではネイティブの uuid 型）に
+移行します。init_db() から呼び出され、移行済みの場合は何もしません。
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from sqlalchemy import String, inspect
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+# BinaryUUID に移行する列（テーブル名, 列名）
+UUID_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("categories", "id"),
+    ("llm_responses", "id"),
+    ("llm_responses", "category_id"),
+    ("sync_changes", "entity_id"),
+)
+
+# SQLite で1回の UPDATE にまとめる値の数
+_BATCH_SIZE = 1000
+
+
+def migrate_uuid_keys(engine: Engine) -> int:
+    """
+    文字列で保存された UUID を BinaryUUID の表現に変換します。
+
+    SQLite と PostgreSQL に対応します。その他のDBでは何もしません。
+
+    Args:
+        engine: 移行するデータベースのエンジン
+
+    Returns:
+        変換した値の件数（PostgreSQL では型を変更した列の数）
+    """
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            converted = _migrate_sqlite(connection)
+    elif engine.dialect.name == "postgresql":
+        converted = _migrate_postgresql(engine)
+    else:
+        return 0
+    if converted:
+        logger.info(f"UUID キーを16バイト表現に移行しました: {converted} 件")
+    return converted
+
+
+def _migrate_sqlite(connection: Connection) -> int:
+    """
+    SQLite の文字列の UUID を 16 バイトの BLOB に書き換えます。
+
+    SQLite は列の宣言型に関わらず BLOB をそのまま保存できるため、
+    テーブルを作り直さずに値のみを置き換えます。
+
+    Args:
+        connection: トランザクション中の接続
+
+    Returns:
+        変換した値の件数
+    """
+    tables = set(inspect(connection).get_table_names())
+    # 複数ワーカーの同時起動でも1つずつ移行するよう、書き込みロックを先に取る。
+    # 主キーと外部キーを順に書き換えるため、制約の検査はコミット時まで遅らせる
+    # （この設定はトランザクションの終了で解除される）
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+    connection.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+    converted = 0
+    for table, column in UUID_COLUMNS:
+        if table not in tables:
+            continue
+        # SQLite では TEXT が常に BLOB より小さく並ぶため、'' 以上 x'' 未満の範囲で
+        # 文字列の値のみをインデックスから取り出せる
+        select_text = (
+            f"SELECT DISTINCT {column} FROM {table} "
+            f"WHERE {column} >= '' AND {column} < x'' LIMIT {_BATCH_SIZE}"
+        )
+        while values := connection.exec_driver_sql(select_text).scalars().all():
+            connection.exec_driver_sql(
+                f"UPDATE {table} SET {column} = ? WHERE {column} = ?",
+                [(UUID(value).bytes, value) for value in values],
+            )
+            converted += len(values)
+    return converted
+
+
+def _migrate_postgresql(engine: Engine) -> int:
+    """
+    PostgreSQL の文字列の UUID 列を uuid 型に変更します。
+
+    主キーの型を変更するため、カテゴリへの外部キー制約を一時的に削除して
+    作り直します。
+
+    Args:
+        engine: 移行するデータベースのエンジン
+
+    Returns:
+        型を変更した列の数
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    pending = [
+        (table, column)
+        for table, column in UUID_COLUMNS
+        if table in tables
+        and any(
+            info["name"] == column and isinstance(info["type"], String)
+            for info in inspector.get_columns(table)
+        )
+    ]
+    if not pending:
+        return 0
+
+    foreign_keys = (
+        [
+            foreign_key["name"]
+            for foreign_key in inspector.get_foreign_keys("llm_responses")
+            if foreign_key["constrained_columns"] == ["category_id"]
+        ]
+        if "llm_responses" in tables
+        else []
+    )
+    with engine.begin() as connection:
+        for name in foreign_keys:
+            connection.exec_driver_sql(
+                f'ALTER TABLE llm_responses DROP CONSTRAINT "{name}"'
+            )
+        for table, column in pending:
+            connection.exec_driver_sql(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid "
+                f"USING {column}::uuid"
+            )
+        for name in foreign_keys:
+            connection.exec_driver_sql(
+                f'ALTER TABLE llm_responses ADD CONSTRAINT "{name}" '
+                "FOREIGN KEY (category_id) REFERENCES categories (id)"
+            )
+    return len(pending)
@@ -0,0 +1,3 @@
+"""
+ドメインイベント配信
+"""
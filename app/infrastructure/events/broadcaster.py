@@ -0,0 +1,217 @@
+"""
+変更通知ブロードキャスターモジュール
+
+変更フィードを1プロセスにつき1つのタスクでポーリングし、
+購読中のすべての接続（Server-Sent Events など）へ通知を配信します。
+接続ごとにクエリを発行しないため、接続数が増えてもDBの負荷は一定です。
+変更フィードはDB上にあるため、他のワーカープロセスでの書き込みも配信されます。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+# 1回のポーリングで読み込む最大件数
+_POLL_BATCH_SIZE = 500
+
+
+class Notification(Protocol):
+    """配信する通知（変更シーケンス番号を持つ）"""
+
+    seq: int
+
+
+class Subscription:
+    """
+    1つの接続の購読
+
+    通知は購読ごとのキューに入ります。キューがあふれた場合（クライアントの
+    受信が遅い場合）は購読を打ち切り、クライアントの再接続時に
+    最後に受信した通知IDから再取得させます。
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize: 未送信の通知を保持する上限
+        """
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    def put(self, notification: Any) -> None:
+        """通知をキューに追加します（あふれた場合は購読を打ち切ります）。"""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.close()
+
+    def close(self) -> None:
+        """購読を打ち切り、待機中の受信側に終了を知らせます。"""
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self, timeout: float) -> Any | None:
+        """
+        次の通知を待ちます。
+
+        Args:
+            timeout: 最大待ち時間（秒）
+
+        Returns:
+            通知。購読が打ち切られた場合はNone
+
+        Raises:
+            TimeoutError: 待ち時間内に通知がなかった場合
+        """
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class ChangeBroadcaster:
+    """
+    変更通知を購読者へファンアウトする asyncio ブロードキャスター
+
+    ポーリングは購読者がいる間だけ行います。同じプロセス内での書き込みは
+    wake() で即座にポーリングさせ、他プロセスの書き込みはポーリング間隔で拾います。
+    """
+
+    def __init__(
+        self,
+        load: Callable[[int, int], Sequence[Notification]],
+        latest_seq: Callable[[], int],
+        poll_interval_seconds: float,
+        queue_size: int,
+    ) -> None:
+        """
+        Args:
+            load: (since, limit) を受け取り、since より後の通知を順に返す関数
+            latest_seq: 最新の変更シーケンス番号を返す関数
+            poll_interval_seconds: ポーリング間隔
+            queue_size: 購読ごとの未送信通知の上限
+        """
+        self.load = load
+        self.latest_seq = latest_seq
+        self.poll_interval_seconds = poll_interval_seconds
+        self.queue_size = queue_size
+        self._subscriptions: set[Subscription] = set()
+        self._task: asyncio.Task | None = None
+        self._started: asyncio.Future[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._last_seq = 0
+
+    async def subscribe(self) -> Subscription:
+        """
+        購読を開始します。
+
+        購読の開始以降にポーリングで見つかった通知が配信されます。
+        それ以前の通知が必要な場合は、購読の開始後に load() で読み込みます
+        （重複はシーケンス番号で除外できます）。
+
+        Returns:
+            購読
+        """
+        if self._task is None or self._task.done():
+            # 判定からタスクの作成までの間に await を挟まず、並行して購読を
+            # 開始した接続がそれぞれポーリングのタスクを作成しないようにする
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._started = self._loop.create_future()
+            self._task = asyncio.create_task(self._poll(self._started))
+        started = self._started
+        subscription = Subscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            # ポーリングの開始位置（最新のシーケンス番号）が決まってから返す
+            await asyncio.shield(started)
+        except BaseException:
+            self.unsubscribe(subscription)
+            raise
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        購読を終了します。
+
+        Args:
+            subscription: 終了する購読
+        """
+        self._subscriptions.discard(subscription)
+
+    def wake(self) -> None:
+        """
+        ポーリングを即座に行わせます。
+
+        任意のスレッドから呼び出せます。
+        """
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def close(self) -> None:
+        """すべての購読を打ち切り、ポーリングを停止します。"""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        self._subscriptions.clear()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _poll(self, started: asyncio.Future[None]) -> None:
+        """
+        購読者がいる間、変更をポーリングして配信します。
+
+        Args:
+            started: ポーリングの開始位置が決まったときに完了させる Future
+        """
+        try:
+            # ポーリング開始時点より前の変更は配信しない
+            self._last_seq = await asyncio.to_thread(self.latest_seq)
+        except asyncio.CancelledError:
+            started.cancel()
+            raise
+        except Exception as e:
+            # 例外は購読を開始した接続に送出する（次の購読でタスクを作り直す）
+            started.set_exception(e)
+            return
+        started.set_result(None)
+        while self._subscriptions:
+            try:
+                await self._poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("変更通知のポーリングに失敗しました")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.poll_interval_seconds
+                )
+            self._wakeup.clear()
+
+    async def _poll_once(self) -> None:
+        """前回以降の通知を読み込み、すべての購読者へ配信します。"""
+        while True:
+            notifications = await asyncio.to_thread(
+                self.load, self._last_seq, _POLL_BATCH_SIZE
+            )
+            for notification in notifications:
+                for subscription in list(self._subscriptions):
+                    subscription.put(notification)
+                    if subscription.closed:
+                        self._subscriptions.discard(subscription)
+                self._last_seq = notification.seq
+            if len(notifications) < _POLL_BATCH_SIZE:
+                return
@@ -0,0 +1,59 @@
+"""
+イベントバスモジュール
+
+リポジトリが発行したドメインイベントを、購読者へ同期的に配信します。
+イベントは書き込みと同じセッション（トランザクション）を伴って配信されるため、
+購読者がセッションに追加した変更（ジョブの登録など）は書き込みと一緒に
+コミットされ、書き込みがロールバックされれば一緒に取り消されます。
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+# 購読者: (セッション, イベント) を受け取る関数
+EventHandler = Callable[[Session, Any], None]
+
+
+class EventBus:
+    """
+    プロセス内イベントバス
+
+    購読者は起動時（モジュールのインポート時）に登録し、以降は変更しません。
+    """
+
+    def __init__(self) -> None:
+        """購読者なしで初期化します。"""
+        self._handlers: dict[type, list[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event_type: type, handler: EventHandler) -> None:
+        """
+        イベントを購読します。
+
+        Args:
+            event_type: 購読するイベントの型
+            handler: イベント発生時に呼び出す関数
+        """
+        self._handlers[event_type].append(handler)
+
+    def publish(self, db: Session, event: Any) -> None:
+        """
+        イベントを購読者に配信します。
+
+        コミット前に呼び出します。購読者で発生した例外はそのまま送出されるため、
+        呼び出し側の書き込みも失敗します。
+
+        Args:
+            db: 書き込み中のデータベースセッション
+            event: 配信するイベント
+        """
+        for handler in self._handlers.get(type(event), []):
+            handler(db, event)
+
+
+# グローバルなイベントバスインスタンス
+event_bus = EventBus()
@@ -0,0 +1,3 @@
+"""
+会話エクスポートの読み込み
+"""
@@ -0,0 +1,400 @@
+"""
+会話エクスポートのリーダー
+
+ChatGPT・Claude・Gemini のデータエクスポート（JSON）を会話ごとに読み込み、
+アシスタントの発話を取り出します。エクスポートはトップレベルが会話
+（Gemini の場合はアクティビティ）の配列であるため、配列の要素ごとに
+逐次読み込み（json_stream）、ファイル全体をメモリに載せません。
+
+対応する形式:
+    - ChatGPT: conversations.json。会話ごとの mapping（メッセージの木）から、
+      ツール宛てでないアシスタントのメッセージを取り出す（再生成された
+      別の分岐の応答も含む）
+    - Claude: conversations.json。chat_messages のアシスタントのメッセージを
+      取り出す（エクスポートにモデル名がない場合は "claude"）
+    - Gemini: Google Takeout の「Gemini アプリ アクティビティ」の
+      MyActivity.json。応答は HTML のため Markdown に変換する
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Any
+
+from app.domain.models.conversation_import import ExportedTurn, ExportFormat
+from app.domain.models.llm_response import LLMProvider
+from app.domain.ports.conversation_export import (
+    ConversationExportError,
+    ConversationExportReader,
+)
+from app.infrastructure.importers.json_stream import (
+    DEFAULT_READ_BYTES,
+    iter_array_items,
+)
+
+# llm_responses テーブルの列の長さ
+_MAX_TITLE_CHARS = 255
+_MAX_MODEL_CHARS = 100
+
+# タイトルがない会話で、プロンプトの1行目から作るタイトルの最大文字数
+_PROMPT_TITLE_CHARS = 80
+_UNTITLED = "無題"
+
+# 本文として取り込む ChatGPT のメッセージの種類
+_CHATGPT_TEXT_TYPES = frozenset({"text", "multimodal_text"})
+
+# Gemini のアクティビティのタイトルのうち、プロンプトの前に付く文言
+_GEMINI_PROMPT_PREFIXES = ("Prompted ",)
+
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_BLOCK_TAGS = frozenset({"p", "div", "blockquote", "table", "tr"})
+_SPACES = re.compile(r"\s+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def _text(value: Any) -> str:
+    """文字列であればそのまま、それ以外は空文字を返します。"""
+    return value if isinstance(value, str) else ""
+
+
+def _title(title: Any, prompt: str) -> str:
+    """
+    LLM応答のタイトルを返します。
+
+    会話にタイトルがない場合は、プロンプトの1行目から作ります。
+    """
+    text = _text(title).strip()
+    if not text and prompt.strip():
+        text = prompt.strip().split("\n", 1)[0][:_PROMPT_TITLE_CHARS]
+    return text[:_MAX_TITLE_CHARS] or _UNTITLED
+
+
+def _from_epoch(value: Any) -> datetime | None:
+    """UNIX 時間（秒）をローカル時刻に変換します。"""
+    if not isinstance(value, int | float) or isinstance(value, bool):
+        return None
+    try:
+        return datetime.fromtimestamp(value)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _from_iso(value: Any) -> datetime | None:
+    """ISO 8601 形式の日時を、タイムゾーンなしのローカル時刻に変換します。"""
+    try:
+        parsed = datetime.fromisoformat(_text(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _chatgpt_text(message: dict[str, Any]) -> str:
+    """ChatGPT のメッセージの本文を返します（本文でないものは空文字）。"""
+    content = message.get("content")
+    if not isinstance(content, dict):
+        return ""
+    if content.get("content_type") not in _CHATGPT_TEXT_TYPES:
+        return ""
+    parts = content.get("parts")
+    if not isinstance(parts, list):
+        return ""
+    # 画像などのパートは辞書のため、文字列のパートのみをつなげる
+    return "\n\n".join(part for part in parts if isinstance(part, str) and part)
+
+
+def _chatgpt_role(message: dict[str, Any]) -> str:
+    """ChatGPT のメッセージの送信者の役割を返します。"""
+    author = message.get("author")
+    return _text(author.get("role")) if isinstance(author, dict) else ""
+
+
+def _chatgpt_prompt(mapping: dict[str, Any], node: dict[str, Any]) -> str:
+    """ChatGPT のメッセージの木をさかのぼり、直前のユーザーの入力を返します。"""
+    parent = mapping.get(node.get("parent"))
+    # 壊れたデータで親が循環していても止まるよう、ノード数で打ち切る
+    for _ in range(len(mapping)):
+        if not isinstance(parent, dict):
+            break
+        message = parent.get("message")
+        if isinstance(message, dict) and _chatgpt_role(message) == "user":
+            text = _chatgpt_text(message)
+            if text:
+                return text
+        parent = mapping.get(parent.get("parent"))
+    return ""
+
+
+def _chatgpt_turns(conversation: dict[str, Any]) -> list[ExportedTurn]:
+    """ChatGPT の会話からアシスタントの発話を取り出します。"""
+    mapping = conversation.get("mapping")
+    if not isinstance(mapping, dict):
+        return []
+    default_model = _text(conversation.get("default_model_slug"))
+    turns: list[ExportedTurn] = []
+    for node in mapping.values():
+        if not isinstance(node, dict):
+            continue
+        message = node.get("message")
+        if not isinstance(message, dict) or _chatgpt_role(message) != "assistant":
+            continue
+        # ツール（コード実行・検索など）宛てのメッセージはユーザーへの応答ではない
+        if message.get("recipient", "all") != "all":
+            continue
+        text = _chatgpt_text(message)
+        if not text.strip():
+            continue
+        metadata = message.get("metadata")
+        model = _text(metadata.get("model_slug")) if isinstance(metadata, dict) else ""
+        prompt = _chatgpt_prompt(mapping, node)
+        turns.append(
+            ExportedTurn(
+                title=_title(conversation.get("title"), prompt),
+                prompt=prompt,
+                content_md=text,
+                model=(model or default_model or "unknown")[:_MAX_MODEL_CHARS],
+                provider=LLMProvider.OPENAI,
+                created_at=_from_epoch(message.get("create_time"))
+                or _from_epoch(conversation.get("create_time")),
+            )
+        )
+    return turns
+
+
+def _claude_text(message: dict[str, Any]) -> str:
+    """Claude のメッセージの本文を返します。"""
+    content = message.get("content")
+    if isinstance(content, list):
+        texts = [
+            item["text"]
+            for item in content
+            if isinstance(item, dict)
+            and item.get("type") == "text"
+            and isinstance(item.get("text"), str)
+        ]
+        if texts:
+            return "\n\n".join(texts)
+    return _text(message.get("text"))
+
+
+def _claude_turns(conversation: dict[str, Any]) -> list[ExportedTurn]:
+    """Claude の会話からアシスタントの発話を取り出します。"""
+    messages = conversation.get("chat_messages")
+    if not isinstance(messages, list):
+        return []
+    model = _text(conversation.get("model")) or "claude"
+    prompt = ""
+    turns: list[ExportedTurn] = []
+    for message in messages:
+        if not isinstance(message, dict):
+            continue
+        text = _claude_text(message)
+        sender = message.get("sender")
+        if sender == "human":
+            prompt = text
+        elif sender == "assistant" and text.strip():
+            turns.append(
+                ExportedTurn(
+                    title=_title(conversation.get("name"), prompt),
+                    prompt=prompt,
+                    content_md=text,
+                    model=model[:_MAX_MODEL_CHARS],
+                    provider=LLMProvider.ANTHROPIC,
+                    created_at=_from_iso(message.get("created_at")),
+                )
+            )
+    return turns
+
+
+class _HtmlToMarkdown(HTMLParser):
+    """
+    HTML を Markdown に変換するパーサー
+
+    Gemini の応答で使われる要素（段落・見出し・リスト・コード・強調・リンク）
+    のみを変換し、それ以外の要素はテキストだけを残します。
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._pre_depth = 0
+        # リストの入れ子（番号付きリストは次の番号、番号なしリストはNone）
+        self._lists: list[int | None] = []
+        self._links: list[str | None] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _HEADING_TAGS:
+            self.parts.append("\n\n" + "#" * int(tag[1]) + " ")
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n\n")
+        elif tag == "br":
+            self.parts.append("\n")
+        elif tag in ("ul", "ol"):
+            if not self._lists:
+                self.parts.append("\n\n")
+            self._lists.append(1 if tag == "ol" else None)
+        elif tag == "li":
+            indent = "  " * max(0, len(self._lists) - 1)
+            number = self._lists[-1] if self._lists else None
+            if number is None:
+                self.parts.append(f"\n{indent}- ")
+            else:
+                self.parts.append(f"\n{indent}{number}. ")
+                self._lists[-1] = number + 1
+        elif tag == "pre":
+            self.parts.append("\n\n```\n")
+            self._pre_depth += 1
+        elif tag == "code" and not self._pre_depth:
+            self.parts.append("`")
+        elif tag in ("strong", "b"):
+            self.parts.append("**")
+        elif tag in ("em", "i"):
+            self.parts.append("*")
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            self._links.append(href)
+            if href:
+                self.parts.append("[")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _HEADING_TAGS or tag in _BLOCK_TAGS:
+            self.parts.append("\n\n")
+        elif tag in ("ul", "ol"):
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self.parts.append("\n\n")
+        elif tag == "pre" and self._pre_depth:
+            self._pre_depth -= 1
+            self.parts.append("\n```\n\n")
+        elif tag == "code" and not self._pre_depth:
+            self.parts.append("`")
+        elif tag in ("strong", "b"):
+            self.parts.append("**")
+        elif tag in ("em", "i"):
+            self.parts.append("*")
+        elif tag == "a" and self._links:
+            href = self._links.pop()
+            if href:
+                self.parts.append(f"]({href})")
+
+    def handle_data(self, data: str) -> None:
+        if self._pre_depth:
+            self.parts.append(data)
+        else:
+            self.parts.append(_SPACES.sub(" ", data))
+
+
+def _html_to_markdown(html: str) -> str:
+    """
+    HTML を Markdown に変換します。
+
+    Args:
+        html: 変換するHTML
+
+    Returns:
+        Markdown の文字列
+    """
+    parser = _HtmlToMarkdown()
+    parser.feed(html)
+    parser.close()
+    lines = "".join(parser.parts).split("\n")
+    text = "\n".join(line.rstrip() for line in lines)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def _gemini_turns(activity: dict[str, Any]) -> list[ExportedTurn]:
+    """Gemini のアクティビティから応答を取り出します。"""
+    items = activity.get("safeHtmlItem")
+    if not isinstance(items, list):
+        return []
+    html = "".join(_text(item.get("html")) for item in items if isinstance(item, dict))
+    content = _html_to_markdown(html)
+    if not content:
+        return []
+    prompt = _text(activity.get("title"))
+    for prefix in _GEMINI_PROMPT_PREFIXES:
+        prompt = prompt.removeprefix(prefix)
+    return [
+        ExportedTurn(
+            title=_title(None, prompt),
+            prompt=prompt,
+            content_md=content,
+            model="gemini",
+            provider=LLMProvider.GOOGLE,
+            created_at=_from_iso(activity.get("time")),
+        )
+    ]
+
+
+# 形式ごとの、会話（配列の要素）からアシスタントの発話を取り出す関数
+_PARSERS: dict[ExportFormat, Callable[[dict[str, Any]], list[ExportedTurn]]] = {
+    ExportFormat.CHATGPT: _chatgpt_turns,
+    ExportFormat.CLAUDE: _claude_turns,
+    ExportFormat.GEMINI: _gemini_turns,
+}
+
+
+def _detect(item: Any) -> ExportFormat | None:
+    """配列の要素のキーから、エクスポートの形式を判別します。"""
+    if not isinstance(item, dict):
+        return None
+    if "mapping" in item:
+        return ExportFormat.CHATGPT
+    if "chat_messages" in item:
+        return ExportFormat.CLAUDE
+    if "safeHtmlItem" in item or "products" in item:
+        return ExportFormat.GEMINI
+    return None
+
+
+class JsonConversationExportReader(ConversationExportReader):
+    """
+    JSON の会話エクスポートを逐次読み込むリーダー
+    """
+
+    def __init__(self, read_bytes: int = DEFAULT_READ_BYTES):
+        """
+        Args:
+            read_bytes: 1回に読み込むバイト数
+        """
+        self.read_bytes = read_bytes
+
+    def detect_format(self, path: str) -> ExportFormat | None:
+        """エクスポートファイルの形式を、先頭の会話の内容から判別します"""
+        with open(path, "rb") as file:
+            try:
+                for item, _ in iter_array_items(file, read_bytes=self.read_bytes):
+                    export_format = _detect(item)
+                    if export_format is None:
+                        raise ConversationExportError(
+                            "会話エクスポートの形式を判別できません"
+                        )
+                    return export_format
+            except (ValueError, UnicodeDecodeError) as e:
+                raise ConversationExportError(str(e)) from None
+        return None
+
+    def read(
+        self, path: str, export_format: ExportFormat, start_offset: int = 0
+    ) -> Iterator[tuple[list[ExportedTurn], int]]:
+        """エクスポートファイルを会話ごとに読み込みます"""
+        parse = _PARSERS[export_format]
+        with open(path, "rb") as file:
+            items = iter_array_items(file, start_offset, self.read_bytes)
+            while True:
+                try:
+                    item, offset = next(items)
+                except StopIteration:
+                    return
+                except (ValueError, UnicodeDecodeError) as e:
+                    raise ConversationExportError(str(e)) from None
+                yield (parse(item) if isinstance(item, dict) else []), offset
+
+
+# グローバルな会話エクスポートリーダーインスタンス
+conversation_export_reader = JsonConversationExportReader()
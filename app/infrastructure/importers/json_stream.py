@@ -0,0 +1,207 @@
+"""
+JSON 配列の逐次読み込み
+
+トップレベルが配列の巨大な JSON ファイル（数GBの会話エクスポートなど）を、
+要素ごとに読み込みます。ファイルは一定のサイズずつ読み込んでデコードし、
+保持するのは読み込み途中の要素1つ分までです。
+要素ごとの解析は標準ライブラリの JSONDecoder.raw_decode（C 実装）で行います。
+
+各要素の直後の位置（ファイル先頭からのバイト数）をあわせて返すため、
+その位置から読み込みを再開できます。
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+# 1回に読み込むバイト数
+DEFAULT_READ_BYTES = 1024 * 1024
+
+# 1要素の最大文字数（これを超える要素は、壊れたファイルとみなして読み込みを中止する）
+DEFAULT_MAX_ITEM_CHARS = 512 * 1024 * 1024
+
+_WHITESPACE = frozenset(" \t\n\r")
+
+# 数値の続きになりうる末尾の文字数（"1e-" の "e-" など）
+_MAX_NUMBER_TAIL_CHARS = 2
+
+
+class _TextWindow:
+    """
+    ファイルを少しずつデコードし、未処理の部分だけを保持する窓
+
+    Attributes:
+        text: 保持しているデコード済みの文字列
+        pos: text 内の処理済みの位置
+        eof: ファイルの終わりまで読み込んだかどうか
+    """
+
+    def __init__(self, file: BinaryIO, offset: int, read_bytes: int):
+        """
+        Args:
+            file: 読み込むバイナリファイル（offset の位置にシーク済み）
+            offset: 読み込みを始める位置（バイト数）
+            read_bytes: 1回に読み込むバイト数
+        """
+        self.file = file
+        self.read_bytes = read_bytes
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        # text[_mark] のファイル上の位置（バイト数）
+        self._offset = offset
+        self._mark = 0
+
+    def byte_offset(self) -> int:
+        """text[pos] のファイル上の位置（バイト数）を返します。"""
+        # 前回から進んだ部分だけをエンコードして数える
+        self._offset += len(self.text[self._mark : self.pos].encode("utf-8"))
+        self._mark = self.pos
+        return self._offset
+
+    def fill(self) -> bool:
+        """
+        処理済みの部分を捨てて、続きを読み込みます。
+
+        未処理の部分が長い（大きな要素の途中）ほど多く読み込み、
+        要素の解析のやり直しが合計で要素の大きさに比例する回数に収まるようにします。
+
+        Returns:
+            読み込んだ場合True、ファイルの終わりに達していた場合False
+        """
+        if self.eof:
+            return False
+        self.byte_offset()
+        self.text = self.text[self.pos :]
+        self.pos = self._mark = 0
+        data = self.file.read(max(self.read_bytes, len(self.text)))
+        if not data:
+            self.text += self._decoder.decode(b"", final=True)
+            self.eof = True
+            return False
+        self.text += self._decoder.decode(data)
+        return True
+
+    def peek(self) -> str | None:
+        """
+        空白を読み飛ばし、次の文字を返します。
+
+        Returns:
+            次の文字。ファイルの終わりに達した場合はNone
+        """
+        while True:
+            text = self.text
+            pos = self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return None
+
+    def _may_continue(self, value: Any, end: int) -> bool:
+        """
+        解析した値が、窓の末尾で途中まで読み込まれたものである可能性を返します。
+
+        数値は "1e" や "1." の時点で "1" として解析されるため、窓の末尾付近で
+        終わる数値も続きを読み込んで解析し直します。
+        """
+        remaining = len(self.text) - end
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return remaining <= _MAX_NUMBER_TAIL_CHARS
+        return remaining == 0
+
+    def decode(self, decoder: json.JSONDecoder, max_chars: int) -> Any:
+        """
+        pos の位置から JSON の値を1つ解析し、その直後まで pos を進めます。
+
+        値が窓に収まっていない場合は、続きを読み込んで解析し直します。
+
+        Args:
+            decoder: JSON デコーダー
+            max_chars: 値の最大文字数
+
+        Returns:
+            解析した値
+
+        Raises:
+            ValueError: JSON として正しくない場合、または値が max_chars を超える場合
+        """
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ValueError(
+                        f"JSON として解析できません: {e.msg}"
+                        f"（{self.byte_offset()} バイト目からの要素）"
+                    ) from None
+            else:
+                if self.eof or not self._may_continue(value, end):
+                    self.pos = end
+                    return value
+            if len(self.text) - self.pos > max_chars:
+                raise ValueError(
+                    f"{self.byte_offset()} バイト目からの要素が大きすぎるか、"
+                    "JSON として正しくありません"
+                )
+            self.fill()
+
+
+def iter_array_items(
+    file: BinaryIO,
+    start_offset: int = 0,
+    read_bytes: int = DEFAULT_READ_BYTES,
+    max_item_chars: int = DEFAULT_MAX_ITEM_CHARS,
+) -> Iterator[tuple[Any, int]]:
+    """
+    トップレベルが配列の JSON ファイルを、要素ごとに読み込みます。
+
+    Args:
+        file: UTF-8 の JSON ファイル（バイナリモードで開いたもの）
+        start_offset: 読み込みを始める位置。0 の場合はファイルの先頭から、
+            それ以外の場合は以前に返された要素の直後の位置から再開する
+        read_bytes: 1回に読み込むバイト数
+        max_item_chars: 1要素の最大文字数
+
+    Yields:
+        (要素, 要素の直後の位置（ファイル先頭からのバイト数）) の組
+
+    Raises:
+        ValueError: トップレベルが配列でない、または JSON として正しくない場合
+        UnicodeDecodeError: UTF-8 でない場合
+    """
+    file.seek(start_offset)
+    window = _TextWindow(file, start_offset, read_bytes)
+    decoder = json.JSONDecoder()
+    after_item = start_offset > 0
+    if not after_item:
+        char = window.peek()
+        if char == "\ufeff":  # BOM
+            window.pos += 1
+            char = window.peek()
+        if char != "[":
+            raise ValueError("トップレベルが JSON の配列ではありません")
+        window.pos += 1
+
+    while True:
+        char = window.peek()
+        if char is None:
+            raise ValueError("JSON の配列が閉じられていません")
+        if char == "]":
+            return
+        if after_item:
+            if char != ",":
+                raise ValueError(
+                    f"{window.byte_offset()} バイト目が配列の要素の区切りではありません"
+                )
+            window.pos += 1
+            window.peek()
+        item = window.decode(decoder, max_item_chars)
+        yield item, window.byte_offset()
+        after_item = True
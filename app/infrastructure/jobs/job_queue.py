@@ -0,0 +1,370 @@
+"""
+ジョブキューモジュール
+
+jobs テーブルを使った永続的なジョブキューを提供します。
+ジョブの登録は呼び出し側のトランザクションに含めて行うため、
+書き込みとジョブの登録は同時にコミット（またはロールバック）されます。
+取り出しは条件付き UPDATE で行い、複数のワーカー（スレッド・プロセス）が
+同じジョブを重複して実行しないようにします。
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Callable, Collection
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Row, and_, delete, event, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.domain.models.job import Job, JobStatus
+from app.infrastructure.db.models import JobORM
+
+logger = logging.getLogger(__name__)
+
+_TABLE = JobORM.__table__
+
+# ジョブを登録したセッションであることを示す Session.info のキー
+_ENQUEUED_KEY = "jobs_enqueued"
+
+
+def job_from_row(row: Row) -> Job:
+    """
+    jobs テーブルの行をジョブエンティティに変換します。
+
+    Args:
+        row: jobs テーブルの行
+
+    Returns:
+        ジョブエンティティ
+    """
+    return Job(
+        id=row.id,
+        kind=row.kind,
+        payload=row.payload,
+        status=JobStatus(row.status),
+        priority=row.priority,
+        attempts=row.attempts,
+        max_attempts=row.max_attempts,
+        run_at=row.run_at,
+        last_error=row.last_error,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+class JobQueue:
+    """
+    SQLite（および他のRDB）上の永続ジョブキュー
+
+    優先度の高い順、同じ優先度では登録順に取り出します。
+    失敗したジョブは指数バックオフで再試行し、最大試行回数に達したら失敗とします。
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        lease_seconds: float,
+    ) -> None:
+        """
+        Args:
+            max_attempts: ジョブの最大試行回数（登録時に指定しない場合）
+            backoff_base_seconds: 1回目の再試行までの待ち時間
+            backoff_max_seconds: 再試行までの待ち時間の上限
+            lease_seconds: 実行中ジョブのリース期間（これを過ぎると再取得される）
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        ジョブを登録したトランザクションのコミット後に呼び出す関数を登録します。
+
+        ワーカーを即座に起こし、ポーリング間隔を待たずに実行を始めるために使用します。
+
+        Args:
+            callback: コミット後に呼び出す関数
+        """
+        self._listeners.append(callback)
+
+    def notify(self) -> None:
+        """登録されたリスナーにジョブの追加を通知します。"""
+        for callback in self._listeners:
+            callback()
+
+    def enqueue(
+        self,
+        db: Session,
+        kind: str,
+        payload: dict[str, Any],
+        priority: int = 0,
+        delay_seconds: float = 0.0,
+        dedupe_key: str | None = None,
+    ) -> None:
+        """
+        ジョブを登録します。
+
+        コミットは行いません。呼び出し側のトランザクションと一緒にコミットされます。
+
+        Args:
+            db: データベースセッション
+            kind: ジョブの種類
+            payload: ハンドラーに渡す引数（JSONに変換可能な値）
+            priority: 優先度（大きいほど先に実行される）
+            delay_seconds: 実行を遅らせる秒数
+            dedupe_key: 重複排除キー。同じキーの実行待ちジョブがあれば登録しない
+        """
+        if dedupe_key is not None:
+            queued = db.execute(
+                select(_TABLE.c.id)
+                .where(
+                    _TABLE.c.dedupe_key == dedupe_key,
+                    _TABLE.c.status == JobStatus.QUEUED.value,
+                )
+                .limit(1)
+            ).first()
+            if queued is not None:
+                return
+
+        now = datetime.now()
+        db.execute(
+            insert(_TABLE).values(
+                kind=kind,
+                payload=payload,
+                status=JobStatus.QUEUED.value,
+                priority=priority,
+                attempts=0,
+                max_attempts=self.max_attempts,
+                run_at=now + timedelta(seconds=delay_seconds),
+                dedupe_key=dedupe_key,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        db.info[_ENQUEUED_KEY] = True
+
+    def claim(self, db: Session, kinds: Collection[str]) -> Job | None:
+        """
+        実行可能なジョブを1件取り出し、実行中にします。
+
+        実行待ちで実行日時を過ぎたジョブと、リース期限が切れた実行中のジョブ
+        （ワーカーが異常終了したもの）が対象です。取り出しはコミットまで行います。
+
+        Args:
+            db: データベースセッション
+            kinds: 取り出すジョブの種類（ハンドラーが登録されているもの）
+
+        Returns:
+            取り出したジョブ。実行可能なジョブがない場合はNone
+        """
+        while True:
+            now = datetime.now()
+            row = db.execute(
+                select(_TABLE)
+                .where(
+                    _TABLE.c.kind.in_(kinds),
+                    or_(
+                        and_(
+                            _TABLE.c.status == JobStatus.QUEUED.value,
+                            _TABLE.c.run_at <= now,
+                        ),
+                        and_(
+                            _TABLE.c.status == JobStatus.RUNNING.value,
+                            _TABLE.c.locked_until < now,
+                        ),
+                    ),
+                )
+                .order_by(_TABLE.c.priority.desc(), _TABLE.c.id)
+                .limit(1)
+            ).first()
+            if row is None:
+                db.rollback()
+                return None
+
+            # 取り出し後に他のワーカーが先に更新していないことを、
+            # 状態と試行回数の一致で確認する（楽観的ロック）
+            unchanged = and_(
+                _TABLE.c.id == row.id,
+                _TABLE.c.status == row.status,
+                _TABLE.c.attempts == row.attempts,
+            )
+            if (
+                row.status == JobStatus.RUNNING.value
+                and row.attempts >= row.max_attempts
+            ):
+                # 最後の試行中にワーカーが異常終了したジョブは失敗とする
+                db.execute(
+                    update(_TABLE)
+                    .where(unchanged)
+                    .values(
+                        status=JobStatus.FAILED.value,
+                        locked_until=None,
+                        last_error="ワーカーが実行中に停止しました",
+                        updated_at=now,
+                    )
+                )
+                db.commit()
+                continue
+
+            result = db.execute(
+                update(_TABLE)
+                .where(unchanged)
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    attempts=row.attempts + 1,
+                    locked_until=now + timedelta(seconds=self.lease_seconds),
+                    updated_at=now,
+                )
+            )
+            db.commit()
+            if result.rowcount == 1:
+                job = job_from_row(row)
+                job.status = JobStatus.RUNNING
+                job.attempts += 1
+                job.updated_at = now
+                return job
+
+    def complete(self, db: Session, job: Job) -> None:
+        """
+        ジョブを成功にします。
+
+        Args:
+            db: データベースセッション
+            job: claim() で取り出したジョブ
+        """
+        now = datetime.now()
+        self._finish(
+            db,
+            job,
+            status=JobStatus.SUCCEEDED.value,
+            locked_until=None,
+            last_error=None,
+            updated_at=now,
+        )
+
+    def fail(self, db: Session, job: Job, error: str) -> None:
+        """
+        ジョブの失敗を記録します。
+
+        最大試行回数に達していなければ、バックオフ後に再試行するよう戻します。
+
+        Args:
+            db: データベースセッション
+            job: claim() で取り出したジョブ
+            error: エラー内容
+        """
+        now = datetime.now()
+        if job.attempts >= job.max_attempts:
+            self._finish(
+                db,
+                job,
+                status=JobStatus.FAILED.value,
+                locked_until=None,
+                last_error=error,
+                updated_at=now,
+            )
+            return
+        self._finish(
+            db,
+            job,
+            status=JobStatus.QUEUED.value,
+            locked_until=None,
+            run_at=now + timedelta(seconds=self.backoff(job.attempts)),
+            last_error=error,
+            updated_at=now,
+        )
+
+    def _finish(self, db: Session, job: Job, **values: Any) -> None:
+        """
+        実行中のジョブを更新します。
+
+        リース期限切れで他のワーカーが再取得していた場合は何もしません。
+
+        Args:
+            db: データベースセッション
+            job: claim() で取り出したジョブ
+            **values: 更新する列と値
+        """
+        result = db.execute(
+            update(_TABLE)
+            .where(
+                _TABLE.c.id == job.id,
+                _TABLE.c.status == JobStatus.RUNNING.value,
+                _TABLE.c.attempts == job.attempts,
+            )
+            .values(**values)
+        )
+        db.commit()
+        if result.rowcount == 0:
+            logger.warning(f"ジョブは他のワーカーに再取得されています: id={job.id}")
+
+    def backoff(self, attempts: int) -> float:
+        """
+        再試行までの待ち時間を計算します。
+
+        試行回数ごとに倍増させ、再試行が同時に集中しないよう揺らぎを加えます。
+
+        Args:
+            attempts: これまでの試行回数
+
+        Returns:
+            待ち時間（秒）
+        """
+        delay = min(
+            self.backoff_max_seconds,
+            self.backoff_base_seconds * 2 ** (attempts - 1),
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+    def purge_succeeded(self, db: Session, before: datetime) -> int:
+        """
+        指定日時より前に成功したジョブを削除します。
+
+        失敗したジョブは調査のために残します。
+
+        Args:
+            db: データベースセッション
+            before: この日時より前に更新されたジョブを削除する
+
+        Returns:
+            削除した件数
+        """
+        result = db.execute(
+            delete(_TABLE).where(
+                _TABLE.c.status == JobStatus.SUCCEEDED.value,
+                _TABLE.c.updated_at < before,
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+
+# グローバルなジョブキューインスタンス
+job_queue = JobQueue(
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    backoff_base_seconds=settings.JOB_BACKOFF_BASE_SECONDS,
+    backoff_max_seconds=settings.JOB_BACKOFF_MAX_SECONDS,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+)
+
+
+# ジョブを登録したトランザクションのコミット後にワーカーへ通知する
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    """ジョブを登録したセッションのコミット後に、ジョブの追加を通知します。"""
+    if session.info.pop(_ENQUEUED_KEY, False):
+        job_queue.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """ロールバックされたジョブの登録を通知対象から外します。"""
+    session.info.pop(_ENQUEUED_KEY, None)
@@ -0,0 +1,198 @@
+"""
+ジョブワーカープールモジュール
+
+ジョブキューからジョブを取り出して実行するワーカースレッド群を提供します。
+CPU バウンドな処理（要約など）はハンドラー側でプロセスプールに委譲します。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config.settings import settings
+from app.domain.models.job import Job
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.jobs.job_queue import JobQueue, job_queue
+
+logger = logging.getLogger(__name__)
+
+# ジョブハンドラー: ジョブの payload を受け取る関数
+JobHandler = Callable[[dict[str, Any]], None]
+
+# 成功したジョブを削除する間隔（秒）
+_PURGE_INTERVAL_SECONDS = 3600
+
+
+class JobWorkerPool:
+    """
+    ジョブを実行するワーカースレッドのプール
+
+    各ワーカーは実行可能なジョブがなくなるまで取り出しと実行を繰り返し、
+    なくなったらポーリング間隔だけ待機します（ジョブの登録時は即座に起こされます）。
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        session_factory: sessionmaker[Session],
+        workers: int,
+        poll_interval_seconds: float,
+        retention_hours: float,
+    ) -> None:
+        """
+        Args:
+            queue: ジョブキュー
+            session_factory: データベースセッションのファクトリ
+            workers: ワーカースレッド数（0の場合このプロセスではジョブを実行しない）
+            poll_interval_seconds: ジョブがない場合の待機時間
+            retention_hours: 成功したジョブを保持する時間
+        """
+        self.queue = queue
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retention_hours = retention_hours
+        self._handlers: dict[str, JobHandler] = {}
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._wakeup = threading.Condition()
+        self._last_purge = 0.0
+        queue.add_listener(self.wake)
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """
+        ジョブの種類に対応するハンドラーを登録します。
+
+        Args:
+            kind: ジョブの種類
+            handler: ジョブを実行する関数（例外を送出すると再試行される）
+        """
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """ワーカースレッドを起動します。"""
+        if self._threads:
+            return
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"ジョブワーカーを起動しました: workers={self.workers}")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        ワーカースレッドを停止します。
+
+        実行中のジョブは完了を待ちます。待ちきれなかったジョブは
+        リース期限切れ後に（このプロセスまたは他のプロセスで）再実行されます。
+
+        Args:
+            timeout: 各スレッドの終了を待つ最大秒数
+        """
+        self._stopping.set()
+        self.wake()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def wake(self) -> None:
+        """待機中のワーカーを起こします。"""
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def run_pending(self) -> int:
+        """
+        実行可能なジョブがなくなるまで、呼び出し元のスレッドで実行します。
+
+        Returns:
+            実行したジョブの件数
+        """
+        executed = 0
+        while self._run_one():
+            executed += 1
+        return executed
+
+    def _run(self) -> None:
+        """ワーカースレッドのメインループ"""
+        while not self._stopping.is_set():
+            try:
+                if self._run_one():
+                    continue
+                self._purge_if_due()
+            except Exception:
+                # DBの一時的なエラー（ロック競合など）でワーカーを止めない
+                logger.exception("ジョブの取り出しに失敗しました")
+            with self._wakeup:
+                self._wakeup.wait(self.poll_interval_seconds)
+
+    def _run_one(self) -> bool:
+        """
+        ジョブを1件取り出して実行します。
+
+        Returns:
+            ジョブを実行した場合True、実行可能なジョブがない場合False
+        """
+        with self.session_factory() as db:
+            job = self.queue.claim(db, self._handlers.keys())
+        if job is None:
+            return False
+        self._execute(job)
+        return True
+
+    def _execute(self, job: Job) -> None:
+        """
+        ジョブを実行し、結果をキューに記録します。
+
+        Args:
+            job: 取り出したジョブ
+        """
+        started = time.perf_counter()
+        try:
+            self._handlers[job.kind](job.payload)
+        except Exception as e:
+            logger.exception(
+                f"ジョブが失敗しました: id={job.id}, kind={job.kind}, "
+                f"attempt={job.attempts}/{job.max_attempts}"
+            )
+            with self.session_factory() as db:
+                self.queue.fail(db, job, f"{type(e).__name__}: {e}")
+            return
+
+        with self.session_factory() as db:
+            self.queue.complete(db, job)
+        logger.debug(
+            f"ジョブが完了しました: id={job.id}, kind={job.kind}, "
+            f"elapsed={time.perf_counter() - started:.3f}s"
+        )
+
+    def _purge_if_due(self) -> None:
+        """一定間隔ごとに、保持期間を過ぎた成功ジョブを削除します。"""
+        now = time.monotonic()
+        if now - self._last_purge < _PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        before = datetime.now() - timedelta(hours=self.retention_hours)
+        with self.session_factory() as db:
+            purged = self.queue.purge_succeeded(db, before)
+        if purged:
+            logger.info(f"成功したジョブを削除しました: {purged} 件")
+
+
+# グローバルなワーカープールインスタンス
+job_worker_pool = JobWorkerPool(
+    job_queue,
+    SessionLocal,
+    workers=settings.JOB_WORKERS,
+    poll_interval_seconds=settings.JOB_POLL_INTERVAL_SECONDS,
+    retention_hours=settings.JOB_RETENTION_HOURS,
+)
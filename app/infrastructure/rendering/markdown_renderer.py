@@ -0,0 +1,258 @@
+"""
+MarkdownRenderer の実装
+
+markdown-it-py で Markdown を HTML に変換し、コードブロックは Pygments で
+シンタックスハイライトします。
+変換結果は内容のハッシュをキーとして、プロセス内の LRU キャッシュと
+STORAGE_PATH 配下のディスクキャッシュ（合計サイズの上限あり）に保存します。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+
+from markdown_it import MarkdownIt
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+
+from app.config.settings import settings
+from app.domain.ports.markdown_renderer import MarkdownRenderer
+
+logger = logging.getLogger(__name__)
+
+
+class MarkdownItRenderer(MarkdownRenderer):
+    """
+    markdown-it-py と Pygments を使用した Markdown レンダラー
+
+    生の HTML は無効化（エスケープ）し、表（GFM テーブル）を有効にします。
+    """
+
+    # 出力形式を変えた場合はこの値を変更し、既存のキャッシュを無効化する
+    VERSION = "markdown-it-1"
+
+    def __init__(self) -> None:
+        """レンダラーを初期化します。"""
+        self._formatter = HtmlFormatter(nowrap=True)
+        self._markdown = MarkdownIt(
+            "commonmark", {"html": False, "highlight": self._highlight}
+        ).enable("table")
+
+    def _highlight(self, code: str, lang: str, attrs: str) -> str:
+        """
+        コードブロックをハイライトします。
+
+        言語が未指定または未知の場合は空文字を返し、markdown-it の
+        既定のエスケープ処理に任せます。
+
+        Args:
+            code: コードブロックの内容
+            lang: 言語名（info string）
+            attrs: 属性（未使用）
+
+        Returns:
+            ハイライト済みの HTML（<pre> の内側）。対象外の場合は空文字
+        """
+        if not lang:
+            return ""
+        try:
+            lexer = get_lexer_by_name(lang)
+        except ClassNotFound:
+            return ""
+        return highlight(code, lexer, self._formatter)
+
+    def render(self, content_md: str) -> str:
+        """Markdown を HTML に変換します"""
+        return self._markdown.render(content_md)
+
+
+class CachedMarkdownRenderer(MarkdownRenderer):
+    """
+    変換結果をキャッシュする Markdown レンダラー
+
+    キーは「レンダラーのバージョン + Markdown」の SHA-256 です。
+    メモリ上の LRU（件数上限あり）を優先し、なければディスクキャッシュ、
+    それもなければ変換してから両方に保存します。
+
+    ディスクキャッシュは、本文の更新や削除で使われなくなったものも残るため、
+    合計サイズが上限を超えたら更新日時（読み込むたびに更新する）の古いものから
+    削除します。合計サイズはプロセスごとに保存した分を加算して見積もり、
+    上限を超えたときにディレクトリを走査して数え直します。
+    """
+
+    # 削除を繰り返さないよう、上限を超えたら上限のこの割合まで減らす
+    PRUNE_RATIO = 0.9
+
+    def __init__(
+        self,
+        renderer: MarkdownItRenderer,
+        cache_dir: Path,
+        max_entries: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            renderer: 実際に変換を行うレンダラー
+            cache_dir: ディスクキャッシュの保存先ディレクトリ
+            max_entries: メモリ上に保持する最大件数
+            max_disk_bytes: ディスクキャッシュの合計サイズの上限（バイト数）
+        """
+        self.renderer = renderer
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._disk_lock = threading.Lock()
+        # ディスクキャッシュの合計サイズの見積もり（最初の保存時に数える）
+        self._disk_bytes: int | None = None
+
+    def render(self, content_md: str) -> str:
+        """Markdown を HTML に変換します（キャッシュがあればそれを返します）"""
+        key = self._key(content_md)
+
+        html = self._get_memory(key)
+        if html is not None:
+            return html
+
+        html = self._read_disk(key)
+        if html is None:
+            html = self.renderer.render(content_md)
+            self._write_disk(key, html)
+        self._put_memory(key, html)
+        return html
+
+    def _key(self, content_md: str) -> str:
+        """キャッシュキー（SHA-256 の16進文字列）を計算します。"""
+        digest = hashlib.sha256(self.renderer.VERSION.encode())
+        digest.update(b"\0")
+        digest.update(content_md.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get_memory(self, key: str) -> str | None:
+        """メモリキャッシュから取得し、最近使用したものとして並べ替えます。"""
+        with self._lock:
+            html = self._memory.get(key)
+            if html is not None:
+                self._memory.move_to_end(key)
+            return html
+
+    def _put_memory(self, key: str, html: str) -> None:
+        """メモリキャッシュに保存し、上限を超えた古いものを破棄します。"""
+        with self._lock:
+            self._memory[key] = html
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """ディスクキャッシュのファイルパスを返します（先頭2文字で分散）。"""
+        return self.cache_dir / key[:2] / f"{key}.html"
+
+    def _read_disk(self, key: str) -> str | None:
+        """ディスクキャッシュから取得します。存在しない場合はNone"""
+        path = self._path(key)
+        try:
+            html = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        # 最近使われたものとして、上限を超えたときの削除の対象から外す
+        with suppress(OSError):
+            os.utime(path)
+        return html
+
+    def _write_disk(self, key: str, html: str) -> None:
+        """
+        ディスクキャッシュに保存します。
+
+        一時ファイルに書いてから置き換えることで、並行して読み込む他の
+        ワーカーが書きかけのファイルを読まないようにします。
+        保存に失敗してもレンダリング結果は返せるため、ログのみ出力します
+        （書きかけの一時ファイルは削除します）。
+        """
+        path = self._path(key)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(html)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            if tmp_name is not None:
+                with suppress(OSError):
+                    os.unlink(tmp_name)
+            logger.warning(f"HTMLキャッシュの保存に失敗しました: {path} - {e}")
+            return
+        self._add_disk_bytes(path.stat().st_size)
+
+    def _add_disk_bytes(self, size: int) -> None:
+        """
+        保存したサイズを合計に加え、上限を超えた場合は古いものを削除します。
+
+        Args:
+            size: 保存したファイルのバイト数
+        """
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._prune(self.max_disk_bytes)
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes > self.max_disk_bytes:
+                self._disk_bytes = self._prune(
+                    int(self.max_disk_bytes * self.PRUNE_RATIO)
+                )
+
+    def _prune(self, target_bytes: int) -> int:
+        """
+        ディスクキャッシュを走査し、合計サイズが目標以下になるまで
+        更新日時の古いものから削除します。
+
+        Args:
+            target_bytes: 削除後の合計サイズの目標（バイト数）
+
+        Returns:
+            削除後の合計サイズ（バイト数）
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*/*.html"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # 他のワーカーが削除した
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"HTMLキャッシュの削除に失敗しました: {path} - {e}")
+                continue
+            total -= size
+        return total
+
+
+# グローバルなレンダラーインスタンス（キャッシュをプロセス内で共有する）
+markdown_renderer = CachedMarkdownRenderer(
+    MarkdownItRenderer(),
+    cache_dir=settings.STORAGE_PATH / "html_cache",
+    max_entries=settings.HTML_CACHE_MAX_ENTRIES,
+    max_disk_bytes=settings.HTML_CACHE_MAX_DISK_BYTES,
+)
@@ -0,0 +1,86 @@
+"""
+AsyncCategoryRepository の実装
+
+AsyncSession を使用した非同期カテゴリリポジトリの実装。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.category import Category, CategoryWithStats
+from app.domain.repositories.async_category_repository import (
+    AsyncCategoryRepository,
+)
+from app.infrastructure.repositories.category_repository_impl import (
+    CategoryRepositoryImpl,
+)
+
+T = TypeVar("T")
+
+
+class AsyncCategoryRepositoryImpl(AsyncCategoryRepository):
+    """
+    AsyncSession を使用したカテゴリリポジトリの実装
+
+    クエリとマッピング、キャッシュの無効化、変更フィードへの記録は同期版の
+    CategoryRepositoryImpl と共通です。AsyncSession.run_sync の中で
+    同期版を呼び出し、DBアクセスは非同期ドライバーを通じて行います。
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        リポジトリを初期化します。
+
+        Args:
+            db: SQLAlchemy 非同期セッション
+        """
+        self.db = db
+
+    async def _run(self, operation: Callable[[CategoryRepositoryImpl], T]) -> T:
+        """
+        同期版のリポジトリ操作を非同期セッション上で実行します。
+
+        Args:
+            operation: 同期版のリポジトリを受け取る関数
+
+        Returns:
+            操作の戻り値
+        """
+        return await self.db.run_sync(lambda db: operation(CategoryRepositoryImpl(db)))
+
+    async def get_by_id(self, category_id: UUID) -> Category | None:
+        """IDでカテゴリを取得します"""
+        return await self._run(lambda repository: repository.get_by_id(category_id))
+
+    async def get_many(self, category_ids: Sequence[UUID]) -> dict[UUID, Category]:
+        """複数のIDでカテゴリをまとめて取得します"""
+        return await self._run(lambda repository: repository.get_many(category_ids))
+
+    async def list(self, skip: int = 0, limit: int = 100) -> list[Category]:
+        """カテゴリのリストを取得します"""
+        return await self._run(lambda repository: repository.list(skip, limit))
+
+    async def list_with_stats(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
+        """集計値付きでカテゴリのリストを取得します"""
+        return await self._run(
+            lambda repository: repository.list_with_stats(skip, limit, top_tags_limit)
+        )
+
+    async def create(self, category: Category) -> Category:
+        """カテゴリを作成します"""
+        return await self._run(lambda repository: repository.create(category))
+
+    async def update(self, category: Category) -> Category:
+        """カテゴリを更新します"""
+        return await self._run(lambda repository: repository.update(category))
+
+    async def delete(self, category_id: UUID) -> bool:
+        """カテゴリを削除します"""
+        return await self._run(lambda repository: repository.delete(category_id))
@@ -0,0 +1,328 @@
+"""
+AsyncLLMResponseRepository の実装
+
+AsyncSession を使用した非同期LLM応答リポジトリの実装。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.models.content_stats import (
+    ContentStatsFilter,
+    ResponseSortKey,
+    SortOrder,
+)
+from app.domain.models.llm_response import LLMResponse
+from app.domain.ports.content_storage import ContentStorage, ContentWriter
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.storage.file_content_storage import content_storage
+
+T = TypeVar("T")
+
+
+class _DeferredDeletes(ContentStorage):
+    """
+    run_sync の中で本文ストレージの削除を行わないためのラッパー
+
+    削除は記録するだけで、run_sync を抜けた後にワーカースレッドで実行します。
+    読み出しは、先に読み込んだ本文があればそれを返します。
+    """
+
+    def __init__(self, storage: ContentStorage, loaded: dict[str, str]) -> None:
+        """
+        Args:
+            storage: 実際の本文ストレージ
+            loaded: 読み込み済みの本文（パスをキーとする）
+        """
+        self.storage = storage
+        self.loaded = loaded
+        self.pending_deletes: list[str] = []
+
+    def open_writer(self, max_bytes: int) -> ContentWriter:
+        return self.storage.open_writer(max_bytes)
+
+    def iter_lines(self, path: str) -> Iterator[str]:
+        return self.storage.iter_lines(path)
+
+    def read_text(self, path: str) -> str:
+        if path in self.loaded:
+            return self.loaded[path]
+        # 先に読み込んだ後で、並行する更新が本文ストレージのパスを変えた場合のみ
+        return self.storage.read_text(path)
+
+    def delete(self, path: str) -> None:
+        self.pending_deletes.append(path)
+
+
+class AsyncLLMResponseRepositoryImpl(AsyncLLMResponseRepository):
+    """
+    AsyncSession を使用したLLM応答リポジトリの実装
+
+    クエリの組み立てと行のマッピング、キャッシュ、変更フィードへの記録、
+    ドメインイベントの発行は同期版の LLMResponseRepositoryImpl と共通です。
+    AsyncSession.run_sync の中で同期版を呼び出すため、DBアクセスは
+    スレッドプールを介さず、イベントループ上で非同期ドライバーを通じて行われます。
+
+    run_sync の中はイベントループ上で実行されるため、本文ストレージの
+    ファイル I/O は run_sync の外のワーカースレッドで行います。
+    取得では同期版に本文を読み出させず（load_contents=False）、返された
+    storage_path の本文を run_sync の後に読み出します。更新では、版に残す
+    更新前の本文を run_sync の前に読み出します。削除は run_sync の後に行います。
+    """
+
+    def __init__(self, db: AsyncSession, storage: ContentStorage = content_storage):
+        """
+        リポジトリを初期化します。
+
+        Args:
+            db: SQLAlchemy 非同期セッション
+            storage: storage_path が設定された本文を読み書きする本文ストレージ
+        """
+        self.db = db
+        self.storage = storage
+        # 読み込んだ本文（本文ストレージのパスごとの本文は書き換えられない）
+        self._loaded: dict[str, str] = {}
+
+    async def _run(
+        self,
+        operation: Callable[[LLMResponseRepositoryImpl], T],
+        load_contents: bool = False,
+    ) -> T:
+        """
+        同期版のリポジトリ操作を非同期セッション上で実行します。
+
+        Args:
+            operation: 同期版のリポジトリを受け取る関数
+            load_contents: 同期版に本文ストレージの本文を読み出させるかどうか
+                （読み込み済みの本文のみを読む操作の場合に True にする）
+
+        Returns:
+            操作の戻り値
+        """
+        storage = _DeferredDeletes(self.storage, self._loaded)
+        result = await self.db.run_sync(
+            lambda db: operation(
+                LLMResponseRepositoryImpl(
+                    db, storage=storage, load_contents=load_contents
+                )
+            )
+        )
+        if storage.pending_deletes:
+            await asyncio.to_thread(self._delete_all, storage.pending_deletes)
+        return result
+
+    async def _load(self, paths: Iterable[str]) -> dict[str, str]:
+        """
+        本文ストレージの本文を、読み込んでいないものだけワーカースレッドで読み出します。
+
+        Args:
+            paths: 本文ストレージのパス
+
+        Returns:
+            読み込み済みの本文（パスをキーとする）
+        """
+        missing = set(paths).difference(self._loaded)
+        if missing:
+            self._loaded.update(await asyncio.to_thread(self._read_all, missing))
+        return self._loaded
+
+    async def _load_responses(self, responses: Iterable[LLMResponse]) -> None:
+        """storage_path が設定されたLLM応答に、本文ストレージの本文を設定します。"""
+        stored = [response for response in responses if response.storage_path]
+        if not stored:
+            return
+        contents = await self._load(response.storage_path for response in stored)
+        for response in stored:
+            response.content_md = contents[response.storage_path]
+
+    async def _load_projections(
+        self, projections: Iterable[dict[str, Any]], fields: Sequence[str]
+    ) -> None:
+        """
+        content_md を要求した射影に、本文ストレージの本文を設定します。
+
+        同期版が本文の読み出し用に加えた storage_path は、要求されていなければ除きます。
+        """
+        if "content_md" not in fields:
+            return
+        requested = "storage_path" in fields
+        stored: list[tuple[dict[str, Any], str]] = []
+        for projection in projections:
+            path = (
+                projection["storage_path"]
+                if requested
+                else projection.pop("storage_path")
+            )
+            if path is not None:
+                stored.append((projection, path))
+        if not stored:
+            return
+        contents = await self._load(path for _, path in stored)
+        for projection, path in stored:
+            projection["content_md"] = contents[path]
+
+    def _read_all(self, paths: set[str]) -> dict[str, str]:
+        """本文ストレージから本文を読み出します（ワーカースレッドで実行）。"""
+        return {path: self.storage.read_text(path) for path in paths}
+
+    def _delete_all(self, paths: list[str]) -> None:
+        """本文ストレージから本文を削除します（ワーカースレッドで実行）。"""
+        for path in paths:
+            self.storage.delete(path)
+
+    async def get_by_id(self, response_id: UUID) -> LLMResponse | None:
+        """IDでLLM応答を取得します"""
+        response = await self._run(lambda repository: repository.get_by_id(response_id))
+        if response is not None:
+            await self._load_responses([response])
+        return response
+
+    async def get_many(self, response_ids: Sequence[UUID]) -> dict[UUID, LLMResponse]:
+        """複数のIDでLLM応答をまとめて取得します"""
+        responses = await self._run(
+            lambda repository: repository.get_many(response_ids)
+        )
+        await self._load_responses(responses.values())
+        return responses
+
+    async def list(self, skip: int = 0, limit: int = 100) -> list[LLMResponse]:
+        """LLM応答のリストを取得します"""
+        responses = await self._run(lambda repository: repository.list(skip, limit))
+        await self._load_responses(responses)
+        return responses
+
+    async def search(
+        self,
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[LLMResponse]:
+        """LLM応答を検索します"""
+        responses = await self._run(
+            lambda repository: repository.search(
+                query=query,
+                category_id=category_id,
+                tags=tags,
+                skip=skip,
+                limit=limit,
+                stats_filter=stats_filter,
+                sort=sort,
+                order=order,
+            )
+        )
+        await self._load_responses(responses)
+        return responses
+
+    async def get_projection(
+        self, response_id: UUID, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """IDでLLM応答の指定フィールドのみを取得します"""
+        projection = await self._run(
+            lambda repository: repository.get_projection(response_id, fields)
+        )
+        if projection is not None:
+            await self._load_projections([projection], fields)
+        return projection
+
+    async def get_many_projection(
+        self, response_ids: Sequence[UUID], fields: Sequence[str]
+    ) -> dict[UUID, dict[str, Any]]:
+        """複数のIDでLLM応答の指定フィールドのみをまとめて取得します"""
+        projections = await self._run(
+            lambda repository: repository.get_many_projection(response_ids, fields)
+        )
+        await self._load_projections(projections.values(), fields)
+        return projections
+
+    async def search_projection(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """LLM応答を検索し、指定フィールドのみを取得します"""
+        projections = await self._run(
+            lambda repository: repository.search_projection(
+                fields=fields,
+                query=query,
+                category_id=category_id,
+                tags=tags,
+                skip=skip,
+                limit=limit,
+                stats_filter=stats_filter,
+                sort=sort,
+                order=order,
+            )
+        )
+        await self._load_projections(projections, fields)
+        return projections
+
+    async def list_chunks(self, response_id: UUID) -> list[ContentChunk] | None:
+        """LLM応答の本文のチャンクの一覧を、位置順に取得します"""
+        return await self._run(lambda repository: repository.list_chunks(response_id))
+
+    async def get_chunk(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """LLM応答の本文のチャンクを1つ取得します"""
+        return await self._run(
+            lambda repository: repository.get_chunk(response_id, position)
+        )
+
+    async def search_chunks(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """本文のチャンク単位でLLM応答を検索します"""
+        return await self._run(
+            lambda repository: repository.search_chunks(
+                query=query, category_id=category_id, skip=skip, limit=limit
+            )
+        )
+
+    async def create(self, response: LLMResponse) -> LLMResponse:
+        """LLM応答を作成します"""
+        return await self._run(lambda repository: repository.create(response))
+
+    async def update(self, response: LLMResponse) -> LLMResponse:
+        """LLM応答を更新します"""
+        if response.storage_path is None:
+            # 本文が変わった場合に版に残す、更新前の本文を先に読み込んでおく
+            previous = await self._run(
+                lambda repository: repository.get_projection(
+                    response.id, ["content_md"]
+                )
+            )
+            if previous is not None and previous["storage_path"] is not None:
+                await self._load([previous["storage_path"]])
+        return await self._run(
+            lambda repository: repository.update(response), load_contents=True
+        )
+
+    async def delete(self, response_id: UUID) -> bool:
+        """LLM応答を削除します"""
+        return await self._run(lambda repository: repository.delete(response_id))
@@ -1,19 +1,29 @@
 """
 CategoryRepository の実装
 
-from __future__ import annotations
-
 SQLAlchemyを使用したカテゴリリポジトリの実装。
 ORMモデルとドメインエンティティ間のマッピングを行います。
 """
 
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Sequence
 from uuid import UUID
 
+from sqlalchemy import func, select, true, update
 from sqlalchemy.orm import Session
 
-from app.domain.models.category import Category
+from app.domain.models.category import Category, CategoryWithStats
+from app.domain.models.change import ChangeOperation, EntityType
 from app.domain.repositories.category_repository import CategoryRepository
-from app.infrastructure.db.models import CategoryORM
+from app.infrastructure.cache.coherence import (
+    CATEGORIES_SCOPE,
+    LLM_RESPONSES_SCOPE,
+    change_tracker,
+)
+from app.infrastructure.db.models import CategoryORM, LLMResponseORM
+from app.infrastructure.sync.change_feed import change_feed
 
 
 class CategoryRepositoryImpl(CategoryRepository):
@@ -41,7 +51,7 @@ class CategoryRepositoryImpl(CategoryRepository):
             Category ドメインエンティティ
         """
         return Category(
-            id=UUID(orm_model.id),
+            id=orm_model.id,
             name=orm_model.name,
             description=orm_model.description,
             created_at=orm_model.created_at,
@@ -59,7 +69,7 @@ class CategoryRepositoryImpl(CategoryRepository):
             CategoryORM インスタンス
         """
         return CategoryORM(
-            id=str(domain_model.id),
+            id=domain_model.id,
             name=domain_model.name,
             description=domain_model.description,
             created_at=domain_model.created_at,
@@ -69,21 +79,129 @@ class CategoryRepositoryImpl(CategoryRepository):
     def get_by_id(self, category_id: UUID) -> Category | None:
         """IDでカテゴリを取得します"""
         orm_model = (
-            self.db.query(CategoryORM)
-            .filter(CategoryORM.id == str(category_id))
-            .first()
+            self.db.query(CategoryORM).filter(CategoryORM.id == category_id).first()
         )
         return self._to_domain(orm_model) if orm_model else None
 
+    def get_many(self, category_ids: Sequence[UUID]) -> dict[UUID, Category]:
+        """複数のIDでカテゴリをまとめて取得します"""
+        if not category_ids:
+            return {}
+        orm_models = (
+            self.db.query(CategoryORM)
+            .filter(CategoryORM.id.in_(set(category_ids)))
+            .all()
+        )
+        return {
+            category.id: category
+            for category in (self._to_domain(orm) for orm in orm_models)
+        }
+
     def list(self, skip: int = 0, limit: int = 100) -> list[Category]:
         """カテゴリのリストを取得します"""
         orm_models = self.db.query(CategoryORM).offset(skip).limit(limit).all()
         return [self._to_domain(orm_model) for orm_model in orm_models]
 
+    def list_with_stats(
+        self, skip: int = 0, limit: int = 100, top_tags_limit: int = 3
+    ) -> list[CategoryWithStats]:
+        """集計値付きでカテゴリのリストを取得します"""
+        # 応答の件数・最終更新日時をカテゴリIDごとに1回の集約クエリで求める
+        response_stats = (
+            select(
+                LLMResponseORM.category_id.label("category_id"),
+                func.count(LLMResponseORM.id).label("response_count"),
+                func.max(LLMResponseORM.updated_at).label("last_activity_at"),
+            )
+            .where(LLMResponseORM.category_id.is_not(None))
+            .group_by(LLMResponseORM.category_id)
+            .subquery()
+        )
+        rows = (
+            self.db.query(
+                CategoryORM,
+                response_stats.c.response_count,
+                response_stats.c.last_activity_at,
+            )
+            .outerjoin(response_stats, response_stats.c.category_id == CategoryORM.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+        top_tags = self._top_tags_by_category(
+            [orm_model.id for orm_model, _, _ in rows], top_tags_limit
+        )
+
+        return [
+            CategoryWithStats(
+                id=orm_model.id,
+                name=orm_model.name,
+                description=orm_model.description,
+                created_at=orm_model.created_at,
+                updated_at=orm_model.updated_at,
+                response_count=response_count or 0,
+                last_activity_at=last_activity_at,
+                top_tags=top_tags.get(orm_model.id, []),
+            )
+            for orm_model, response_count, last_activity_at in rows
+        ]
+
+    def _top_tags_by_category(
+        self, category_ids: list[UUID], top_tags_limit: int
+    ) -> dict[UUID, list[str]]:
+        """
+        カテゴリごとの使用頻度上位タグを取得します。
+
+        SQLiteでは json_each でタグ配列を展開し、DB側で集計します。
+        その他のDBではタグ列のみを取得してアプリ側で集計します。
+
+        Args:
+            category_ids: 対象カテゴリのIDリスト
+            top_tags_limit: カテゴリごとに返すタグの最大数
+
+        Returns:
+            カテゴリIDをキー、タグのリスト（多い順）を値とする辞書
+        """
+        if not category_ids or top_tags_limit <= 0:
+            return {}
+
+        counters: dict[UUID, Counter[str]] = defaultdict(Counter)
+        in_categories = LLMResponseORM.category_id.in_(category_ids)
+
+        if self.db.get_bind().dialect.name == "sqlite":
+            tag = func.json_each(LLMResponseORM.tags).table_valued("value")
+            tag_counts = self.db.execute(
+                select(LLMResponseORM.category_id, tag.c.value, func.count())
+                .select_from(LLMResponseORM)
+                .join(tag, true())
+                .where(in_categories)
+                .group_by(LLMResponseORM.category_id, tag.c.value)
+            )
+            for category_id, tag_name, count in tag_counts:
+                counters[category_id][tag_name] = count
+        else:
+            tag_lists = self.db.execute(
+                select(LLMResponseORM.category_id, LLMResponseORM.tags).where(
+                    in_categories
+                )
+            )
+            for category_id, tags in tag_lists:
+                counters[category_id].update(tags or [])
+
+        return {
+            category_id: [name for name, _ in counter.most_common(top_tags_limit)]
+            for category_id, counter in counters.items()
+        }
+
     def create(self, category: Category) -> Category:
         """カテゴリを作成します"""
         orm_model = self._to_orm(category)
         self.db.add(orm_model)
+        change_tracker.bump(self.db, CATEGORIES_SCOPE)
+        change_feed.record(
+            self.db, EntityType.CATEGORY, category.id, ChangeOperation.CREATED
+        )
         self.db.commit()
         self.db.refresh(orm_model)
         return self._to_domain(orm_model)
@@ -91,14 +209,16 @@ class CategoryRepositoryImpl(CategoryRepository):
     def update(self, category: Category) -> Category:
         """カテゴリを更新します"""
         orm_model = (
-            self.db.query(CategoryORM)
-            .filter(CategoryORM.id == str(category.id))
-            .first()
+            self.db.query(CategoryORM).filter(CategoryORM.id == category.id).first()
         )
         if orm_model:
             orm_model.name = category.name
             orm_model.description = category.description
             orm_model.updated_at = category.updated_at
+            change_tracker.bump(self.db, CATEGORIES_SCOPE)
+            change_feed.record(
+                self.db, EntityType.CATEGORY, category.id, ChangeOperation.UPDATED
+            )
             self.db.commit()
             self.db.refresh(orm_model)
             return self._to_domain(orm_model)
@@ -106,10 +226,41 @@ class CategoryRepositoryImpl(CategoryRepository):
 
     def delete(self, category_id: UUID) -> bool:
         """カテゴリを削除します"""
+        # 外部キー制約に違反しないよう、所属するLLM応答を未分類にしてから削除する
+        self._detach_responses(category_id)
         result = (
-            self.db.query(CategoryORM)
-            .filter(CategoryORM.id == str(category_id))
-            .delete()
+            self.db.query(CategoryORM).filter(CategoryORM.id == category_id).delete()
         )
+        if result > 0:
+            change_tracker.bump(self.db, CATEGORIES_SCOPE)
+            change_feed.record(
+                self.db, EntityType.CATEGORY, category_id, ChangeOperation.DELETED
+            )
         self.db.commit()
         return result > 0
+
+    def _detach_responses(self, category_id: UUID) -> None:
+        """
+        カテゴリに所属するLLM応答のカテゴリを解除します。
+
+        コミットは呼び出し側で行います。
+
+        Args:
+            category_id: 削除するカテゴリのID
+        """
+        table = LLMResponseORM.__table__
+        response_ids = self.db.scalars(
+            select(table.c.id).where(table.c.category_id == category_id)
+        ).all()
+        if not response_ids:
+            return
+        self.db.execute(
+            update(table)
+            .where(table.c.category_id == category_id)
+            .values(category_id=None, updated_at=table.c.updated_at)
+        )
+        change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+        for response_id in response_ids:
+            change_feed.record(
+                self.db, EntityType.RESPONSE, response_id, ChangeOperation.UPDATED
+            )
@@ -0,0 +1,52 @@
+"""
+ChangeRepository の実装
+
+SQLAlchemyを使用した変更記録リポジトリの実装。
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.domain.models.change import Change, ChangeOperation, EntityType
+from app.domain.repositories.change_repository import ChangeRepository
+from app.infrastructure.db.models import SyncChangeORM
+
+_TABLE = SyncChangeORM.__table__
+
+
+class ChangeRepositoryImpl(ChangeRepository):
+    """
+    変更記録リポジトリの実装クラス
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: データベースセッション
+        """
+        self.db = db
+
+    def list_since(self, since: int, limit: int = 500) -> list[Change]:
+        """指定したシーケンス番号より後の変更を、シーケンス番号順に取得します"""
+        rows = self.db.execute(
+            select(_TABLE)
+            .where(_TABLE.c.seq > since)
+            .order_by(_TABLE.c.seq)
+            .limit(limit)
+        )
+        return [
+            Change(
+                entity_type=EntityType(row.entity_type),
+                entity_id=row.entity_id,
+                operation=ChangeOperation(row.operation),
+                seq=row.seq,
+                changed_at=row.changed_at,
+            )
+            for row in rows
+        ]
+
+    def latest_seq(self) -> int:
+        """最新の変更シーケンス番号を取得します"""
+        return self.db.execute(select(func.max(_TABLE.c.seq))).scalar() or 0
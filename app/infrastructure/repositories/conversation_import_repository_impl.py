@@ -0,0 +1,156 @@
+"""
+ConversationImportRepository の実装
+
+SQLAlchemyを使用した取り込みリポジトリの実装。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.domain.events import ConversationImportQueued
+from app.domain.models.conversation_import import (
+    ConversationImport,
+    ExportFormat,
+    ImportStatus,
+)
+from app.domain.repositories.conversation_import_repository import (
+    ConversationImportRepository,
+)
+from app.infrastructure.db.models import ConversationImportORM
+from app.infrastructure.events.event_bus import event_bus
+
+_TABLE = ConversationImportORM.__table__
+
+# 作成後に変わらない列（update() の対象外）
+_IMMUTABLE_COLUMNS = ("id", "source_path", "source_bytes", "created_at")
+
+
+def _to_domain(row: Row) -> ConversationImport:
+    """
+    conversation_imports テーブルの行をドメインエンティティに変換します。
+
+    Args:
+        row: conversation_imports テーブルの全カラムを含む行
+
+    Returns:
+        ConversationImport ドメインエンティティ
+    """
+    return ConversationImport(
+        id=row.id,
+        source_path=row.source_path,
+        source_bytes=row.source_bytes,
+        format=ExportFormat(row.format) if row.format is not None else None,
+        category_id=row.category_id,
+        tags=row.tags if row.tags else [],
+        delete_source=row.delete_source,
+        status=ImportStatus(row.status),
+        byte_offset=row.byte_offset,
+        conversation_count=row.conversation_count,
+        imported_count=row.imported_count,
+        duplicate_count=row.duplicate_count,
+        last_error=row.last_error,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        completed_at=row.completed_at,
+    )
+
+
+def _to_row(conversation_import: ConversationImport) -> dict[str, Any]:
+    """
+    ドメインエンティティを conversation_imports テーブルの列値に変換します。
+
+    Args:
+        conversation_import: ConversationImport ドメインエンティティ
+
+    Returns:
+        カラム名をキーとする辞書
+    """
+    export_format = conversation_import.format
+    return {
+        "id": conversation_import.id,
+        "source_path": conversation_import.source_path,
+        "source_bytes": conversation_import.source_bytes,
+        "format": export_format.value if export_format is not None else None,
+        "category_id": conversation_import.category_id,
+        "tags": conversation_import.tags,
+        "delete_source": conversation_import.delete_source,
+        "status": conversation_import.status.value,
+        "byte_offset": conversation_import.byte_offset,
+        "conversation_count": conversation_import.conversation_count,
+        "imported_count": conversation_import.imported_count,
+        "duplicate_count": conversation_import.duplicate_count,
+        "last_error": conversation_import.last_error,
+        "created_at": conversation_import.created_at,
+        "updated_at": conversation_import.updated_at,
+        "completed_at": conversation_import.completed_at,
+    }
+
+
+class ConversationImportRepositoryImpl(ConversationImportRepository):
+    """
+    SQLAlchemy を使用した取り込みリポジトリの実装
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: SQLAlchemyセッション
+        """
+        self.db = db
+
+    def get_by_id(self, import_id: UUID) -> ConversationImport | None:
+        """IDで取り込みを取得します"""
+        row = self.db.execute(select(_TABLE).where(_TABLE.c.id == import_id)).first()
+        return _to_domain(row) if row is not None else None
+
+    def list(self, skip: int = 0, limit: int = 100) -> list[ConversationImport]:
+        """取り込みの一覧を新しい順に取得します"""
+        rows = self.db.execute(
+            select(_TABLE)
+            .order_by(_TABLE.c.created_at.desc(), _TABLE.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [_to_domain(row) for row in rows]
+
+    def find_resumable(
+        self, source_path: str, source_bytes: int
+    ) -> ConversationImport | None:
+        """同じエクスポートファイルの、完了していない最新の取り込みを取得します"""
+        row = self.db.execute(
+            select(_TABLE)
+            .where(
+                _TABLE.c.source_path == source_path,
+                _TABLE.c.source_bytes == source_bytes,
+                _TABLE.c.status != ImportStatus.COMPLETED.value,
+            )
+            .order_by(_TABLE.c.created_at.desc())
+            .limit(1)
+        ).first()
+        return _to_domain(row) if row is not None else None
+
+    def create(self, conversation_import: ConversationImport) -> ConversationImport:
+        """取り込みを登録します"""
+        self.db.execute(insert(_TABLE).values(_to_row(conversation_import)))
+        if conversation_import.status is ImportStatus.QUEUED:
+            event_bus.publish(self.db, ConversationImportQueued(conversation_import))
+        self.db.commit()
+        return conversation_import
+
+    def update(self, conversation_import: ConversationImport) -> ConversationImport:
+        """取り込みの状態と進捗を更新します"""
+        conversation_import.updated_at = datetime.now()
+        values = _to_row(conversation_import)
+        for column in _IMMUTABLE_COLUMNS:
+            values.pop(column)
+        self.db.execute(
+            update(_TABLE).where(_TABLE.c.id == conversation_import.id).values(values)
+        )
+        self.db.commit()
+        return conversation_import
@@ -0,0 +1,77 @@
+"""
+JobRepository の実装
+
+SQLAlchemyを使用したジョブリポジトリの実装。
+ジョブキューと同じ jobs テーブルを参照します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.domain.models.job import Job, JobStatus
+from app.domain.repositories.job_repository import JobRepository
+from app.infrastructure.db.models import JobORM
+from app.infrastructure.jobs.job_queue import JobQueue, job_from_row, job_queue
+
+_TABLE = JobORM.__table__
+
+
+class JobRepositoryImpl(JobRepository):
+    """
+    ジョブリポジトリの実装クラス
+    """
+
+    def __init__(self, db: Session, queue: JobQueue = job_queue):
+        """
+        Args:
+            db: データベースセッション
+            queue: 再登録時にワーカーへ通知するジョブキュー
+        """
+        self.db = db
+        self.queue = queue
+
+    def get_by_id(self, job_id: int) -> Job | None:
+        """IDでジョブを取得します"""
+        row = self.db.execute(select(_TABLE).where(_TABLE.c.id == job_id)).first()
+        return job_from_row(row) if row is not None else None
+
+    def list(
+        self,
+        status: JobStatus | None = None,
+        kind: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Job]:
+        """ジョブの一覧を新しい順に取得します"""
+        statement = select(_TABLE)
+        if status is not None:
+            statement = statement.where(_TABLE.c.status == status.value)
+        if kind is not None:
+            statement = statement.where(_TABLE.c.kind == kind)
+        rows = self.db.execute(
+            statement.order_by(_TABLE.c.id.desc()).offset(skip).limit(limit)
+        )
+        return [job_from_row(row) for row in rows]
+
+    def retry(self, job_id: int) -> Job | None:
+        """失敗したジョブを試行回数をリセットして再登録します"""
+        now = datetime.now()
+        result = self.db.execute(
+            update(_TABLE)
+            .where(_TABLE.c.id == job_id, _TABLE.c.status == JobStatus.FAILED.value)
+            .values(
+                status=JobStatus.QUEUED.value,
+                attempts=0,
+                run_at=now,
+                updated_at=now,
+            )
+        )
+        self.db.commit()
+        if result.rowcount == 0:
+            return None
+        self.queue.notify()
+        return self.get_by_id(job_id)
@@ -2,18 +2,341 @@
 LLMResponseRepository の実装
 
 SQLAlchemyを使用したLLM応答リポジトリの実装。
-ORMモデルとドメインエンティティ間のマッピングを行います。
+テーブルの行とドメインエンティティ間のマッピングを行います。
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import batched
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Text,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    insert,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.orm import Session
 
-from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.events import (
+    LLMResponseCreated,
+    LLMResponseDeleted,
+    LLMResponsesCreated,
+    LLMResponseUpdated,
+)
+from app.domain.models.category import Category
+from app.domain.models.change import ChangeOperation, EntityType
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.models.content_stats import (
+    ContentStats,
+    ContentStatsFilter,
+    ResponseSortKey,
+    SortOrder,
+)
+from app.domain.models.llm_response import LLMProvider, LLMResponse, SummarySource
+from app.domain.ports.content_storage import ContentStorage
 from app.domain.repositories.llm_response_repository import LLMResponseRepository
-from app.infrastructure.db.models import LLMResponseORM
+from app.infrastructure.cache.category_cache import CategoryCache, category_cache
+from app.infrastructure.cache.coherence import LLM_RESPONSES_SCOPE, change_tracker
+from app.infrastructure.db.models import (
+    LLMResponseORM,
+    PromptORM,
+    ResponseChunkORM,
+    ResponseRevisionORM,
+)
+from app.infrastructure.events.event_bus import event_bus
+from app.infrastructure.repositories.prompt_repository_impl import (
+    delete_unused_prompts,
+    intern_prompts,
+)
+from app.infrastructure.repositories.response_revision_repository_impl import (
+    record_revision,
+)
+from app.infrastructure.repositories.tag_stat_repository_impl import (
+    update_tag_stats,
+)
+from app.infrastructure.storage.file_content_storage import content_storage
+from app.infrastructure.sync.change_feed import change_feed
+
+# 読み書きは ORM インスタンスを介さず Core のテーブルに対して行う
+_TABLE = LLMResponseORM.__table__
+
+_CHUNKS = ResponseChunkORM.__table__
+
+_PROMPTS = PromptORM.__table__
+
+_REVISIONS = ResponseRevisionORM.__table__
+
+# プロンプトの本文は prompts テーブルから主キーで結合して読む
+# （prompt_id が未設定の行のプロンプトは NULL になる）
+_PROMPT_JOIN = _TABLE.outerjoin(_PROMPTS, _PROMPTS.c.id == _TABLE.c.prompt_id)
+_PROMPT_TEXT = _PROMPTS.c.text.label("prompt")
+
+# LLM応答の全カラムとプロンプトの本文を取得する SELECT 文
+_SELECT_RESPONSES = select(_TABLE, _PROMPT_TEXT).select_from(_PROMPT_JOIN)
+
+# IN 句1回あたりのID数（SQLiteのバインド変数上限 999 を下回るように分割する）
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+# プロバイダー文字列から Enum への変換表（行ごとの Enum 探索を避ける）
+_PROVIDERS: dict[str, LLMProvider] = {
+    provider.value: provider for provider in LLMProvider
+}
+
+# 要約の設定元の文字列から Enum への変換表
+_SUMMARY_SOURCES: dict[str | None, SummarySource] = {
+    source.value: source for source in SummarySource
+}
+
+
+# 本文の統計情報を保存する列（ContentStats の属性名と同じ）
+_STATS_COLUMNS: tuple[str, ...] = tuple(ContentStats.__dataclass_fields__)
+
+
+def _stats_from_values(values: Any) -> ContentStats | None:
+    """
+    統計情報の列の値から ContentStats を組み立てます。
+
+    Args:
+        values: 統計情報の列を属性として持つ行
+
+    Returns:
+        本文の統計情報。未算出（NULL）の場合はNone
+    """
+    if values.char_count is None:
+        return None
+    return ContentStats(
+        char_count=values.char_count,
+        byte_count=values.byte_count,
+        token_estimate=values.token_estimate,
+        code_block_count=values.code_block_count,
+        code_languages=values.code_languages or [],
+        heading_count=values.heading_count,
+        link_count=values.link_count,
+    )
+
+
+def _stats_to_values(stats: ContentStats | None) -> dict[str, Any]:
+    """
+    ContentStats を統計情報の列の値に変換します。
+
+    Args:
+        stats: 本文の統計情報。未算出の場合はNone
+
+    Returns:
+        列名をキーとする辞書（未算出の場合はすべて None）
+    """
+    return {name: getattr(stats, name, None) for name in _STATS_COLUMNS}
+
+
+def _select_projection(fields: Sequence[str]) -> Select:
+    """
+    要求されたフィールドの取得に必要な列のみの SELECT 文を返します。
+
+    id は常に含み、"category" は category_id 列から、"stats" は統計情報の
+    各列から、"content_md" は本文ストレージに保存されている場合に備えて
+    storage_path 列もあわせて解決します。"prompt" を要求された場合のみ
+    prompts テーブルを結合します。
+
+    Args:
+        fields: 要求されたフィールド名
+
+    Returns:
+        llm_responses テーブルを対象とする SELECT 文
+
+    Raises:
+        ValueError: 存在しないフィールド名が含まれる場合
+    """
+    names = {"id"}
+    with_prompt = False
+    for name in fields:
+        if name == "category":
+            names.add("category_id")
+        elif name == "content_md":
+            names.update(("content_md", "storage_path"))
+        elif name == "stats":
+            names.update(_STATS_COLUMNS)
+        elif name == "prompt":
+            with_prompt = True
+        elif name in _TABLE.c:
+            names.add(name)
+        else:
+            raise ValueError(f"未知のフィールドです: {name}")
+    columns: list[Any] = [column for column in _TABLE.c if column.name in names]
+    if not with_prompt:
+        return select(*columns)
+    return select(*columns, _PROMPT_TEXT).select_from(_PROMPT_JOIN)
+
+
+def _chunk_from_row(row: Row, with_content: bool = True) -> ContentChunk:
+    """
+    response_chunks テーブルの行を ContentChunk に変換します。
+
+    Args:
+        row: response_chunks テーブルの行
+        with_content: content 列を含む行かどうか
+
+    Returns:
+        本文のチャンク
+    """
+    return ContentChunk(
+        position=row.position,
+        start_offset=row.start_offset,
+        end_offset=row.end_offset,
+        heading=row.heading,
+        heading_level=row.heading_level,
+        content=row.content if with_content else None,
+    )
+
+
+def _chunk_rows(response_id: UUID, chunks: Iterable[ContentChunk]) -> list[dict]:
+    """
+    チャンクを response_chunks テーブルの列値に変換します。
+
+    Args:
+        response_id: チャンクを含むLLM応答のID
+        chunks: 本文のチャンク
+
+    Returns:
+        カラム名をキーとする辞書のリスト
+    """
+    return [
+        {
+            "response_id": response_id,
+            "position": chunk.position,
+            "start_offset": chunk.start_offset,
+            "end_offset": chunk.end_offset,
+            "heading": chunk.heading,
+            "heading_level": chunk.heading_level,
+            "content": chunk.content or "",
+        }
+        for chunk in chunks
+    ]
+
+
+def _missing_summary():
+    """要約が未設定（NULL または空文字）であることを表す条件を返します。"""
+    return or_(_TABLE.c.summary.is_(None), _TABLE.c.summary == "")
+
+
+def _filter_stats(stats_filter: ContentStatsFilter) -> list[ColumnElement[bool]]:
+    """
+    本文の統計情報による絞り込み条件を返します。
+
+    Args:
+        stats_filter: 統計情報による絞り込み条件
+
+    Returns:
+        WHERE 句に追加する条件のリスト
+    """
+    conditions: list[ColumnElement[bool]] = []
+    if stats_filter.min_chars is not None:
+        conditions.append(_TABLE.c.char_count >= stats_filter.min_chars)
+    if stats_filter.max_chars is not None:
+        conditions.append(_TABLE.c.char_count <= stats_filter.max_chars)
+    if stats_filter.min_tokens is not None:
+        conditions.append(_TABLE.c.token_estimate >= stats_filter.min_tokens)
+    if stats_filter.max_tokens is not None:
+        conditions.append(_TABLE.c.token_estimate <= stats_filter.max_tokens)
+    if stats_filter.has_code is True:
+        conditions.append(_TABLE.c.code_block_count > 0)
+    elif stats_filter.has_code is False:
+        conditions.append(_TABLE.c.code_block_count == 0)
+    if stats_filter.code_language:
+        # JSON 配列の要素は二重引用符で囲まれるため、引用符ごと照合して
+        # 部分一致（"c" が "cpp" に一致するなど）を避ける
+        language = stats_filter.code_language.lower()
+        escaped = language.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append(
+            cast(_TABLE.c.code_languages, Text).like(f'%"{escaped}"%', escape="\\")
+        )
+    return conditions
+
+
+def _order_by(sort: ResponseSortKey, order: SortOrder) -> list[ColumnElement[Any]]:
+    """
+    並べ替えの ORDER BY 句を返します。
+
+    キーが同じ値の行の順序が一定になるよう、ID を第2キーにします。
+
+    Args:
+        sort: 並べ替えキー
+        order: 並び順
+
+    Returns:
+        ORDER BY 句に指定する式のリスト
+    """
+    columns = (_TABLE.c[sort.value], _TABLE.c.id)
+    if order == SortOrder.DESC:
+        return [column.desc() for column in columns]
+    return [column.asc() for column in columns]
+
+
+def _filter_search(
+    statement: Select,
+    query: str | None,
+    category_id: UUID | None,
+    tags: list[str] | None,
+    stats_filter: ContentStatsFilter | None = None,
+) -> Select:
+    """
+    検索条件を SELECT 文に追加します。
+
+    Args:
+        statement: 条件を追加する SELECT 文
+        query: 検索クエリ（タイトル・プロンプト・内容で検索）
+        category_id: カテゴリIDでフィルタ
+        tags: タグでフィルタ
+        stats_filter: 本文の統計情報でフィルタ
+
+    Returns:
+        検索条件を追加した SELECT 文
+    """
+    # テキスト検索（タイトル、プロンプト、内容）
+    # 本文ストレージに保存された本文は、DBに保存したチャンクで検索する
+    if query:
+        search_pattern = f"%{query}%"
+        statement = statement.where(
+            (_TABLE.c.title.like(search_pattern))
+            | _TABLE.c.prompt_id.in_(
+                select(_PROMPTS.c.id).where(_PROMPTS.c.text.like(search_pattern))
+            )
+            | (_TABLE.c.content_md.like(search_pattern))
+            | (
+                _TABLE.c.storage_path.is_not(None)
+                & exists().where(
+                    _CHUNKS.c.response_id == _TABLE.c.id,
+                    _CHUNKS.c.content.like(search_pattern),
+                )
+            )
+        )
+
+    # カテゴリでフィルタ
+    if category_id:
+        statement = statement.where(_TABLE.c.category_id == category_id)
+
+    # タグでフィルタ（JSON配列内の要素を検索）
+    # 注: SQLiteでは簡易的な実装、PostgreSQLではより高度な検索が可能
+    if tags:
+        for tag in tags:
+            statement = statement.where(_TABLE.c.tags.contains(tag))
+
+    # 本文の統計情報でフィルタ（インデックス付きの列で絞り込む）
+    if stats_filter is not None:
+        statement = statement.where(*_filter_stats(stats_filter))
+
+    return statement
 
 
 class LLMResponseRepositoryImpl(LLMResponseRepository):
@@ -21,88 +344,184 @@ class LLMResponseRepositoryImpl(LLMResponseRepository):
     SQLAlchemy を使用したLLM応答リポジトリの実装
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        categories: CategoryCache = category_cache,
+        storage: ContentStorage = content_storage,
+        load_contents: bool = True,
+    ):
         """
         リポジトリを初期化します。
 
         Args:
             db: SQLAlchemyセッション
+            categories: カテゴリ参照の埋め込みに使用するカテゴリキャッシュ
+            storage: storage_path が設定された本文を読み書きする本文ストレージ
+            load_contents: 取得したLLM応答の本文を本文ストレージから読み出すか。
+                False の場合、storage_path が設定されたLLM応答の content_md は
+                空文字のまま返し（射影では storage_path も含める）、本文の
+                読み出しは呼び出し側で行う
         """
         self.db = db
+        self.categories = categories
+        self.storage = storage
+        self.load_contents = load_contents
+        self._category_snapshot: dict[UUID, Category] | None = None
+
+    def _category_ref(self, category_id: UUID | None) -> Category | None:
+        """
+        カテゴリキャッシュから所属カテゴリを取得します。
+
+        スナップショットはリポジトリインスタンス（リクエスト）ごとに1回だけ取得し、
+        以降は同じものを参照します。
+
+        Args:
+            category_id: カテゴリID
+
+        Returns:
+            カテゴリエンティティ。カテゴリ未設定または存在しない場合はNone
+        """
+        if category_id is None:
+            return None
+        if self._category_snapshot is None:
+            self._category_snapshot = self.categories.snapshot(self.db)
+        return self._category_snapshot.get(category_id)
+
+    def _content_md(self, content_md: str, storage_path: str | None) -> str:
+        """
+        本文を返します。本文ストレージに保存されている場合はそこから読み出します。
+
+        Args:
+            content_md: content_md 列の値
+            storage_path: storage_path 列の値
+
+        Returns:
+            本文の文字列（本文ストレージの本文を読み出さない設定の場合は空文字）
+        """
+        if storage_path is None:
+            return content_md
+        if not self.load_contents:
+            return ""
+        return self.storage.read_text(storage_path)
 
-    def _to_domain(self, orm_model: LLMResponseORM) -> LLMResponse:
+    def _to_domain(self, row: Row) -> LLMResponse:
         """
-        ORMモデルをドメインエンティティに変換します。
+        llm_responses テーブルの行をドメインエンティティに変換します。
+
+        ORMインスタンスを経由せず SQLAlchemy Core の Row から直接組み立てます。
+        プロバイダーの Enum 変換は辞書引きで行い、行ごとのオブジェクト生成を
+        抑えます（ID の UUID への変換は列型 BinaryUUID が行います）。
 
         Args:
-            orm_model: LLMResponseORM インスタンス
+            row: llm_responses テーブルの全カラムとプロンプトの本文（prompt）を含む行
 
         Returns:
             LLMResponse ドメインエンティティ
         """
+        category_id = row.category_id
         return LLMResponse(
-            id=UUID(orm_model.id),
-            title=orm_model.title,
-            prompt=orm_model.prompt,
-            content_md=orm_model.content_md,
-            model=orm_model.model,
-            provider=LLMProvider(orm_model.provider),
-            category_id=UUID(orm_model.category_id) if orm_model.category_id else None,
-            tags=orm_model.tags if orm_model.tags else [],
-            summary=orm_model.summary,
-            storage_location=orm_model.storage_location,
-            storage_path=orm_model.storage_path,
-            created_at=orm_model.created_at,
-            updated_at=orm_model.updated_at,
+            id=row.id,
+            title=row.title,
+            prompt=row.prompt or "",
+            content_md=self._content_md(row.content_md, row.storage_path),
+            model=row.model,
+            provider=_PROVIDERS[row.provider],
+            category_id=category_id,
+            tags=row.tags if row.tags else [],
+            summary=row.summary,
+            summary_source=_SUMMARY_SOURCES.get(row.summary_source),
+            storage_location=row.storage_location,
+            storage_path=row.storage_path,
+            stats=_stats_from_values(row),
+            content_hash=row.content_hash,
+            prompt_id=row.prompt_id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            category=self._category_ref(category_id),
         )
 
-    def _to_orm(self, domain_model: LLMResponse) -> LLMResponseORM:
+    def _to_row(self, domain_model: LLMResponse) -> dict[str, Any]:
         """
-        ドメインエンティティをORMモデルに変換します。
+        ドメインエンティティを llm_responses テーブルの列値に変換します。
 
         Args:
             domain_model: LLMResponse ドメインエンティティ
 
         Returns:
-            LLMResponseORM インスタンス
-        """
-        return LLMResponseORM(
-            id=str(domain_model.id),
-            title=domain_model.title,
-            prompt=domain_model.prompt,
-            content_md=domain_model.content_md,
-            model=domain_model.model,
-            provider=domain_model.provider.value,
-            category_id=str(domain_model.category_id)
-            if domain_model.category_id
+            カラム名をキーとする辞書
+        """
+        return {
+            "id": domain_model.id,
+            "title": domain_model.title,
+            "prompt_id": domain_model.prompt_id,
+            "content_md": domain_model.content_md,
+            "model": domain_model.model,
+            "provider": domain_model.provider.value,
+            "category_id": domain_model.category_id,
+            "tags": domain_model.tags,
+            "summary": domain_model.summary,
+            "summary_source": domain_model.summary_source.value
+            if domain_model.summary_source
             else None,
-            tags=domain_model.tags,
-            summary=domain_model.summary,
-            storage_location=domain_model.storage_location,
-            storage_path=domain_model.storage_path,
-            created_at=domain_model.created_at,
-            updated_at=domain_model.updated_at,
-        )
+            "storage_location": domain_model.storage_location,
+            "storage_path": domain_model.storage_path,
+            **_stats_to_values(domain_model.stats),
+            "content_hash": domain_model.content_hash,
+            "created_at": domain_model.created_at,
+            "updated_at": domain_model.updated_at,
+        }
 
     def get_by_id(self, response_id: UUID) -> LLMResponse | None:
         """IDでLLM応答を取得します"""
-        orm_model = (
-            self.db.query(LLMResponseORM)
-            .filter(LLMResponseORM.id == str(response_id))
-            .first()
+        row = self.db.execute(
+            _SELECT_RESPONSES.where(_TABLE.c.id == response_id)
+        ).first()
+        return self._to_domain(row) if row else None
+
+    def get_many(self, response_ids: Sequence[UUID]) -> dict[UUID, LLMResponse]:
+        """複数のIDでLLM応答をまとめて取得します"""
+        responses = (
+            self._to_domain(row)
+            for row in self._select_by_ids(_SELECT_RESPONSES, response_ids)
         )
-        return self._to_domain(orm_model) if orm_model else None
+        return {response.id: response for response in responses}
+
+    def get_many_projection(
+        self, response_ids: Sequence[UUID], fields: Sequence[str]
+    ) -> dict[UUID, dict[str, Any]]:
+        """複数のIDでLLM応答の指定フィールドのみをまとめて取得します"""
+        rows = self._select_by_ids(_select_projection(fields), response_ids)
+        return {row.id: self._to_projection(row, fields) for row in rows}
+
+    def _select_by_ids(
+        self, statement: Select, response_ids: Sequence[UUID]
+    ) -> Iterator[Row]:
+        """
+        ID の IN 句で行を取得します。
+
+        バインド変数の上限を超えないよう、IDを一定数ごとに分割して問い合わせます。
+
+        Args:
+            statement: 条件を追加する SELECT 文
+            response_ids: 取得するLLM応答のIDリスト
+
+        Yields:
+            取得した行
+        """
+        ids = list(dict.fromkeys(response_ids))
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+            yield from self.db.execute(statement.where(_TABLE.c.id.in_(chunk)))
 
     def list(self, skip: int = 0, limit: int = 100) -> list[LLMResponse]:
         """LLM応答のリストを取得します"""
-        orm_models = (
-            self.db.query(LLMResponseORM)
-            .order_by(LLMResponseORM.created_at.desc())
+        rows = self.db.execute(
+            _SELECT_RESPONSES.order_by(_TABLE.c.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
-        return [self._to_domain(orm_model) for orm_model in orm_models]
+        return [self._to_domain(row) for row in rows]
 
     def search(
         self,
@@ -111,75 +530,540 @@ class LLMResponseRepositoryImpl(LLMResponseRepository):
         tags: list[str] | None = None,
         skip: int = 0,
         limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
     ) -> list[LLMResponse]:
         """LLM応答を検索します"""
-        db_query = self.db.query(LLMResponseORM)
+        statement = _filter_search(
+            _SELECT_RESPONSES, query, category_id, tags, stats_filter
+        )
+        rows = self.db.execute(
+            statement.order_by(*_order_by(sort, order)).offset(skip).limit(limit)
+        )
+        return [self._to_domain(row) for row in rows]
+
+    def get_projection(
+        self, response_id: UUID, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """IDでLLM応答の指定フィールドのみを取得します"""
+        row = self.db.execute(
+            _select_projection(fields).where(_TABLE.c.id == response_id)
+        ).first()
+        return self._to_projection(row, fields) if row else None
+
+    def search_projection(
+        self,
+        fields: Sequence[str],
+        query: str | None = None,
+        category_id: UUID | None = None,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        stats_filter: ContentStatsFilter | None = None,
+        sort: ResponseSortKey = ResponseSortKey.CREATED_AT,
+        order: SortOrder = SortOrder.DESC,
+    ) -> list[dict[str, Any]]:
+        """LLM応答を検索し、指定フィールドのみを取得します"""
+        statement = _filter_search(
+            _select_projection(fields),
+            query,
+            category_id,
+            tags,
+            stats_filter,
+        )
+        rows = self.db.execute(
+            statement.order_by(*_order_by(sort, order)).offset(skip).limit(limit)
+        )
+        return [self._to_projection(row, fields) for row in rows]
+
+    def list_by_prompt(
+        self, prompt_id: UUID, skip: int = 0, limit: int = 100
+    ) -> list[LLMResponse]:
+        """同じプロンプトのLLM応答を作成順に取得します"""
+        rows = self.db.execute(
+            _SELECT_RESPONSES.where(_TABLE.c.prompt_id == prompt_id)
+            .order_by(_TABLE.c.created_at, _TABLE.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [self._to_domain(row) for row in rows]
+
+    def list_by_prompt_projection(
+        self,
+        prompt_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """同じプロンプトのLLM応答の指定フィールドのみを作成順に取得します"""
+        rows = self.db.execute(
+            _select_projection(fields)
+            .where(_TABLE.c.prompt_id == prompt_id)
+            .order_by(_TABLE.c.created_at, _TABLE.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [self._to_projection(row, fields) for row in rows]
+
+    def _to_projection(self, row: Row, fields: Sequence[str]) -> dict[str, Any]:
+        """
+        射影クエリの行を、要求されたフィールドのみの辞書に変換します。
+
+        値は Enum への変換を行わず、DBの値をそのまま返します
+        （JSONに直列化した結果は同じになるため）。
+
+        Args:
+            row: _select_projection() で選択した列を含む行
+            fields: 要求されたフィールド名
+
+        Returns:
+            id と要求フィールドを含む辞書（本文を読み出さない設定で
+            content_md を要求された場合は storage_path も含む）
+        """
+        values = row._asdict()
+        projection = {"id": values["id"]}
+        for name in fields:
+            if name == "category":
+                projection[name] = self._category_ref(values["category_id"])
+            elif name == "stats":
+                projection[name] = _stats_from_values(row)
+            elif name == "content_md":
+                projection[name] = self._content_md(
+                    values["content_md"], values["storage_path"]
+                )
+                if not self.load_contents:
+                    # 呼び出し側が本文を読み出すためのパス
+                    projection["storage_path"] = values["storage_path"]
+            elif name == "prompt":
+                projection[name] = values["prompt"] or ""
+            else:
+                projection[name] = values[name]
+        return projection
 
-        # テキスト検索（タイトル、プロンプト、内容）
-        if query:
-            search_pattern = f"%{query}%"
-            db_query = db_query.filter(
-                (LLMResponseORM.title.like(search_pattern))
-                | (LLMResponseORM.prompt.like(search_pattern))
-                | (LLMResponseORM.content_md.like(search_pattern))
+    def list_missing_summary(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """要約が未設定のLLM応答のIDと本文を、ID順に取得します"""
+        statement = select(
+            _TABLE.c.id, _TABLE.c.content_md, _TABLE.c.storage_path
+        ).where(_missing_summary())
+        if after_id is not None:
+            statement = statement.where(_TABLE.c.id > after_id)
+        rows = self.db.execute(statement.order_by(_TABLE.c.id).limit(limit))
+        return [
+            (row.id, self._content_md(row.content_md, row.storage_path)) for row in rows
+        ]
+
+    def set_summary_if_empty(
+        self, response_id: UUID, summary: str, content_hash: str | None = None
+    ) -> bool:
+        """要約が未設定の場合のみ、自動生成した要約を設定します"""
+        conditions = [_TABLE.c.id == response_id, _missing_summary()]
+        if content_hash is not None:
+            conditions.append(_TABLE.c.content_hash == content_hash)
+        result = self.db.execute(
+            update(_TABLE)
+            .where(*conditions)
+            .values(
+                summary=summary,
+                summary_source=SummarySource.AUTO.value,
+                updated_at=_TABLE.c.updated_at,
+            )
+        )
+        if result.rowcount > 0:
+            change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+            change_feed.record(
+                self.db, EntityType.RESPONSE, response_id, ChangeOperation.UPDATED
             )
+        self.db.commit()
+        return result.rowcount > 0
 
-        # カテゴリでフィルタ
-        if category_id:
-            db_query = db_query.filter(LLMResponseORM.category_id == str(category_id))
+    def list_missing_stats(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """本文の統計情報が未算出のLLM応答のIDと本文を、ID順に取得します"""
+        statement = select(
+            _TABLE.c.id, _TABLE.c.content_md, _TABLE.c.storage_path
+        ).where(_TABLE.c.char_count.is_(None))
+        if after_id is not None:
+            statement = statement.where(_TABLE.c.id > after_id)
+        rows = self.db.execute(statement.order_by(_TABLE.c.id).limit(limit))
+        return [
+            (row.id, self._content_md(row.content_md, row.storage_path)) for row in rows
+        ]
+
+    def set_stats_if_missing(
+        self, stats_by_id: Sequence[tuple[UUID, ContentStats]]
+    ) -> int:
+        """本文の統計情報が未算出の場合のみ、統計情報をまとめて設定します"""
+        stats_of = dict(stats_by_id)
+        pending = [
+            row.id
+            for row in self._select_by_ids(
+                select(_TABLE.c.id).where(_TABLE.c.char_count.is_(None)), list(stats_of)
+            )
+        ]
+        if pending:
+            # 行ごとの UPDATE を1回の executemany にまとめる
+            # （バインド名は列名と重複できないため接頭辞を付ける）
+            self.db.execute(
+                update(_TABLE)
+                .where(
+                    _TABLE.c.id == bindparam("target_id"),
+                    _TABLE.c.char_count.is_(None),
+                )
+                .values(
+                    {
+                        **{name: bindparam(f"stats_{name}") for name in _STATS_COLUMNS},
+                        "updated_at": _TABLE.c.updated_at,
+                    }
+                ),
+                [
+                    {
+                        "target_id": response_id,
+                        **{
+                            f"stats_{name}": value
+                            for name, value in _stats_to_values(
+                                stats_of[response_id]
+                            ).items()
+                        },
+                    }
+                    for response_id in pending
+                ],
+            )
+            change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+            change_feed.record_many(
+                self.db, EntityType.RESPONSE, pending, ChangeOperation.UPDATED
+            )
+        self.db.commit()
+        return len(pending)
 
-        # タグでフィルタ（JSON配列内の要素を検索）
-        # 注: SQLiteでは簡易的な実装、PostgreSQLではより高度な検索が可能
-        if tags:
-            for tag in tags:
-                db_query = db_query.filter(LLMResponseORM.tags.contains(tag))
+    def list_chunks(self, response_id: UUID) -> list[ContentChunk] | None:
+        """LLM応答の本文のチャンクを、本文を含めずに位置順で取得します"""
+        rows = self.db.execute(
+            select(
+                _CHUNKS.c.position,
+                _CHUNKS.c.start_offset,
+                _CHUNKS.c.end_offset,
+                _CHUNKS.c.heading,
+                _CHUNKS.c.heading_level,
+            )
+            .where(_CHUNKS.c.response_id == response_id)
+            .order_by(_CHUNKS.c.position)
+        ).all()
+        if not rows and not self._exists(response_id):
+            return None
+        return [_chunk_from_row(row, with_content=False) for row in rows]
 
-        orm_models = (
-            db_query.order_by(LLMResponseORM.created_at.desc())
+    def get_chunk(self, response_id: UUID, position: int) -> ContentChunk | None:
+        """LLM応答の本文のチャンクを1つ取得します"""
+        row = self.db.execute(
+            select(_CHUNKS).where(
+                _CHUNKS.c.response_id == response_id,
+                _CHUNKS.c.position == position,
+            )
+        ).first()
+        return _chunk_from_row(row) if row else None
+
+    def search_chunks(
+        self,
+        query: str,
+        category_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ChunkSearchHit]:
+        """本文のチャンク単位でLLM応答を検索します"""
+        statement = (
+            select(_CHUNKS, _TABLE.c.title)
+            .join(_TABLE, _TABLE.c.id == _CHUNKS.c.response_id)
+            .where(_CHUNKS.c.content.like(f"%{query}%"))
+        )
+        if category_id:
+            statement = statement.where(_TABLE.c.category_id == category_id)
+        rows = self.db.execute(
+            statement.order_by(
+                _TABLE.c.created_at.desc(), _TABLE.c.id, _CHUNKS.c.position
+            )
             .offset(skip)
             .limit(limit)
-            .all()
         )
-        return [self._to_domain(orm_model) for orm_model in orm_models]
+        return [
+            ChunkSearchHit(
+                response_id=row.response_id, title=row.title, chunk=_chunk_from_row(row)
+            )
+            for row in rows
+        ]
+
+    def list_missing_chunks(
+        self, limit: int = 100, after_id: UUID | None = None
+    ) -> list[tuple[UUID, str]]:
+        """本文のチャンクが未作成のLLM応答のIDと本文を、ID順に取得します"""
+        statement = select(_TABLE.c.id, _TABLE.c.content_md).where(
+            _TABLE.c.content_md != "",
+            ~exists().where(_CHUNKS.c.response_id == _TABLE.c.id),
+        )
+        if after_id is not None:
+            statement = statement.where(_TABLE.c.id > after_id)
+        rows = self.db.execute(statement.order_by(_TABLE.c.id).limit(limit))
+        return [(row.id, row.content_md) for row in rows]
+
+    def add_chunks_if_missing(
+        self, chunks_by_id: Sequence[tuple[UUID, list[ContentChunk]]]
+    ) -> int:
+        """本文のチャンクが未作成の場合のみ、チャンクをまとめて保存します"""
+        chunks_of = dict(chunks_by_id)
+        ids = list(chunks_of)
+        chunked: set[UUID] = set()
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunked.update(
+                self.db.execute(
+                    select(_CHUNKS.c.response_id)
+                    .where(
+                        _CHUNKS.c.response_id.in_(
+                            ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+                        )
+                    )
+                    .distinct()
+                ).scalars()
+            )
+        pending = [
+            response_id
+            for response_id, chunks in chunks_of.items()
+            if chunks and response_id not in chunked
+        ]
+        rows = [
+            row
+            for response_id in pending
+            for row in _chunk_rows(response_id, chunks_of[response_id])
+        ]
+        if rows:
+            self.db.execute(insert(_CHUNKS), rows)
+        self.db.commit()
+        return len(pending)
+
+    def _exists(self, response_id: UUID) -> bool:
+        """LLM応答が存在するかどうかを返します。"""
+        return (
+            self.db.execute(
+                select(_TABLE.c.id).where(_TABLE.c.id == response_id)
+            ).first()
+            is not None
+        )
+
+    def _replace_chunks(self, response: LLMResponse, created: bool = False) -> None:
+        """
+        LLM応答の本文のチャンクを保存します（既存のチャンクは置き換えます）。
+
+        チャンクが設定されていない（None の）場合は何もしません。
+
+        Args:
+            response: チャンクを設定したLLM応答エンティティ
+            created: 作成直後（既存のチャンクがない）かどうか
+        """
+        if response.chunks is None:
+            return
+        if not created:
+            self.db.execute(delete(_CHUNKS).where(_CHUNKS.c.response_id == response.id))
+        # イテレーターの場合に全体をメモリに載せないよう、一定数ごとに挿入する
+        for chunks in batched(response.chunks, _IN_CLAUSE_CHUNK_SIZE, strict=False):
+            self.db.execute(insert(_CHUNKS), _chunk_rows(response.id, chunks))
+
+    def _assign_prompts(self, responses: Sequence[LLMResponse]) -> None:
+        """
+        プロンプトIDが未設定のLLM応答に、プロンプトの本文に対応するIDを設定します。
+
+        同じ本文のプロンプトがなければ作成します。コミットは呼び出し側で行います。
+
+        Args:
+            responses: 書き込むLLM応答エンティティ
+        """
+        pending = [response for response in responses if response.prompt_id is None]
+        if not pending:
+            return
+        prompt_ids = intern_prompts(self.db, (response.prompt for response in pending))
+        for response in pending:
+            response.prompt_id = prompt_ids[response.prompt]
+
+    def find_content_hashes(self, content_hashes: Sequence[str]) -> set[str]:
+        """指定した本文のハッシュのうち、既存のLLM応答の本文のものを返します"""
+        hashes = list(dict.fromkeys(content_hashes))
+        found: set[str] = set()
+        for start in range(0, len(hashes), _IN_CLAUSE_CHUNK_SIZE):
+            found.update(
+                self.db.execute(
+                    select(_TABLE.c.content_hash)
+                    .where(
+                        _TABLE.c.content_hash.in_(
+                            hashes[start : start + _IN_CLAUSE_CHUNK_SIZE]
+                        )
+                    )
+                    .distinct()
+                ).scalars()
+            )
+        return found
+
+    def create_many(self, responses: Sequence[LLMResponse]) -> int:
+        """複数のLLM応答を1つのトランザクションで作成します"""
+        if not responses:
+            return 0
+        try:
+            self._assign_prompts(responses)
+            self.db.execute(
+                insert(_TABLE), [self._to_row(response) for response in responses]
+            )
+            chunk_rows = [
+                row
+                for response in responses
+                if response.chunks is not None
+                for row in _chunk_rows(response.id, response.chunks)
+            ]
+            if chunk_rows:
+                self.db.execute(insert(_CHUNKS), chunk_rows)
+            update_tag_stats(
+                self.db,
+                added=(tag for response in responses for tag in set(response.tags)),
+                removed=(),
+                used_at=max(response.created_at for response in responses),
+            )
+            change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+            change_feed.record_many(
+                self.db,
+                EntityType.RESPONSE,
+                [response.id for response in responses],
+                ChangeOperation.CREATED,
+            )
+            event_bus.publish(self.db, LLMResponsesCreated(tuple(responses)))
+            self.db.commit()
+        except Exception:
+            # 同じセッションの後続の書き込みに、途中まで書き込んだ行を残さない
+            self.db.rollback()
+            raise
+        return len(responses)
 
     def create(self, response: LLMResponse) -> LLMResponse:
         """LLM応答を作成します"""
-        orm_model = self._to_orm(response)
-        self.db.add(orm_model)
+        # 書き込んだ値はエンティティが保持しているため、再読み込みは行わない
+        self._assign_prompts([response])
+        self.db.execute(insert(_TABLE).values(self._to_row(response)))
+        self._replace_chunks(response, created=True)
+        update_tag_stats(
+            self.db, added=set(response.tags), removed=(), used_at=response.created_at
+        )
+        change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+        change_feed.record(
+            self.db, EntityType.RESPONSE, response.id, ChangeOperation.CREATED
+        )
+        event_bus.publish(self.db, LLMResponseCreated(response))
         self.db.commit()
-        self.db.refresh(orm_model)
-        return self._to_domain(orm_model)
+        response.category = self._category_ref(response.category_id)
+        return response
 
     def update(self, response: LLMResponse) -> LLMResponse:
         """LLM応答を更新します"""
-        orm_model = (
-            self.db.query(LLMResponseORM)
-            .filter(LLMResponseORM.id == str(response.id))
-            .first()
-        )
-        if orm_model:
-            orm_model.title = response.title
-            orm_model.prompt = response.prompt
-            orm_model.content_md = response.content_md
-            orm_model.model = response.model
-            orm_model.provider = response.provider.value
-            orm_model.category_id = (
-                str(response.category_id) if response.category_id else None
-            )
-            orm_model.tags = response.tags
-            orm_model.summary = response.summary
-            orm_model.updated_at = response.updated_at
-            self.db.commit()
-            self.db.refresh(orm_model)
-            return self._to_domain(orm_model)
+        # 更新前の値（プロンプト・タグ・本文）を読む前に行の書き込みロックを取り、
+        # 並行する更新が同じ更新前の値からタグの集計や版を記録しないようにする
+        locked = self.db.execute(
+            update(_TABLE)
+            .where(_TABLE.c.id == response.id)
+            .values(updated_at=_TABLE.c.updated_at)
+        )
+        if locked.rowcount == 0:
+            self.db.rollback()
+            return response
+        previous = self.db.execute(
+            select(
+                _TABLE.c.prompt_id,
+                _TABLE.c.tags,
+                _TABLE.c.content_md,
+                _TABLE.c.storage_path,
+                _TABLE.c.updated_at,
+            ).where(_TABLE.c.id == response.id)
+        ).one()
+        released_prompt_id = None
+        if response.prompt_id is None:
+            # プロンプトが変わった場合、元のプロンプトは参照されなくなる可能性がある
+            released_prompt_id = previous.prompt_id
+            self._assign_prompts([response])
+        values = self._to_row(response)
+        # 作成日時・ストレージの種類は更新対象外
+        for column in ("id", "created_at", "storage_location"):
+            values.pop(column)
+        released_path = None
+        content_changed = False
+        if response.storage_path is not None:
+            # 本文ストレージの本文は変わらないため、本文の列は更新しない
+            values.pop("content_md")
+            values.pop("storage_path")
+        else:
+            # 本文をDBに保存し直す場合、本文ストレージの本文は不要になる
+            released_path = previous.storage_path
+            previous_content = self._content_md(
+                previous.content_md, previous.storage_path
+            )
+            content_changed = previous_content != response.content_md
+            if content_changed:
+                # 本文が変わった場合は更新前の本文を版として残す
+                record_revision(
+                    self.db,
+                    response.id,
+                    previous_content,
+                    response.content_md,
+                    previous_at=previous.updated_at,
+                    changed_at=response.updated_at,
+                )
+        self.db.execute(update(_TABLE).where(_TABLE.c.id == response.id).values(values))
+        self._replace_chunks(response)
+        previous_tags = set(previous.tags or [])
+        tags = set(response.tags)
+        update_tag_stats(
+            self.db,
+            added=tags - previous_tags,
+            removed=previous_tags - tags,
+            used_at=response.updated_at,
+        )
+        if released_prompt_id != response.prompt_id:
+            delete_unused_prompts(self.db, [released_prompt_id])
+        change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+        change_feed.record(
+            self.db, EntityType.RESPONSE, response.id, ChangeOperation.UPDATED
+        )
+        event_bus.publish(
+            self.db, LLMResponseUpdated(response, content_changed=content_changed)
+        )
+        self.db.commit()
+        if released_path is not None:
+            self.storage.delete(released_path)
+        response.category = self._category_ref(response.category_id)
         return response
 
     def delete(self, response_id: UUID) -> bool:
         """LLM応答を削除します"""
-        result = (
-            self.db.query(LLMResponseORM)
-            .filter(LLMResponseORM.id == str(response_id))
-            .delete()
+        # 外部キー制約が無効な環境でも残らないよう、チャンクと版を明示的に削除する
+        self.db.execute(delete(_CHUNKS).where(_CHUNKS.c.response_id == response_id))
+        self.db.execute(
+            delete(_REVISIONS).where(_REVISIONS.c.response_id == response_id)
         )
+        deleted = self.db.execute(
+            delete(_TABLE)
+            .where(_TABLE.c.id == response_id)
+            .returning(_TABLE.c.storage_path, _TABLE.c.prompt_id, _TABLE.c.tags)
+        ).first()
+        if deleted is not None:
+            delete_unused_prompts(self.db, [deleted.prompt_id])
+            update_tag_stats(
+                self.db,
+                added=(),
+                removed=set(deleted.tags or []),
+                used_at=datetime.now(),
+            )
+            change_tracker.bump(self.db, LLM_RESPONSES_SCOPE)
+            change_feed.record(
+                self.db, EntityType.RESPONSE, response_id, ChangeOperation.DELETED
+            )
+            event_bus.publish(self.db, LLMResponseDeleted(response_id))
         self.db.commit()
-        return result > 0
+        # 本文ストレージの本文は、削除をコミットしてから消す
+        if deleted is not None and deleted.storage_path is not None:
+            self.storage.delete(deleted.storage_path)
+        return deleted is not None
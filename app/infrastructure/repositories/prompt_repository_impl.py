@@ -0,0 +1,190 @@
+"""
+PromptRepository の実装
+
+SQLAlchemyを使用したプロンプトリポジトリの実装。
+LLM応答の書き込みと同じトランザクションでプロンプトを作成・削除する
+intern_prompts() / delete_unused_prompts() もあわせて定義します。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import batched
+from uuid import UUID, uuid4
+
+from sqlalchemy import Insert, Row, delete, exists, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.domain.models.prompt import Prompt
+from app.domain.repositories.prompt_repository import PromptRepository
+from app.domain.services.content_hash import compute_content_hash
+from app.infrastructure.db.models import LLMResponseORM, PromptORM
+
+_TABLE = PromptORM.__table__
+
+_RESPONSES = LLMResponseORM.__table__
+
+# IN 句1回あたりの値の数（SQLiteのバインド変数上限 999 を下回るように分割する）
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def _insert_ignoring_duplicates(db: Session) -> Insert:
+    """
+    本文のハッシュが既存の行と重複する行を無視する INSERT 文を返します。
+
+    同じプロンプトを同時に作成するトランザクションがあっても、一意インデックスの
+    違反にしないために使用します（SQLite・PostgreSQL 以外では通常の INSERT）。
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(_TABLE).on_conflict_do_nothing(
+            index_elements=[_TABLE.c.prompt_hash]
+        )
+    if dialect == "postgresql":
+        return postgresql.insert(_TABLE).on_conflict_do_nothing(
+            index_elements=[_TABLE.c.prompt_hash]
+        )
+    return insert(_TABLE)
+
+
+def _find_ids(db: Session, prompt_hashes: Iterable[str]) -> dict[str, UUID]:
+    """本文のハッシュから、既存のプロンプトのIDを取得します。"""
+    found: dict[str, UUID] = {}
+    for chunk in batched(prompt_hashes, _IN_CLAUSE_CHUNK_SIZE, strict=False):
+        found.update(
+            db.execute(
+                select(_TABLE.c.prompt_hash, _TABLE.c.id).where(
+                    _TABLE.c.prompt_hash.in_(chunk)
+                )
+            ).all()
+        )
+    return found
+
+
+def intern_prompts(db: Session, texts: Iterable[str]) -> dict[str, UUID]:
+    """
+    プロンプトの本文から、対応するプロンプトのIDを返します。
+
+    同じ本文のプロンプトがなければ作成します。コミットは呼び出し側で行います。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        texts: プロンプトの本文
+
+    Returns:
+        本文をキーとする、プロンプトIDの辞書
+    """
+    text_of = {compute_content_hash(text): text for text in texts}
+    ids = _find_ids(db, text_of)
+    missing = [prompt_hash for prompt_hash in text_of if prompt_hash not in ids]
+    if missing:
+        now = datetime.now()
+        rows = [
+            {
+                "id": uuid4(),
+                "prompt_hash": prompt_hash,
+                "text": text_of[prompt_hash],
+                "created_at": now,
+            }
+            for prompt_hash in missing
+        ]
+        result = db.execute(_insert_ignoring_duplicates(db), rows)
+        if result.rowcount == len(rows):
+            ids.update((row["prompt_hash"], row["id"]) for row in rows)
+        else:
+            # 他のトランザクションが先に作成した行は、そちらのIDを使う
+            ids.update(_find_ids(db, missing))
+    return {text_of[prompt_hash]: prompt_id for prompt_hash, prompt_id in ids.items()}
+
+
+def delete_unused_prompts(db: Session, prompt_ids: Iterable[UUID | None]) -> None:
+    """
+    指定したプロンプトのうち、どのLLM応答からも参照されていないものを削除します。
+
+    LLM応答の削除やプロンプトの変更の後に呼び出します。参照の有無は
+    llm_responses.prompt_id のインデックスで調べます。コミットは呼び出し側で行います。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        prompt_ids: 参照されなくなった可能性のあるプロンプトのID（None は無視する）
+    """
+    ids = [prompt_id for prompt_id in dict.fromkeys(prompt_ids) if prompt_id]
+    for chunk in batched(ids, _IN_CLAUSE_CHUNK_SIZE, strict=False):
+        db.execute(
+            delete(_TABLE).where(
+                _TABLE.c.id.in_(chunk),
+                ~exists().where(_RESPONSES.c.prompt_id == _TABLE.c.id),
+            )
+        )
+
+
+def _to_domain(row: Row) -> Prompt:
+    """
+    prompts テーブルの行（と参照数）をドメインエンティティに変換します。
+
+    Args:
+        row: prompts テーブルの全カラムと response_count を含む行
+
+    Returns:
+        Prompt ドメインエンティティ
+    """
+    return Prompt(
+        id=row.id,
+        text=row.text,
+        prompt_hash=row.prompt_hash,
+        created_at=row.created_at,
+        response_count=row.response_count,
+    )
+
+
+class PromptRepositoryImpl(PromptRepository):
+    """
+    プロンプトリポジトリの実装クラス
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: データベースセッション
+        """
+        self.db = db
+
+    def get_by_id(self, prompt_id: UUID) -> Prompt | None:
+        """IDでプロンプトを取得します"""
+        response_count = (
+            select(func.count())
+            .where(_RESPONSES.c.prompt_id == _TABLE.c.id)
+            .scalar_subquery()
+        )
+        row = self.db.execute(
+            select(_TABLE, response_count.label("response_count")).where(
+                _TABLE.c.id == prompt_id
+            )
+        ).first()
+        return _to_domain(row) if row is not None else None
+
+    def list(
+        self, min_responses: int = 1, skip: int = 0, limit: int = 100
+    ) -> list[Prompt]:
+        """プロンプトの一覧を、参照するLLM応答の多い順に取得します"""
+        # prompt_id のインデックスのみで集計し、プロンプトの本文は結果の行だけ読む
+        counts = (
+            select(
+                _RESPONSES.c.prompt_id,
+                func.count().label("response_count"),
+            )
+            .where(_RESPONSES.c.prompt_id.is_not(None))
+            .group_by(_RESPONSES.c.prompt_id)
+            .having(func.count() >= min_responses)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(_TABLE, counts.c.response_count)
+            .join(counts, counts.c.prompt_id == _TABLE.c.id)
+            .order_by(counts.c.response_count.desc(), _TABLE.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [_to_domain(row) for row in rows]
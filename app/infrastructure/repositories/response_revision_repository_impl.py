@@ -0,0 +1,210 @@
+"""
+ResponseRevisionRepository の実装
+
+SQLAlchemyを使用したLLM応答リビジョンリポジトリの実装。
+LLM応答の本文の更新と同じトランザクションで版を記録する
+record_revision() もあわせて定義します。
+
+版は前の版との行単位の差分（JSON）を zlib で圧縮して保存し、
+REVISION_SNAPSHOT_INTERVAL 版ごとに本文全体を圧縮して保存します。
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.domain.models.response_revision import ResponseRevision
+from app.domain.repositories.response_revision_repository import (
+    ResponseRevisionRepository,
+)
+from app.domain.services.content_delta import apply_delta, compute_delta
+from app.domain.services.content_hash import compute_content_hash
+from app.infrastructure.db.models import LLMResponseORM, ResponseRevisionORM
+
+_TABLE = ResponseRevisionORM.__table__
+
+_RESPONSES = LLMResponseORM.__table__
+
+
+def _snapshot_row(
+    response_id: UUID, number: int, content: str, created_at: datetime
+) -> dict[str, Any]:
+    """本文全体を保存する版の行を返します。"""
+    return {
+        "response_id": response_id,
+        "number": number,
+        "is_snapshot": True,
+        "data": zlib.compress(content.encode("utf-8")),
+        "content_hash": compute_content_hash(content),
+        "char_count": len(content),
+        "created_at": created_at,
+    }
+
+
+def _delta_row(
+    response_id: UUID,
+    number: int,
+    previous: str,
+    content: str,
+    created_at: datetime,
+) -> dict[str, Any]:
+    """
+    前の版との差分を保存する版の行を返します。
+
+    本文の大半を書き換えた場合など、差分が本文全体より大きくなる場合は
+    本文全体を保存します。
+    """
+    delta = compute_delta(previous, content)
+    data = zlib.compress(
+        json.dumps(delta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+    inserted_chars = sum(
+        len(operation) for operation in delta if isinstance(operation, str)
+    )
+    # 挿入した文字が少なければ差分のほうが小さいため、本文全体は圧縮しない
+    if inserted_chars * 2 > len(content):
+        snapshot = _snapshot_row(response_id, number, content, created_at)
+        if len(snapshot["data"]) <= len(data):
+            return snapshot
+    return {
+        "response_id": response_id,
+        "number": number,
+        "is_snapshot": False,
+        "data": data,
+        "content_hash": compute_content_hash(content),
+        "char_count": len(content),
+        "created_at": created_at,
+    }
+
+
+def record_revision(
+    db: Session,
+    response_id: UUID,
+    previous: str,
+    content: str,
+    previous_at: datetime,
+    changed_at: datetime,
+) -> None:
+    """
+    LLM応答の本文の更新を、新しい版として記録します。
+
+    最初の更新では、更新前の本文を版 1 として記録してから新しい版を追加します。
+    同じLLM応答の更新が並行しないよう、LLM応答の行を更新した後
+    （行ロックを取得した後）に呼び出します。コミットは呼び出し側で行います。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        response_id: LLM応答のID
+        previous: 更新前の本文（最新の版の本文）
+        content: 更新後の本文
+        previous_at: 更新前の本文になった日時（LLM応答の更新前の更新日時）
+        changed_at: 本文を更新した日時
+    """
+    latest = db.execute(
+        select(func.max(_TABLE.c.number)).where(_TABLE.c.response_id == response_id)
+    ).scalar()
+    rows = []
+    if latest is None:
+        rows.append(_snapshot_row(response_id, 1, previous, previous_at))
+        latest = 1
+    number = latest + 1
+    if (number - 1) % settings.REVISION_SNAPSHOT_INTERVAL == 0:
+        rows.append(_snapshot_row(response_id, number, content, changed_at))
+    else:
+        rows.append(_delta_row(response_id, number, previous, content, changed_at))
+    db.execute(insert(_TABLE), rows)
+
+
+def _to_domain(row: Row, content: str | None = None) -> ResponseRevision:
+    """
+    response_revisions テーブルの行をドメインエンティティに変換します。
+
+    Args:
+        row: 版の行（data の代わりに stored_bytes を含んでもよい）
+        content: 復元した本文
+
+    Returns:
+        ResponseRevision ドメインエンティティ
+    """
+    return ResponseRevision(
+        response_id=row.response_id,
+        number=row.number,
+        is_snapshot=row.is_snapshot,
+        content_hash=row.content_hash,
+        char_count=row.char_count,
+        stored_bytes=row.stored_bytes,
+        created_at=row.created_at,
+        content=content,
+    )
+
+
+class ResponseRevisionRepositoryImpl(ResponseRevisionRepository):
+    """
+    LLM応答リビジョンリポジトリの実装クラス
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: データベースセッション
+        """
+        self.db = db
+
+    def list(self, response_id: UUID) -> list[ResponseRevision] | None:
+        """LLM応答の本文の版の一覧を、本文を復元せずに番号順で取得します"""
+        rows = self.db.execute(
+            select(
+                _TABLE.c.response_id,
+                _TABLE.c.number,
+                _TABLE.c.is_snapshot,
+                _TABLE.c.content_hash,
+                _TABLE.c.char_count,
+                func.length(_TABLE.c.data).label("stored_bytes"),
+                _TABLE.c.created_at,
+            )
+            .where(_TABLE.c.response_id == response_id)
+            .order_by(_TABLE.c.number)
+        ).all()
+        if not rows:
+            exists = self.db.execute(
+                select(_RESPONSES.c.id).where(_RESPONSES.c.id == response_id)
+            ).first()
+            if exists is None:
+                return None
+        return [_to_domain(row) for row in rows]
+
+    def get(self, response_id: UUID, number: int) -> ResponseRevision | None:
+        """LLM応答の本文の版を、直前のスナップショットから復元して取得します"""
+        # 直前のスナップショットから指定した版までの行のみを読む
+        # （読む行数は REVISION_SNAPSHOT_INTERVAL 以下）
+        snapshot_number = (
+            select(func.max(_TABLE.c.number))
+            .where(
+                _TABLE.c.response_id == response_id,
+                _TABLE.c.is_snapshot.is_(True),
+                _TABLE.c.number <= number,
+            )
+            .scalar_subquery()
+        )
+        rows = self.db.execute(
+            select(_TABLE, func.length(_TABLE.c.data).label("stored_bytes"))
+            .where(
+                _TABLE.c.response_id == response_id,
+                _TABLE.c.number.between(snapshot_number, number),
+            )
+            .order_by(_TABLE.c.number)
+        ).all()
+        if not rows or rows[-1].number != number:
+            return None
+        content = zlib.decompress(rows[0].data).decode("utf-8")
+        for row in rows[1:]:
+            content = apply_delta(content, json.loads(zlib.decompress(row.data)))
+        return _to_domain(rows[-1], content)
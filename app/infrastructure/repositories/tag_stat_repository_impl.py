@@ -0,0 +1,182 @@
+"""
+TagStatRepository の実装
+
+SQLAlchemyを使用したタグ統計リポジトリの実装。
+LLM応答の書き込みと同じトランザクションでタグの使用状況を更新する
+update_tag_stats() もあわせて定義します。
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import batched
+
+from sqlalchemy import Row, bindparam, case, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.domain.models.tag_stat import TagSortKey, TagStat
+from app.domain.repositories.tag_stat_repository import TagStatRepository
+from app.infrastructure.db.models import TagStatORM
+
+_TABLE = TagStatORM.__table__
+
+# IN 句1回あたりの値の数（SQLiteのバインド変数上限 999 を下回るように分割する）
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+# 前方一致の上限に使う文字（Unicode の最大のコードポイント）
+_MAX_CHAR = "\U0010ffff"
+
+_ORDER_BY = {
+    TagSortKey.COUNT: (_TABLE.c.response_count.desc(), _TABLE.c.tag),
+    TagSortKey.RECENT: (_TABLE.c.last_used_at.desc(), _TABLE.c.tag),
+}
+
+
+def _increment(db: Session, counts: dict[str, int], used_at: datetime) -> None:
+    """
+    タグの使用数を増やし、最後に使われた日時を更新します（なければ作成します）。
+
+    SQLite・PostgreSQL では INSERT ... ON CONFLICT DO UPDATE の1文で行い、
+    同じタグを同時に作成するトランザクションがあっても一意制約の違反にしません。
+    最後に使われた日時は、記録済みの日時より新しい場合のみ更新します
+    （取り込んだ会話の日時など、過去の日時で付けられる場合があるため）。
+    """
+    rows = [
+        {"tag": tag, "response_count": count, "last_used_at": used_at}
+        for tag, count in counts.items()
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        dialect_module = sqlite if dialect == "sqlite" else postgresql
+        statement = dialect_module.insert(_TABLE)
+        # SQLite の複数引数の max() は、引数のうち最大の値を返す
+        latest = func.max if dialect == "sqlite" else func.greatest
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[_TABLE.c.tag],
+                set_={
+                    "response_count": _TABLE.c.response_count
+                    + statement.excluded.response_count,
+                    "last_used_at": latest(
+                        _TABLE.c.last_used_at, statement.excluded.last_used_at
+                    ),
+                },
+            ),
+            rows,
+        )
+        return
+    existing: set[str] = set()
+    for chunk in batched(counts, _IN_CLAUSE_CHUNK_SIZE, strict=False):
+        existing.update(
+            db.execute(select(_TABLE.c.tag).where(_TABLE.c.tag.in_(chunk))).scalars()
+        )
+    if existing:
+        db.execute(
+            update(_TABLE)
+            .where(_TABLE.c.tag == bindparam("target_tag"))
+            .values(
+                response_count=_TABLE.c.response_count + bindparam("amount"),
+                last_used_at=case(
+                    (_TABLE.c.last_used_at < used_at, used_at),
+                    else_=_TABLE.c.last_used_at,
+                ),
+            ),
+            [{"target_tag": tag, "amount": counts[tag]} for tag in existing],
+        )
+    missing = [row for row in rows if row["tag"] not in existing]
+    if missing:
+        db.execute(insert(_TABLE), missing)
+
+
+def _decrement(db: Session, counts: dict[str, int]) -> None:
+    """タグの使用数を減らし、どのLLM応答にも使われなくなったタグを削除します。"""
+    db.execute(
+        update(_TABLE)
+        .where(_TABLE.c.tag == bindparam("target_tag"))
+        .values(response_count=_TABLE.c.response_count - bindparam("amount")),
+        [{"target_tag": tag, "amount": count} for tag, count in counts.items()],
+    )
+    for chunk in batched(counts, _IN_CLAUSE_CHUNK_SIZE, strict=False):
+        db.execute(
+            delete(_TABLE).where(_TABLE.c.tag.in_(chunk), _TABLE.c.response_count <= 0)
+        )
+
+
+def update_tag_stats(
+    db: Session,
+    added: Iterable[str],
+    removed: Iterable[str],
+    used_at: datetime,
+) -> None:
+    """
+    LLM応答に付けた・外したタグを、タグの使用状況に反映します。
+
+    LLM応答ごとに重複を除いたタグを渡します（複数のLLM応答のタグをまとめて
+    渡す場合、同じタグが複数回現れてよい）。コミットは呼び出し側で行います。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        added: LLM応答に付けたタグ
+        removed: LLM応答から外したタグ
+        used_at: タグを付けた日時（付けたタグの最後に使われた日時になる）
+    """
+    changes = Counter(added)
+    changes.subtract(removed)
+    increments = {tag: count for tag, count in changes.items() if count > 0}
+    decrements = {tag: -count for tag, count in changes.items() if count < 0}
+    if increments:
+        _increment(db, increments, used_at)
+    if decrements:
+        _decrement(db, decrements)
+
+
+def _to_domain(row: Row) -> TagStat:
+    """
+    tag_stats テーブルの行をドメインエンティティに変換します。
+
+    Args:
+        row: tag_stats テーブルの行
+
+    Returns:
+        TagStat ドメインエンティティ
+    """
+    return TagStat(
+        tag=row.tag, response_count=row.response_count, last_used_at=row.last_used_at
+    )
+
+
+class TagStatRepositoryImpl(TagStatRepository):
+    """
+    タグ統計リポジトリの実装クラス
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: データベースセッション
+        """
+        self.db = db
+
+    def list(
+        self, sort: TagSortKey = TagSortKey.COUNT, skip: int = 0, limit: int = 100
+    ) -> list[TagStat]:
+        """タグの使用状況の一覧を取得します"""
+        rows = self.db.execute(
+            select(_TABLE).order_by(*_ORDER_BY[sort]).offset(skip).limit(limit)
+        )
+        return [_to_domain(row) for row in rows]
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[TagStat]:
+        """指定した文字列で始まるタグを、LLM応答の多い順に取得します"""
+        # LIKE ではなく範囲の条件にし、主キー（タグ）のインデックスで
+        # 前方一致するタグのみを読む
+        rows = self.db.execute(
+            select(_TABLE)
+            .where(_TABLE.c.tag >= prefix, _TABLE.c.tag < prefix + _MAX_CHAR)
+            .order_by(*_ORDER_BY[TagSortKey.COUNT])
+            .limit(limit)
+        )
+        return [_to_domain(row) for row in rows]
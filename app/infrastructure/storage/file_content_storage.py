@@ -0,0 +1,156 @@
+"""
+ファイルシステムを使用した本文ストレージ
+
+LLM応答の本文を STORAGE_PATH 配下のファイルに保存します。
+書き込みは一時ファイルに少しずつ追記しながら SHA-256 ハッシュとサイズを
+算出し、確定時に最終的なパスへ置き換えます。
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import os
+import tempfile
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+from app.config.settings import settings
+from app.domain.models.stored_content import StoredContent
+from app.domain.ports.content_storage import (
+    ContentStorage,
+    ContentTooLargeError,
+    ContentWriter,
+)
+
+
+class FileContentWriter(ContentWriter):
+    """
+    一時ファイルに本文を書き込むライター
+
+    UTF-8 として正しいかどうかを、書き込みと同時に逐次デコードして確認します
+    （デコード結果は保持しないため、メモリ使用量は本文の大きさによらない）。
+    """
+
+    def __init__(self, root: Path, max_bytes: int, suffix: str = ".md"):
+        """
+        Args:
+            root: ストレージのルートディレクトリ
+            max_bytes: 本文の最大バイト数
+            suffix: 保存するファイルの拡張子
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.byte_count = 0
+        self._digest = hashlib.sha256()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        tmp_dir = root / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        # 一時ファイルは commit() または abort() で閉じる
+        self._file = tempfile.NamedTemporaryFile(
+            "wb", dir=tmp_dir, suffix=".part", delete=False
+        )
+        self._done = False
+
+    def write(self, data: bytes) -> None:
+        """本文の続きを書き込みます"""
+        self.byte_count += len(data)
+        if self.byte_count > self.max_bytes:
+            self.abort()
+            raise ContentTooLargeError(self.max_bytes)
+        self._decoder.decode(data)
+        self._digest.update(data)
+        self._file.write(data)
+
+    def commit(self) -> StoredContent:
+        """書き込みを確定し、一意な名前（先頭2文字のディレクトリで分散）で保存します"""
+        self._decoder.decode(b"", final=True)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        name = uuid.uuid4().hex
+        relative = f"{name[:2]}/{name}{self.suffix}"
+        target = self.root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._file.name, target)
+        self._done = True
+        return StoredContent(
+            path=relative, sha256=self._digest.hexdigest(), byte_count=self.byte_count
+        )
+
+    def abort(self) -> None:
+        """書き込みを破棄し、一時ファイルを削除します"""
+        if self._done:
+            return
+        self._done = True
+        self._file.close()
+        Path(self._file.name).unlink(missing_ok=True)
+
+
+class FileContentStorage(ContentStorage):
+    """
+    ファイルシステムを使用した本文ストレージ
+    """
+
+    def __init__(self, root: Path, suffix: str = ".md"):
+        """
+        Args:
+            root: 本文を保存するルートディレクトリ
+            suffix: 保存するファイルの拡張子
+        """
+        self.root = root
+        self.suffix = suffix
+
+    def _resolve(self, path: str) -> Path:
+        """
+        ストレージ内のパスをファイルパスに変換します。
+
+        Raises:
+            ValueError: ルートディレクトリの外を指すパスの場合
+        """
+        resolved = (self.root / path).resolve()
+        if not resolved.is_relative_to(self.root.resolve()):
+            raise ValueError(f"ストレージの外を指すパスです: {path}")
+        return resolved
+
+    def open_writer(self, max_bytes: int) -> FileContentWriter:
+        """本文を書き込むライターを開きます"""
+        return FileContentWriter(self.root, max_bytes, self.suffix)
+
+    def local_path(self, path: str) -> Path:
+        """
+        保存した本文のファイルシステム上のパスを返します。
+
+        Args:
+            path: ストレージ内のパス
+
+        Returns:
+            絶対パス
+
+        Raises:
+            ValueError: ルートディレクトリの外を指すパスの場合
+        """
+        return self._resolve(path)
+
+    def iter_lines(self, path: str) -> Iterator[str]:
+        """保存した本文を1行ずつ読み出します（改行文字は変換しない）"""
+        with self._resolve(path).open(encoding="utf-8", newline="") as file:
+            yield from file
+
+    def read_text(self, path: str) -> str:
+        """保存した本文全体を読み出します"""
+        with self._resolve(path).open(encoding="utf-8", newline="") as file:
+            return file.read()
+
+    def delete(self, path: str) -> None:
+        """保存した本文を削除します"""
+        self._resolve(path).unlink(missing_ok=True)
+
+
+# グローバルな本文ストレージインスタンス
+content_storage = FileContentStorage(settings.STORAGE_PATH / "contents")
+
+# API でアップロードされた会話エクスポートの一時的な保存先（取り込みの完了後に削除する）
+export_storage = FileContentStorage(settings.STORAGE_PATH / "imports", suffix=".json")
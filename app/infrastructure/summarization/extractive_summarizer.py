@@ -0,0 +1,208 @@
+"""
+抽出型サマライザー
+
+外部サービスや学習済みモデルを使わず、Markdown 本文から重要度の高い文を
+抜き出して要約を作成します。
+
+アルゴリズム:
+    1. コードブロック・表・インライン記法を取り除き、見出しと本文の文に分割する
+       （日本語の「。！？」と英語の「. ! ?」を文末として扱う）。
+    2. 文を語に分解する。英数字は単語単位、漢字・カタカナの連続は
+       分かち書きの代わりに文字 bigram とする（ひらがなは助詞等が多いため除外）。
+    3. 文書全体での語の出現頻度を求め、文のスコアを
+       「含まれる語の頻度の和 / √語数」とする。見出しに含まれる語と
+       文書の前半にある文には加点する。
+    4. スコアの高い文から最大文字数に収まるだけ選び、元の順序で連結する。
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+from app.domain.ports.summarizer import Summarizer
+
+# コードブロックの開始・終了（``` または ~~~）
+_FENCE = re.compile(r"^\s*(```|~~~)")
+# 見出し
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+# 箇条書き・番号付きリスト・引用の記号
+_BLOCK_MARKER = re.compile(r"^\s*(?:>\s*)*(?:[-*+]\s+|\d+[.)]\s+)?")
+# インデントによるコードブロック（リスト項目は除く）
+_INDENTED_CODE = re.compile(r"^(?: {4}|\t)(?!\s*(?:[-*+]|\d+[.)])\s)")
+# インライン記法
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_URL = re.compile(r"https?://\S+")
+_EMPHASIS = re.compile(r"[*_~]{1,3}")
+_SPACES = re.compile(r"\s+")
+# 文の区切り（日本語の閉じ括弧は直前の文に含める）
+_SENTENCE = re.compile(r".+?(?:[。！？!?]+[」』）)]*|\.(?=\s)|$)")
+# 語の抽出（英数字の単語、漢字・カタカナの連続）
+_TOKEN = re.compile(
+    r"[A-Za-z][A-Za-z0-9_+#.-]*[A-Za-z0-9+#]|[A-Za-z]|[゠-ヿ一-鿿々ー]+"
+)
+# スコア計算から除外する英語の機能語
+_STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have if in is it its of on or "
+    "that the this to was were will with you your we not but so do does".split()
+)
+
+# 短すぎる文は要約に含めない（見出しの断片や記号だけの行を除くため）
+_MIN_SENTENCE_CHARS = 8
+
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    頻度ベースの抽出型サマライザー
+
+    処理は純粋な Python で完結し、プロセスプールに渡せるよう状態を持ちません。
+    """
+
+    def __init__(self, max_chars: int = 200) -> None:
+        """
+        Args:
+            max_chars: 要約の最大文字数
+        """
+        self.max_chars = max_chars
+
+    def summarize(self, content_md: str) -> str:
+        """Markdown 本文の要約を生成します"""
+        headings, sentences = _split_sentences(content_md)
+        if not sentences:
+            return ""
+
+        tokenized = [_tokenize(sentence) for sentence in sentences]
+        frequencies = Counter(token for tokens in tokenized for token in tokens)
+        heading_terms = {token for heading in headings for token in _tokenize(heading)}
+
+        scores: list[tuple[float, int]] = []
+        for index, tokens in enumerate(tokenized):
+            unique = set(tokens)
+            if not unique:
+                continue
+            score = sum(
+                frequencies[token] * (1.5 if token in heading_terms else 1.0)
+                for token in unique
+            ) / math.sqrt(len(unique))
+            # 冒頭の文ほど要点を述べていることが多いため加点する
+            score *= 1.0 + 0.5 / (1 + index)
+            scores.append((score, index))
+        if not scores:
+            return self._truncate(sentences[0])
+
+        selected: list[int] = []
+        length = 0
+        for _, index in sorted(scores, reverse=True):
+            sentence_length = len(sentences[index])
+            if length + sentence_length > self.max_chars:
+                continue
+            selected.append(index)
+            length += sentence_length
+        if not selected:
+            # 最も重要な文だけでも上限を超える場合は切り詰める
+            return self._truncate(sentences[max(scores)[1]])
+
+        return _join([sentences[index] for index in sorted(selected)])
+
+    def _truncate(self, sentence: str) -> str:
+        """文を最大文字数に切り詰めます。"""
+        if len(sentence) <= self.max_chars:
+            return sentence
+        return sentence[: self.max_chars - 1] + "…"
+
+
+def _split_sentences(content_md: str) -> tuple[list[str], list[str]]:
+    """
+    Markdown を見出しと本文の文に分割します。
+
+    Args:
+        content_md: Markdown 文字列
+
+    Returns:
+        (見出しのリスト, 本文の文のリスト)
+    """
+    headings: list[str] = []
+    paragraphs: list[str] = []
+    current: list[str] = []
+    in_fence = False
+
+    def flush() -> None:
+        if current:
+            paragraphs.append(" ".join(current))
+            current.clear()
+
+    for line in content_md.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            flush()
+            continue
+        if in_fence or _INDENTED_CODE.match(line):
+            continue
+        stripped = line.strip()
+        if not stripped or stripped.startswith("|"):
+            # 空行と表は段落の区切りとして扱う
+            flush()
+            continue
+        heading = _HEADING.match(line)
+        if heading:
+            flush()
+            headings.append(_clean_inline(heading.group(1)))
+            continue
+        marker = _BLOCK_MARKER.match(line)
+        if marker and marker.group(0).strip():
+            # リスト項目・引用は1項目を1段落とする
+            flush()
+        current.append(_clean_inline(line[marker.end() if marker else 0 :]))
+    flush()
+
+    sentences = [
+        sentence.strip()
+        for paragraph in paragraphs
+        for sentence in _SENTENCE.findall(paragraph)
+    ]
+    return headings, [s for s in sentences if len(s) >= _MIN_SENTENCE_CHARS]
+
+
+def _clean_inline(text: str) -> str:
+    """インラインの Markdown 記法・HTML・URL を取り除きます。"""
+    text = _INLINE_CODE.sub(r"\1", text)
+    text = _IMAGE.sub("", text)
+    text = _LINK.sub(r"\1", text)
+    text = _HTML_TAG.sub("", text)
+    text = _URL.sub("", text)
+    text = _EMPHASIS.sub("", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def _tokenize(sentence: str) -> list[str]:
+    """
+    文を語に分解します。
+
+    英単語は小文字化して機能語を除き、漢字・カタカナの連続は文字 bigram
+    （1文字の場合はその文字）に分解します。
+    """
+    tokens: list[str] = []
+    for match in _TOKEN.findall(sentence):
+        if match.isascii():
+            word = match.lower()
+            if len(word) > 1 and word not in _STOPWORDS:
+                tokens.append(word)
+        elif len(match) == 1:
+            tokens.append(match)
+        else:
+            tokens.extend(match[i : i + 2] for i in range(len(match) - 1))
+    return tokens
+
+
+def _join(sentences: list[str]) -> str:
+    """文を連結します。日本語の文の後には空白を入れません。"""
+    parts: list[str] = []
+    for sentence in sentences:
+        if parts and not parts[-1].endswith(("。", "！", "？", "」", "』", "）")):
+            parts.append(" ")
+        parts.append(sentence)
+    return "".join(parts)
@@ -0,0 +1,70 @@
+"""
+プロセスプールで動作するサマライザー
+
+要約の生成は CPU バウンドな処理のため、API サーバーのスレッドやイベントループを
+占有しないよう、別プロセスのワーカープールで実行します。
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config.settings import settings
+from app.domain.ports.summarizer import Summarizer
+from app.infrastructure.summarization.extractive_summarizer import (
+    ExtractiveSummarizer,
+)
+
+
+class ProcessPoolSummarizer(Summarizer):
+    """
+    処理をプロセスプールに委譲するサマライザー
+
+    プールは最初の呼び出し時に起動します（インポートや起動時間に影響させないため）。
+    委譲先のサマライザーは pickle 可能である必要があります。
+    """
+
+    def __init__(self, summarizer: Summarizer, max_workers: int) -> None:
+        """
+        Args:
+            summarizer: 実際に要約を生成するサマライザー
+            max_workers: ワーカープロセス数
+        """
+        self.summarizer = summarizer
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """プロセスプールを取得します（未起動なら起動します）。"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def summarize(self, content_md: str) -> str:
+        """Markdown 本文の要約をワーカープロセスで生成します"""
+        return self._pool().submit(self.summarizer.summarize, content_md).result()
+
+    def summarize_many(self, contents: Sequence[str]) -> list[str]:
+        """複数の本文の要約をワーカープロセスで並列に生成します"""
+        chunksize = max(1, len(contents) // (self.max_workers * 4))
+        return list(
+            self._pool().map(self.summarizer.summarize, contents, chunksize=chunksize)
+        )
+
+    def shutdown(self) -> None:
+        """プロセスプールを停止します。"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+# グローバルなサマライザーインスタンス（プロセスプールをアプリ全体で共有する）
+summarizer = ProcessPoolSummarizer(
+    ExtractiveSummarizer(max_chars=settings.SUMMARY_MAX_CHARS),
+    max_workers=settings.SUMMARY_WORKERS,
+)
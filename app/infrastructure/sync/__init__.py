@@ -0,0 +1,3 @@
+"""
+差分同期のための変更記録
+"""
@@ -0,0 +1,309 @@
+"""
+変更フィードモジュール
+
+差分同期のために、エンティティの書き込みを sync_changes テーブルへ記録します。
+リポジトリの書き込みと同じトランザクション内で record() を呼び出します。
+
+シーケンス番号は change_versions テーブルの1行をカウンターとして採番します。
+カウンター行の更新ロックはコミットまで保持されるため、書き込みトランザクションは
+採番順にコミットされ、クライアントが番号の飛び越しで変更を見落とすことはありません。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from datetime import datetime
+
+from sqlalchemy import bindparam, event, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.domain.models.change import ChangeOperation, EntityType
+from app.infrastructure.db.models import (
+    CategoryORM,
+    ChangeVersionORM,
+    LLMResponseORM,
+    SyncChangeORM,
+)
+
+logger = logging.getLogger(__name__)
+
+_TABLE = SyncChangeORM.__table__
+
+# シーケンス番号のカウンターとして使う change_versions のスコープ名
+CHANGE_SEQ_SCOPE = "sync_changes"
+
+# 既存データの記録（seed）を終えたことを示す change_versions のスコープ名
+SEEDED_SCOPE = "sync_changes_seeded"
+
+# IN 句1回あたりのID数（SQLiteのバインド変数上限 999 を下回るように分割する）
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+# 変更を記録したセッションであることを示す Session.info のキー
+_RECORDED_KEY = "sync_changes_recorded"
+
+# 記録対象のエンティティとテーブル
+_ENTITY_TABLES = {
+    EntityType.CATEGORY: CategoryORM.__table__,
+    EntityType.RESPONSE: LLMResponseORM.__table__,
+}
+
+
+class ChangeFeed:
+    """
+    変更フィードへの記録を行うクラス
+    """
+
+    def __init__(self) -> None:
+        """リスナーなしで初期化します。"""
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        変更を記録したトランザクションのコミット後に呼び出す関数を登録します。
+
+        同じプロセス内の変更をポーリング間隔を待たずに通知するために使用します。
+        コミットしたスレッドから呼び出されるため、スレッドセーフである必要があります。
+
+        Args:
+            callback: コミット後に呼び出す関数
+        """
+        self._listeners.append(callback)
+
+    def notify(self) -> None:
+        """登録されたリスナーに変更のコミットを通知します。"""
+        for callback in self._listeners:
+            callback()
+
+    def record(
+        self,
+        db: Session,
+        entity_type: EntityType,
+        entity_id: object,
+        operation: ChangeOperation,
+    ) -> int:
+        """
+        エンティティの変更を記録します。
+
+        コミットは呼び出し側で行います。
+
+        Args:
+            db: 書き込み中のデータベースセッション
+            entity_type: エンティティの種類
+            entity_id: エンティティのID
+            operation: 変更操作
+
+        Returns:
+            採番したシーケンス番号
+        """
+        seq = self._next_seq(db, 1)
+        key = (
+            _TABLE.c.entity_type == entity_type.value,
+            _TABLE.c.entity_id == entity_id,
+        )
+        values = {
+            "operation": operation.value,
+            "seq": seq,
+            "changed_at": datetime.now(),
+        }
+        result = db.execute(update(_TABLE).where(*key).values(values))
+        if result.rowcount == 0:
+            db.execute(
+                insert(_TABLE).values(
+                    entity_type=entity_type.value,
+                    entity_id=entity_id,
+                    **values,
+                )
+            )
+        db.info[_RECORDED_KEY] = True
+        return seq
+
+    def record_many(
+        self,
+        db: Session,
+        entity_type: EntityType,
+        entity_ids: Sequence[object],
+        operation: ChangeOperation,
+    ) -> int:
+        """
+        同じ種類・同じ操作の複数エンティティの変更をまとめて記録します。
+
+        シーケンス番号を一括で採番し、既存の記録の更新と新規の記録の追加を
+        それぞれ1回の executemany で行います。バックフィルなどの一括更新で使用します。
+        コミットは呼び出し側で行います。
+
+        Args:
+            db: 書き込み中のデータベースセッション
+            entity_type: エンティティの種類
+            entity_ids: エンティティのIDのリスト
+            operation: 変更操作
+
+        Returns:
+            採番したシーケンス番号の最大値。記録するIDがない場合は0
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return 0
+        last_seq = self._next_seq(db, len(ids))
+        first_seq = last_seq - len(ids) + 1
+        changed_at = datetime.now()
+
+        recorded: set[object] = set()
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK_SIZE]
+            recorded.update(
+                db.execute(
+                    select(_TABLE.c.entity_id).where(
+                        _TABLE.c.entity_type == entity_type.value,
+                        _TABLE.c.entity_id.in_(chunk),
+                    )
+                ).scalars()
+            )
+
+        rows = [
+            {"target_id": entity_id, "target_seq": first_seq + offset}
+            for offset, entity_id in enumerate(ids)
+        ]
+        existing = [row for row in rows if row["target_id"] in recorded]
+        if existing:
+            db.execute(
+                update(_TABLE)
+                .where(
+                    _TABLE.c.entity_type == entity_type.value,
+                    _TABLE.c.entity_id == bindparam("target_id"),
+                )
+                .values(
+                    operation=operation.value,
+                    seq=bindparam("target_seq"),
+                    changed_at=changed_at,
+                ),
+                existing,
+            )
+        new = [
+            {
+                "entity_type": entity_type.value,
+                "entity_id": row["target_id"],
+                "operation": operation.value,
+                "seq": row["target_seq"],
+                "changed_at": changed_at,
+            }
+            for row in rows
+            if row["target_id"] not in recorded
+        ]
+        if new:
+            db.execute(insert(_TABLE), new)
+        db.info[_RECORDED_KEY] = True
+        return last_seq
+
+    def seed(self, db: Session) -> int:
+        """
+        変更記録のない既存エンティティを記録します。
+
+        変更フィードの導入前から存在するデータを、初回の同期に含めるために使用します。
+        起動時に呼び出します。記録を終えたことを change_versions に残すため、
+        記録済みのデータベースでは主キーでの1回の検索のみで終わります。
+        複数のワーカーが同時に起動しても、記録は1つのトランザクションで1回だけ行います。
+
+        Args:
+            db: データベースセッション
+
+        Returns:
+            記録したエンティティの件数
+        """
+        counter = ChangeVersionORM.__table__
+        if db.get_bind().dialect.name == "sqlite":
+            # 同時に起動した他のワーカーと直列化するよう、書き込みロックを先に取る
+            db.rollback()
+            db.execute(text("BEGIN IMMEDIATE"))
+        seeded_marker = db.execute(
+            select(counter.c.scope).where(counter.c.scope == SEEDED_SCOPE)
+        ).first()
+        if seeded_marker is not None:
+            db.rollback()
+            return 0
+
+        seeded = 0
+        try:
+            for entity_type, table in _ENTITY_TABLES.items():
+                recorded = select(_TABLE.c.entity_id).where(
+                    _TABLE.c.entity_type == entity_type.value
+                )
+                rows = db.execute(
+                    select(table.c.id, table.c.updated_at)
+                    .where(table.c.id.not_in(recorded))
+                    .order_by(table.c.updated_at)
+                ).all()
+                if not rows:
+                    continue
+
+                # 一括で採番し、更新日時の古い順に番号を割り当てる
+                last_seq = self._next_seq(db, len(rows))
+                first_seq = last_seq - len(rows) + 1
+                db.execute(
+                    insert(_TABLE),
+                    [
+                        {
+                            "entity_type": entity_type.value,
+                            "entity_id": row.id,
+                            "operation": ChangeOperation.CREATED.value,
+                            "seq": first_seq + offset,
+                            "changed_at": row.updated_at,
+                        }
+                        for offset, row in enumerate(rows)
+                    ],
+                )
+                seeded += len(rows)
+            # 以降の書き込みはすべて記録されるため、次回の起動からは確認しない
+            db.execute(insert(counter).values(scope=SEEDED_SCOPE, version=1))
+            db.commit()
+        except IntegrityError:
+            # SQLite 以外で、同時に起動した他のワーカーが先に記録した場合
+            db.rollback()
+            return 0
+
+        if seeded:
+            logger.info(f"既存データを変更フィードに記録しました: {seeded} 件")
+        return seeded
+
+    def _next_seq(self, db: Session, count: int) -> int:
+        """
+        シーケンス番号を採番します。
+
+        Args:
+            db: データベースセッション
+            count: 採番する個数
+
+        Returns:
+            採番した番号の最大値（count 個の連番の末尾）
+        """
+        counter = ChangeVersionORM.__table__
+        result = db.execute(
+            update(counter)
+            .where(counter.c.scope == CHANGE_SEQ_SCOPE)
+            .values(version=counter.c.version + count)
+        )
+        if result.rowcount == 0:
+            # 初回の書き込み時のみ行を作成する
+            db.execute(insert(counter).values(scope=CHANGE_SEQ_SCOPE, version=count))
+            return count
+        return db.execute(
+            select(counter.c.version).where(counter.c.scope == CHANGE_SEQ_SCOPE)
+        ).scalar_one()
+
+
+# グローバルな変更フィードインスタンス
+change_feed = ChangeFeed()
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    """変更を記録したセッションのコミット後に、リスナーへ通知します。"""
+    if session.info.pop(_RECORDED_KEY, False):
+        change_feed.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """ロールバックされた変更を通知対象から外します。"""
+    session.info.pop(_RECORDED_KEY, None)
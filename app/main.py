@@ -8,11 +8,21 @@ LLM応答管理バックエンドのメインアプリケーション。
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 
 from app.config.logging import setup_logging
-from app.infrastructure.db.base import init_db
+from app.config.settings import settings
+from app.infrastructure.cache.category_cache import category_cache
+from app.infrastructure.cache.coherence import change_tracker
+from app.infrastructure.db.base import SessionLocal, init_db
+from app.infrastructure.jobs.worker_pool import job_worker_pool
+from app.infrastructure.summarization.process_pool_summarizer import summarizer
+from app.infrastructure.sync.change_feed import change_feed
+from app.presentation import jobs  # noqa: F401  ジョブハンドラーとイベント購読の登録
+from app.presentation.api.v1.events import change_broadcaster
 from app.presentation.api.v1.router import api_v1_router
 
 
@@ -26,8 +36,21 @@ async def lifespan(app: FastAPI):
     # 起動時の処理
     setup_logging()
     init_db()  # データベースの初期化（テーブル作成）
+    with SessionLocal() as db:
+        change_tracker.sync(db)  # 起動時点の変更バージョンを記録
+        category_cache.load(db)  # カテゴリキャッシュの事前読み込み
+        change_feed.seed(db)  # 変更フィード導入前のデータを同期対象に含める
+    job_worker_pool.start()  # バックグラウンドジョブの実行開始（中断分も再開）
     yield
-    # 終了時の処理（必要であればここに記述）
+    # 終了時の処理
+    await change_broadcaster.close()  # 変更通知の接続を終了
+    job_worker_pool.stop()  # 実行中のジョブの完了を待って停止
+    summarizer.shutdown()  # 要約ワーカープロセスの停止
+    if settings.DATABASE_ASYNC:
+        from app.infrastructure.db.async_base import async_engine, async_read_engine
+
+        await async_engine.dispose()  # 非同期エンジンの接続を閉じる
+        await async_read_engine.dispose()
 
 
 # FastAPIアプリケーションの作成
@@ -51,6 +74,17 @@ app.add_middleware(
 app.include_router(api_v1_router)
 
 
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    """
+    制約違反（存在しないカテゴリの参照など）を 409 Conflict として返します。
+    """
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "データの整合性制約に違反しています"},
+    )
+
+
 @app.get("/", tags=["root"])
 def root():
     """
@@ -0,0 +1,232 @@
+"""
+アドミッション制御（流量制御）
+
+エンドポイントをルートクラス（検索・書き込み・読み取り）に分類し、
+クラスごとに同時実行数と待ち行列の長さを制限します。
+
+同期エンドポイントは Starlette のスレッドプールで実行されるため、
+重い検索が集中するとスレッドを使い切り、軽い読み取りまで待たされます。
+ここではスレッドプールに入る前（イベントループ上）で入場を制御し、
+待ち行列があふれた場合は 503 と Retry-After を即座に返します。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import Depends, HTTPException, status
+
+from app.config.settings import settings
+
+# ルートクラス
+SEARCH = "search"
+WRITE = "write"
+READ = "read"
+
+# 待ち時間の分位数の計算に使う直近のサンプル数
+_WAIT_SAMPLES = 1024
+
+
+class AdmissionLimiter:
+    """
+    ルートクラスごとの同時実行数制限と待ち行列
+
+    イベントループ上でのみ操作するため、ロックは使用しません。
+    空きが出たときは待ち行列の先頭に実行枠を直接引き渡します（FIFO）。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+    ) -> None:
+        """
+        Args:
+            name: ルートクラス名
+            max_concurrency: 同時に実行できるリクエスト数
+            max_queue: 実行待ちにできるリクエスト数（超えたら即座に拒否）
+            queue_timeout_seconds: 実行待ちの最大時間（超えたら拒否）
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._waits: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    async def acquire(self) -> float:
+        """
+        実行枠を取得します。
+
+        Returns:
+            実行枠を得るまでの待ち時間（秒）
+
+        Raises:
+            HTTPException: 待ち行列が満杯、または待ち時間の上限を超えた場合（503）
+        """
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._record(0.0)
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            raise self._unavailable("混雑しているため受け付けられません")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout_seconds)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 枠の引き渡しとタイムアウト（または切断）が同時に起きた場合は
+                # 受け取った枠を次の待ち手に回す
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._timed_out += 1
+            raise self._unavailable("待ち時間の上限を超えました") from None
+
+        waited = time.perf_counter() - started
+        self._record(waited)
+        return waited
+
+    def release(self) -> None:
+        """実行枠を返却し、待ち行列の先頭があれば引き渡します。"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        現在の状態と待ち時間の統計を返します。
+
+        Returns:
+            実行中・待機中の件数、累計件数、待ち時間の分位数（ミリ秒）
+        """
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(len(waits) * p))] * 1000, 3)
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "queue_wait_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": round(waits[-1] * 1000, 3) if waits else 0.0,
+            },
+        }
+
+    def _record(self, waited: float) -> None:
+        """入場と待ち時間を記録します。"""
+        self._admitted += 1
+        self._waits.append(waited)
+
+    def _unavailable(self, reason: str) -> HTTPException:
+        """拒否時に返す 503 エラーを生成します。"""
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{reason}（{self.name}）",
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
+
+
+# ルートクラスごとのリミッター（プロセス内で共有する）
+admission_limiters: dict[str, AdmissionLimiter] = {
+    SEARCH: AdmissionLimiter(
+        SEARCH,
+        max_concurrency=settings.ADMISSION_SEARCH_CONCURRENCY,
+        max_queue=settings.ADMISSION_SEARCH_QUEUE,
+        queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+    WRITE: AdmissionLimiter(
+        WRITE,
+        max_concurrency=settings.ADMISSION_WRITE_CONCURRENCY,
+        max_queue=settings.ADMISSION_WRITE_QUEUE,
+        queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+    READ: AdmissionLimiter(
+        READ,
+        max_concurrency=settings.ADMISSION_READ_CONCURRENCY,
+        max_queue=settings.ADMISSION_READ_QUEUE,
+        queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+}
+
+
+def admit(route_class: str) -> Callable[[], AsyncIterator[None]]:
+    """
+    ルートクラスの実行枠を取得する依存関数を返します。
+
+    エンドポイントの dependencies に指定します。依存関数は async のため
+    イベントループ上で待機し、スレッドプールのスレッドを占有しません。
+    枠はレスポンスの送信完了後に返却されます。
+
+    Args:
+        route_class: ルートクラス（SEARCH / WRITE / READ）
+
+    Returns:
+        依存関数
+    """
+    limiter = admission_limiters[route_class]
+
+    async def dependency() -> AsyncIterator[None]:
+        await limiter.acquire()
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    return dependency
+
+
+@asynccontextmanager
+async def admitted(route_class: str) -> AsyncIterator[None]:
+    """
+    ルートクラスの実行枠を取得し、ブロックを抜けるときに返却します。
+
+    リクエストボディを受信し終えてから枠を取るエンドポイントなど、
+    処理の一部でのみ枠を使う場合に、依存関数の代わりに使用します。
+
+    Args:
+        route_class: ルートクラス（SEARCH / WRITE / READ）
+    """
+    limiter = admission_limiters[route_class]
+    await limiter.acquire()
+    try:
+        yield
+    finally:
+        limiter.release()
+
+
+# エンドポイントの dependencies に指定する依存（ルートクラスごと）
+search_admission = Depends(admit(SEARCH))
+write_admission = Depends(admit(WRITE))
+read_admission = Depends(admit(READ))
@@ -0,0 +1,176 @@
+"""
+FastAPI 非同期依存関数
+
+非同期のエンドポイント（DATABASE_ASYNC=true）で使用する依存関数を定義します。
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ports.content_storage import ContentStorage
+from app.domain.ports.markdown_renderer import MarkdownRenderer
+from app.infrastructure.cache.coherence import change_tracker
+from app.infrastructure.db.async_base import get_async_db, get_async_read_db
+from app.infrastructure.rendering.markdown_renderer import markdown_renderer
+from app.infrastructure.repositories.async_category_repository_impl import (
+    AsyncCategoryRepositoryImpl,
+)
+from app.infrastructure.repositories.async_llm_response_repository_impl import (
+    AsyncLLMResponseRepositoryImpl,
+)
+from app.infrastructure.storage.file_content_storage import content_storage
+
+
+# データベースセッション依存
+async def _synced(sessions: AsyncIterator[AsyncSession]) -> AsyncIterator[AsyncSession]:
+    """
+    セッションを開き、変更バージョンを確認してプロセス内キャッシュを同期させます。
+
+    Args:
+        sessions: セッションを返す非同期ジェネレータ（get_async_db / get_async_read_db）
+
+    Yields:
+        AsyncSession: SQLAlchemy 非同期セッション
+    """
+    db = await anext(sessions)
+    try:
+        await db.run_sync(change_tracker.sync)
+        yield db
+    finally:
+        await sessions.aclose()
+
+
+async def get_async_database() -> AsyncIterator[AsyncSession]:
+    """
+    書き込み用エンジンの非同期データベースセッションを取得します。
+
+    同期版の get_database と同様に、リクエストごとに1回、変更バージョンを
+    確認してプロセス内キャッシュを同期させます。
+
+    Yields:
+        AsyncSession: SQLAlchemy 非同期セッション
+    """
+    async for db in _synced(get_async_db()):
+        yield db
+
+
+async def get_async_read_database() -> AsyncIterator[AsyncSession]:
+    """
+    読み取り専用エンジンの非同期データベースセッションを取得します。
+
+    書き込みを行わないユースケースのリポジトリ（get_async_read_*）で使用します。
+
+    Yields:
+        AsyncSession: 読み取り専用エンジンに接続した非同期データベースセッション
+    """
+    async for db in _synced(get_async_read_db()):
+        yield db
+
+
+# 本文ストレージ依存
+async def get_async_content_storage() -> ContentStorage:
+    """
+    本文ストレージを取得します。
+
+    Returns:
+        ContentStorage: ファイルシステムを使用した本文ストレージ
+    """
+    return content_storage
+
+
+# リポジトリ依存（同期関数の依存はスレッドプールで実行されるため async def にする）
+async def get_async_category_repository(
+    db: AsyncSession = Depends(get_async_database),
+) -> AsyncCategoryRepositoryImpl:
+    """
+    非同期カテゴリリポジトリを取得します。
+
+    Args:
+        db: 非同期データベースセッション
+
+    Returns:
+        AsyncCategoryRepositoryImpl: 非同期カテゴリリポジトリ実装
+    """
+    return AsyncCategoryRepositoryImpl(db)
+
+
+async def get_async_read_category_repository(
+    db: AsyncSession = Depends(get_async_read_database),
+) -> AsyncCategoryRepositoryImpl:
+    """
+    読み取り専用セッションの非同期カテゴリリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用の非同期データベースセッション
+
+    Returns:
+        AsyncCategoryRepositoryImpl: 非同期カテゴリリポジトリ実装
+    """
+    return AsyncCategoryRepositoryImpl(db)
+
+
+async def get_async_llm_response_repository(
+    db: AsyncSession = Depends(get_async_database),
+    storage: ContentStorage = Depends(get_async_content_storage),
+) -> AsyncLLMResponseRepositoryImpl:
+    """
+    非同期LLM応答リポジトリを取得します。
+
+    Args:
+        db: 非同期データベースセッション
+        storage: 本文ストレージ
+
+    Returns:
+        AsyncLLMResponseRepositoryImpl: 非同期LLM応答リポジトリ実装
+    """
+    return AsyncLLMResponseRepositoryImpl(db, storage)
+
+
+@asynccontextmanager
+async def open_async_llm_response_repository() -> AsyncIterator[
+    AsyncLLMResponseRepositoryImpl
+]:
+    """
+    依存関数を介さずに、書き込み用セッションの非同期LLM応答リポジトリを開きます。
+
+    リクエストボディを受信し終えてからセッションを開くエンドポイントで
+    使用します（受信中に接続を占有しないため）。
+
+    Yields:
+        AsyncLLMResponseRepositoryImpl: 非同期LLM応答リポジトリ実装
+    """
+    async with asynccontextmanager(get_async_database)() as db:
+        yield AsyncLLMResponseRepositoryImpl(db, content_storage)
+
+
+async def get_async_read_llm_response_repository(
+    db: AsyncSession = Depends(get_async_read_database),
+    storage: ContentStorage = Depends(get_async_content_storage),
+) -> AsyncLLMResponseRepositoryImpl:
+    """
+    読み取り専用セッションの非同期LLM応答リポジトリを取得します。
+
+    Args:
+        db: 読み取り専用の非同期データベースセッション
+        storage: 本文ストレージ
+
+    Returns:
+        AsyncLLMResponseRepositoryImpl: 非同期LLM応答リポジトリ実装
+    """
+    return AsyncLLMResponseRepositoryImpl(db, storage)
+
+
+# レンダラー依存
+async def get_async_markdown_renderer() -> MarkdownRenderer:
+    """
+    Markdownレンダラーを取得します。
+
+    Returns:
+        MarkdownRenderer: キャッシュ付きMarkdownレンダラー
+    """
+    return markdown_renderer
@@ -0,0 +1,102 @@
+"""
+クエリ期限の依存関数
+
+リクエストごとにクエリの制限時間を設定し、クライアントが切断した場合は
+実行中のクエリを中断します。制限時間はエンドポイントごとに設定できます
+（QUERY_TIMEOUT_SECONDS、QUERY_TIMEOUTS）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from fastapi import HTTPException, Request, status
+
+from app.config.settings import settings
+from app.infrastructure.db.deadline import (
+    QueryDeadline,
+    is_interrupted,
+    set_query_deadline,
+)
+
+
+def query_timeout_seconds(endpoint_name: str) -> float:
+    """
+    エンドポイントのクエリの制限時間を取得します。
+
+    Args:
+        endpoint_name: エンドポイント名（関数名）
+
+    Returns:
+        制限時間（秒、0以下は無制限）
+    """
+    return settings.QUERY_TIMEOUTS.get(endpoint_name, settings.QUERY_TIMEOUT_SECONDS)
+
+
+def streams_request_body[F: Callable[..., Any]](endpoint: F) -> F:
+    """
+    リクエストボディをエンドポイント内で受信しながら処理することを示すデコレーター
+
+    切断を監視する request.receive() がボディを読み取ってしまうため、
+    このエンドポイントにはクエリ期限を設定しません（ボディの受信中の切断は
+    エンドポイント側で検知されます）。
+
+    Args:
+        endpoint: エンドポイント関数
+
+    Returns:
+        印を付けたエンドポイント関数
+    """
+    endpoint.streams_request_body = True  # type: ignore[attr-defined]
+    return endpoint
+
+
+async def _cancel_on_disconnect(request: Request, deadline: QueryDeadline) -> None:
+    """クライアントの切断を待ち、切断されたら期限を中断します。"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            deadline.cancel()
+            return
+
+
+async def query_deadline(request: Request) -> AsyncIterator[None]:
+    """
+    リクエストのクエリ期限を設定する依存関数
+
+    期限切れやクライアントの切断でクエリが中断された場合は 504 を返します。
+    ルーターの dependencies に指定します。
+
+    Args:
+        request: リクエスト
+    """
+    endpoint = request.scope.get("endpoint")
+    timeout = query_timeout_seconds(getattr(endpoint, "__name__", ""))
+    if timeout <= 0 or getattr(endpoint, "streams_request_body", False):
+        yield
+        return
+
+    deadline = QueryDeadline(timeout)
+    set_query_deadline(deadline)
+    watcher = asyncio.create_task(_cancel_on_disconnect(request, deadline))
+    try:
+        yield
+    except Exception as e:
+        if is_interrupted(e):
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=(
+                    "クライアントの切断によりクエリを中断しました"
+                    if deadline.cancelled
+                    else f"クエリが制限時間（{timeout}秒）を超えたため中断しました"
+                ),
+            ) from e
+        raise
+    finally:
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        set_query_deadline(None)
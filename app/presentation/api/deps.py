@@ -6,29 +6,108 @@ from __future__ import annotations
 エンドポイントで使用する共通の依存関数を定義します。
 """
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.infrastructure.db.base import get_db
+from app.domain.ports.content_storage import ContentStorage
+from app.domain.ports.conversation_export import ConversationExportReader
+from app.domain.ports.markdown_renderer import MarkdownRenderer
+from app.infrastructure.cache.coherence import change_tracker
+from app.infrastructure.db.base import get_db, get_read_db
+from app.infrastructure.importers.conversation_export_reader import (
+    conversation_export_reader,
+)
+from app.infrastructure.rendering.markdown_renderer import markdown_renderer
 from app.infrastructure.repositories.category_repository_impl import (
     CategoryRepositoryImpl,
 )
+from app.infrastructure.repositories.change_repository_impl import (
+    ChangeRepositoryImpl,
+)
+from app.infrastructure.repositories.conversation_import_repository_impl import (
+    ConversationImportRepositoryImpl,
+)
+from app.infrastructure.repositories.job_repository_impl import JobRepositoryImpl
 from app.infrastructure.repositories.llm_response_repository_impl import (
     LLMResponseRepositoryImpl,
 )
+from app.infrastructure.repositories.prompt_repository_impl import PromptRepositoryImpl
+from app.infrastructure.repositories.response_revision_repository_impl import (
+    ResponseRevisionRepositoryImpl,
+)
+from app.infrastructure.repositories.tag_stat_repository_impl import (
+    TagStatRepositoryImpl,
+)
+from app.infrastructure.storage.file_content_storage import (
+    FileContentStorage,
+    content_storage,
+    export_storage,
+)
 
 
 # データベースセッション依存
+def _synced(sessions: Generator[Session]) -> Generator[Session]:
+    """
+    セッションを開き、変更バージョンを確認してプロセス内キャッシュを同期させます。
+
+    Args:
+        sessions: セッションを返すジェネレータ（get_db / get_read_db）
+
+    Yields:
+        Session: SQLAlchemyセッション
+    """
+    db = next(sessions)
+    try:
+        change_tracker.sync(db)
+        yield db
+    finally:
+        sessions.close()
+
+
 def get_database() -> Generator[Session]:
     """
-    データベースセッションを取得します。
+    書き込み用エンジンのデータベースセッションを取得します。
+
+    書き込みを行うユースケースのリポジトリで使用します。
+    リクエストごとに1回、変更バージョンを確認してプロセス内キャッシュを
+    他ワーカーの書き込みと同期させます。
+
+    Yields:
+        Session: SQLAlchemyセッション
+    """
+    yield from _synced(get_db())
+
+
+def get_read_database() -> Generator[Session]:
+    """
+    読み取り専用エンジンのデータベースセッションを取得します。
+
+    書き込みを行わないユースケースのリポジトリ（get_read_*）で使用します。
+    HTTPメソッドによらず、POST の読み取り（batchGet など）も対象です。
+
+    Yields:
+        Session: 読み取り専用エンジンに接続したSQLAlchemyセッション
+    """
+    yield from _synced(get_read_db())
+
+
+@contextmanager
+def open_database() -> Iterator[Session]:
+    """
+    依存関数を介さずに、書き込み用エンジンのデータベースセッションを開きます。
+
+    リクエストボディを受信し終えてからセッションを開くエンドポイントで
+    使用します（受信中に接続を占有しないため）。複数のリポジトリで
+    1つのセッションを共有する場合は、このセッションから作成します。
 
     Yields:
         Session: SQLAlchemyセッション
     """
-    yield from get_db()
+    with contextmanager(get_database)() as db:
+        yield db
 
 
 # リポジトリ依存
@@ -47,6 +126,21 @@ def get_category_repository(
     return CategoryRepositoryImpl(db)
 
 
+def get_read_category_repository(
+    db: Session = Depends(get_read_database),
+) -> CategoryRepositoryImpl:
+    """
+    読み取り専用セッションのカテゴリリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        CategoryRepositoryImpl: カテゴリリポジトリ実装
+    """
+    return CategoryRepositoryImpl(db)
+
+
 def get_llm_response_repository(
     db: Session = Depends(get_database),
 ) -> LLMResponseRepositoryImpl:
@@ -60,3 +154,215 @@ def get_llm_response_repository(
         LLMResponseRepositoryImpl: LLM応答リポジトリ実装
     """
     return LLMResponseRepositoryImpl(db)
+
+
+@contextmanager
+def open_llm_response_repository() -> Iterator[LLMResponseRepositoryImpl]:
+    """
+    依存関数を介さずに、書き込み用セッションのLLM応答リポジトリを開きます。
+
+    セッションは open_database で開きます。
+
+    Yields:
+        LLMResponseRepositoryImpl: LLM応答リポジトリ実装
+    """
+    with open_database() as db:
+        yield get_llm_response_repository(db)
+
+
+def get_read_llm_response_repository(
+    db: Session = Depends(get_read_database),
+) -> LLMResponseRepositoryImpl:
+    """
+    読み取り専用セッションのLLM応答リポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        LLMResponseRepositoryImpl: LLM応答リポジトリ実装
+    """
+    return LLMResponseRepositoryImpl(db)
+
+
+def get_prompt_repository(
+    db: Session = Depends(get_database),
+) -> PromptRepositoryImpl:
+    """
+    プロンプトリポジトリを取得します。
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        PromptRepositoryImpl: プロンプトリポジトリ実装
+    """
+    return PromptRepositoryImpl(db)
+
+
+def get_read_prompt_repository(
+    db: Session = Depends(get_read_database),
+) -> PromptRepositoryImpl:
+    """
+    読み取り専用セッションのプロンプトリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        PromptRepositoryImpl: プロンプトリポジトリ実装
+    """
+    return PromptRepositoryImpl(db)
+
+
+def get_read_response_revision_repository(
+    db: Session = Depends(get_read_database),
+) -> ResponseRevisionRepositoryImpl:
+    """
+    読み取り専用セッションのLLM応答リビジョンリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        ResponseRevisionRepositoryImpl: LLM応答リビジョンリポジトリ実装
+    """
+    return ResponseRevisionRepositoryImpl(db)
+
+
+def get_read_tag_stat_repository(
+    db: Session = Depends(get_read_database),
+) -> TagStatRepositoryImpl:
+    """
+    読み取り専用セッションのタグ統計リポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        TagStatRepositoryImpl: タグ統計リポジトリ実装
+    """
+    return TagStatRepositoryImpl(db)
+
+
+def get_job_repository(
+    db: Session = Depends(get_database),
+) -> JobRepositoryImpl:
+    """
+    ジョブリポジトリを取得します。
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        JobRepositoryImpl: ジョブリポジトリ実装
+    """
+    return JobRepositoryImpl(db)
+
+
+def get_read_job_repository(
+    db: Session = Depends(get_read_database),
+) -> JobRepositoryImpl:
+    """
+    読み取り専用セッションのジョブリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        JobRepositoryImpl: ジョブリポジトリ実装
+    """
+    return JobRepositoryImpl(db)
+
+
+def get_read_change_repository(
+    db: Session = Depends(get_read_database),
+) -> ChangeRepositoryImpl:
+    """
+    読み取り専用セッションの変更記録リポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        ChangeRepositoryImpl: 変更記録リポジトリ実装
+    """
+    return ChangeRepositoryImpl(db)
+
+
+def get_conversation_import_repository(
+    db: Session = Depends(get_database),
+) -> ConversationImportRepositoryImpl:
+    """
+    取り込みリポジトリを取得します。
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        ConversationImportRepositoryImpl: 取り込みリポジトリ実装
+    """
+    return ConversationImportRepositoryImpl(db)
+
+
+def get_read_conversation_import_repository(
+    db: Session = Depends(get_read_database),
+) -> ConversationImportRepositoryImpl:
+    """
+    読み取り専用セッションの取り込みリポジトリを取得します。
+
+    Args:
+        db: 読み取り専用のデータベースセッション
+
+    Returns:
+        ConversationImportRepositoryImpl: 取り込みリポジトリ実装
+    """
+    return ConversationImportRepositoryImpl(db)
+
+
+# 本文ストレージ依存
+def get_content_storage() -> ContentStorage:
+    """
+    本文ストレージを取得します。
+
+    Returns:
+        ContentStorage: ファイルシステムを使用した本文ストレージ
+    """
+    return content_storage
+
+
+def get_export_storage() -> FileContentStorage:
+    """
+    アップロードされた会話エクスポートの保存先を取得します。
+
+    取り込みはファイルシステム上のパスから読み込むため、
+    ファイルシステムを使用したストレージを返します。
+
+    Returns:
+        FileContentStorage: 会話エクスポートの保存先
+    """
+    return export_storage
+
+
+# 会話エクスポートのリーダー依存
+def get_conversation_export_reader() -> ConversationExportReader:
+    """
+    会話エクスポートのリーダーを取得します。
+
+    Returns:
+        ConversationExportReader: JSON を逐次読み込むリーダー
+    """
+    return conversation_export_reader
+
+
+# レンダラー依存
+def get_markdown_renderer() -> MarkdownRenderer:
+    """
+    Markdownレンダラーを取得します。
+
+    キャッシュをプロセス内で共有するため、常に同じインスタンスを返します。
+
+    Returns:
+        MarkdownRenderer: キャッシュ付きMarkdownレンダラー
+    """
+    return markdown_renderer
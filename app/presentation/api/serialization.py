@@ -0,0 +1,260 @@
+"""
+高速JSONシリアライズモジュール
+
+一覧取得などの大きなレスポンスで、Pydanticモデルへの再検証（from_attributes）と
+標準ライブラリの json エンコーダを経由せずに、ドメインエンティティから
+直接JSONバイト列を生成します。
+
+orjson がインストールされていれば orjson を、なければ pydantic-core の
+to_json を使用します。どちらも dataclass・UUID・datetime・Enum を
+ネイティブに扱えるため、辞書への変換以外の前処理は不要です。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from pydantic_core import to_json
+
+from app.domain.models.category import Category
+from app.domain.models.content_chunk import ChunkSearchHit, ContentChunk
+from app.domain.models.llm_response import LLMResponse
+from app.domain.models.stored_content import StoredContent
+from app.presentation.schemas.llm_response import LLMResponseListItem, LLMResponseRead
+
+try:
+    import orjson
+except ImportError:  # orjson はオプション依存
+    orjson = None
+
+# スキーマ定義と出力フィールドがずれないよう、フィールド名はスキーマから取得する
+READ_FIELDS: tuple[str, ...] = tuple(LLMResponseRead.model_fields)
+LIST_ITEM_FIELDS: tuple[str, ...] = tuple(LLMResponseListItem.model_fields)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    値をJSONバイト列に変換します。
+
+    Args:
+        content: 変換する値
+
+    Returns:
+        UTF-8エンコードされたJSONバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return to_json(content)
+
+
+class FastJSONResponse(Response):
+    """
+    dumps() でシリアライズするJSONレスポンス
+
+    エンドポイントからこのレスポンスを直接返すと、FastAPIの
+    response_model による検証・変換はスキップされます
+    （response_model はOpenAPIドキュメントのためにのみ使用されます）。
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """レスポンスボディを生成します"""
+        return dumps(content)
+
+
+def parse_fields(fields: str | list[str] | None) -> tuple[str, ...] | None:
+    """
+    フィールド指定（?fields= のカンマ区切り文字列、またはリスト）を解析します。
+
+    Args:
+        fields: カンマ区切りのフィールド名、またはそのリスト。未指定の場合はNone
+
+    Returns:
+        重複を除いたフィールド名のタプル。未指定の場合はNone
+
+    Raises:
+        HTTPException: LLMResponseRead に存在しないフィールドが含まれる場合（400）
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    stripped = (name.strip() for name in fields)
+    names = tuple(dict.fromkeys(name for name in stripped if name))
+    if not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="フィールドが指定されていません",
+        )
+    unknown = [name for name in names if name not in READ_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"未知のフィールドです: {', '.join(unknown)}",
+        )
+    return names
+
+
+def category_ref_dict(category: Category | None) -> dict[str, Any] | None:
+    """
+    カテゴリを CategoryRef 相当の辞書に変換します。
+
+    Args:
+        category: カテゴリエンティティ
+
+    Returns:
+        id と name のみを持つ辞書。カテゴリがNoneの場合はNone
+    """
+    if category is None:
+        return None
+    return {"id": category.id, "name": category.name}
+
+
+def category_dict(category: Category) -> dict[str, Any]:
+    """
+    カテゴリエンティティを CategoryRead 相当の辞書に変換します。
+
+    Args:
+        category: カテゴリエンティティ
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    return {
+        "id": category.id,
+        "name": category.name,
+        "description": category.description,
+        "created_at": category.created_at,
+        "updated_at": category.updated_at,
+    }
+
+
+def response_dict(
+    response: LLMResponse, fields: Iterable[str] = READ_FIELDS
+) -> dict[str, Any]:
+    """
+    LLM応答エンティティを指定フィールドのみの辞書に変換します。
+
+    Args:
+        response: LLM応答エンティティ
+        fields: 出力するフィールド名
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    content = {name: getattr(response, name) for name in fields}
+    if "category" in content:
+        content["category"] = category_ref_dict(response.category)
+    return content
+
+
+def upload_dict(response: LLMResponse, content: StoredContent) -> dict[str, Any]:
+    """
+    アップロードで作成したLLM応答を LLMResponseUploadRead 相当の辞書に変換します。
+
+    Args:
+        response: 作成したLLM応答エンティティ
+        content: 本文ストレージに書き込んだ本文
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    return {
+        **response_dict(response, LIST_ITEM_FIELDS),
+        "storage_path": content.path,
+        "content_sha256": content.sha256,
+        "content_bytes": content.byte_count,
+    }
+
+
+def projection_dict(projection: dict[str, Any]) -> dict[str, Any]:
+    """
+    リポジトリが返した射影（フィールド指定での取得結果）をJSON用に変換します。
+
+    Args:
+        projection: フィールド名をキーとする辞書
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    if "category" in projection:
+        projection["category"] = category_ref_dict(projection["category"])
+    return projection
+
+
+def section_dict(
+    chunk: ContentChunk, response_id: UUID | None = None
+) -> dict[str, Any]:
+    """
+    本文のチャンクをセクションの辞書に変換します。
+
+    Args:
+        chunk: 本文のチャンク
+        response_id: LLM応答のID（指定した場合は response_id と content を含める）
+
+    Returns:
+        ResponseSectionSummary（response_id 指定時は ResponseSectionRead）
+        相当の辞書
+    """
+    content: dict[str, Any] = {
+        "position": chunk.position,
+        "heading": chunk.heading,
+        "heading_level": chunk.heading_level,
+        "start_offset": chunk.start_offset,
+        "end_offset": chunk.end_offset,
+    }
+    if response_id is not None:
+        content["response_id"] = response_id
+        content["content"] = chunk.content
+    return content
+
+
+def section_hit_dict(hit: ChunkSearchHit) -> dict[str, Any]:
+    """
+    チャンク単位の検索結果を SectionSearchHit 相当の辞書に変換します。
+
+    セクションの本文は含めず、スニペットのみを返します。
+
+    Args:
+        hit: チャンク単位の検索結果
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    return {
+        **section_dict(hit.chunk),
+        "response_id": hit.response_id,
+        "title": hit.title,
+        "snippet": hit.snippet,
+    }
+
+
+def response_list_dict(
+    responses: list[LLMResponse] | list[dict[str, Any]], skip: int, limit: int
+) -> dict[str, Any]:
+    """
+    LLM応答の一覧を LLMResponseListResponse 相当の辞書に変換します。
+
+    Args:
+        responses: LLM応答エンティティ、または射影（辞書）のリスト
+        skip: スキップした件数
+        limit: 取得件数の上限
+
+    Returns:
+        JSONシリアライズ可能な辞書
+    """
+    return {
+        "items": [
+            projection_dict(response)
+            if isinstance(response, dict)
+            else response_dict(response, LIST_ITEM_FIELDS)
+            for response in responses
+        ],
+        "total": len(responses),
+        "skip": skip,
+        "limit": limit,
+    }
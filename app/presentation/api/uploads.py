@@ -0,0 +1,341 @@
+"""
+multipart/form-data のストリーミング受信
+
+Starlette のフォーム解析は、ファイルのパートを一時ファイルに spool してから
+ハンドラーに渡し、ハンドラーで改めて読み出す必要があります。
+ここではリクエストボディを受信しながら解析し、本文のパートを本文ストレージへ
+直接書き込みます（書き込みと同時に SHA-256 ハッシュとサイズを算出する）。
+本文以外のフィールドは、合計サイズを制限してメモリ上に集めます。
+
+アップロードごとのメモリ使用量は、受信した1回分のデータと本文以外の
+フィールドの大きさまでに抑えられ、本文の大きさにはよりません。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.domain.models.stored_content import StoredContent
+from app.domain.ports.content_storage import (
+    ContentStorage,
+    ContentTooLargeError,
+    ContentWriter,
+)
+from app.presentation.schemas.llm_response import LLMResponseUploadForm
+
+# 本文を送信するパートの名前
+CONTENT_FIELD = "content"
+
+# 本文以外のフィールドの区切りやヘッダーに見込む大きさ（Content-Length の事前確認用）
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def upload_openapi(
+    form: type[BaseModel], content_field: str, description: str
+) -> dict[str, Any]:
+    """
+    アップロードのエンドポイントの openapi_extra を作成します。
+
+    ボディはエンドポイント内で受信しながら解析するため、リクエストボディの
+    スキーマを手動で記述します。
+
+    Args:
+        form: 本文以外のフィールドのスキーマ
+        content_field: 本文（ファイル）を送信するパートの名前
+        description: 本文のパートの説明
+
+    Returns:
+        openapi_extra に指定する辞書
+    """
+    schema = form.model_json_schema(ref_template="#/components/schemas/{model}")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            **schema["properties"],
+                            content_field: {
+                                "type": "string",
+                                "format": "binary",
+                                "description": description,
+                            },
+                        },
+                        "required": [*schema.get("required", []), content_field],
+                    }
+                }
+            },
+        }
+    }
+
+
+# LLM応答のアップロードのエンドポイントの openapi_extra
+UPLOAD_OPENAPI = upload_openapi(
+    LLMResponseUploadForm, CONTENT_FIELD, "応答内容（Markdown形式、UTF-8）"
+)
+
+
+@dataclass(slots=True)
+class UploadedForm:
+    """
+    受信したフォーム
+
+    Attributes:
+        content: 本文ストレージに書き込んだ本文
+        fields: 本文以外のフィールド（同名のフィールドは受信順のリスト）
+    """
+
+    content: StoredContent
+    fields: dict[str, list[str]] = field(default_factory=dict)
+
+
+class _FormReceiver:
+    """
+    MultipartParser のコールバックを受け、パートを振り分けます。
+
+    本文のデータはイベントループ上でファイルに書き込まないよう pending に
+    ためておき、呼び出し側がスレッドプールで書き込みます。
+    """
+
+    def __init__(self, max_field_bytes: int, content_field: str = CONTENT_FIELD):
+        """
+        Args:
+            max_field_bytes: 本文以外のフィールドの合計の最大バイト数
+            content_field: 本文を送信するパートの名前
+        """
+        self.max_field_bytes = max_field_bytes
+        self.content_field = content_field
+        self.field_bytes = 0
+        self.fields: dict[str, list[str]] = {}
+        self.pending: list[bytes] = []
+        self.has_content = False
+        self._header_name = bytearray()
+        self._header_value = bytearray()
+        self._disposition = b""
+        self._name = ""
+        self._value = bytearray()
+        self._is_content = False
+
+    def callbacks(self) -> dict:
+        """MultipartParser に渡すコールバックの辞書を返します"""
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+
+    def on_part_begin(self) -> None:
+        self._disposition = b""
+        self._value = bytearray()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = bytes(self._header_value)
+        self._header_name.clear()
+        self._header_value.clear()
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        name = options.get(b"name")
+        if name is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Content-Disposition に name がないパートがあります",
+            )
+        self._name = name.decode("utf-8", "replace")
+        self._is_content = self._name == self.content_field
+        if self._is_content:
+            if self.has_content:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"本文（{self.content_field}）のパートが複数あります",
+                )
+            self.has_content = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._is_content:
+            self.pending.append(data[start:end])
+            return
+        self.field_bytes += end - start
+        if self.field_bytes > self.max_field_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"本文以外のフィールドが上限（{self.max_field_bytes} バイト）"
+                "を超えています",
+            )
+        self._value += data[start:end]
+
+    def on_part_end(self) -> None:
+        if self._is_content:
+            return
+        try:
+            value = self._value.decode("utf-8")
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"フィールド {self._name} が UTF-8 ではありません",
+            ) from None
+        self.fields.setdefault(self._name, []).append(value)
+
+
+async def receive_upload(
+    request: Request,
+    storage: ContentStorage,
+    max_bytes: int,
+    max_field_bytes: int,
+    content_field: str = CONTENT_FIELD,
+) -> UploadedForm:
+    """
+    multipart/form-data のリクエストを受信し、本文を本文ストレージに書き込みます。
+
+    Args:
+        request: HTTPリクエスト
+        storage: 本文ストレージ
+        max_bytes: 本文の最大バイト数
+        max_field_bytes: 本文以外のフィールドの合計の最大バイト数
+        content_field: 本文を送信するパートの名前
+
+    Returns:
+        本文ストレージに書き込んだ本文と、本文以外のフィールド
+
+    Raises:
+        HTTPException: multipart/form-data でない場合（415）、上限を超えた場合
+            （413）、形式が正しくない場合（400）、本文がない・UTF-8 でない
+            場合（422）
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type"))
+    if content_type != b"multipart/form-data":
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="multipart/form-data で送信してください",
+        )
+    boundary = options.get(b"boundary")
+    if not boundary:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="multipart の boundary が指定されていません",
+        )
+    # 上限を明らかに超えるリクエストは、受信を始める前に拒否する
+    content_length = request.headers.get("content-length")
+    limit = max_bytes + max_field_bytes + _MULTIPART_OVERHEAD_BYTES
+    if content_length is not None and content_length.isdigit():
+        if int(content_length) > limit:
+            raise _too_large(max_bytes)
+
+    receiver = _FormReceiver(max_field_bytes, content_field)
+    parser = MultipartParser(boundary, receiver.callbacks())
+    with storage.open_writer(max_bytes) as writer:
+        try:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                await _flush(receiver, writer)
+            parser.finalize()
+            await _flush(receiver, writer)
+            if not receiver.has_content:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=f"本文（{content_field}）のパートがありません",
+                )
+            content = await run_in_threadpool(writer.commit)
+        except ContentTooLargeError:
+            raise _too_large(max_bytes) from None
+        except MultipartParseError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="multipart/form-data の形式が正しくありません",
+            ) from None
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="本文が UTF-8 ではありません",
+            ) from None
+    return UploadedForm(content=content, fields=receiver.fields)
+
+
+async def _flush(receiver: _FormReceiver, writer: ContentWriter) -> None:
+    """
+    ためておいた本文のデータを、スレッドプールで本文ストレージに書き込みます。
+
+    Args:
+        receiver: パートを振り分けたレシーバー
+        writer: 本文のライター
+    """
+    if receiver.pending:
+        data = b"".join(receiver.pending)
+        receiver.pending.clear()
+        await run_in_threadpool(writer.write, data)
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    """本文が上限を超えたことを示す 413 の例外を返します"""
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"本文が上限（{max_bytes} バイト）を超えています",
+    )
+
+
+def validate_upload_form[M: BaseModel](
+    upload: UploadedForm, storage: ContentStorage, form_schema: type[M]
+) -> M:
+    """
+    受信したフォームの本文以外のフィールドを検証します。
+
+    tags は同名のフィールドを繰り返して指定するためリストとして、
+    それ以外のフィールドは最後の値を検証します。スキーマに content_sha256 が
+    ある場合は、受信した本文のハッシュと照合します。
+    検証に失敗した場合は、本文ストレージに書き込んだ本文を削除します。
+
+    Args:
+        upload: 受信したフォーム
+        storage: 本文ストレージ
+        form_schema: 本文以外のフィールドのスキーマ
+
+    Returns:
+        検証したフィールド
+
+    Raises:
+        RequestValidationError: フィールドが正しくない場合（422）
+        HTTPException: content_sha256 が受信した本文と一致しない場合（422）
+    """
+    values: dict[str, object] = {
+        name: items if name == "tags" else items[-1]
+        for name, items in upload.fields.items()
+    }
+    try:
+        form = form_schema.model_validate(values)
+    except ValidationError as e:
+        storage.delete(upload.content.path)
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        ) from None
+    content_sha256 = getattr(form, "content_sha256", None)
+    if content_sha256 is not None and content_sha256.lower() != upload.content.sha256:
+        storage.delete(upload.content.path)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="content_sha256 が受信した本文のハッシュと一致しません",
+        )
+    return form
@@ -0,0 +1,140 @@
+"""
+カテゴリ API エンドポイント（非同期版）
+
+categories モジュールと同じエンドポイントを async def で定義します。
+DATABASE_ASYNC=true の場合に categories の代わりに登録されます。
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.use_cases.create_category import AsyncCreateCategoryUseCase
+from app.application.use_cases.list_categories import AsyncListCategoriesUseCase
+from app.domain.repositories.async_category_repository import (
+    AsyncCategoryRepository,
+)
+from app.presentation.api.admission import read_admission, write_admission
+from app.presentation.api.async_deps import (
+    get_async_category_repository,
+    get_async_read_category_repository,
+)
+from app.presentation.schemas.category import (
+    CategoryCreate,
+    CategoryListResponse,
+    CategoryRead,
+    CategoryUpdate,
+)
+
+router = APIRouter(prefix="/categories", tags=["categories"])
+
+
+@router.post(
+    "",
+    response_model=CategoryRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="カテゴリを作成",
+    dependencies=[write_admission],
+)
+async def create_category(
+    category_data: CategoryCreate,
+    repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+):
+    """
+    新しいカテゴリを作成します。
+    """
+    use_case = AsyncCreateCategoryUseCase(repository)
+    category = await use_case.execute(
+        name=category_data.name, description=category_data.description
+    )
+    return category
+
+
+@router.get(
+    "",
+    response_model=CategoryListResponse,
+    summary="カテゴリ一覧を取得",
+    dependencies=[read_admission],
+)
+async def list_categories(
+    skip: int = 0,
+    limit: int = 100,
+    top_tags: int = Query(3, ge=0, le=20, description="カテゴリごとの上位タグ数"),
+    repository: AsyncCategoryRepository = Depends(get_async_read_category_repository),
+):
+    """
+    カテゴリの一覧を、応答件数・最終更新日時・上位タグ付きで取得します。
+    """
+    use_case = AsyncListCategoriesUseCase(repository)
+    categories = await use_case.execute(skip=skip, limit=limit, top_tags_limit=top_tags)
+    return CategoryListResponse(
+        items=categories, total=len(categories), skip=skip, limit=limit
+    )
+
+
+@router.get(
+    "/{category_id}",
+    response_model=CategoryRead,
+    summary="カテゴリを取得",
+    dependencies=[read_admission],
+)
+async def get_category(
+    category_id: UUID,
+    repository: AsyncCategoryRepository = Depends(get_async_read_category_repository),
+):
+    """
+    IDでカテゴリを取得します。
+    """
+    category = await repository.get_by_id(category_id)
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="カテゴリが見つかりません"
+        )
+    return category
+
+
+@router.put(
+    "/{category_id}",
+    response_model=CategoryRead,
+    summary="カテゴリを更新",
+    dependencies=[write_admission],
+)
+async def update_category(
+    category_id: UUID,
+    category_data: CategoryUpdate,
+    repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+):
+    """
+    カテゴリを更新します。
+    """
+    category = await repository.get_by_id(category_id)
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="カテゴリが見つかりません"
+        )
+
+    category.update(name=category_data.name, description=category_data.description)
+    updated_category = await repository.update(category)
+    return updated_category
+
+
+@router.delete(
+    "/{category_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="カテゴリを削除",
+    dependencies=[write_admission],
+)
+async def delete_category(
+    category_id: UUID,
+    repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+):
+    """
+    カテゴリを削除します。
+    """
+    success = await repository.delete(category_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="カテゴリが見つかりません"
+        )
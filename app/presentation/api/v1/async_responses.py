@@ -0,0 +1,485 @@
+"""
+LLM応答 API エンドポイント（非同期版）
+
+responses モジュールと同じエンドポイントを async def で定義します。
+DATABASE_ASYNC=true の場合に responses の代わりに登録されます。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import HTMLResponse
+
+from app.application.use_cases.batch_get_responses import AsyncBatchGetResponsesUseCase
+from app.application.use_cases.create_response import AsyncCreateResponseUseCase
+from app.application.use_cases.list_responses import AsyncListResponsesUseCase
+from app.application.use_cases.render_response_html import (
+    AsyncRenderResponseHtmlUseCase,
+)
+from app.application.use_cases.response_sections import (
+    AsyncGetResponseSectionUseCase,
+    AsyncListResponseSectionsUseCase,
+    AsyncSearchResponseSectionsUseCase,
+)
+from app.application.use_cases.search_responses import AsyncSearchResponsesUseCase
+from app.application.use_cases.update_response import AsyncUpdateResponseUseCase
+from app.application.use_cases.upload_response import AsyncUploadResponseUseCase
+from app.config.settings import settings
+from app.domain.models.content_stats import ContentStatsFilter
+from app.domain.ports.content_storage import ContentStorage
+from app.domain.ports.markdown_renderer import MarkdownRenderer
+from app.domain.repositories.async_llm_response_repository import (
+    AsyncLLMResponseRepository,
+)
+from app.presentation.api.admission import (
+    WRITE,
+    admitted,
+    read_admission,
+    search_admission,
+    write_admission,
+)
+from app.presentation.api.async_deps import (
+    get_async_content_storage,
+    get_async_llm_response_repository,
+    get_async_markdown_renderer,
+    get_async_read_llm_response_repository,
+    open_async_llm_response_repository,
+)
+from app.presentation.api.deadline import streams_request_body
+from app.presentation.api.serialization import (
+    FastJSONResponse,
+    parse_fields,
+    projection_dict,
+    response_dict,
+    response_list_dict,
+    section_dict,
+    section_hit_dict,
+    upload_dict,
+)
+from app.presentation.api.uploads import (
+    UPLOAD_OPENAPI,
+    receive_upload,
+    validate_upload_form,
+)
+from app.presentation.api.v1.responses import (
+    FIELDS_DESCRIPTION,
+    content_stats_filter,
+)
+from app.presentation.schemas.llm_response import (
+    LLMResponseBatchGetRequest,
+    LLMResponseBatchGetResponse,
+    LLMResponseCreate,
+    LLMResponseListResponse,
+    LLMResponseRead,
+    LLMResponseUpdate,
+    LLMResponseUploadForm,
+    LLMResponseUploadRead,
+    ResponseSectionListResponse,
+    ResponseSectionRead,
+    ResponseSortKey,
+    SectionSearchResponse,
+    SortOrder,
+)
+
+router = APIRouter(prefix="/responses", tags=["responses"])
+
+
+@router.post(
+    "",
+    response_model=LLMResponseRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="LLM応答を作成",
+    dependencies=[write_admission],
+)
+async def create_response(
+    response_data: LLMResponseCreate,
+    repository: AsyncLLMResponseRepository = Depends(get_async_llm_response_repository),
+):
+    """
+    新しいLLM応答を作成します。
+
+    HTMLの事前レンダリングと（要約を省略した場合の）要約の生成は、
+    バックグラウンドジョブとして実行されます。
+    """
+    use_case = AsyncCreateResponseUseCase(repository)
+    llm_response = await use_case.execute(
+        title=response_data.title,
+        prompt=response_data.prompt,
+        content_md=response_data.content_md,
+        model=response_data.model,
+        provider=response_data.provider,
+        category_id=response_data.category_id,
+        tags=response_data.tags,
+        summary=response_data.summary,
+    )
+    return llm_response
+
+
+@router.post(
+    ":upload",
+    response_model=LLMResponseUploadRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="LLM応答を本文のアップロードで作成",
+    openapi_extra=UPLOAD_OPENAPI,
+)
+@streams_request_body
+async def upload_response(
+    request: Request,
+    storage: ContentStorage = Depends(get_async_content_storage),
+):
+    """
+    multipart/form-data で本文を送信して、新しいLLM応答を作成します。
+
+    本文（content パート）は受信しながら本文ストレージに書き込むため、
+    大きな本文でもメモリ使用量はほぼ一定です。本文のサイズは UPLOAD_MAX_BYTES、
+    本文以外のフィールドの合計は UPLOAD_MAX_FIELD_BYTES までです。
+    content_sha256 を指定すると、受信した本文のハッシュと照合します。
+    データベースのセッションと書き込みの実行枠は、本文を受信し終えてから取得します。
+    """
+    upload = await receive_upload(
+        request, storage, settings.UPLOAD_MAX_BYTES, settings.UPLOAD_MAX_FIELD_BYTES
+    )
+    form = validate_upload_form(upload, storage, LLMResponseUploadForm)
+    try:
+        async with (
+            admitted(WRITE),
+            open_async_llm_response_repository() as repository,
+        ):
+            use_case = AsyncUploadResponseUseCase(repository, storage)
+            llm_response = await use_case.execute(
+                upload.content,
+                title=form.title,
+                prompt=form.prompt,
+                model=form.model,
+                provider=form.provider,
+                category_id=form.category_id,
+                tags=form.tags,
+                summary=form.summary,
+            )
+    except BaseException:
+        # 実行枠を得られなかった場合も、受信した本文を残さない
+        await asyncio.to_thread(storage.delete, upload.content.path)
+        raise
+    return FastJSONResponse(
+        upload_dict(llm_response, upload.content),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "",
+    response_model=LLMResponseListResponse,
+    summary="LLM応答一覧を取得",
+    dependencies=[read_admission],
+)
+async def list_responses(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    LLM応答の一覧を取得します。
+    """
+    use_case = AsyncListResponsesUseCase(repository)
+    field_names = parse_fields(fields)
+    if field_names:
+        responses = await use_case.execute_with_fields(
+            fields=field_names, skip=skip, limit=limit
+        )
+    else:
+        responses = await use_case.execute(skip=skip, limit=limit)
+    return FastJSONResponse(response_list_dict(responses, skip=skip, limit=limit))
+
+
+@router.get(
+    "/search",
+    response_model=LLMResponseListResponse,
+    summary="LLM応答を検索",
+    dependencies=[search_admission],
+)
+async def search_responses(
+    query: str | None = Query(None, description="検索文字列"),
+    category_id: UUID | None = Query(None, description="カテゴリID"),
+    tags: list[str] | None = Query(None, description="タグ"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    stats_filter: ContentStatsFilter = Depends(content_stats_filter),
+    sort: ResponseSortKey = Query(
+        ResponseSortKey.CREATED_AT, description="並べ替えキー"
+    ),
+    order: SortOrder = Query(SortOrder.DESC, description="並び順"),
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    LLM応答を検索します。
+    """
+    use_case = AsyncSearchResponsesUseCase(repository)
+    field_names = parse_fields(fields)
+    if field_names:
+        responses = await use_case.execute_with_fields(
+            fields=field_names,
+            query=query,
+            category_id=category_id,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
+        )
+    else:
+        responses = await use_case.execute(
+            query=query,
+            category_id=category_id,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+            stats_filter=stats_filter,
+            sort=sort,
+            order=order,
+        )
+    return FastJSONResponse(response_list_dict(responses, skip=skip, limit=limit))
+
+
+@router.get(
+    "/search/sections",
+    response_model=SectionSearchResponse,
+    summary="LLM応答をセクション単位で検索",
+    dependencies=[search_admission],
+)
+async def search_response_sections(
+    query: str = Query(..., min_length=1, description="検索文字列"),
+    category_id: UUID | None = Query(None, description="カテゴリID"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    本文に検索文字列を含むセクションを、スニペット付きで返します。
+
+    セクションの本文は含まれないため、必要なセクションのみを
+    GET /responses/{response_id}/sections/{position} で取得します。
+    """
+    use_case = AsyncSearchResponseSectionsUseCase(repository)
+    hits = await use_case.execute(
+        query=query, category_id=category_id, skip=skip, limit=limit
+    )
+    return FastJSONResponse(
+        {
+            "items": [section_hit_dict(hit) for hit in hits],
+            "total": len(hits),
+            "skip": skip,
+            "limit": limit,
+        }
+    )
+
+
+@router.post(
+    ":batchGet",
+    response_model=LLMResponseBatchGetResponse,
+    summary="LLM応答を一括取得",
+    dependencies=[read_admission],
+)
+async def batch_get_responses(
+    request: LLMResponseBatchGetRequest,
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    複数のIDでLLM応答を一括取得します。
+
+    結果はリクエストのID順に並び、存在しないIDは missing に返します。
+    """
+    field_names = parse_fields(request.fields)
+    use_case = AsyncBatchGetResponsesUseCase(repository)
+    result = await use_case.execute(request.ids, fields=field_names)
+    return FastJSONResponse(
+        {
+            "items": [
+                projection_dict(item) if field_names else response_dict(item)
+                for item in result.items
+            ],
+            "missing": result.missing,
+        }
+    )
+
+
+@router.get(
+    "/{response_id}",
+    response_model=LLMResponseRead,
+    summary="LLM応答を取得",
+    dependencies=[read_admission],
+)
+async def get_response(
+    response_id: UUID,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    IDでLLM応答を取得します。
+    """
+    field_names = parse_fields(fields)
+    if field_names:
+        projection = await repository.get_projection(response_id, field_names)
+        content = projection_dict(projection) if projection else None
+    else:
+        llm_response = await repository.get_by_id(response_id)
+        content = response_dict(llm_response) if llm_response else None
+    if content is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
+    return FastJSONResponse(content)
+
+
+@router.get(
+    "/{response_id}/html",
+    response_class=HTMLResponse,
+    summary="LLM応答をHTMLで取得",
+    dependencies=[read_admission],
+)
+async def get_response_html(
+    response_id: UUID,
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+    renderer: MarkdownRenderer = Depends(get_async_markdown_renderer),
+):
+    """
+    LLM応答の Markdown をサーバー側で HTML に変換して返します。
+
+    コードブロックはシンタックスハイライト済みです（Pygments の CSS クラス）。
+    """
+    use_case = AsyncRenderResponseHtmlUseCase(repository, renderer)
+    html = await use_case.execute(response_id)
+    if html is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
+    return HTMLResponse(html)
+
+
+@router.get(
+    "/{response_id}/sections",
+    response_model=ResponseSectionListResponse,
+    summary="LLM応答のセクション一覧を取得",
+    dependencies=[read_admission],
+)
+async def list_response_sections(
+    response_id: UUID,
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    LLM応答の本文を見出し・コードブロックの境界で分割したセクションの
+    見出しと本文内の位置を返します（セクションの本文は含みません）。
+    """
+    use_case = AsyncListResponseSectionsUseCase(repository)
+    sections = await use_case.execute(response_id)
+    if sections is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
+    return FastJSONResponse(
+        {
+            "response_id": response_id,
+            "items": [section_dict(section) for section in sections],
+            "total": len(sections),
+        }
+    )
+
+
+@router.get(
+    "/{response_id}/sections/{position}",
+    response_model=ResponseSectionRead,
+    summary="LLM応答のセクションを取得",
+    dependencies=[read_admission],
+)
+async def get_response_section(
+    response_id: UUID,
+    position: int = Path(..., ge=0, description="セクションの番号（0 始まり）"),
+    repository: AsyncLLMResponseRepository = Depends(
+        get_async_read_llm_response_repository
+    ),
+):
+    """
+    LLM応答の本文のうち、指定した番号のセクションのみを返します。
+    """
+    use_case = AsyncGetResponseSectionUseCase(repository)
+    section = await use_case.execute(response_id, position)
+    if section is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="セクションが見つかりません"
+        )
+    return FastJSONResponse(section_dict(section, response_id))
+
+
+@router.put(
+    "/{response_id}",
+    response_model=LLMResponseRead,
+    summary="LLM応答を更新",
+    dependencies=[write_admission],
+)
+async def update_response(
+    response_id: UUID,
+    response_data: LLMResponseUpdate,
+    repository: AsyncLLMResponseRepository = Depends(get_async_llm_response_repository),
+):
+    """
+    LLM応答を更新します。
+
+    HTMLの事前レンダリングと（要約が未設定の場合の）要約の生成は、
+    バックグラウンドジョブとして実行されます。
+    """
+    use_case = AsyncUpdateResponseUseCase(repository)
+    updated_response = await use_case.execute(
+        response_id=response_id,
+        title=response_data.title,
+        prompt=response_data.prompt,
+        content_md=response_data.content_md,
+        model=response_data.model,
+        provider=response_data.provider,
+        category_id=response_data.category_id,
+        tags=response_data.tags,
+        summary=response_data.summary,
+    )
+    if not updated_response:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
+    return updated_response
+
+
+@router.delete(
+    "/{response_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="LLM応答を削除",
+    dependencies=[write_admission],
+)
+async def delete_response(
+    response_id: UUID,
+    repository: AsyncLLMResponseRepository = Depends(get_async_llm_response_repository),
+):
+    """
+    LLM応答を削除します。
+    """
+    success = await repository.delete(response_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
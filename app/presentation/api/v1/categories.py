@@ -8,12 +8,16 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.application.use_cases.create_category import CreateCategoryUseCase
 from app.application.use_cases.list_categories import ListCategoriesUseCase
 from app.domain.repositories.category_repository import CategoryRepository
-from app.presentation.api.deps import get_category_repository
+from app.presentation.api.admission import read_admission, write_admission
+from app.presentation.api.deps import (
+    get_category_repository,
+    get_read_category_repository,
+)
 from app.presentation.schemas.category import (
     CategoryCreate,
     CategoryListResponse,
@@ -29,6 +33,7 @@ router = APIRouter(prefix="/categories", tags=["categories"])
     response_model=CategoryRead,
     status_code=status.HTTP_201_CREATED,
     summary="カテゴリを作成",
+    dependencies=[write_admission],
 )
 def create_category(
     category_data: CategoryCreate,
@@ -44,26 +49,37 @@ def create_category(
     return category
 
 
-@router.get("", response_model=CategoryListResponse, summary="カテゴリ一覧を取得")
+@router.get(
+    "",
+    response_model=CategoryListResponse,
+    summary="カテゴリ一覧を取得",
+    dependencies=[read_admission],
+)
 def list_categories(
     skip: int = 0,
     limit: int = 100,
-    repository: CategoryRepository = Depends(get_category_repository),
+    top_tags: int = Query(3, ge=0, le=20, description="カテゴリごとの上位タグ数"),
+    repository: CategoryRepository = Depends(get_read_category_repository),
 ):
     """
-    カテゴリの一覧を取得します。
+    カテゴリの一覧を、応答件数・最終更新日時・上位タグ付きで取得します。
     """
     use_case = ListCategoriesUseCase(repository)
-    categories = use_case.execute(skip=skip, limit=limit)
+    categories = use_case.execute(skip=skip, limit=limit, top_tags_limit=top_tags)
     return CategoryListResponse(
         items=categories, total=len(categories), skip=skip, limit=limit
     )
 
 
-@router.get("/{category_id}", response_model=CategoryRead, summary="カテゴリを取得")
+@router.get(
+    "/{category_id}",
+    response_model=CategoryRead,
+    summary="カテゴリを取得",
+    dependencies=[read_admission],
+)
 def get_category(
     category_id: UUID,
-    repository: CategoryRepository = Depends(get_category_repository),
+    repository: CategoryRepository = Depends(get_read_category_repository),
 ):
     """
     IDでカテゴリを取得します。
@@ -76,7 +92,12 @@ def get_category(
     return category
 
 
-@router.put("/{category_id}", response_model=CategoryRead, summary="カテゴリを更新")
+@router.put(
+    "/{category_id}",
+    response_model=CategoryRead,
+    summary="カテゴリを更新",
+    dependencies=[write_admission],
+)
 def update_category(
     category_id: UUID,
     category_data: CategoryUpdate,
@@ -97,7 +118,10 @@ def update_category(
 
 
 @router.delete(
-    "/{category_id}", status_code=status.HTTP_204_NO_CONTENT, summary="カテゴリを削除"
+    "/{category_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="カテゴリを削除",
+    dependencies=[write_admission],
 )
 def delete_category(
     category_id: UUID,
@@ -0,0 +1,199 @@
+"""
+変更通知 API エンドポイント
+
+LLM応答・カテゴリの作成・更新・削除を Server-Sent Events で配信する
+APIエンドポイントを定義します。一覧APIのポーリングの代わりに使用します。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.application.use_cases.list_change_notifications import (
+    ChangeNotification,
+    ListChangeNotificationsUseCase,
+)
+from app.config.settings import settings
+from app.infrastructure.cache.coherence import change_tracker
+from app.infrastructure.db.base import ReadSessionLocal
+from app.infrastructure.events.broadcaster import ChangeBroadcaster
+from app.infrastructure.repositories.change_repository_impl import (
+    ChangeRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.sync.change_feed import change_feed
+from app.presentation.api.serialization import dumps
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Last-Event-ID からの再送で1回に読み込む件数
+_REPLAY_BATCH_SIZE = 500
+
+# クライアントが再接続するまでの待ち時間（ミリ秒）
+_RETRY_MILLISECONDS = 3000
+
+
+def load_notifications(since: int, limit: int) -> list[ChangeNotification]:
+    """
+    変更通知を読み込みます（ワーカースレッドから呼び出されます）。
+
+    Args:
+        since: このシーケンス番号より後の変更を読み込む
+        limit: 読み込む最大件数
+
+    Returns:
+        変更通知のリスト
+    """
+    with ReadSessionLocal() as db:
+        change_tracker.sync(db)
+        use_case = ListChangeNotificationsUseCase(
+            ChangeRepositoryImpl(db), LLMResponseRepositoryImpl(db)
+        )
+        return use_case.execute(since, limit)
+
+
+def latest_seq() -> int:
+    """最新の変更シーケンス番号を取得します（ワーカースレッドから呼び出されます）。"""
+    with ReadSessionLocal() as db:
+        return ChangeRepositoryImpl(db).latest_seq()
+
+
+# グローバルなブロードキャスターインスタンス（プロセス内の全接続で共有する）
+change_broadcaster = ChangeBroadcaster(
+    load_notifications,
+    latest_seq,
+    poll_interval_seconds=settings.EVENTS_POLL_INTERVAL_SECONDS,
+    queue_size=settings.EVENTS_QUEUE_SIZE,
+)
+change_feed.add_listener(change_broadcaster.wake)
+
+
+def format_event(notification: ChangeNotification) -> bytes:
+    """
+    変更通知を Server-Sent Events の1イベントに変換します。
+
+    Args:
+        notification: 変更通知
+
+    Returns:
+        イベントのバイト列
+    """
+    data = dumps(
+        {
+            "entity_type": notification.entity_type,
+            "id": notification.entity_id,
+            "operation": notification.operation,
+            "category_id": notification.category_id,
+            "tags": notification.tags,
+            "changed_at": notification.changed_at,
+        }
+    )
+    event_name = f"{notification.entity_type.value}.{notification.operation.value}"
+    return (
+        f"id: {notification.seq}\nevent: {event_name}\ndata: ".encode() + data + b"\n\n"
+    )
+
+
+async def stream_events(
+    last_event_id: int | None, category_id: UUID | None, tags: list[str]
+) -> AsyncIterator[bytes]:
+    """
+    変更通知のイベントストリームを生成します。
+
+    Last-Event-ID が指定された場合は、購読を開始してから変更フィードの
+    続きを再送し、以降はブロードキャスターからの通知を配信します。
+    再送と配信の重複はシーケンス番号で除外します。
+
+    Args:
+        last_event_id: クライアントが最後に受信したイベントID
+        category_id: カテゴリIDの条件
+        tags: タグの条件
+
+    Yields:
+        イベントのバイト列
+    """
+    subscription = await change_broadcaster.subscribe()
+    try:
+        yield f"retry: {_RETRY_MILLISECONDS}\n\n".encode()
+
+        delivered = 0
+        if last_event_id is not None:
+            delivered = last_event_id
+            while True:
+                notifications = await asyncio.to_thread(
+                    load_notifications, delivered, _REPLAY_BATCH_SIZE
+                )
+                for notification in notifications:
+                    if notification.matches(category_id, tags):
+                        yield format_event(notification)
+                    delivered = notification.seq
+                if len(notifications) < _REPLAY_BATCH_SIZE:
+                    break
+
+        while True:
+            try:
+                notification = await subscription.get(settings.EVENTS_HEARTBEAT_SECONDS)
+            except TimeoutError:
+                # 中継サーバーにアイドル接続として切断されないようにする
+                yield b": keepalive\n\n"
+                continue
+            if notification is None:
+                # 受信が遅れて購読が打ち切られた（クライアントは再接続して再送を受ける）
+                return
+            if notification.seq <= delivered:
+                continue
+            delivered = notification.seq
+            if notification.matches(category_id, tags):
+                yield format_event(notification)
+    finally:
+        change_broadcaster.unsubscribe(subscription)
+
+
+@router.get(
+    "",
+    summary="変更通知を購読（Server-Sent Events）",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def events(
+    category_id: UUID | None = Query(
+        None, description="このカテゴリに属するLLM応答の変更のみ通知"
+    ),
+    tags: list[str] | None = Query(
+        None, description="これらのタグをすべて含むLLM応答の変更のみ通知"
+    ),
+    last_event_id: str | None = Header(
+        None,
+        alias="Last-Event-ID",
+        description="最後に受信したイベントID（再接続時にその続きから再送する）",
+    ),
+):
+    """
+    LLM応答・カテゴリの作成・更新・削除を Server-Sent Events で通知します。
+
+    イベント名は `response.created` のように「種類.操作」で、data にはIDと
+    所属カテゴリ・タグを含みます。内容は必要に応じて取得APIで読み込んでください。
+    削除の通知はフィルタに関係なく配信されます。
+    短時間に複数回変更されたエンティティは、最新の変更のみが通知されることがあります。
+    """
+    if last_event_id is not None and not last_event_id.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"不正な Last-Event-ID です: {last_event_id}",
+        )
+    return StreamingResponse(
+        stream_events(
+            int(last_event_id) if last_event_id is not None else None,
+            category_id,
+            tags or [],
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
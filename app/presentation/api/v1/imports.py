@@ -0,0 +1,186 @@
+"""
+会話エクスポートの取り込み API エンドポイント
+
+ChatGPT・Claude・Gemini の会話エクスポートのアップロードと、
+取り込みの進捗の参照を提供します。取り込み自体はバックグラウンドジョブで
+行います（1回のジョブで IMPORT_JOB_SLICE_SECONDS ずつ進め、続きは次のジョブで
+記録された位置から再開します）。
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.application.use_cases.import_conversations import ImportConversationsUseCase
+from app.config.settings import settings
+from app.domain.models.conversation_import import ConversationImport, ExportFormat
+from app.domain.ports.conversation_export import (
+    ConversationExportError,
+    ConversationExportReader,
+)
+from app.domain.repositories.conversation_import_repository import (
+    ConversationImportRepository,
+)
+from app.infrastructure.storage.file_content_storage import FileContentStorage
+from app.presentation.api.admission import WRITE, admitted, read_admission
+from app.presentation.api.deadline import streams_request_body
+from app.presentation.api.deps import (
+    get_category_repository,
+    get_conversation_export_reader,
+    get_conversation_import_repository,
+    get_export_storage,
+    get_llm_response_repository,
+    get_read_conversation_import_repository,
+    open_database,
+)
+from app.presentation.api.uploads import (
+    receive_upload,
+    upload_openapi,
+    validate_upload_form,
+)
+from app.presentation.schemas.conversation_import import (
+    ConversationImportForm,
+    ConversationImportListResponse,
+    ConversationImportRead,
+)
+
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+# エクスポートファイルを送信するパートの名前
+EXPORT_FIELD = "file"
+
+IMPORT_OPENAPI = upload_openapi(
+    ConversationImportForm,
+    EXPORT_FIELD,
+    "会話エクスポートのファイル（conversations.json など、UTF-8 の JSON）",
+)
+
+
+@router.post(
+    "",
+    response_model=ConversationImportRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="会話エクスポートを取り込む",
+    openapi_extra=IMPORT_OPENAPI,
+)
+@streams_request_body
+async def create_import(
+    request: Request,
+    storage: FileContentStorage = Depends(get_export_storage),
+    reader: ConversationExportReader = Depends(get_conversation_export_reader),
+):
+    """
+    multipart/form-data で会話エクスポートを送信して、取り込みを登録します。
+
+    ファイル（file パート）は受信しながら保存するため、数GBのエクスポートでも
+    メモリ使用量はほぼ一定です（上限は IMPORT_UPLOAD_MAX_BYTES）。
+    取り込みはバックグラウンドジョブで行い、進捗は
+    `GET /api/v1/imports/{import_id}` で確認できます。
+    本文が既存のLLM応答と同じ発話は取り込みません。
+
+    データベースのセッションと書き込みの実行枠は、ファイルを受信し終えてから
+    取得します（遅いクライアントの受信中に接続や枠を占有しないため）。
+    """
+    upload = await receive_upload(
+        request,
+        storage,
+        settings.IMPORT_UPLOAD_MAX_BYTES,
+        settings.UPLOAD_MAX_FIELD_BYTES,
+        content_field=EXPORT_FIELD,
+    )
+    form = validate_upload_form(upload, storage, ConversationImportForm)
+    source_path = str(storage.local_path(upload.content.path))
+
+    def start(export_format: ExportFormat | None) -> ConversationImport:
+        with open_database() as db:
+            if form.category_id is not None:
+                category = get_category_repository(db).get_by_id(form.category_id)
+                if category is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="取り込み先のカテゴリが存在しません",
+                    )
+            use_case = ImportConversationsUseCase(
+                get_llm_response_repository(db),
+                get_conversation_import_repository(db),
+                reader,
+            )
+            return use_case.start(
+                source_path,
+                upload.content.byte_count,
+                export_format=export_format,
+                category_id=form.category_id,
+                tags=form.tags,
+                queued=True,
+                delete_source=True,
+                resume=False,
+            )
+
+    try:
+        if form.format is not None:
+            export_format = ExportFormat(form.format.value)
+        else:
+            # 形式を判別できないファイルは、ジョブに回さずにここで拒否する
+            try:
+                export_format = await run_in_threadpool(
+                    reader.detect_format, source_path
+                )
+            except ConversationExportError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
+                ) from None
+        async with admitted(WRITE):
+            return await run_in_threadpool(start, export_format)
+    except BaseException:
+        # 実行枠を得られなかった場合も、受信したファイルを残さない
+        storage.delete(upload.content.path)
+        raise
+
+
+@router.get(
+    "",
+    response_model=ConversationImportListResponse,
+    summary="取り込み一覧を取得",
+    dependencies=[read_admission],
+)
+def list_imports(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    repository: ConversationImportRepository = Depends(
+        get_read_conversation_import_repository
+    ),
+):
+    """
+    取り込みの一覧を新しい順に取得します。
+    """
+    imports = repository.list(skip=skip, limit=limit)
+    return ConversationImportListResponse(
+        items=imports, total=len(imports), skip=skip, limit=limit
+    )
+
+
+@router.get(
+    "/{import_id}",
+    response_model=ConversationImportRead,
+    summary="取り込みの進捗を取得",
+    dependencies=[read_admission],
+)
+def get_import(
+    import_id: UUID,
+    repository: ConversationImportRepository = Depends(
+        get_read_conversation_import_repository
+    ),
+):
+    """
+    IDで取り込みを取得します。処理した会話の数・作成したLLM応答の数と、
+    ファイル上の位置から算出した進捗（progress）を返します。
+    """
+    conversation_import = repository.get_by_id(import_id)
+    if not conversation_import:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="取り込みが見つかりません"
+        )
+    return conversation_import
@@ -0,0 +1,91 @@
+"""
+ジョブ API エンドポイント
+
+バックグラウンドジョブの状態の参照と、失敗したジョブの再実行を提供します。
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.domain.models.job import JobStatus as DomainJobStatus
+from app.domain.repositories.job_repository import JobRepository
+from app.presentation.api.admission import read_admission, write_admission
+from app.presentation.api.deps import get_job_repository, get_read_job_repository
+from app.presentation.schemas.job import JobListResponse, JobRead, JobStatus
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "",
+    response_model=JobListResponse,
+    summary="ジョブ一覧を取得",
+    dependencies=[read_admission],
+)
+def list_jobs(
+    status_filter: JobStatus | None = Query(
+        None, alias="status", description="状態でフィルタリング"
+    ),
+    kind: str | None = Query(None, description="種類でフィルタリング"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    repository: JobRepository = Depends(get_read_job_repository),
+):
+    """
+    ジョブの一覧を新しい順に取得します。
+    """
+    jobs = repository.list(
+        status=DomainJobStatus(status_filter.value) if status_filter else None,
+        kind=kind,
+        skip=skip,
+        limit=limit,
+    )
+    return JobListResponse(items=jobs, total=len(jobs), skip=skip, limit=limit)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobRead,
+    summary="ジョブを取得",
+    dependencies=[read_admission],
+)
+def get_job(
+    job_id: int,
+    repository: JobRepository = Depends(get_read_job_repository),
+):
+    """
+    IDでジョブを取得します。
+    """
+    job = repository.get_by_id(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="ジョブが見つかりません"
+        )
+    return job
+
+
+@router.post(
+    "/{job_id}:retry",
+    response_model=JobRead,
+    summary="ジョブを再実行",
+    dependencies=[write_admission],
+)
+def retry_job(
+    job_id: int,
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """
+    失敗したジョブを、試行回数をリセットして再実行します。
+    """
+    job = repository.retry(job_id)
+    if job is not None:
+        return job
+    if repository.get_by_id(job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="ジョブが見つかりません"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="失敗したジョブのみ再実行できます",
+    )
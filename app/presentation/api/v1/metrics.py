@@ -0,0 +1,23 @@
+"""
+メトリクス API エンドポイント
+
+運用監視のための内部状態を返すAPIエンドポイントを定義します。
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.presentation.api.admission import admission_limiters
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/admission", summary="アドミッション制御の状態を取得")
+async def admission_metrics():
+    """
+    ルートクラスごとの実行中・待機中の件数、拒否件数、待ち時間の分位数を返します。
+
+    値はこのワーカープロセス内のものです。
+    """
+    return {name: limiter.stats() for name, limiter in admission_limiters.items()}
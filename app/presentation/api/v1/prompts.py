@@ -0,0 +1,111 @@
+"""
+プロンプト API エンドポイント
+
+LLM応答が共有するプロンプトの参照と、同じプロンプトのLLM応答の一覧
+（モデルの比較や再実行の結果の比較）を提供します。
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.domain.repositories.prompt_repository import PromptRepository
+from app.presentation.api.admission import read_admission
+from app.presentation.api.deps import (
+    get_read_llm_response_repository,
+    get_read_prompt_repository,
+)
+from app.presentation.api.serialization import (
+    FastJSONResponse,
+    parse_fields,
+    response_list_dict,
+)
+from app.presentation.api.v1.responses import FIELDS_DESCRIPTION
+from app.presentation.schemas.llm_response import LLMResponseListResponse
+from app.presentation.schemas.prompt import PromptListResponse, PromptRead
+
+router = APIRouter(prefix="/prompts", tags=["prompts"])
+
+
+@router.get(
+    "",
+    response_model=PromptListResponse,
+    summary="プロンプト一覧を取得",
+    dependencies=[read_admission],
+)
+def list_prompts(
+    min_responses: int = Query(
+        1,
+        ge=1,
+        description="LLM応答の最小数（2 以上で、比較できるプロンプトのみを取得）",
+    ),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    repository: PromptRepository = Depends(get_read_prompt_repository),
+):
+    """
+    プロンプトの一覧を、LLM応答の多い順に取得します。
+    """
+    prompts = repository.list(min_responses=min_responses, skip=skip, limit=limit)
+    return PromptListResponse(items=prompts, total=len(prompts), skip=skip, limit=limit)
+
+
+@router.get(
+    "/{prompt_id}",
+    response_model=PromptRead,
+    summary="プロンプトを取得",
+    dependencies=[read_admission],
+)
+def get_prompt(
+    prompt_id: UUID,
+    repository: PromptRepository = Depends(get_read_prompt_repository),
+):
+    """
+    IDでプロンプトを取得します。
+    """
+    prompt = repository.get_by_id(prompt_id)
+    if not prompt:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="プロンプトが見つかりません",
+        )
+    return prompt
+
+
+@router.get(
+    "/{prompt_id}/responses",
+    response_model=LLMResponseListResponse,
+    summary="プロンプトのLLM応答一覧を取得",
+    dependencies=[read_admission],
+)
+def list_prompt_responses(
+    prompt_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    repository: LLMResponseRepository = Depends(get_read_llm_response_repository),
+    prompt_repository: PromptRepository = Depends(get_read_prompt_repository),
+):
+    """
+    同じプロンプトのLLM応答を作成順に取得します。
+
+    プロンプトIDのインデックスで取得するため、モデルごとの応答の比較に
+    使用できます（本文も比較する場合は `fields=id,model,content_md` のように
+    指定します）。
+    """
+    field_names = parse_fields(fields)
+    if field_names:
+        responses = repository.list_by_prompt_projection(
+            prompt_id, field_names, skip=skip, limit=limit
+        )
+    else:
+        responses = repository.list_by_prompt(prompt_id, skip=skip, limit=limit)
+    if not responses and prompt_repository.get_by_id(prompt_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="プロンプトが見つかりません",
+        )
+    return FastJSONResponse(response_list_dict(responses, skip=skip, limit=limit))
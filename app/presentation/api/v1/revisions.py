@@ -0,0 +1,78 @@
+"""
+LLM応答リビジョン API エンドポイント
+
+LLM応答の本文の版（リビジョン）の一覧と、過去の版の本文の取得を提供します。
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+
+from app.domain.repositories.response_revision_repository import (
+    ResponseRevisionRepository,
+)
+from app.presentation.api.admission import read_admission
+from app.presentation.api.deps import get_read_response_revision_repository
+from app.presentation.schemas.response_revision import (
+    ResponseRevisionContentRead,
+    ResponseRevisionListResponse,
+)
+
+router = APIRouter(prefix="/responses", tags=["responses"])
+
+
+@router.get(
+    "/{response_id}/revisions",
+    response_model=ResponseRevisionListResponse,
+    summary="LLM応答の本文の版の一覧を取得",
+    dependencies=[read_admission],
+)
+def list_response_revisions(
+    response_id: UUID,
+    repository: ResponseRevisionRepository = Depends(
+        get_read_response_revision_repository
+    ),
+):
+    """
+    LLM応答の本文の版を番号順に返します（本文は含みません）。
+
+    版は本文を初めて更新したときから記録され、更新前の本文が版 1 になります。
+    本文を更新していないLLM応答では空のリストを返します。
+    """
+    revisions = repository.list(response_id)
+    if revisions is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LLM応答が見つかりません"
+        )
+    return ResponseRevisionListResponse(
+        response_id=response_id, items=revisions, total=len(revisions)
+    )
+
+
+@router.get(
+    "/{response_id}/revisions/{number}",
+    response_model=ResponseRevisionContentRead,
+    summary="LLM応答の本文の版を取得",
+    dependencies=[read_admission],
+)
+def get_response_revision(
+    response_id: UUID,
+    number: int = Path(..., ge=1, description="版の番号（1 始まり）"),
+    repository: ResponseRevisionRepository = Depends(
+        get_read_response_revision_repository
+    ),
+):
+    """
+    指定した版の本文を返します。
+
+    本文は直前のスナップショットから差分を順に適用して復元するため、
+    適用する差分の数は REVISION_SNAPSHOT_INTERVAL 未満に収まります。
+    """
+    revision = repository.get(response_id, number)
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="版が見つかりません"
+        )
+    return revision
@@ -6,13 +6,44 @@ from __future__ import annotations
 API バージョン 1 のすべてのエンドポイントを統合します。
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.presentation.api.v1 import categories, responses
+from app.config.settings import settings
+from app.presentation.api.deadline import query_deadline
+from app.presentation.api.v1 import (
+    events,
+    imports,
+    jobs,
+    metrics,
+    prompts,
+    revisions,
+    sync,
+    tags,
+)
+
+# LLM応答・カテゴリは、設定に応じて非同期版のエンドポイントを使用する
+# （非同期ドライバーはオプション依存のため、有効な場合のみインポートする）
+if settings.DATABASE_ASYNC:
+    from app.presentation.api.v1 import async_categories as categories
+    from app.presentation.api.v1 import async_responses as responses
+else:
+    from app.presentation.api.v1 import categories, responses
 
 # v1 APIルーターの作成
 api_v1_router = APIRouter(prefix="/api/v1")
 
+# DBを使うエンドポイントにはクエリ期限を設定する
+# （変更通知は長時間接続のため対象外）
+with_deadline = [Depends(query_deadline)]
+
 # 各リソースのルーターを登録
-api_v1_router.include_router(categories.router)
-api_v1_router.include_router(responses.router)
+api_v1_router.include_router(categories.router, dependencies=with_deadline)
+api_v1_router.include_router(responses.router, dependencies=with_deadline)
+api_v1_router.include_router(revisions.router, dependencies=with_deadline)
+api_v1_router.include_router(prompts.router, dependencies=with_deadline)
+api_v1_router.include_router(tags.router, dependencies=with_deadline)
+api_v1_router.include_router(jobs.router, dependencies=with_deadline)
+api_v1_router.include_router(imports.router, dependencies=with_deadline)
+api_v1_router.include_router(sync.router, dependencies=with_deadline)
+api_v1_router.include_router(events.router)
+api_v1_router.include_router(metrics.router)
@@ -0,0 +1,98 @@
+"""
+差分同期 API エンドポイント
+
+オフラインファーストのクライアント向けに、前回の同期以降の変更のみを返す
+APIエンドポイントを定義します。
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.use_cases.sync_changes import SyncChangesUseCase
+from app.domain.repositories.category_repository import CategoryRepository
+from app.domain.repositories.change_repository import ChangeRepository
+from app.domain.repositories.llm_response_repository import LLMResponseRepository
+from app.presentation.api.admission import read_admission
+from app.presentation.api.deps import (
+    get_read_category_repository,
+    get_read_change_repository,
+    get_read_llm_response_repository,
+)
+from app.presentation.api.serialization import (
+    FastJSONResponse,
+    category_dict,
+    response_dict,
+)
+from app.presentation.schemas.sync import EntityType, SyncResponse
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+def parse_sync_token(token: str | None) -> int:
+    """
+    同期トークンを変更シーケンス番号に変換します。
+
+    Args:
+        token: 前回の同期で返された next_token（初回はNone）
+
+    Returns:
+        変更シーケンス番号
+
+    Raises:
+        HTTPException: トークンが不正な場合（400）
+    """
+    if token is None or token == "":
+        return 0
+    if not token.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"不正な同期トークンです: {token}",
+        )
+    return int(token)
+
+
+@router.get(
+    "",
+    response_model=SyncResponse,
+    summary="前回の同期以降の変更を取得",
+    dependencies=[read_admission],
+)
+def sync(
+    since: str | None = Query(
+        None, description="前回の同期で返された next_token（省略時は全件）"
+    ),
+    limit: int = Query(500, ge=1, le=1000, description="1ページあたりの最大変更件数"),
+    change_repository: ChangeRepository = Depends(get_read_change_repository),
+    llm_response_repository: LLMResponseRepository = Depends(
+        get_read_llm_response_repository
+    ),
+    category_repository: CategoryRepository = Depends(get_read_category_repository),
+):
+    """
+    前回の同期以降に変更されたLLM応答・カテゴリと、削除のトゥームストーンを
+    変更順に返します。
+
+    has_more が true の間は next_token を since に指定して続きを取得し、
+    false になったら next_token を保存して次回の同期に使用します。
+    """
+    use_case = SyncChangesUseCase(
+        change_repository, llm_response_repository, category_repository
+    )
+    page = use_case.execute(parse_sync_token(since), limit=limit)
+    return FastJSONResponse(
+        {
+            "responses": [response_dict(response) for response in page.responses],
+            "categories": [category_dict(category) for category in page.categories],
+            "tombstones": [
+                {
+                    "entity_type": EntityType(change.entity_type.value),
+                    "id": change.entity_id,
+                    "deleted_at": change.changed_at,
+                }
+                for change in page.tombstones
+            ],
+            "next_token": str(page.last_seq),
+            "has_more": page.has_more,
+        }
+    )
@@ -0,0 +1,65 @@
+"""
+タグ API エンドポイント
+
+タグの使用状況の一覧（タグクラウド）と、タグの入力補完を提供します。
+どちらも tag_stats テーブルのみを読み、LLM応答の tags 列は走査しません。
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from app.domain.repositories.tag_stat_repository import TagStatRepository
+from app.presentation.api.admission import read_admission
+from app.presentation.api.deps import get_read_tag_stat_repository
+from app.presentation.schemas.tag_stat import (
+    TagAutocompleteResponse,
+    TagSortKey,
+    TagStatListResponse,
+)
+
+router = APIRouter(prefix="/tags", tags=["tags"])
+
+
+@router.get(
+    "",
+    response_model=TagStatListResponse,
+    summary="タグ一覧を取得",
+    dependencies=[read_admission],
+)
+def list_tags(
+    sort: TagSortKey = Query(
+        TagSortKey.COUNT,
+        description="並べ替えキー（count: LLM応答の多い順、recent: 最近使われた順）",
+    ),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    repository: TagStatRepository = Depends(get_read_tag_stat_repository),
+):
+    """
+    タグと、そのタグを付けたLLM応答の数・最後に使われた日時を取得します。
+    """
+    tags = repository.list(sort=sort, skip=skip, limit=limit)
+    return TagStatListResponse(items=tags, total=len(tags), skip=skip, limit=limit)
+
+
+@router.get(
+    "/autocomplete",
+    response_model=TagAutocompleteResponse,
+    summary="タグの補完候補を取得",
+    dependencies=[read_admission],
+)
+def autocomplete_tags(
+    prefix: str = Query(
+        ..., min_length=1, max_length=255, description="タグの先頭の文字列"
+    ),
+    limit: int = Query(10, ge=1, le=100),
+    repository: TagStatRepository = Depends(get_read_tag_stat_repository),
+):
+    """
+    指定した文字列で始まるタグを、LLM応答の多い順に取得します。
+
+    大文字と小文字は区別します。
+    """
+    tags = repository.search_prefix(prefix, limit=limit)
+    return TagAutocompleteResponse(prefix=prefix, items=tags)
@@ -0,0 +1,70 @@
+"""
+本文のチャンクのバックフィルコマンド
+
+チャンク（セクション）が未作成の既存LLM応答すべてについて、本文を
+見出し・コードブロックの境界で分割したチャンクを保存します。
+
+使い方:
+    uv run python -m app.presentation.cli.backfill_chunks \
+        [--batch-size N] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.application.use_cases.backfill_chunks import BackfillChunksUseCase
+from app.infrastructure.db.base import SessionLocal, init_db
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    本文のチャンクのバックフィルを実行します。
+
+    Args:
+        argv: コマンドライン引数（省略時は sys.argv）
+    """
+    parser = argparse.ArgumentParser(
+        description="未作成の本文のチャンクを一括保存します"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="1バッチあたりの件数"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="本文を分割するワーカープロセス数（1 の場合は逐次処理）",
+    )
+    args = parser.parse_args(argv)
+
+    # チャンクのテーブルがなければ作成してから処理する
+    init_db()
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    started = time.perf_counter()
+
+    def report(processed: int, updated: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"{processed} 件処理 / {updated} 件保存 ({elapsed:.1f}s)", flush=True)
+
+    try:
+        with SessionLocal() as db:
+            repository = LLMResponseRepositoryImpl(db)
+            use_case = BackfillChunksUseCase(
+                repository, executor=executor, workers=args.workers
+            )
+            updated = use_case.execute(batch_size=args.batch_size, on_progress=report)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    print(f"完了: {updated} 件のLLM応答のチャンクを保存しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+本文の統計情報バックフィルコマンド
+
+統計情報（文字数・推定トークン数・コードブロックなど）が未算出の
+既存LLM応答すべてに、本文から算出した統計情報を設定します。
+
+使い方:
+    uv run python -m app.presentation.cli.backfill_content_stats \
+        [--batch-size N] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.application.use_cases.backfill_content_stats import (
+    BackfillContentStatsUseCase,
+)
+from app.infrastructure.db.base import SessionLocal, init_db
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    本文の統計情報のバックフィルを実行します。
+
+    Args:
+        argv: コマンドライン引数（省略時は sys.argv）
+    """
+    parser = argparse.ArgumentParser(
+        description="未算出の本文の統計情報を一括設定します"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="1バッチあたりの件数"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="統計情報を算出するワーカープロセス数（1 の場合は逐次処理）",
+    )
+    args = parser.parse_args(argv)
+
+    # 既存のデータベースには統計情報の列を追加してから処理する
+    init_db()
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    started = time.perf_counter()
+
+    def report(processed: int, updated: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"{processed} 件処理 / {updated} 件設定 ({elapsed:.1f}s)", flush=True)
+
+    try:
+        with SessionLocal() as db:
+            repository = LLMResponseRepositoryImpl(db)
+            use_case = BackfillContentStatsUseCase(
+                repository, executor=executor, workers=args.workers
+            )
+            updated = use_case.execute(batch_size=args.batch_size, on_progress=report)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    print(f"完了: {updated} 件の統計情報を設定しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+要約バックフィルコマンド
+
+要約が未設定の既存LLM応答すべてに、本文から生成した要約を設定します。
+
+使い方:
+    uv run python -m app.presentation.cli.backfill_summaries \
+        [--batch-size N] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.application.use_cases.summarize_response import BackfillSummariesUseCase
+from app.config.settings import settings
+from app.infrastructure.db.base import SessionLocal, init_db
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.summarization.extractive_summarizer import (
+    ExtractiveSummarizer,
+)
+from app.infrastructure.summarization.process_pool_summarizer import (
+    ProcessPoolSummarizer,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    要約バックフィルを実行します。
+
+    Args:
+        argv: コマンドライン引数（省略時は sys.argv）
+    """
+    parser = argparse.ArgumentParser(description="未設定の要約を一括生成します")
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="1バッチあたりの件数"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.SUMMARY_WORKERS,
+        help="要約を生成するワーカープロセス数",
+    )
+    args = parser.parse_args(argv)
+
+    init_db()
+    summarizer = ProcessPoolSummarizer(
+        ExtractiveSummarizer(max_chars=settings.SUMMARY_MAX_CHARS),
+        max_workers=args.workers,
+    )
+    started = time.perf_counter()
+
+    def report(processed: int, updated: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"{processed} 件処理 / {updated} 件設定 ({elapsed:.1f}s)", flush=True)
+
+    try:
+        with SessionLocal() as db:
+            repository = LLMResponseRepositoryImpl(db)
+            use_case = BackfillSummariesUseCase(repository, summarizer)
+            updated = use_case.execute(batch_size=args.batch_size, on_progress=report)
+    finally:
+        summarizer.shutdown()
+    print(f"完了: {updated} 件の要約を設定しました")
+
+
+if __name__ == "__main__":
+    main()
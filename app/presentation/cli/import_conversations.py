@@ -0,0 +1,135 @@
+"""
+会話エクスポートの取り込みコマンド
+
+ChatGPT・Claude・Gemini のデータエクスポート（conversations.json など）から、
+アシスタントの発話をLLM応答として取り込みます。ファイルは会話ごとに
+逐次読み込むため、数GBのエクスポートでもメモリ使用量はほぼ一定です。
+
+中断した場合は、同じファイルを指定して再実行すると続きから再開します
+（--restart で最初からやり直します。取り込み済みの発話は本文のハッシュで
+重複として除かれます）。
+
+使い方:
+    uv run python -m app.presentation.cli.import_conversations PATH \
+        [--format chatgpt|claude|gemini] [--tag TAG ...] [--category-id ID] \
+        [--batch-size N] [--restart]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+from app.application.use_cases.import_conversations import ImportConversationsUseCase
+from app.domain.models.conversation_import import ConversationImport, ExportFormat
+from app.domain.ports.conversation_export import ConversationExportError
+from app.infrastructure.db.base import SessionLocal, init_db
+from app.infrastructure.importers.conversation_export_reader import (
+    conversation_export_reader,
+)
+from app.infrastructure.repositories.conversation_import_repository_impl import (
+    ConversationImportRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    会話エクスポートの取り込みを実行します。
+
+    Args:
+        argv: コマンドライン引数（省略時は sys.argv）
+    """
+    parser = argparse.ArgumentParser(
+        description="LLMプロバイダーの会話エクスポートをLLM応答として取り込みます"
+    )
+    parser.add_argument("path", type=Path, help="エクスポートファイルのパス")
+    parser.add_argument(
+        "--format",
+        choices=[export_format.value for export_format in ExportFormat],
+        default=None,
+        help="エクスポートの形式（省略時は内容から判別）",
+    )
+    parser.add_argument(
+        "--tag",
+        action="append",
+        default=[],
+        help="取り込んだLLM応答に付けるタグ（複数指定可）",
+    )
+    parser.add_argument(
+        "--category-id", type=UUID, default=None, help="取り込み先のカテゴリID"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="1トランザクションで作成するLLM応答の件数",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="中断した取り込みを再開せず、最初から取り込む",
+    )
+    args = parser.parse_args(argv)
+
+    path = args.path.resolve()
+    if not path.is_file():
+        parser.error(f"ファイルが見つかりません: {path}")
+
+    # 取り込みのテーブルがなければ作成してから処理する
+    init_db()
+    started = time.perf_counter()
+
+    def report(conversation_import: ConversationImport) -> None:
+        elapsed = time.perf_counter() - started
+        print(
+            f"{conversation_import.progress:6.1%} "
+            f"{conversation_import.conversation_count} 件の会話 / "
+            f"{conversation_import.imported_count} 件取り込み / "
+            f"{conversation_import.duplicate_count} 件重複 ({elapsed:.1f}s)",
+            flush=True,
+        )
+
+    with SessionLocal() as db:
+        use_case = ImportConversationsUseCase(
+            LLMResponseRepositoryImpl(db),
+            ConversationImportRepositoryImpl(db),
+            conversation_export_reader,
+        )
+        conversation_import = use_case.start(
+            str(path),
+            path.stat().st_size,
+            export_format=ExportFormat(args.format) if args.format else None,
+            category_id=args.category_id,
+            tags=args.tag,
+            resume=not args.restart,
+        )
+        if conversation_import.byte_offset > 0:
+            print(
+                f"前回の続き（{conversation_import.byte_offset} バイト目）から"
+                f"再開します: {conversation_import.id}"
+            )
+        try:
+            conversation_import = use_case.execute(
+                conversation_import, batch_size=args.batch_size, on_progress=report
+            )
+        except ConversationExportError as e:
+            sys.exit(f"取り込みに失敗しました: {e}")
+        except KeyboardInterrupt:
+            sys.exit(
+                "中断しました。同じファイルを指定して再実行すると続きから再開します"
+            )
+
+    print(
+        f"完了: {conversation_import.imported_count} 件のLLM応答を取り込みました"
+        f"（重複 {conversation_import.duplicate_count} 件）"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+バックグラウンドジョブ
+
+LLM応答の書き込みに続いて行う派生データの更新（HTMLの事前レンダリング、
+要約の生成）と、API で登録された会話エクスポートの取り込みを、ジョブとして
+登録・実行する処理を定義します。
+
+ジョブはリポジトリが発行するドメインイベントを受けて、書き込みと同じ
+トランザクションで登録されます。そのためプロセスが再起動してもジョブは失われず、
+リクエストの処理時間にも影響しません。
+各ハンドラーはリクエストとは独立したデータベースセッションを開いて実行します。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.import_conversations import ImportConversationsUseCase
+from app.application.use_cases.render_response_html import RenderResponseHtmlUseCase
+from app.application.use_cases.summarize_response import SummarizeResponseUseCase
+from app.config.settings import settings
+from app.domain.events import (
+    ConversationImportQueued,
+    LLMResponseCreated,
+    LLMResponsesCreated,
+    LLMResponseUpdated,
+)
+from app.domain.models.conversation_import import ImportStatus
+from app.infrastructure.cache.coherence import change_tracker
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.events.event_bus import event_bus
+from app.infrastructure.importers.conversation_export_reader import (
+    conversation_export_reader,
+)
+from app.infrastructure.jobs.job_queue import job_queue
+from app.infrastructure.jobs.worker_pool import job_worker_pool
+from app.infrastructure.rendering.markdown_renderer import markdown_renderer
+from app.infrastructure.repositories.conversation_import_repository_impl import (
+    ConversationImportRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.summarization.process_pool_summarizer import summarizer
+
+# ジョブの種類
+RENDER_HTML_JOB = "render_response_html"
+SUMMARIZE_JOB = "summarize_response"
+SUMMARIZE_BATCH_JOB = "summarize_responses"
+IMPORT_CONVERSATIONS_JOB = "import_conversations"
+
+# ジョブの優先度（初回表示に影響するHTMLの事前レンダリングを優先し、
+# 大量のLLM応答を作成する取り込みは後回しにする）
+RENDER_HTML_PRIORITY = 10
+SUMMARIZE_PRIORITY = 0
+IMPORT_CONVERSATIONS_PRIORITY = -10
+
+
+def render_response_html(payload: dict[str, Any]) -> None:
+    """
+    LLM応答のHTMLを事前レンダリングしてキャッシュします。
+
+    Args:
+        payload: {"response_id": 対象のLLM応答のID}
+    """
+    with SessionLocal() as db:
+        change_tracker.sync(db)
+        use_case = RenderResponseHtmlUseCase(
+            LLMResponseRepositoryImpl(db), markdown_renderer
+        )
+        use_case.execute(UUID(payload["response_id"]))
+
+
+def summarize_response(payload: dict[str, Any]) -> None:
+    """
+    LLM応答の要約を生成して設定します（要約が未設定の場合のみ）。
+
+    要約の生成自体はプロセスプールで実行されます。
+
+    Args:
+        payload: {"response_id": 対象のLLM応答のID}
+    """
+    with SessionLocal() as db:
+        change_tracker.sync(db)
+        use_case = SummarizeResponseUseCase(LLMResponseRepositoryImpl(db), summarizer)
+        use_case.execute(UUID(payload["response_id"]))
+
+
+def summarize_responses(payload: dict[str, Any]) -> None:
+    """
+    一括作成した複数のLLM応答の要約を、まとめて並列に生成して設定します
+    （要約が未設定の場合のみ）。
+
+    Args:
+        payload: {"response_ids": 対象のLLM応答のIDのリスト}
+    """
+    with SessionLocal() as db:
+        change_tracker.sync(db)
+        use_case = SummarizeResponseUseCase(LLMResponseRepositoryImpl(db), summarizer)
+        use_case.execute_many(
+            [UUID(response_id) for response_id in payload["response_ids"]]
+        )
+
+
+def import_conversations(payload: dict[str, Any]) -> None:
+    """
+    会話エクスポートの取り込みを、記録された位置から IMPORT_JOB_SLICE_SECONDS
+    だけ進めます。
+
+    終わらなかった場合は続きを新しいジョブとして登録し、1回のジョブが
+    リース期限（JOB_LEASE_SECONDS）を超えないようにします。完了した場合は
+    アップロードされたエクスポートファイルを削除します。
+
+    Args:
+        payload: {"import_id": 対象の取り込みのID}
+    """
+    with SessionLocal() as db:
+        change_tracker.sync(db)
+        imports = ConversationImportRepositoryImpl(db)
+        conversation_import = imports.get_by_id(UUID(payload["import_id"]))
+        if (
+            conversation_import is None
+            or conversation_import.status is ImportStatus.COMPLETED
+        ):
+            return
+        use_case = ImportConversationsUseCase(
+            LLMResponseRepositoryImpl(db), imports, conversation_export_reader
+        )
+        conversation_import = use_case.execute(
+            conversation_import,
+            batch_size=settings.IMPORT_BATCH_SIZE,
+            max_seconds=settings.IMPORT_JOB_SLICE_SECONDS,
+        )
+        if conversation_import.status is not ImportStatus.COMPLETED:
+            _enqueue_import(db, payload["import_id"])
+            db.commit()
+            return
+    if conversation_import.delete_source:
+        Path(conversation_import.source_path).unlink(missing_ok=True)
+
+
+def _enqueue_import(db: Session, import_id: str) -> None:
+    """
+    会話エクスポートの取り込みのジョブを登録します。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        import_id: 取り込みのID
+    """
+    job_queue.enqueue(
+        db,
+        IMPORT_CONVERSATIONS_JOB,
+        {"import_id": import_id},
+        priority=IMPORT_CONVERSATIONS_PRIORITY,
+        dedupe_key=f"{IMPORT_CONVERSATIONS_JOB}:{import_id}",
+    )
+
+
+def enqueue_conversation_import(db: Session, event: ConversationImportQueued) -> None:
+    """
+    会話エクスポートの取り込みの登録を受けて、取り込みのジョブを登録します。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        event: 取り込みの登録イベント
+    """
+    _enqueue_import(db, str(event.conversation_import.id))
+
+
+def enqueue_follow_up_jobs(
+    db: Session, event: LLMResponseCreated | LLMResponseUpdated
+) -> None:
+    """
+    LLM応答の作成・更新を受けて、派生データを更新するジョブを登録します。
+
+    派生データは本文から作るため、本文が変わらない更新（タイトルやタグのみの
+    更新）では登録しません。同じLLM応答に対する実行待ちのジョブがあれば
+    重複して登録しません。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        event: LLM応答の作成・更新イベント
+    """
+    if isinstance(event, LLMResponseUpdated) and not event.content_changed:
+        return
+    response_id = str(event.response.id)
+    job_queue.enqueue(
+        db,
+        RENDER_HTML_JOB,
+        {"response_id": response_id},
+        priority=RENDER_HTML_PRIORITY,
+        dedupe_key=f"{RENDER_HTML_JOB}:{response_id}",
+    )
+    if not event.response.summary:
+        job_queue.enqueue(
+            db,
+            SUMMARIZE_JOB,
+            {"response_id": response_id},
+            priority=SUMMARIZE_PRIORITY,
+            dedupe_key=f"{SUMMARIZE_JOB}:{response_id}",
+        )
+
+
+def enqueue_bulk_follow_up_jobs(db: Session, event: LLMResponsesCreated) -> None:
+    """
+    LLM応答の一括作成（会話の取り込みなど）を受けて、要約を生成するジョブを
+    一括作成1回につき1件だけ登録します。
+
+    HTMLの事前レンダリングは行いません（表示時にレンダリングしてキャッシュする）。
+    LLM応答ごとにジョブを登録すると、取り込みの件数だけジョブの行が増えるためです。
+
+    Args:
+        db: 書き込み中のデータベースセッション
+        event: LLM応答の一括作成イベント
+    """
+    response_ids = [
+        str(response.id) for response in event.responses if not response.summary
+    ]
+    if response_ids:
+        job_queue.enqueue(
+            db,
+            SUMMARIZE_BATCH_JOB,
+            {"response_ids": response_ids},
+            priority=SUMMARIZE_PRIORITY,
+        )
+
+
+# ジョブハンドラーとイベント購読の登録
+job_worker_pool.register(RENDER_HTML_JOB, render_response_html)
+job_worker_pool.register(SUMMARIZE_JOB, summarize_response)
+job_worker_pool.register(SUMMARIZE_BATCH_JOB, summarize_responses)
+job_worker_pool.register(IMPORT_CONVERSATIONS_JOB, import_conversations)
+event_bus.subscribe(LLMResponseCreated, enqueue_follow_up_jobs)
+event_bus.subscribe(LLMResponsesCreated, enqueue_bulk_follow_up_jobs)
+event_bus.subscribe(LLMResponseUpdated, enqueue_follow_up_jobs)
+event_bus.subscribe(ConversationImportQueued, enqueue_conversation_import)
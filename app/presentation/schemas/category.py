@@ -66,12 +66,26 @@ class CategoryRead(CategoryBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CategoryWithStatsRead(CategoryRead):
+    """
+    集計値付きカテゴリ取得レスポンススキーマ
+    """
+
+    response_count: int = Field(0, description="所属するLLM応答の件数")
+    last_activity_at: datetime | None = Field(
+        None, description="所属するLLM応答の最終更新日時"
+    )
+    top_tags: list[str] = Field(
+        default_factory=list, description="使用頻度の高いタグ（多い順）"
+    )
+
+
 class CategoryListResponse(BaseModel):
     """
     カテゴリ一覧取得レスポンススキーマ
     """
 
-    items: list[CategoryRead] = Field(..., description="カテゴリのリスト")
+    items: list[CategoryWithStatsRead] = Field(..., description="カテゴリのリスト")
     total: int = Field(..., description="総件数")
     skip: int = Field(..., description="スキップした件数")
     limit: int = Field(..., description="取得件数の上限")
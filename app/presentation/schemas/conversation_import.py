@@ -0,0 +1,100 @@
+"""
+ConversationImport スキーマ定義
+
+会話エクスポートの取り込みのAPI入出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ExportFormat(str, Enum):
+    """
+    会話エクスポートの形式の列挙型
+    """
+
+    CHATGPT = "chatgpt"
+    CLAUDE = "claude"
+    GEMINI = "gemini"
+
+
+class ImportStatus(str, Enum):
+    """
+    取り込みの状態の列挙型
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ConversationImportForm(BaseModel):
+    """
+    会話エクスポートのアップロード（multipart/form-data）のファイル以外の
+    フィールドのスキーマ
+
+    エクスポートファイルは file パートで送信します。tags は同名のフィールドを
+    繰り返して指定します。
+    """
+
+    format: ExportFormat | None = Field(
+        None, description="エクスポートの形式（省略時は内容から判別）"
+    )
+    category_id: UUID | None = Field(None, description="取り込み先のカテゴリID")
+    tags: list[str] = Field(
+        default_factory=list, description="取り込んだLLM応答に付けるタグのリスト"
+    )
+    content_sha256: str | None = Field(
+        None,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description=(
+            "ファイルの SHA-256 ハッシュ（指定した場合、受信したファイルと照合する）"
+        ),
+    )
+
+
+class ConversationImportRead(BaseModel):
+    """
+    取り込み取得レスポンススキーマ
+    """
+
+    id: UUID = Field(..., description="取り込みID")
+    format: ExportFormat | None = Field(
+        None, description="エクスポートの形式（判別前はnull）"
+    )
+    status: ImportStatus = Field(..., description="取り込みの状態")
+    source_bytes: int = Field(..., description="エクスポートファイルのバイト数")
+    byte_offset: int = Field(..., description="取り込み済みの位置（バイト数）")
+    progress: float = Field(..., description="取り込み済みの割合（0.0〜1.0）")
+    conversation_count: int = Field(..., description="処理した会話の数")
+    imported_count: int = Field(..., description="作成したLLM応答の数")
+    duplicate_count: int = Field(
+        ..., description="本文が重複していたため作成しなかった発話の数"
+    )
+    category_id: UUID | None = Field(None, description="取り込み先のカテゴリID")
+    tags: list[str] = Field(..., description="取り込んだLLM応答に付けるタグ")
+    last_error: str | None = Field(None, description="最後に発生したエラー")
+    created_at: datetime = Field(..., description="登録日時")
+    updated_at: datetime = Field(..., description="更新日時")
+    completed_at: datetime | None = Field(None, description="完了日時")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ConversationImportListResponse(BaseModel):
+    """
+    取り込み一覧取得レスポンススキーマ
+    """
+
+    items: list[ConversationImportRead] = Field(
+        ..., description="取り込みのリスト（新しい順）"
+    )
+    total: int = Field(..., description="総件数")
+    skip: int = Field(..., description="スキップした件数")
+    limit: int = Field(..., description="取得件数の上限")
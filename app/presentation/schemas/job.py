@@ -0,0 +1,55 @@
+"""
+Job スキーマ定義
+
+バックグラウンドジョブの状態を返すAPI出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobStatus(str, Enum):
+    """
+    ジョブの状態の列挙型
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRead(BaseModel):
+    """
+    ジョブ取得レスポンススキーマ
+    """
+
+    id: int = Field(..., description="ジョブID")
+    kind: str = Field(..., description="ジョブの種類")
+    payload: dict[str, Any] = Field(..., description="ジョブの引数")
+    status: JobStatus = Field(..., description="ジョブの状態")
+    priority: int = Field(..., description="優先度（大きいほど先に実行される）")
+    attempts: int = Field(..., description="実行を試みた回数")
+    max_attempts: int = Field(..., description="最大試行回数")
+    run_at: datetime = Field(..., description="実行可能になる日時")
+    last_error: str | None = Field(None, description="最後に発生したエラー")
+    created_at: datetime = Field(..., description="登録日時")
+    updated_at: datetime = Field(..., description="更新日時")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobListResponse(BaseModel):
+    """
+    ジョブ一覧取得レスポンススキーマ
+    """
+
+    items: list[JobRead] = Field(..., description="ジョブのリスト（新しい順）")
+    total: int = Field(..., description="総件数")
+    skip: int = Field(..., description="スキップした件数")
+    limit: int = Field(..., description="取得件数の上限")
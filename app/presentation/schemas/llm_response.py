@@ -27,6 +27,54 @@ class LLMProvider(str, Enum):
     OTHER = "other"
 
 
+class SummarySource(str, Enum):
+    """
+    要約の設定元の列挙型
+    """
+
+    USER = "user"
+    AUTO = "auto"
+
+
+class ResponseSortKey(str, Enum):
+    """
+    LLM応答の検索結果の並べ替えキー
+    """
+
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    CHAR_COUNT = "char_count"
+    BYTE_COUNT = "byte_count"
+    TOKEN_ESTIMATE = "token_estimate"
+    HEADING_COUNT = "heading_count"
+    LINK_COUNT = "link_count"
+
+
+class SortOrder(str, Enum):
+    """
+    並び順
+    """
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class ContentStatsRead(BaseModel):
+    """
+    本文の統計情報スキーマ
+    """
+
+    char_count: int = Field(..., description="文字数")
+    byte_count: int = Field(..., description="UTF-8 でのバイト数")
+    token_estimate: int = Field(..., description="推定トークン数")
+    code_block_count: int = Field(..., description="コードブロックの数")
+    code_languages: list[str] = Field(..., description="コードブロックの言語名")
+    heading_count: int = Field(..., description="見出しの数")
+    link_count: int = Field(..., description="リンクの数")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class LLMResponseBase(BaseModel):
     """
     LLM応答の基本スキーマ
@@ -50,6 +98,28 @@ class LLMResponseCreate(LLMResponseBase):
     pass
 
 
+class LLMResponseUploadForm(BaseModel):
+    """
+    LLM応答アップロード（multipart/form-data）の本文以外のフィールドのスキーマ
+
+    本文は content パートで送信します。tags は同名のフィールドを繰り返して
+    指定します。
+    """
+
+    title: str = Field(..., description="応答のタイトル", min_length=1, max_length=255)
+    prompt: str = Field(..., description="LLMへの入力プロンプト")
+    model: str = Field(..., description="使用したモデル名", max_length=100)
+    provider: LLMProvider = Field(..., description="LLMプロバイダー")
+    category_id: UUID | None = Field(None, description="所属カテゴリのID")
+    tags: list[str] = Field(default_factory=list, description="タグのリスト")
+    summary: str | None = Field(None, description="応答の要約")
+    content_sha256: str | None = Field(
+        None,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description="本文の SHA-256 ハッシュ（指定した場合、受信した本文と照合する）",
+    )
+
+
 class LLMResponseUpdate(BaseModel):
     """
     LLM応答更新リクエストスキーマ
@@ -75,11 +145,21 @@ class LLMResponseRead(LLMResponseBase):
     """
 
     id: UUID = Field(..., description="応答ID")
+    prompt_id: UUID | None = Field(
+        None, description="プロンプトID（同じプロンプトのLLM応答で共通）"
+    )
+    summary_source: SummarySource | None = Field(
+        None,
+        description="要約の設定元（auto の要約は本文を更新すると作り直される）",
+    )
     storage_location: str = Field(..., description="ストレージの種類")
     storage_path: str | None = Field(None, description="実際のストレージパス")
     created_at: datetime = Field(..., description="作成日時")
     updated_at: datetime = Field(..., description="更新日時")
     category: CategoryRef | None = Field(None, description="所属カテゴリ")
+    stats: ContentStatsRead | None = Field(
+        None, description="本文の統計情報（未算出の場合はnull）"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -91,16 +171,33 @@ class LLMResponseListItem(BaseModel):
 
     id: UUID = Field(..., description="応答ID")
     title: str = Field(..., description="応答のタイトル")
+    prompt_id: UUID | None = Field(
+        None, description="プロンプトID（同じプロンプトのLLM応答で共通）"
+    )
     model: str = Field(..., description="使用したモデル名")
     provider: LLMProvider = Field(..., description="LLMプロバイダー")
     category_id: UUID | None = Field(None, description="所属カテゴリのID")
     tags: list[str] = Field(..., description="タグのリスト")
     summary: str | None = Field(None, description="応答の要約")
     created_at: datetime = Field(..., description="作成日時")
+    category: CategoryRef | None = Field(None, description="所属カテゴリ")
+    stats: ContentStatsRead | None = Field(
+        None, description="本文の統計情報（未算出の場合はnull）"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class LLMResponseUploadRead(LLMResponseListItem):
+    """
+    LLM応答アップロードレスポンススキーマ（本文は含まない）
+    """
+
+    storage_path: str = Field(..., description="本文ストレージ内のパス")
+    content_sha256: str = Field(..., description="受信した本文の SHA-256 ハッシュ")
+    content_bytes: int = Field(..., description="受信した本文のバイト数")
+
+
 class LLMResponseListResponse(BaseModel):
     """
     LLM応答一覧取得レスポンススキーマ
@@ -112,6 +209,84 @@ class LLMResponseListResponse(BaseModel):
     limit: int = Field(..., description="取得件数の上限")
 
 
+class LLMResponseBatchGetRequest(BaseModel):
+    """
+    LLM応答一括取得リクエストスキーマ
+    """
+
+    ids: list[UUID] = Field(
+        ..., description="取得するLLM応答のID", min_length=1, max_length=500
+    )
+    fields: list[str] | None = Field(
+        None, description="取得するフィールド（省略時はすべてのフィールド）"
+    )
+
+
+class LLMResponseBatchGetResponse(BaseModel):
+    """
+    LLM応答一括取得レスポンススキーマ
+    """
+
+    items: list[LLMResponseRead] = Field(
+        ..., description="取得できたLLM応答（リクエストのID順）"
+    )
+    missing: list[UUID] = Field(..., description="存在しなかったID")
+
+
+class ResponseSectionSummary(BaseModel):
+    """
+    LLM応答セクションの一覧項目スキーマ（セクションの本文は含まない）
+    """
+
+    position: int = Field(..., description="セクションの番号（0 始まり）")
+    heading: str | None = Field(None, description="セクションが属する見出し")
+    heading_level: int | None = Field(None, description="見出しのレベル（1〜6）")
+    start_offset: int = Field(..., description="本文内の開始位置（文字単位）")
+    end_offset: int = Field(
+        ..., description="本文内の終了位置（文字単位、この位置を含まない）"
+    )
+
+
+class ResponseSectionRead(ResponseSectionSummary):
+    """
+    LLM応答セクション取得レスポンススキーマ
+    """
+
+    response_id: UUID = Field(..., description="LLM応答のID")
+    content: str = Field(..., description="セクションの内容（Markdown形式）")
+
+
+class ResponseSectionListResponse(BaseModel):
+    """
+    LLM応答セクション一覧取得レスポンススキーマ
+    """
+
+    response_id: UUID = Field(..., description="LLM応答のID")
+    items: list[ResponseSectionSummary] = Field(..., description="セクションのリスト")
+    total: int = Field(..., description="セクション数")
+
+
+class SectionSearchHit(ResponseSectionSummary):
+    """
+    セクション単位の検索結果の項目スキーマ
+    """
+
+    response_id: UUID = Field(..., description="LLM応答のID")
+    title: str = Field(..., description="LLM応答のタイトル")
+    snippet: str = Field(..., description="検索語の前後を切り出した文字列")
+
+
+class SectionSearchResponse(BaseModel):
+    """
+    セクション単位の検索レスポンススキーマ
+    """
+
+    items: list[SectionSearchHit] = Field(..., description="検索結果のリスト")
+    total: int = Field(..., description="件数")
+    skip: int = Field(..., description="スキップした件数")
+    limit: int = Field(..., description="取得件数の上限")
+
+
 class LLMResponseSearchQuery(BaseModel):
     """
     LLM応答検索クエリスキーマ
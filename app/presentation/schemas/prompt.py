@@ -0,0 +1,39 @@
+"""
+Prompt スキーマ定義
+
+LLM応答が共有するプロンプトを返すAPI出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PromptRead(BaseModel):
+    """
+    プロンプト取得レスポンススキーマ
+    """
+
+    id: UUID = Field(..., description="プロンプトID")
+    text: str = Field(..., description="プロンプトの本文")
+    prompt_hash: str = Field(..., description="本文の SHA-256 ハッシュ")
+    response_count: int = Field(..., description="このプロンプトのLLM応答の数")
+    created_at: datetime = Field(..., description="作成日時")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PromptListResponse(BaseModel):
+    """
+    プロンプト一覧取得レスポンススキーマ
+    """
+
+    items: list[PromptRead] = Field(
+        ..., description="プロンプトのリスト（LLM応答の多い順）"
+    )
+    total: int = Field(..., description="総件数")
+    skip: int = Field(..., description="スキップした件数")
+    limit: int = Field(..., description="取得件数の上限")
@@ -0,0 +1,48 @@
+"""
+ResponseRevision スキーマ定義
+
+LLM応答の本文の版（リビジョン）を返すAPI出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ResponseRevisionRead(BaseModel):
+    """
+    LLM応答の本文の版の取得レスポンススキーマ（本文を含まない）
+    """
+
+    number: int = Field(..., description="版の番号（1 始まり、最大の番号が現在の本文）")
+    is_snapshot: bool = Field(
+        ..., description="本文全体を保存した版か（False の場合は前の版との差分）"
+    )
+    content_hash: str = Field(..., description="本文の SHA-256 ハッシュ")
+    char_count: int = Field(..., description="本文の文字数")
+    stored_bytes: int = Field(..., description="保存している（圧縮後の）バイト数")
+    created_at: datetime = Field(..., description="この版の本文になった日時")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResponseRevisionContentRead(ResponseRevisionRead):
+    """
+    LLM応答の本文の版の取得レスポンススキーマ（本文を含む）
+    """
+
+    response_id: UUID = Field(..., description="LLM応答ID")
+    content: str = Field(..., description="この版の本文（Markdown形式）")
+
+
+class ResponseRevisionListResponse(BaseModel):
+    """
+    LLM応答の本文の版の一覧取得レスポンススキーマ
+    """
+
+    response_id: UUID = Field(..., description="LLM応答ID")
+    items: list[ResponseRevisionRead] = Field(..., description="版のリスト（番号順）")
+    total: int = Field(..., description="総件数")
@@ -0,0 +1,56 @@
+"""
+Sync スキーマ定義
+
+差分同期APIの出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.presentation.schemas.category import CategoryRead
+from app.presentation.schemas.llm_response import LLMResponseRead
+
+
+class EntityType(str, Enum):
+    """
+    削除されたエンティティの種類の列挙型
+    """
+
+    RESPONSE = "response"
+    CATEGORY = "category"
+
+
+class Tombstone(BaseModel):
+    """
+    削除されたエンティティを表すスキーマ
+    """
+
+    entity_type: EntityType = Field(..., description="エンティティの種類")
+    id: UUID = Field(..., description="削除されたエンティティのID")
+    deleted_at: datetime = Field(..., description="削除日時")
+
+
+class SyncResponse(BaseModel):
+    """
+    差分同期レスポンススキーマ
+    """
+
+    responses: list[LLMResponseRead] = Field(
+        ..., description="作成・更新されたLLM応答（変更順）"
+    )
+    categories: list[CategoryRead] = Field(
+        ..., description="作成・更新されたカテゴリ（変更順）"
+    )
+    tombstones: list[Tombstone] = Field(
+        ..., description="削除されたエンティティ（変更順）"
+    )
+    next_token: str = Field(
+        ...,
+        description="次回の since に指定するトークン（has_more の場合は続きのページ）",
+    )
+    has_more: bool = Field(..., description="続きのページがあるか")
@@ -0,0 +1,55 @@
+"""
+TagStat スキーマ定義
+
+タグの使用状況（一覧・補完）を返すAPI出力スキーマを定義します。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TagSortKey(str, Enum):
+    """
+    タグの一覧の並べ替えキー
+    """
+
+    COUNT = "count"
+    RECENT = "recent"
+
+
+class TagStatRead(BaseModel):
+    """
+    タグの使用状況の取得レスポンススキーマ
+    """
+
+    tag: str = Field(..., description="タグ")
+    response_count: int = Field(..., description="このタグを付けたLLM応答の数")
+    last_used_at: datetime = Field(..., description="最後にLLM応答に付けた日時")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TagStatListResponse(BaseModel):
+    """
+    タグの使用状況の一覧取得レスポンススキーマ
+    """
+
+    items: list[TagStatRead] = Field(..., description="タグの使用状況のリスト")
+    total: int = Field(..., description="総件数")
+    skip: int = Field(..., description="スキップした件数")
+    limit: int = Field(..., description="取得件数の上限")
+
+
+class TagAutocompleteResponse(BaseModel):
+    """
+    タグの補完候補の取得レスポンススキーマ
+    """
+
+    prefix: str = Field(..., description="入力されたタグの先頭の文字列")
+    items: list[TagStatRead] = Field(
+        ..., description="前方一致したタグ（LLM応答の多い順）"
+    )
@@ -0,0 +1,147 @@
+"""
+アドミッション制御のベンチマーク
+
+全件を走査する重い検索（一致しない %LIKE%）を多数のクライアントから送り続けながら、
+別のクライアント群で軽い `GET /responses/{id}` のレイテンシを計測します。
+アドミッション制御なし（制限を事実上無効化）とあり（既定の設定）を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_admission
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_admission_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'bench.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+os.environ["JOB_WORKERS"] = "0"
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.infrastructure.db.base import SessionLocal, init_db  # noqa: E402
+from app.infrastructure.db.models import LLMResponseORM  # noqa: E402
+from app.main import app  # noqa: E402
+from app.presentation.api.admission import admission_limiters  # noqa: E402
+
+ROW_COUNT = 20_000
+SEARCH_CLIENTS = 60
+READ_CLIENTS = 10
+DURATION_SECONDS = 8.0
+
+
+def seed() -> list[str]:
+    """検索対象のLLM応答を投入し、読み取りに使うIDを返します。"""
+    init_db()
+    body = "非同期処理とイベントループについての説明です。" * 40
+    rows = [
+        {
+            "id": f"00000000-0000-4000-8000-{i:012d}",
+            "title": f"title {i}",
+            "content_md": body,
+            "model": "model",
+            "provider": "openai",
+            "tags": [],
+        }
+        for i in range(ROW_COUNT)
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(LLMResponseORM.__table__), rows)
+        db.commit()
+    return [row["id"] for row in rows[:100]]
+
+
+async def run(ids: list[str]) -> dict[str, float]:
+    """検索の集中下で、読み取りのレイテンシと検索の処理件数を計測します。"""
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    read_latencies: list[float] = []
+    counts = {"search_ok": 0, "search_503": 0, "read_503": 0, "errors": 0}
+    deadline = time.perf_counter() + DURATION_SECONDS
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=60
+    ) as client:
+
+        async def search_client() -> None:
+            while time.perf_counter() < deadline:
+                r = await client.get(
+                    "/api/v1/responses/search", params={"query": "zzz-not-found"}
+                )
+                if r.status_code == 503:
+                    counts["search_503"] += 1
+                    await asyncio.sleep(0.05)
+                elif r.status_code >= 500:
+                    counts["errors"] += 1
+                else:
+                    counts["search_ok"] += 1
+
+        async def read_client(offset: int) -> None:
+            i = offset
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                r = await client.get(f"/api/v1/responses/{ids[i % len(ids)]}")
+                if r.status_code == 503:
+                    counts["read_503"] += 1
+                elif r.status_code >= 500:
+                    counts["errors"] += 1
+                else:
+                    read_latencies.append(time.perf_counter() - started)
+                i += 1
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            *(search_client() for _ in range(SEARCH_CLIENTS)),
+            *(read_client(i) for i in range(READ_CLIENTS)),
+        )
+
+    read_latencies.sort()
+    quantiles = statistics.quantiles(read_latencies, n=100)
+    return {
+        "reads": len(read_latencies),
+        "read_p50_ms": quantiles[49] * 1000,
+        "read_p99_ms": quantiles[98] * 1000,
+        "read_max_ms": read_latencies[-1] * 1000,
+        **counts,
+    }
+
+
+def main() -> None:
+    ids = seed()
+    print(
+        f"rows={ROW_COUNT}, search clients={SEARCH_CLIENTS}, "
+        f"read clients={READ_CLIENTS}, duration={DURATION_SECONDS}s"
+    )
+
+    defaults = {
+        name: (limiter.max_concurrency, limiter.max_queue)
+        for name, limiter in admission_limiters.items()
+    }
+    for label, enabled in (("admission off", False), ("admission on ", True)):
+        for name, limiter in admission_limiters.items():
+            if enabled:
+                limiter.max_concurrency, limiter.max_queue = defaults[name]
+            else:
+                limiter.max_concurrency, limiter.max_queue = 10_000, 10_000
+        result = asyncio.run(run(ids))
+        print(
+            f"{label}: reads={result['reads']:5d}  "
+            f"read p50={result['read_p50_ms']:7.1f}ms  "
+            f"p99={result['read_p99_ms']:7.1f}ms  "
+            f"max={result['read_max_ms']:7.1f}ms  "
+            f"searches ok={result['search_ok']:4d} "
+            f"503={result['search_503']:5d}  read 503={result['read_503']}  "
+            f"errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+同期・非同期データベースアクセスのスループット比較
+
+同じデータに対して、同期版（def のエンドポイント + スレッドプール）と
+非同期版（DATABASE_ASYNC=true: async def のエンドポイント + AsyncSession）の
+サーバーをそれぞれ起動し、500 の同時クライアントから読み取りを送り続けて
+スループットとレイテンシを比較します。
+
+読み取りの待ち行列はクライアント数より長くし、503 で拒否されないようにします。
+同時実行数は既定値（スレッドプールより少ない値）と、非同期版のみ
+クライアント数まで引き上げた場合を計測します。同期版で同時実行数を
+スレッドプールより大きくすると、接続待ちのスレッドがプールを使い切って
+エンドポイントを実行できなくなるため計測しません。
+
+実行方法:
+    uv run python -m benchmarks.bench_async_db
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_async_db_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'bench.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.infrastructure.db.base import SessionLocal, init_db  # noqa: E402
+from app.infrastructure.db.models import LLMResponseORM  # noqa: E402
+
+ROW_COUNT = 5_000
+CLIENTS = 500
+WARMUP_SECONDS = 2.0
+DURATION_SECONDS = 10.0
+
+
+def seed() -> list[str]:
+    """読み取り対象のLLM応答を投入し、そのIDを返します。"""
+    init_db()
+    rows = [
+        {
+            "id": f"00000000-0000-4000-8000-{i:012d}",
+            "title": f"title {i}",
+            "content_md": f"# 見出し {i}\n\n本文です。" * 20,
+            "model": "model",
+            "provider": "openai",
+            "tags": ["bench"],
+        }
+        for i in range(ROW_COUNT)
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(LLMResponseORM.__table__), rows)
+        db.commit()
+    return [row["id"] for row in rows]
+
+
+def free_port() -> int:
+    """空いているTCPポートを返します。"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    port: int, use_async: bool, read_concurrency: int | None
+) -> subprocess.Popen:
+    """uvicorn でサーバーを起動し、応答するまで待ちます。"""
+    env = {
+        **os.environ,
+        "DATABASE_ASYNC": "true" if use_async else "false",
+        "JOB_WORKERS": "0",
+        "ADMISSION_READ_QUEUE": str(CLIENTS * 2),
+        "LOG_LEVEL": "WARNING",
+    }
+    if read_concurrency is not None:
+        env["ADMISSION_READ_CONCURRENCY"] = str(read_concurrency)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("サーバーが起動しませんでした")
+
+
+async def request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str
+) -> int:
+    """キープアライブ接続で GET を1回送り、ステータスコードを返します。"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_code = int(head.split(b" ", 2)[1])
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            await reader.readexactly(int(line.split(b":", 1)[1]))
+            break
+    return status_code
+
+
+async def load(port: int, ids: list[str]) -> dict[str, float]:
+    """
+    同時クライアントから読み取りを送り続け、スループットとレイテンシを計測します。
+
+    負荷生成側の処理がボトルネックにならないよう、HTTP クライアントライブラリ
+    ではなく asyncio のストリームで最小限の HTTP/1.1 リクエストを送ります。
+    """
+    latencies: list[float] = []
+    errors = 0
+    measuring = False
+
+    async def worker(stop_at: float) -> None:
+        nonlocal errors
+        rng = random.Random()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while time.perf_counter() < stop_at:
+                started = time.perf_counter()
+                status_code = await request(
+                    reader, writer, f"/api/v1/responses/{rng.choice(ids)}"
+                )
+                if not measuring:
+                    continue
+                if status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+        finally:
+            writer.close()
+
+    stop_at = time.perf_counter() + WARMUP_SECONDS + DURATION_SECONDS
+    tasks = [asyncio.create_task(worker(stop_at)) for _ in range(CLIENTS)]
+    await asyncio.sleep(WARMUP_SECONDS)
+    measuring = True
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / DURATION_SECONDS,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    ids = seed()
+    print(f"rows={ROW_COUNT}, clients={CLIENTS}, duration={DURATION_SECONDS}s")
+    scenarios = (
+        ("sync,  default admission ", False, None),
+        ("async, default admission ", True, None),
+        ("async, admission lifted  ", True, CLIENTS),
+    )
+    for label, use_async, read_concurrency in scenarios:
+        port = free_port()
+        server = start_server(port, use_async, read_concurrency)
+        try:
+            result = asyncio.run(load(port, ids))
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{label}: {result['rps']:8.1f} req/s  "
+            f"p50={result['p50_ms']:7.1f}ms  p99={result['p99_ms']:7.1f}ms  "
+            f"errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
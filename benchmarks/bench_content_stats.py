@@ -0,0 +1,142 @@
+"""
+本文の統計情報の列のベンチマーク
+
+本文の長さでの絞り込み・並べ替えを、本文から都度算出する場合
+（LENGTH(content_md) や LIKE によるコードブロックの検出）と、
+作成時に算出して保存したインデックス付きの列を使う場合とで比較します。
+あわせて、既存の行への統計情報のバックフィルの処理速度を計測します。
+
+実行方法:
+    uv run python -m benchmarks.bench_content_stats
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_content_stats_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'bench.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+
+from sqlalchemy import create_engine, func, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.application.use_cases.backfill_content_stats import (  # noqa: E402
+    BackfillContentStatsUseCase,
+)
+from app.infrastructure.db import models  # noqa: E402, F401  テーブル定義の登録
+from app.infrastructure.db.base import Base  # noqa: E402
+from app.infrastructure.repositories.llm_response_repository_impl import (  # noqa: E402
+    LLMResponseRepositoryImpl,
+)
+
+ROW_COUNT = 50_000
+REPEAT = 20
+
+_PARAGRAPH = "LLM の応答本文です。Markdown で書かれた説明が続きます。\n\n"
+_CODE = "```python\nfor i in range(10):\n    print(i)\n```\n\n"
+
+
+def content(rng: random.Random) -> str:
+    """長さとコードブロックの有無がばらつく本文を生成します。"""
+    parts = ["# 見出し\n\n", _PARAGRAPH * rng.randint(1, 60)]
+    if rng.random() < 0.3:
+        parts.append(_CODE)
+    return "".join(parts)
+
+
+def seed(engine) -> None:
+    """統計情報が未算出のLLM応答を投入します。"""
+    rng = random.Random(0)
+    now = datetime.now()
+    table = Base.metadata.tables["llm_responses"]
+    with engine.begin() as connection:
+        connection.execute(
+            insert(table),
+            [
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128)),
+                    "title": f"title {i}",
+                    "content_md": content(rng),
+                    "model": "model",
+                    "provider": "openai",
+                    "tags": ["bench"],
+                    "storage_location": "file",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(ROW_COUNT)
+            ],
+        )
+
+
+def timed(engine, statement) -> float:
+    """クエリを繰り返し実行し、1回あたりの所要時間（ミリ秒）を返します。"""
+    with engine.connect() as connection:
+        connection.execute(statement).all()
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            connection.execute(statement).all()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main() -> None:
+    # アプリのエンジンに登録されたイベント（クエリ期限など）の影響を受けないよう、
+    # 素のエンジンで計測する
+    engine = create_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(engine)
+    seed(engine)
+    print(f"responses={ROW_COUNT}, repeat={REPEAT}")
+
+    with Session(engine) as db:
+        started = time.perf_counter()
+        updated = BackfillContentStatsUseCase(LLMResponseRepositoryImpl(db)).execute()
+        elapsed = time.perf_counter() - started
+    print(
+        f"backfill: {updated} rows in {elapsed:.2f}s ({updated / elapsed:.0f} rows/s)"
+    )
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+
+    table = Base.metadata.tables["llm_responses"]
+    length = func.length(table.c.content_md)
+    scenarios = (
+        (
+            "longest 20",
+            select(table.c.id).order_by(length.desc()).limit(20),
+            select(table.c.id).order_by(table.c.char_count.desc()).limit(20),
+        ),
+        (
+            "chars in [2000, 2100]",
+            select(table.c.id).where(length.between(2000, 2100)),
+            select(table.c.id).where(table.c.char_count.between(2000, 2100)),
+        ),
+        (
+            "has code, longest 20",
+            select(table.c.id)
+            .where(table.c.content_md.like("%```%"))
+            .order_by(length.desc())
+            .limit(20),
+            select(table.c.id)
+            .where(table.c.code_block_count > 0)
+            .order_by(table.c.char_count.desc())
+            .limit(20),
+        ),
+    )
+    for label, computed, stored in scenarios:
+        print(
+            f"{label:22}: computed={timed(engine, computed):8.2f}ms  "
+            f"stored column={timed(engine, stored):6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
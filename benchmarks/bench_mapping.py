@@ -0,0 +1,139 @@
+"""
+ドメインエンティティのメモリ使用量とマッピング速度のベンチマーク
+
+- エンティティ1件あたりのメモリ: slots なしの dataclass と slots 付きの
+  LLMResponse を tracemalloc で比較します。
+- マッピング速度: ORM インスタンス経由（都度 UUID / Enum 変換）と、
+  Core の Row から直接組み立てる現在のリポジトリ実装を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_mapping
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import timeit
+import tracemalloc
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.infrastructure.cache.category_cache import CategoryCache
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import CategoryORM, LLMResponseORM
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+ROW_COUNT = 1000
+REPEAT = 20
+
+
+def _without_slots(cls: type) -> type:
+    """同じフィールド定義を持つ slots なしの dataclass を生成します。"""
+    fields = [
+        (
+            f.name,
+            f.type,
+            dataclasses.field(default=f.default, default_factory=f.default_factory),
+        )
+        for f in dataclasses.fields(cls)
+    ]
+    return dataclasses.make_dataclass(f"{cls.__name__}NoSlots", fields)
+
+
+def bytes_per_entity(cls: type, count: int = ROW_COUNT) -> float:
+    """エンティティ1件あたりの確保バイト数（フィールド値自体は共有）を計測します。"""
+    category_id = uuid4()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [
+        cls(
+            title="title",
+            prompt="prompt",
+            content_md="content",
+            model="model",
+            provider=LLMProvider.OPENAI,
+            category_id=category_id,
+        )
+        for _ in range(count)
+    ]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del entities
+    return total / count
+
+
+def legacy_to_domain(orm_model: LLMResponseORM) -> LLMResponse:
+    """変更前の ORM インスタンスからのマッピングを再現します。"""
+    return LLMResponse(
+        id=orm_model.id,
+        title=orm_model.title,
+        # プロンプトの本文は prompts テーブルにあり、投入する行では未設定
+        prompt="",
+        prompt_id=orm_model.prompt_id,
+        content_md=orm_model.content_md,
+        model=orm_model.model,
+        provider=LLMProvider(orm_model.provider),
+        category_id=orm_model.category_id,
+        tags=orm_model.tags if orm_model.tags else [],
+        summary=orm_model.summary,
+        storage_location=orm_model.storage_location,
+        storage_path=orm_model.storage_path,
+        created_at=orm_model.created_at,
+        updated_at=orm_model.updated_at,
+    )
+
+
+def main() -> None:
+    """メモリ使用量とマッピング速度を計測して表示します。"""
+    no_slots = bytes_per_entity(_without_slots(LLMResponse))
+    slots = bytes_per_entity(LLMResponse)
+    print(f"bytes/entity  dataclass            {no_slots:8.1f}")
+    print(f"bytes/entity  dataclass(slots)     {slots:8.1f}")
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    category_id = str(uuid4())
+    with Session(engine) as db:
+        db.add(CategoryORM(id=category_id, name="bench"))
+        db.execute(
+            insert(LLMResponseORM),
+            [
+                {
+                    "id": str(uuid4()),
+                    "title": f"title {i}",
+                    "content_md": "# content\n" * 50,
+                    "model": "gpt-4o",
+                    "provider": "openai",
+                    "category_id": category_id,
+                    "tags": ["a", "b"],
+                }
+                for i in range(ROW_COUNT)
+            ],
+        )
+        db.commit()
+
+        def legacy() -> list[LLMResponse]:
+            db.expunge_all()
+            return [legacy_to_domain(m) for m in db.query(LLMResponseORM).all()]
+
+        repository = LLMResponseRepositoryImpl(db, CategoryCache())
+
+        def current() -> list[LLMResponse]:
+            return repository.list(limit=ROW_COUNT)
+
+        for name, path in (
+            ("ORM + per-row conversion", legacy),
+            ("Core rows", current),
+        ):
+            best = min(timeit.repeat(path, number=1, repeat=REPEAT))
+            print(f"map {ROW_COUNT} rows  {name:28s} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+プロンプトの正規化のベンチマーク
+
+同じデータを、プロンプトの本文をLLM応答ごとに llm_responses.prompt 列へ
+保存するスキーマ（従来）と、prompts テーブルに1件ずつ保存して prompt_id で
+参照するスキーマ（現在）の2つの SQLite ファイルに投入し、データベースの
+サイズ、プロンプトごとの件数の集計（グループ化）、同じプロンプトの
+LLM応答の取得の速度を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_prompts
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_prompts_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'app.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    MetaData,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine  # noqa: E402
+
+from app.infrastructure.db import models  # noqa: E402, F401  テーブル定義の登録
+from app.infrastructure.db.base import Base  # noqa: E402
+
+RESPONSE_COUNT = 100_000
+PROMPT_COUNT = 5_000
+PROMPT_CHARS = 1_500
+GROUP_LIMIT = 100
+LOOKUPS = 500
+
+
+def legacy_metadata() -> MetaData:
+    """prompt_id 列の代わりに prompt 列を持つ、従来の llm_responses を返します。"""
+    metadata = MetaData()
+    responses = Base.metadata.tables["llm_responses"]
+    Table(
+        responses.name,
+        metadata,
+        *(
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+                index=column.index,
+            )
+            for column in responses.columns
+            if column.name != "prompt_id"
+        ),
+        Column("prompt", Text, nullable=False),
+    )
+    return metadata
+
+
+def seed(target: Engine, metadata: MetaData, normalized: bool) -> None:
+    """プロンプトとLLM応答を投入します（従来のスキーマではLLM応答のみ）。"""
+    rng = random.Random(0)
+    now = datetime.now()
+    texts = [
+        f"質問 {n}: " + "この処理の意図と改善点を説明してください。" * 60
+        for n in range(PROMPT_COUNT)
+    ]
+    texts = [prompt[:PROMPT_CHARS] for prompt in texts]
+    prompt_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in texts]
+    responses = metadata.tables["llm_responses"]
+    with target.begin() as connection:
+        if normalized:
+            connection.execute(
+                insert(metadata.tables["prompts"]),
+                [
+                    {
+                        "id": prompt_id,
+                        "prompt_hash": hashlib.sha256(prompt.encode()).hexdigest(),
+                        "text": prompt,
+                        "created_at": now,
+                    }
+                    for prompt_id, prompt in zip(prompt_ids, texts, strict=True)
+                ],
+            )
+        rows = []
+        for n in range(RESPONSE_COUNT):
+            index = rng.randrange(PROMPT_COUNT)
+            row = {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "title": f"title {n}",
+                "content_md": "本文です。" * 40,
+                "model": rng.choice(("gpt-4o", "claude", "gemini")),
+                "provider": "openai",
+                "tags": ["bench"],
+                "storage_location": "file",
+                "created_at": now,
+                "updated_at": now,
+            }
+            if normalized:
+                row["prompt_id"] = prompt_ids[index]
+            else:
+                row["prompt"] = texts[index]
+            rows.append(row)
+        connection.execute(insert(responses), rows)
+    with target.connect() as connection:
+        connection.execute(text("VACUUM"))
+        connection.execute(text("ANALYZE"))
+
+
+def database_mib(target: Engine) -> float:
+    """データベースのサイズ（MiB）を返します。"""
+    with target.connect() as connection:
+        pages = connection.execute(text("PRAGMA page_count")).scalar()
+        page_size = connection.execute(text("PRAGMA page_size")).scalar()
+    return pages * page_size / 1024 / 1024
+
+
+def measure(target: Engine, metadata: MetaData, normalized: bool) -> dict[str, float]:
+    """プロンプトごとの集計と、同じプロンプトのLLM応答の取得を計測します。"""
+    responses = metadata.tables["llm_responses"]
+    if normalized:
+        prompts = metadata.tables["prompts"]
+        counts = (
+            select(responses.c.prompt_id, func.count().label("response_count"))
+            .group_by(responses.c.prompt_id)
+            .subquery()
+        )
+        group = (
+            select(prompts.c.text, counts.c.response_count)
+            .join(counts, counts.c.prompt_id == prompts.c.id)
+            .order_by(counts.c.response_count.desc())
+            .limit(GROUP_LIMIT)
+        )
+        key_column = responses.c.prompt_id
+        keys_query = select(prompts.c.id)
+    else:
+        group = (
+            select(responses.c.prompt, func.count().label("response_count"))
+            .group_by(responses.c.prompt)
+            .order_by(func.count().desc())
+            .limit(GROUP_LIMIT)
+        )
+        key_column = responses.c.prompt
+        keys_query = select(responses.c.prompt).distinct()
+
+    with target.connect() as connection:
+        started = time.perf_counter()
+        connection.execute(group).all()
+        group_seconds = time.perf_counter() - started
+
+        keys = random.Random(1).sample(
+            connection.execute(keys_query).scalars().all(), LOOKUPS
+        )
+        by_prompt = select(responses.c.id, responses.c.model).where(
+            key_column == bindparam("key")
+        )
+        started = time.perf_counter()
+        for key in keys:
+            connection.execute(by_prompt, {"key": key}).all()
+        lookup_seconds = time.perf_counter() - started
+
+    return {
+        "group_ms": group_seconds * 1000,
+        "lookup_ms": lookup_seconds / LOOKUPS * 1000,
+    }
+
+
+def main() -> None:
+    # アプリのエンジンに登録されたイベント（クエリ期限など）の影響を受けないよう、
+    # どちらも素のエンジンで計測する
+    legacy_engine = create_engine(f"sqlite:///{_WORK_DIR / 'inline.db'}")
+    legacy = legacy_metadata()
+    legacy.create_all(legacy_engine)
+    normalized_engine = create_engine(f"sqlite:///{_WORK_DIR / 'normalized.db'}")
+    Base.metadata.create_all(normalized_engine)
+
+    print(
+        f"responses={RESPONSE_COUNT}, prompts={PROMPT_COUNT}, "
+        f"prompt_chars={PROMPT_CHARS}"
+    )
+    scenarios = (
+        ("inline prompt", legacy_engine, legacy, False),
+        ("prompts table", normalized_engine, Base.metadata, True),
+    )
+    for label, target, metadata, normalized in scenarios:
+        seed(target, metadata, normalized)
+        timings = measure(target, metadata, normalized)
+        print(
+            f"{label:14}: db={database_mib(target):7.1f}MiB  "
+            f"group by prompt={timings['group_ms']:8.1f}ms  "
+            f"responses for prompt={timings['lookup_ms']:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
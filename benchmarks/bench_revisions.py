@@ -0,0 +1,138 @@
+"""
+本文の版（リビジョン）の履歴のベンチマーク
+
+1件のLLM応答の本文を少しずつ何度も更新し、版の履歴の保存サイズを、
+すべての版の本文をそのまま保存する場合・圧縮して保存する場合と比較します。
+あわせて、過去の版の取得（復元）時間を、スナップショットの間隔を
+REVISION_SNAPSHOT_INTERVAL にした場合と、スナップショットを保存せず
+差分だけをつなげた場合とで比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_revisions
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_revisions_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'bench.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+os.environ["JOB_WORKERS"] = "0"
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.application.use_cases.create_response import (  # noqa: E402
+    CreateResponseUseCase,
+)
+from app.application.use_cases.update_response import (  # noqa: E402
+    UpdateResponseUseCase,
+)
+from app.config.settings import settings  # noqa: E402
+from app.domain.models.llm_response import LLMProvider  # noqa: E402
+from app.infrastructure.db.base import SessionLocal, init_db  # noqa: E402
+from app.infrastructure.db.models import ResponseRevisionORM  # noqa: E402
+from app.infrastructure.repositories.llm_response_repository_impl import (  # noqa: E402
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.repositories.response_revision_repository_impl import (  # noqa: E402
+    ResponseRevisionRepositoryImpl,
+)
+
+EDITS = 200
+SECTIONS = 40
+
+_TABLE = ResponseRevisionORM.__table__
+
+
+def initial_content() -> str:
+    """見出し・段落・コードブロックからなる本文（約 30KB）を生成します。"""
+    parts = []
+    for n in range(SECTIONS):
+        parts.append(f"## セクション {n}\n\n")
+        parts.extend(
+            f"段落 {n}-{line}: LLM の応答本文の説明です。詳細は以下の通りです。\n"
+            for line in range(8)
+        )
+        parts.append(f"\n```python\ndef section_{n}():\n    return {n}\n```\n\n")
+    return "".join(parts)
+
+
+def edit(content: str, rng: random.Random, n: int) -> str:
+    """本文の数行を書き換え、ときどき段落を追加します。"""
+    lines = content.splitlines(keepends=True)
+    for _ in range(rng.randint(1, 3)):
+        index = rng.randrange(len(lines))
+        lines[index] = f"編集 {n}: {lines[index]}"
+    if rng.random() < 0.2:
+        lines.insert(rng.randrange(len(lines)), f"追加した段落 {n}。\n\n")
+    return "".join(lines)
+
+
+def run(label: str, snapshot_interval: int) -> list[str]:
+    """LLM応答を作成して EDITS 回更新し、保存サイズと取得時間を表示します。"""
+    settings.REVISION_SNAPSHOT_INTERVAL = snapshot_interval
+    rng = random.Random(0)
+    versions = [initial_content()]
+    with SessionLocal() as db:
+        repository = LLMResponseRepositoryImpl(db)
+        response = CreateResponseUseCase(repository).execute(
+            title="bench",
+            prompt="bench",
+            content_md=versions[0],
+            model="bench",
+            provider=LLMProvider.OPENAI,
+        )
+        update = UpdateResponseUseCase(repository)
+        started = time.perf_counter()
+        for n in range(EDITS):
+            versions.append(edit(versions[-1], rng, n))
+            update.execute(response.id, content_md=versions[-1])
+        update_ms = (time.perf_counter() - started) / EDITS * 1000
+
+        stored = db.execute(
+            select(func.sum(func.length(_TABLE.c.data))).where(
+                _TABLE.c.response_id == response.id
+            )
+        ).scalar()
+
+        revisions = ResponseRevisionRepositoryImpl(db)
+        revisions.get(response.id, 1)  # 文のコンパイルなど初回のみの処理を除く
+        timings = []
+        for number in range(1, len(versions) + 1):
+            started = time.perf_counter()
+            revision = revisions.get(response.id, number)
+            timings.append(time.perf_counter() - started)
+            assert revision is not None and revision.content == versions[number - 1]
+
+    print(
+        f"{label:22}: stored={stored / 1024:8.1f}KiB  update={update_ms:6.2f}ms  "
+        f"get mean={sum(timings) / len(timings) * 1000:6.2f}ms  "
+        f"max={max(timings) * 1000:7.2f}ms"
+    )
+    return versions
+
+
+def main() -> None:
+    init_db()
+    print(f"edits={EDITS}, content={len(initial_content().encode()) / 1024:.1f}KiB")
+    interval = settings.REVISION_SNAPSHOT_INTERVAL
+    versions = run(f"snapshot every {interval}", interval)
+    run("deltas only", EDITS * 10)
+
+    encoded = [version.encode("utf-8") for version in versions]
+    raw = sum(len(data) for data in encoded)
+    compressed = sum(len(zlib.compress(data)) for data in encoded)
+    print(f"{'full copies':22}: stored={raw / 1024:8.1f}KiB")
+    print(f"{'full copies (zlib)':22}: stored={compressed / 1024:8.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
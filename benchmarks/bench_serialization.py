@@ -0,0 +1,106 @@
+"""
+JSONシリアライズのベンチマーク
+
+1000件の一覧レスポンスについて、従来の経路（Pydanticでの検証 → JSON互換の
+Python値への変換 → 標準ライブラリ json）と、高速経路
+（ドメインエンティティ → 辞書 → orjson / pydantic-core）を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_serialization
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from app.domain.models.category import Category
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.presentation.api import serialization
+from app.presentation.schemas.llm_response import LLMResponseListResponse
+
+ITEM_COUNT = 1000
+REPEAT = 20
+
+
+def make_entities(count: int) -> list[LLMResponse]:
+    """ベンチマーク用のLLM応答エンティティを生成します。"""
+    category = Category(name="ベンチマーク")
+    return [
+        LLMResponse(
+            title=f"応答 {i}",
+            prompt="プロンプト" * 20,
+            content_md="# 見出し\n\n本文です。\n" * 200,
+            model="gpt-4o",
+            provider=LLMProvider.OPENAI,
+            category_id=category.id,
+            tags=["python", "fastapi", f"tag{i % 10}"],
+            summary="要約" * 10,
+            id=uuid4(),
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            category=category,
+        )
+        for i in range(count)
+    ]
+
+
+def current_path(entities: list[LLMResponse]) -> bytes:
+    """
+    従来の経路を再現します。
+
+    エンドポイント内でのモデル構築、FastAPIによる response_model での再検証、
+    JSON互換値へのダンプ、Starlette の JSONResponse と同じ json.dumps を行います。
+    """
+    adapter = TypeAdapter(LLMResponseListResponse)
+    content = LLMResponseListResponse(
+        items=entities, total=len(entities), skip=0, limit=ITEM_COUNT
+    )
+    validated = adapter.validate_python(content, from_attributes=True)
+    data = adapter.dump_python(validated, mode="json")
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def fast_path_orjson(entities: list[LLMResponse]) -> bytes:
+    """高速経路（orjson）"""
+    return serialization.orjson.dumps(
+        serialization.response_list_dict(entities, skip=0, limit=ITEM_COUNT)
+    )
+
+
+def fast_path_pydantic_core(entities: list[LLMResponse]) -> bytes:
+    """高速経路（pydantic-core の to_json）"""
+    return to_json(serialization.response_list_dict(entities, skip=0, limit=ITEM_COUNT))
+
+
+def main() -> None:
+    """各経路の実行時間を計測して表示します。"""
+    entities = make_entities(ITEM_COUNT)
+    paths = {
+        "current (pydantic validate + json)": current_path,
+        "fast (pydantic-core to_json)": fast_path_pydantic_core,
+    }
+    if serialization.orjson is not None:
+        paths["fast (orjson)"] = fast_path_orjson
+
+    # 出力内容が一致することを確認する
+    expected = json.loads(current_path(entities))
+    for name, path in paths.items():
+        assert json.loads(path(entities)) == expected, name
+
+    baseline = None
+    for name, path in paths.items():
+        best = min(timeit.repeat(lambda p=path: p(entities), number=1, repeat=REPEAT))
+        baseline = baseline or best
+        print(f"{name:40s} {best * 1000:8.2f} ms  x{baseline / best:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+SQLite エンジンプロファイルのベンチマーク
+
+複数ワーカーでの運用を想定して、読み取りプロセスと書き込みプロセスを
+同時に動かし、リポジトリ経由の `get_by_id` と `create` のスループット、
+読み取りのレイテンシを計測します。
+従来の設定（ロールバックジャーナル、synchronous=FULL、既定のキャッシュ、
+プール 5+10）と、既定のプロファイル（WAL、synchronous=NORMAL、mmap など）を
+比較します。
+
+設定はインポート時に読み込まれるため、プロファイルごとに環境変数を変えた
+子プロセスで計測します（スレッドでは GIL の切り替えが支配的になるため）。
+ジャーナルモードはデータベースファイルに保存されるため、プロファイルごとに
+別のファイルを使用します。
+
+実行方法:
+    uv run python -m benchmarks.bench_sqlite_profile
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROW_COUNT = 5_000
+READERS = 4
+WRITERS = 2
+DURATION_SECONDS = 10.0
+
+# 変更前の挙動を再現する設定
+BASELINE = {
+    "SQLITE_JOURNAL_MODE": "DELETE",
+    "SQLITE_SYNCHRONOUS": "FULL",
+    "SQLITE_MMAP_SIZE_BYTES": "0",
+    "SQLITE_CACHE_SIZE_KIB": "2000",
+    "SQLITE_TEMP_STORE": "DEFAULT",
+    "SQLITE_FOREIGN_KEYS": "false",
+    "DATABASE_POOL_SIZE": "5",
+    "DATABASE_MAX_OVERFLOW": "10",
+}
+
+PROFILES = (
+    ("baseline (rollback journal)", BASELINE),
+    ("tuned (WAL profile)        ", {}),
+)
+
+
+def seed() -> None:
+    """読み取り対象のLLM応答を投入します。"""
+    from sqlalchemy import insert
+
+    from app.infrastructure.db.base import SessionLocal, init_db
+    from app.infrastructure.db.models import LLMResponseORM
+
+    init_db()
+    rows = [
+        {
+            "id": response_id(i),
+            "title": f"title {i}",
+            "content_md": f"# 見出し {i}\n\n本文です。" * 20,
+            "model": "model",
+            "provider": "openai",
+            "tags": ["bench"],
+        }
+        for i in range(ROW_COUNT)
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(LLMResponseORM.__table__), rows)
+        db.commit()
+
+
+def response_id(index: int) -> str:
+    """投入するLLM応答のIDを返します。"""
+    return f"00000000-0000-4000-8000-{index:012d}"
+
+
+def read(index: int) -> dict[str, object]:
+    """IDを変えながら get_by_id を繰り返し、各回のレイテンシを返します。"""
+    from uuid import UUID
+
+    from app.infrastructure.db.base import SessionLocal
+    from app.infrastructure.repositories.llm_response_repository_impl import (
+        LLMResponseRepositoryImpl,
+    )
+
+    latencies: list[float] = []
+    errors = 0
+    position = index
+    stop_at = time.perf_counter() + DURATION_SECONDS
+    with SessionLocal() as db:
+        repository = LLMResponseRepositoryImpl(db)
+        while time.perf_counter() < stop_at:
+            position = (position + 7919) % ROW_COUNT
+            started = time.perf_counter()
+            try:
+                repository.get_by_id(UUID(response_id(position)))
+            except Exception:
+                errors += 1
+                continue
+            finally:
+                # 読み取りトランザクションを終えて共有ロックを解放する
+                db.rollback()
+            latencies.append(time.perf_counter() - started)
+    return {"latencies": latencies, "errors": errors}
+
+
+def write() -> dict[str, object]:
+    """LLM応答の作成を繰り返し、成功件数を返します。"""
+    from app.domain.models.llm_response import LLMProvider, LLMResponse
+    from app.infrastructure.db.base import SessionLocal
+    from app.infrastructure.repositories.llm_response_repository_impl import (
+        LLMResponseRepositoryImpl,
+    )
+
+    writes = 0
+    errors = 0
+    stop_at = time.perf_counter() + DURATION_SECONDS
+    with SessionLocal() as db:
+        repository = LLMResponseRepositoryImpl(db)
+        while time.perf_counter() < stop_at:
+            try:
+                repository.create(
+                    LLMResponse(
+                        title="written",
+                        prompt="prompt",
+                        content_md="# 書き込み\n\n本文です。" * 20,
+                        model="model",
+                        provider=LLMProvider.OPENAI,
+                        tags=["bench"],
+                    )
+                )
+                writes += 1
+            except Exception:
+                db.rollback()
+                errors += 1
+    return {"writes": writes, "errors": errors}
+
+
+def spawn(env: dict[str, str], *args: str) -> subprocess.Popen:
+    """このモジュールを子プロセスとして起動します。"""
+    return subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_sqlite_profile", *args],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def collect(process: subprocess.Popen) -> dict:
+    """子プロセスの終了を待ち、出力された結果を返します。"""
+    output, _ = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError("計測用の子プロセスが失敗しました")
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_profile(overrides: dict[str, str]) -> dict[str, float]:
+    """1つのプロファイルでデータを投入し、読み書きのプロセスを同時に動かします。"""
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_sqlite_profile_"))
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{work_dir / 'bench.db'}",
+        "STORAGE_PATH": str(work_dir / "storage"),
+        "APP_ENV": "production",
+        "JOB_WORKERS": "0",
+        **overrides,
+    }
+    collect(spawn(env, "--seed"))
+    readers = [spawn(env, "--read", str(i)) for i in range(READERS)]
+    writers = [spawn(env, "--write") for _ in range(WRITERS)]
+    read_results = [collect(process) for process in readers]
+    write_results = [collect(process) for process in writers]
+
+    latencies = sorted(
+        latency for result in read_results for latency in result["latencies"]
+    )
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "reads_per_second": len(latencies) / DURATION_SECONDS,
+        "writes_per_second": sum(r["writes"] for r in write_results) / DURATION_SECONDS,
+        "read_p50_ms": quantiles[49] * 1000,
+        "read_p99_ms": quantiles[98] * 1000,
+        "errors": sum(r["errors"] for r in read_results + write_results),
+    }
+
+
+def main() -> None:
+    print(
+        f"rows={ROW_COUNT}, reader processes={READERS}, "
+        f"writer processes={WRITERS}, duration={DURATION_SECONDS}s"
+    )
+    for label, overrides in PROFILES:
+        result = run_profile(overrides)
+        print(
+            f"{label}: reads={result['reads_per_second']:8.1f}/s  "
+            f"writes={result['writes_per_second']:6.1f}/s  "
+            f"read p50={result['read_p50_ms']:6.2f}ms  "
+            f"p99={result['read_p99_ms']:7.2f}ms  errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    if "--seed" in sys.argv:
+        seed()
+        print(json.dumps({}))
+    elif "--read" in sys.argv:
+        print(json.dumps(read(int(sys.argv[-1]))))
+    elif "--write" in sys.argv:
+        print(json.dumps(write()))
+    else:
+        main()
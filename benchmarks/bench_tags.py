@@ -0,0 +1,164 @@
+"""
+タグの統計テーブルのベンチマーク
+
+タグの一覧（使用数の多い順・最近使われた順）と前方一致の補完を、
+LLM応答の tags 列（JSON）を json_each で走査して集計する場合と、
+書き込み時に更新する tag_stats テーブルを読む場合とで比較します。
+あわせて、既存のLLM応答からの集計（初回の移行）と、書き込み時の
+更新（500件の一括作成1回分）にかかる時間を計測します。
+
+実行方法:
+    uv run python -m benchmarks.bench_tags
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_tags_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'bench.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+
+from sqlalchemy import (  # noqa: E402
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.domain.models.tag_stat import TagSortKey  # noqa: E402
+from app.infrastructure.db import models  # noqa: E402, F401  テーブル定義の登録
+from app.infrastructure.db.base import Base, engine  # noqa: E402
+from app.infrastructure.db.tag_stats_migration import migrate_tag_stats  # noqa: E402
+from app.infrastructure.repositories.tag_stat_repository_impl import (  # noqa: E402
+    TagStatRepositoryImpl,
+    update_tag_stats,
+)
+
+RESPONSE_COUNT = 100_000
+TAG_COUNT = 2_000
+TAGS_PER_RESPONSE = 4
+LIMIT = 50
+PREFIX = "topic-1"
+REPEAT = 5
+
+_RESPONSES = Base.metadata.tables["llm_responses"]
+
+
+def seed() -> None:
+    """使用数に偏りのあるタグを付けたLLM応答を投入します。"""
+    rng = random.Random(0)
+    vocabulary = [f"topic-{n}" for n in range(TAG_COUNT)]
+    # 少数のタグに使用が集中するよう、順位の逆数に比例して選ぶ
+    weights = [1 / (rank + 1) for rank in range(TAG_COUNT)]
+    started_at = datetime.now() - timedelta(days=365)
+    rows = []
+    for n in range(RESPONSE_COUNT):
+        created_at = started_at + timedelta(minutes=5 * n)
+        rows.append(
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "title": f"title {n}",
+                "content_md": "本文です。",
+                "model": "gpt-4o",
+                "provider": "openai",
+                "tags": sorted(
+                    set(rng.choices(vocabulary, weights, k=TAGS_PER_RESPONSE))
+                ),
+                "storage_location": "file",
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+    with engine.begin() as connection:
+        connection.execute(insert(_RESPONSES), rows)
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def timed(run) -> float:
+    """REPEAT 回実行し、1回あたりの平均時間（ミリ秒）を返します。"""
+    run()
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        run()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def main() -> None:
+    Base.metadata.create_all(engine)
+    seed()
+    print(
+        f"responses={RESPONSE_COUNT}, tags={TAG_COUNT}, "
+        f"tags/response<={TAGS_PER_RESPONSE}"
+    )
+
+    started = time.perf_counter()
+    migrate_tag_stats(engine)
+    print(f"initial build from tags column: {time.perf_counter() - started:.2f}s")
+
+    # tags 列を走査する集計（SQLite の json_each でタグごとに展開する）
+    tag = func.json_each(_RESPONSES.c.tags).table_valued("value")
+    scanned = (
+        select(
+            tag.c.value.label("tag"),
+            func.count().label("response_count"),
+            func.max(_RESPONSES.c.updated_at).label("last_used_at"),
+        )
+        .select_from(_RESPONSES)
+        .join(tag, true())
+    )
+    scans = {
+        "by count": scanned.group_by(tag.c.value)
+        .order_by(literal_column("response_count").desc())
+        .limit(LIMIT),
+        "by recency": scanned.group_by(tag.c.value)
+        .order_by(literal_column("last_used_at").desc())
+        .limit(LIMIT),
+        "prefix": scanned.where(tag.c.value.like(f"{PREFIX}%"))
+        .group_by(tag.c.value)
+        .order_by(literal_column("response_count").desc())
+        .limit(10),
+    }
+    with Session(engine) as db:
+        repository = TagStatRepositoryImpl(db)
+        stats = {
+            "by count": lambda: repository.list(TagSortKey.COUNT, limit=LIMIT),
+            "by recency": lambda: repository.list(TagSortKey.RECENT, limit=LIMIT),
+            "prefix": lambda: repository.search_prefix(PREFIX, limit=10),
+        }
+        for label, statement in scans.items():
+            scan_ms = timed(lambda statement=statement: db.execute(statement).all())
+            stats_ms = timed(stats[label])
+            print(
+                f"{label:10}: scan tags column={scan_ms:8.2f}ms  "
+                f"tag_stats={stats_ms:6.3f}ms"
+            )
+
+        # 会話の取り込み1回分（500件の一括作成）のタグの更新
+        rng = random.Random(1)
+        batch = [
+            name
+            for _ in range(500)
+            for name in {f"topic-{rng.randrange(TAG_COUNT)}" for _ in range(3)}
+        ]
+        started = time.perf_counter()
+        update_tag_stats(db, added=batch, removed=(), used_at=datetime.now())
+        elapsed = (time.perf_counter() - started) * 1000
+        db.rollback()
+        print(f"update for 500 created responses: {elapsed:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
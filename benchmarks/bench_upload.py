@@ -0,0 +1,159 @@
+"""
+本文のアップロードのベンチマーク
+
+大きな本文のLLM応答を、JSON の `POST /responses` と multipart/form-data の
+`POST /responses:upload` で作成し、1リクエストあたりのピークメモリの増分
+（プロセスの最大RSSの増分）と所要時間を比較します。
+リクエストボディはクライアント側で少しずつ生成して送信するため、
+計測値はサーバー側（アプリ）のメモリ使用量のみを反映します。
+
+最大RSSはプロセス内で減らないため、方式・サイズの組み合わせごとに
+別プロセスで計測します。
+
+実行方法:
+    uv run python -m benchmarks.bench_upload
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+SIZES_MB = (1, 8, 32)
+MODES = ("json", "upload")
+
+_LINE = "LLM の応答本文です。Markdown で書かれた説明が続きます。"
+_PIECE_BYTES = 64 * 1024
+_BOUNDARY = "bench-boundary"
+
+
+async def _markdown_body(size_bytes: int, newline: str) -> AsyncIterator[bytes]:
+    """
+    おおよそ size_bytes の本文を、64KiB ずつのバイト列として生成します。
+
+    newline には JSON 文字列に埋め込む場合はエスケープした改行を指定します。
+    """
+    line = (_LINE + newline).encode("utf-8")
+    piece = line * max(1, _PIECE_BYTES // len(line))
+    yield f"# 見出し{newline}".encode()
+    sent = 0
+    while sent < size_bytes:
+        yield piece
+        sent += len(piece)
+
+
+async def _json_body(size_bytes: int) -> AsyncIterator[bytes]:
+    """LLMResponseCreate の JSON を少しずつ生成します。"""
+    yield (
+        b'{"title": "bench", "prompt": "prompt", "model": "model", '
+        b'"provider": "openai", "summary": "bench", "content_md": "'
+    )
+    async for piece in _markdown_body(size_bytes, "\\n"):
+        yield piece
+    yield b'"}'
+
+
+async def _multipart_body(size_bytes: int) -> AsyncIterator[bytes]:
+    """アップロードの multipart/form-data を少しずつ生成します。"""
+    fields = {
+        "title": "bench",
+        "prompt": "prompt",
+        "model": "model",
+        "provider": "openai",
+        "summary": "bench",
+    }
+    for name, value in fields.items():
+        yield (
+            f"--{_BOUNDARY}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+    yield (
+        f"--{_BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="content"; filename="bench.md"\r\n'
+        "Content-Type: text/markdown\r\n\r\n"
+    ).encode()
+    async for piece in _markdown_body(size_bytes, "\n"):
+        yield piece
+    yield f"\r\n--{_BOUNDARY}--\r\n".encode()
+
+
+async def _send(client, mode: str, size_bytes: int) -> int:
+    """方式に応じたリクエストを1回送信し、ステータスコードを返します。"""
+    if mode == "json":
+        response = await client.post(
+            "/api/v1/responses",
+            content=_json_body(size_bytes),
+            headers={"Content-Type": "application/json"},
+        )
+    else:
+        response = await client.post(
+            "/api/v1/responses:upload",
+            content=_multipart_body(size_bytes),
+            headers={"Content-Type": f"multipart/form-data; boundary={_BOUNDARY}"},
+        )
+    return response.status_code
+
+
+def _max_rss_mb() -> float:
+    """プロセスの最大RSS（MiB）を返します。"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode: str, size_mb: int) -> None:
+    """1つの方式・サイズを計測し、結果を1行で出力します（子プロセスで実行）。"""
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_upload_"))
+    os.environ["DATABASE_URL"] = f"sqlite:///{work_dir / 'bench.db'}"
+    os.environ["STORAGE_PATH"] = str(work_dir / "storage")
+    os.environ["APP_ENV"] = "production"
+    os.environ["JOB_WORKERS"] = "0"
+    os.environ["UPLOAD_MAX_BYTES"] = str(1024 * 1024 * 1024)
+
+    import httpx
+
+    from app.infrastructure.db.base import init_db
+    from app.main import app
+
+    init_db()
+
+    async def run() -> tuple[float, float, int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=600
+        ) as client:
+            # 初回のインポートや接続確立の分を除くため、小さな本文で1回送る
+            await _send(client, mode, 64 * 1024)
+            baseline = _max_rss_mb()
+            started = time.perf_counter()
+            status_code = await _send(client, mode, size_mb * 1024 * 1024)
+            elapsed = time.perf_counter() - started
+        return _max_rss_mb() - baseline, elapsed, status_code
+
+    peak, elapsed, status_code = asyncio.run(run())
+    print(
+        f"{mode:6} {size_mb:3d} MiB: peak RSS +{peak:7.1f} MiB  "
+        f"{elapsed:6.2f}s  (status {status_code})"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], int(sys.argv[2]))
+        return
+    for size_mb in SIZES_MB:
+        for mode in MODES:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_upload", mode, str(size_mb)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+UUID キーの保存形式のベンチマーク
+
+同じデータを、ID を 36 文字の文字列で保存するスキーマ（従来）と、
+16 バイトの BinaryUUID で保存するスキーマ（現在）の2つの SQLite ファイルに
+投入し、主キー・外部キーのインデックスサイズ、ID による1件取得、
+カテゴリとの結合の速度を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_uuid_keys
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# 設定はインポート時に読み込まれるため、アプリのインポートより前に一時DBを指定する
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="bench_uuid_keys_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'binary.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+
+from sqlalchemy import (  # noqa: E402
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    create_engine,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine  # noqa: E402
+
+from app.infrastructure.db import models  # noqa: E402, F401  テーブル定義の登録
+from app.infrastructure.db.base import Base  # noqa: E402
+from app.infrastructure.db.uuid_migration import UUID_COLUMNS  # noqa: E402
+
+RESPONSE_COUNT = 200_000
+CATEGORY_COUNT = 1_000
+LOOKUPS = 20_000
+JOIN_REPEAT = 5
+
+
+def legacy_tables(legacy_engine: Engine) -> MetaData:
+    """UUID 列を String(36) にした従来のスキーマを作成します。"""
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        copied = table.to_metadata(metadata)
+        for table_name, column in UUID_COLUMNS:
+            if table_name == table.name:
+                copied.c[column].type = String(36)
+    metadata.create_all(legacy_engine)
+    return metadata
+
+
+def seed(target: Engine, tables: dict[str, Table], as_text: bool) -> list[uuid.UUID]:
+    """カテゴリとLLM応答を投入し、LLM応答のIDを返します。"""
+    rng = random.Random(0)
+    now = datetime.now()
+
+    def key(value: uuid.UUID) -> object:
+        return str(value) if as_text else value
+
+    category_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(CATEGORY_COUNT)]
+    response_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(RESPONSE_COUNT)]
+    with target.begin() as connection:
+        connection.execute(
+            insert(tables["categories"]),
+            [
+                {"id": key(i), "name": f"c{n}", "created_at": now, "updated_at": now}
+                for n, i in enumerate(category_ids)
+            ],
+        )
+        connection.execute(
+            insert(tables["llm_responses"]),
+            [
+                {
+                    "id": key(i),
+                    "title": f"title {n}",
+                    "content_md": "本文です。" * 20,
+                    "model": "model",
+                    "provider": "openai",
+                    "category_id": key(category_ids[n % CATEGORY_COUNT]),
+                    "tags": ["bench"],
+                    "storage_location": "file",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for n, i in enumerate(response_ids)
+            ],
+        )
+    return response_ids
+
+
+def index_sizes(target: Engine) -> dict[str, int]:
+    """llm_responses のインデックスごとのサイズ（バイト）を返します。"""
+    with target.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT name, SUM(pgsize) FROM dbstat "
+                "WHERE name IN (SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'llm_responses') "
+                "GROUP BY name"
+            )
+        )
+        return {name: size for name, size in rows}
+
+
+def measure(
+    target: Engine, tables: dict[str, Table], ids: list[uuid.UUID], as_text: bool
+) -> dict[str, float]:
+    """ID による1件取得と、カテゴリとの結合の所要時間を計測します。"""
+    responses = tables["llm_responses"]
+    categories = tables["categories"]
+    sample = random.Random(1).choices(ids, k=LOOKUPS)
+    by_id = select(responses).where(responses.c.id == bindparam("response_id"))
+
+    with target.connect() as connection:
+        started = time.perf_counter()
+        for response_id in sample:
+            row = connection.execute(
+                by_id,
+                {"response_id": str(response_id) if as_text else response_id},
+            ).one()
+            # 従来のスキーマではドメインモデルへの変換時に UUID を生成していた
+            if as_text:
+                uuid.UUID(row.id)
+        lookup_seconds = time.perf_counter() - started
+
+        join = (
+            select(categories.c.name, func.count())
+            .select_from(responses)
+            .join(categories, responses.c.category_id == categories.c.id)
+            .group_by(categories.c.name)
+        )
+        started = time.perf_counter()
+        for _ in range(JOIN_REPEAT):
+            connection.execute(join).all()
+        join_seconds = (time.perf_counter() - started) / JOIN_REPEAT
+
+    return {
+        "lookup_us": lookup_seconds / LOOKUPS * 1_000_000,
+        "join_ms": join_seconds * 1000,
+    }
+
+
+def main() -> None:
+    # アプリのエンジンに登録されたイベント（クエリ期限など）の影響を受けないよう、
+    # どちらも素のエンジンで計測する
+    legacy_engine = create_engine(f"sqlite:///{_WORK_DIR / 'text.db'}")
+    legacy = legacy_tables(legacy_engine)
+    binary_engine = create_engine(f"sqlite:///{_WORK_DIR / 'binary.db'}")
+    Base.metadata.create_all(binary_engine)
+
+    scenarios = (
+        ("String(36)", legacy_engine, legacy.tables, True),
+        ("BinaryUUID", binary_engine, Base.metadata.tables, False),
+    )
+    print(f"responses={RESPONSE_COUNT}, categories={CATEGORY_COUNT}, lookups={LOOKUPS}")
+    for label, target, tables, as_text in scenarios:
+        ids = seed(target, tables, as_text)
+        with target.connect() as connection:
+            connection.execute(text("ANALYZE"))
+        sizes = index_sizes(target)
+        timings = measure(target, tables, ids, as_text)
+        size_text = "  ".join(
+            f"{name}={size / 1024 / 1024:.2f}MiB"
+            for name, size in sorted(sizes.items())
+        )
+        print(
+            f"{label}: {size_text}  lookup={timings['lookup_us']:.1f}us  "
+            f"join={timings['join_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+テスト共通の設定とフィクスチャ
+
+設定はインポート時に読み込まれるため、アプリのインポートより前に
+一時ディレクトリのDBとストレージを指定します。
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="llmoonclip_tests_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_WORK_DIR / 'test.db'}"
+os.environ["STORAGE_PATH"] = str(_WORK_DIR / "storage")
+os.environ["APP_ENV"] = "production"
+os.environ["JOB_WORKERS"] = "0"
+os.environ["DATABASE_ASYNC"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+
+from app.infrastructure.cache.category_cache import category_cache  # noqa: E402
+from app.infrastructure.db.base import Base, SessionLocal, engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+# 初版のスキーマ（ID を 36 文字の文字列、プロンプトをLLM応答ごとに保存していた）
+BASELINE_SCHEMA = (
+    """
+    CREATE TABLE categories (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        description TEXT,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE llm_responses (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        title VARCHAR(255) NOT NULL,
+        prompt TEXT NOT NULL,
+        content_md TEXT NOT NULL,
+        model VARCHAR(100) NOT NULL,
+        provider VARCHAR(50) NOT NULL,
+        category_id VARCHAR(36) REFERENCES categories (id),
+        tags JSON NOT NULL,
+        summary TEXT,
+        storage_location VARCHAR(50) NOT NULL,
+        storage_path VARCHAR(500),
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )
+    """,
+)
+
+# 変更バージョンはプロセス内の確認済みの値と比較されるため、
+# テストごとに消さずに単調増加させる
+_KEPT_TABLES = frozenset({"change_versions"})
+
+
+@pytest.fixture(scope="session")
+def work_dir() -> Path:
+    """テスト用の一時ディレクトリを返します。"""
+    return _WORK_DIR
+
+
+@pytest.fixture(scope="session")
+def _schema() -> None:
+    """テスト用DBのテーブルを1回だけ作成します。"""
+    init_db()
+
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    """初版のスキーマで作成した SQLite データベースのエンジンを返します。"""
+    baseline = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with baseline.begin() as connection:
+        for statement in BASELINE_SCHEMA:
+            connection.exec_driver_sql(statement)
+    yield baseline
+    baseline.dispose()
+
+
+@pytest.fixture
+def database(_schema) -> None:
+    """すべてのテーブルの行を削除し、空のデータベースを用意します。"""
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            if table.name not in _KEPT_TABLES:
+                connection.execute(table.delete())
+    category_cache.invalidate()
+
+
+@pytest.fixture
+def db(database):
+    """空のデータベースに接続したセッションを返します。"""
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def client(database):
+    """空のデータベースを使うテストクライアントを返します。"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def create_response(client):
+    """API でLLM応答を作成し、レスポンスのJSONを返す関数を返します。"""
+
+    def create(**overrides) -> dict:
+        payload = {
+            "title": "タイトル",
+            "prompt": "プロンプト",
+            "content_md": "本文です。",
+            "model": "gpt-4o",
+            "provider": "openai",
+            **overrides,
+        }
+        response = client.post("/api/v1/responses", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
@@ -0,0 +1,119 @@
+"""
+LLM応答アップロードユースケース（非同期版）のテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from app.application.use_cases.upload_response import AsyncUploadResponseUseCase
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.models.stored_content import StoredContent
+from app.domain.ports.content_storage import ContentStorage, ContentWriter
+from app.domain.services.content_chunker import split_into_chunks
+from app.domain.services.content_stats import compute_content_stats
+from app.infrastructure.storage.file_content_storage import content_storage
+
+CONTENT = "# 見出し\n\n段落です。\n\n## 小見出し\n\n```python\nprint(1)\n```\n"
+
+
+class RecordingStorage(ContentStorage):
+    """本文ストレージの読み出し・削除を行ったスレッドを記録する本文ストレージ"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+
+    def open_writer(self, max_bytes: int) -> ContentWriter:
+        return content_storage.open_writer(max_bytes)
+
+    def iter_lines(self, path: str) -> Iterator[str]:
+        for line in content_storage.iter_lines(path):
+            self.calls.append(("iter_lines", threading.get_ident()))
+            yield line
+
+    def read_text(self, path: str) -> str:
+        self.calls.append(("read_text", threading.get_ident()))
+        return content_storage.read_text(path)
+
+    def delete(self, path: str) -> None:
+        self.calls.append(("delete", threading.get_ident()))
+        content_storage.delete(path)
+
+
+class RecordingRepository:
+    """作成を記録する（または失敗する）非同期LLM応答リポジトリ"""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.created: list[LLMResponse] = []
+
+    async def create(self, response: LLMResponse) -> LLMResponse:
+        if self.error is not None:
+            raise self.error
+        self.created.append(response)
+        return response
+
+
+def _store() -> StoredContent:
+    with content_storage.open_writer(1024 * 1024) as writer:
+        writer.write(CONTENT.encode())
+        return writer.commit()
+
+
+def _execute(repository: RecordingRepository, storage: RecordingStorage, stored):
+    async def run():
+        use_case = AsyncUploadResponseUseCase(repository, storage)
+        result = await use_case.execute(
+            stored,
+            title="アップロード",
+            prompt="プロンプト",
+            model="gpt-4o",
+            provider=LLMProvider.OPENAI,
+        )
+        return result, threading.get_ident()
+
+    return asyncio.run(run())
+
+
+def test_reads_stored_content_outside_event_loop():
+    storage = RecordingStorage()
+    repository = RecordingRepository()
+    stored = _store()
+
+    created, loop_thread = _execute(repository, storage, stored)
+
+    assert created.storage_path == stored.path
+    assert created.stats == compute_content_stats(CONTENT)
+    # チャンクは保存前にリストにしてあり、保存時に本文ストレージを読まない
+    assert created.chunks == split_into_chunks(CONTENT)
+    assert storage.calls
+    assert all(thread != loop_thread for _, thread in storage.calls)
+    content_storage.delete(stored.path)
+
+
+def test_deletes_stored_content_outside_event_loop_on_failure():
+    storage = RecordingStorage()
+    stored = _store()
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await AsyncUploadResponseUseCase(
+                RecordingRepository(RuntimeError("失敗")), storage
+            ).execute(
+                stored,
+                title="アップロード",
+                prompt="プロンプト",
+                model="gpt-4o",
+                provider=LLMProvider.OPENAI,
+            )
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert storage.calls[-1][0] == "delete"
+    assert all(thread != loop_thread for _, thread in storage.calls)
+    assert not content_storage.local_path(stored.path).exists()
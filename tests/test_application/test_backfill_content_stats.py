@@ -0,0 +1,71 @@
+"""
+本文の統計情報バックフィルユースケースのテスト
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from app.application.use_cases.backfill_content_stats import (
+    BackfillContentStatsUseCase,
+)
+from app.application.use_cases.upload_response import UploadResponseUseCase
+from app.domain.models.content_stats import ContentStats
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.services.content_stats import compute_content_stats
+from app.infrastructure.db.models import LLMResponseORM
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.storage.file_content_storage import content_storage
+
+_TABLE = LLMResponseORM.__table__
+
+STORED = "# 保存された本文\n\n```python\nprint(1)\n```\n\n段落です。\n"
+
+
+def _clear_stats(db) -> None:
+    db.execute(
+        update(_TABLE).values(
+            {name: None for name in ContentStats.__dataclass_fields__}
+        )
+    )
+    db.commit()
+
+
+def test_backfill_reads_stored_content(db):
+    repository = LLMResponseRepositoryImpl(db)
+    with content_storage.open_writer(1024 * 1024) as writer:
+        writer.write(STORED.encode())
+        stored = writer.commit()
+    uploaded = UploadResponseUseCase(repository, content_storage).execute(
+        stored,
+        title="アップロード",
+        prompt="プロンプト",
+        model="gpt-4o",
+        provider=LLMProvider.OPENAI,
+    )
+    inline = repository.create(
+        LLMResponse(
+            title="DB",
+            prompt="プロンプト",
+            content_md="DBの本文です。",
+            model="gpt-4o",
+            provider=LLMProvider.OPENAI,
+        )
+    )
+    _clear_stats(db)
+
+    assert dict(repository.list_missing_stats()) == {
+        uploaded.id: STORED,
+        inline.id: "DBの本文です。",
+    }
+
+    updated = BackfillContentStatsUseCase(repository).execute(batch_size=1)
+
+    assert updated == 2
+    assert repository.list_missing_stats() == []
+    assert repository.get_by_id(uploaded.id).stats == compute_content_stats(STORED)
+    assert repository.get_by_id(inline.id).stats == compute_content_stats(
+        "DBの本文です。"
+    )
@@ -0,0 +1,142 @@
+"""
+会話エクスポートの取り込みユースケースのテスト
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from app.application.use_cases.import_conversations import ImportConversationsUseCase
+from app.domain.models.conversation_import import ExportFormat, ImportStatus
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.ports.conversation_export import ConversationExportError
+from app.domain.services.content_hash import compute_content_hash
+from app.infrastructure.importers.conversation_export_reader import (
+    JsonConversationExportReader,
+)
+from app.infrastructure.repositories.conversation_import_repository_impl import (
+    ConversationImportRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+
+def _conversation(name: str, *answers: str) -> dict:
+    messages = []
+    for answer in answers:
+        messages.append({"sender": "human", "text": f"{name}の質問"})
+        messages.append({"sender": "assistant", "text": answer})
+    return {"name": name, "chat_messages": messages}
+
+
+CONVERSATIONS = [
+    _conversation("会話1", "回答A", "回答B"),
+    _conversation("会話2", "回答A", "回答C"),
+    _conversation("会話3", "既存の回答"),
+    _conversation("会話4", "回答D"),
+]
+
+
+@pytest.fixture
+def export_path(tmp_path) -> str:
+    path = tmp_path / "conversations.json"
+    path.write_text(json.dumps(CONVERSATIONS, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def use_case(db) -> ImportConversationsUseCase:
+    return ImportConversationsUseCase(
+        LLMResponseRepositoryImpl(db),
+        ConversationImportRepositoryImpl(db),
+        JsonConversationExportReader(read_bytes=16),
+    )
+
+
+def _contents(db) -> list[str]:
+    return sorted(
+        response.content_md for response in LLMResponseRepositoryImpl(db).list()
+    )
+
+
+def test_imports_turns_and_skips_duplicates(db, use_case, export_path):
+    LLMResponseRepositoryImpl(db).create(
+        LLMResponse(
+            title="既存",
+            prompt="プロンプト",
+            content_md="既存の回答",
+            model="claude",
+            provider=LLMProvider.ANTHROPIC,
+            content_hash=compute_content_hash("既存の回答"),
+        )
+    )
+    run = use_case.start(export_path, 100, tags=["imported"])
+
+    completed = use_case.execute(run, batch_size=2)
+
+    assert completed.status is ImportStatus.COMPLETED
+    assert completed.format is ExportFormat.CLAUDE
+    assert completed.progress == 1.0
+    assert completed.conversation_count == 4
+    assert completed.imported_count == 4
+    # 先の会話と同じ本文（回答A）と、既存のLLM応答と同じ本文
+    assert completed.duplicate_count == 2
+    assert _contents(db) == sorted(["回答A", "回答B", "回答C", "回答D", "既存の回答"])
+    imported = [
+        response
+        for response in LLMResponseRepositoryImpl(db).list()
+        if response.content_md == "回答D"
+    ]
+    assert imported[0].tags == ["imported"]
+    assert imported[0].prompt == "会話4の質問"
+
+
+def test_resumes_from_recorded_offset(db, use_case, export_path):
+    run = use_case.start(export_path, 100, export_format=ExportFormat.CLAUDE)
+    progress = []
+
+    # 最初のバッチを保存した時点で中断する
+    paused = use_case.execute(
+        run, batch_size=1, max_seconds=0, on_progress=progress.append
+    )
+
+    assert paused.status is ImportStatus.RUNNING
+    assert paused.conversation_count == 1
+    assert 0 < paused.byte_offset < os.path.getsize(export_path)
+    assert _contents(db) == ["回答A", "回答B"]
+    assert len(progress) == 1
+
+    # 同じファイルの取り込みは、登録済みのものを再開する
+    resumed = use_case.start(export_path, 100)
+    assert resumed.id == run.id
+    completed = use_case.execute(resumed, batch_size=1)
+
+    assert completed.status is ImportStatus.COMPLETED
+    assert completed.conversation_count == 4
+    assert completed.imported_count == 5
+    assert _contents(db) == ["回答A", "回答B", "回答C", "回答D", "既存の回答"]
+
+
+def test_start_without_resume_registers_new_import(use_case, export_path):
+    first = use_case.start(export_path, 100, queued=True)
+    second = use_case.start(export_path, 100, queued=True, resume=False)
+
+    assert first.status is ImportStatus.QUEUED
+    assert second.id != first.id
+
+
+def test_broken_export_marks_import_failed(db, use_case, tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"chat_messages": []}, {"chat_messages": ', encoding="utf-8")
+    run = use_case.start(str(path), 100, export_format=ExportFormat.CLAUDE)
+
+    with pytest.raises(ConversationExportError):
+        use_case.execute(run)
+
+    stored = ConversationImportRepositoryImpl(db).get_by_id(run.id)
+    assert stored.status is ImportStatus.FAILED
+    assert stored.last_error.startswith("ConversationExportError")
@@ -0,0 +1,121 @@
+"""
+LLM応答要約ユースケースのテスト
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import select
+
+from app.application.use_cases.create_response import CreateResponseUseCase
+from app.application.use_cases.summarize_response import SummarizeResponseUseCase
+from app.application.use_cases.update_response import UpdateResponseUseCase
+from app.domain.models.llm_response import LLMProvider, SummarySource
+from app.domain.ports.summarizer import Summarizer
+from app.infrastructure.db.models import JobORM
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.presentation.jobs import SUMMARIZE_JOB
+
+
+class _FirstLineSummarizer(Summarizer):
+    """本文の1行目を要約とするサマライザー"""
+
+    def summarize(self, content_md: str) -> str:
+        return content_md.splitlines()[0]
+
+    def summarize_many(self, contents: Sequence[str]) -> list[str]:
+        return [self.summarize(content) for content in contents]
+
+
+def _create(repository: LLMResponseRepositoryImpl, summary: str | None = None):
+    return CreateResponseUseCase(repository).execute(
+        title="タイトル",
+        prompt="プロンプト",
+        content_md="最初の本文\n続き",
+        model="gpt-4o",
+        provider=LLMProvider.OPENAI,
+        summary=summary,
+    )
+
+
+def _pending_summarize_jobs(db, response_id) -> int:
+    jobs = db.execute(
+        select(JobORM.payload).where(
+            JobORM.kind == SUMMARIZE_JOB, JobORM.status == "queued"
+        )
+    ).scalars()
+    return sum(payload["response_id"] == str(response_id) for payload in jobs)
+
+
+def test_summary_is_generated_and_marked_auto(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = _create(repository)
+
+    assert SummarizeResponseUseCase(repository, _FirstLineSummarizer()).execute(
+        response.id
+    )
+
+    stored = repository.get_by_id(response.id)
+    assert stored.summary == "最初の本文"
+    assert stored.summary_source is SummarySource.AUTO
+
+
+def test_content_update_regenerates_auto_summary(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = _create(repository)
+    summarize = SummarizeResponseUseCase(repository, _FirstLineSummarizer())
+    summarize.execute(response.id)
+    db.execute(JobORM.__table__.delete())
+    db.commit()
+
+    updated = UpdateResponseUseCase(repository).execute(
+        response.id, content_md="書き換えた本文\n続き"
+    )
+
+    assert updated.summary is None
+    assert repository.get_by_id(response.id).summary is None
+    assert _pending_summarize_jobs(db, response.id) == 1
+    assert summarize.execute(response.id)
+    assert repository.get_by_id(response.id).summary == "書き換えた本文"
+
+
+def test_content_update_keeps_user_summary(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = _create(repository, summary="利用者の要約")
+    db.execute(JobORM.__table__.delete())
+    db.commit()
+
+    UpdateResponseUseCase(repository).execute(response.id, content_md="別の本文")
+
+    stored = repository.get_by_id(response.id)
+    assert stored.summary == "利用者の要約"
+    assert stored.summary_source is SummarySource.USER
+    assert _pending_summarize_jobs(db, response.id) == 0
+
+
+def test_summary_of_outdated_content_is_not_stored(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = _create(repository)
+
+    # 要約の生成中に本文が更新された場合
+    assert not repository.set_summary_if_empty(
+        response.id, "古い要約", content_hash="0" * 64
+    )
+    assert repository.get_by_id(response.id).summary is None
+
+
+def test_execute_many_skips_responses_with_summary(db):
+    repository = LLMResponseRepositoryImpl(db)
+    pending = _create(repository)
+    summarized = _create(repository, summary="利用者の要約")
+
+    updated = SummarizeResponseUseCase(repository, _FirstLineSummarizer()).execute_many(
+        [pending.id, summarized.id]
+    )
+
+    assert updated == 1
+    assert repository.get_by_id(pending.id).summary == "最初の本文"
+    assert repository.get_by_id(summarized.id).summary == "利用者の要約"
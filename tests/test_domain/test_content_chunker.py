@@ -0,0 +1,115 @@
+"""
+本文のチャンク分割のテスト
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.domain.services.content_chunker import (
+    iter_chunks,
+    make_snippet,
+    split_into_chunks,
+)
+
+
+def _assert_covers(content: str, chunks) -> None:
+    """チャンクが本文を先頭から隙間なく覆っていることを確認します。"""
+    assert "".join(chunk.content for chunk in chunks) == content
+    assert [chunk.position for chunk in chunks] == list(range(len(chunks)))
+    offset = 0
+    for chunk in chunks:
+        assert chunk.start_offset == offset
+        assert content[chunk.start_offset : chunk.end_offset] == chunk.content
+        offset = chunk.end_offset
+    assert offset == len(content)
+
+
+def test_empty_content_has_no_chunks():
+    assert split_into_chunks("") == []
+
+
+def test_splits_at_headings():
+    content = "前置きです。\n\n# 概要\n\n本文1\n\n## 詳細 ##\n本文2\n"
+
+    chunks = split_into_chunks(content)
+
+    _assert_covers(content, chunks)
+    assert [(chunk.heading, chunk.heading_level) for chunk in chunks] == [
+        (None, None),
+        ("概要", 1),
+        ("詳細", 2),
+    ]
+    assert chunks[1].content == "# 概要\n\n本文1\n\n"
+
+
+def test_headings_inside_code_blocks_are_ignored():
+    content = "# 見出し\n\n```markdown\n# コメント\n~~~\n```\n\n後の段落\n"
+
+    chunks = split_into_chunks(content)
+
+    _assert_covers(content, chunks)
+    assert len(chunks) == 1
+    assert chunks[0].heading == "見出し"
+
+
+def test_code_block_longer_than_max_chars_is_not_split():
+    code = "```python\n" + "x = 1\n" * 50 + "```\n"
+    content = "# コード\n\n" + "段落\n\n" + code + "\n後の段落\n"
+
+    chunks = split_into_chunks(content, max_chars=40)
+
+    _assert_covers(content, chunks)
+    assert code in [chunk.content for chunk in chunks]
+    assert all(chunk.heading == "コード" for chunk in chunks)
+
+
+def test_long_sections_continue_under_the_same_heading():
+    paragraphs = [f"段落{n}。" * 5 + "\n\n" for n in range(6)]
+    content = "## 長いセクション\n\n" + "".join(paragraphs)
+
+    chunks = split_into_chunks(content, max_chars=60)
+
+    _assert_covers(content, chunks)
+    assert len(chunks) > 1
+    assert all(chunk.heading == "長いセクション" for chunk in chunks)
+    assert all(chunk.heading_level == 2 for chunk in chunks)
+    # 見出しだけのチャンクは作らない
+    assert chunks[0].content.startswith("## 長いセクション\n\n段落0")
+
+
+def test_long_lines_are_split_by_characters():
+    content = "a" * 250 + "\n"
+
+    chunks = split_into_chunks(content, max_chars=100)
+
+    _assert_covers(content, chunks)
+    assert all(len(chunk.content) <= 100 for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "本文のみ\n",
+        "# A\r\n本文\r\n\r\n## B\r\n```\r\ncode\r\n```\r\n",
+        "# 閉じないコードブロック\n\n```\ncode\n",
+        "#見出しではない\n\n####### 7 レベル\n",
+    ],
+)
+def test_iter_chunks_matches_split_into_chunks(content):
+    chunks = split_into_chunks(content)
+
+    _assert_covers(content, chunks)
+    assert list(iter_chunks(content.splitlines(keepends=True))) == chunks
+
+
+def test_make_snippet_centers_query():
+    text = "前" * 100 + "検索語" + "後" * 100
+
+    snippet = make_snippet(text, "検索語", width=21)
+
+    assert snippet == "…" + "前" * 9 + "検索語" + "後" * 9 + "…"
+
+
+def test_make_snippet_without_match_starts_at_beginning():
+    assert make_snippet("短い  本文\nです", "なし") == "短い 本文 です"
@@ -0,0 +1,54 @@
+"""
+本文の差分（compute_delta / apply_delta）のテスト
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.domain.services.content_delta import apply_delta, compute_delta
+
+BASE = "# 見出し\n\n1行目\n2行目\n3行目\n"
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        BASE,
+        "",
+        "# 見出し\n\n1行目\n追加した行\n2行目\n3行目\n",
+        "# 見出し\n\n1行目\n3行目\n",
+        "# 新しい見出し\n\n1行目\n2行目\n3行目\n4行目\n",
+        "# 見出し\n\n1行目\n2行目\n3行目",
+        "まったく別の本文\r\nCRLF の行\r\n",
+    ],
+    ids=["same", "empty", "insert", "delete", "replace", "no-newline", "rewrite"],
+)
+def test_apply_delta_restores_target(target):
+    delta = compute_delta(BASE, target)
+
+    assert apply_delta(BASE, delta) == target
+
+
+def test_delta_from_empty_base():
+    assert apply_delta("", compute_delta("", BASE)) == BASE
+
+
+def test_unchanged_lines_are_copied_by_range():
+    assert compute_delta(BASE, BASE) == [[0, 5]]
+
+
+def test_deleted_lines_are_not_stored():
+    delta = compute_delta(BASE, "# 見出し\n\n1行目\n3行目\n")
+
+    assert delta == [[0, 3], [4, 5]]
+
+
+def test_only_inserted_text_is_stored():
+    target = "# 見出し\n\n1行目\n追加した行\n2行目\n3行目\n"
+
+    delta = compute_delta(BASE, target)
+
+    assert [operation for operation in delta if isinstance(operation, str)] == [
+        "追加した行\n"
+    ]
@@ -0,0 +1,60 @@
+"""
+LLM応答エンティティのテスト
+"""
+
+from __future__ import annotations
+
+from app.domain.models.llm_response import LLMProvider, LLMResponse, SummarySource
+
+
+def _response(**overrides) -> LLMResponse:
+    values = {
+        "title": "タイトル",
+        "prompt": "プロンプト",
+        "content_md": "本文です。",
+        "model": "gpt-4o",
+        "provider": LLMProvider.OPENAI,
+    }
+    values.update(overrides)
+    return LLMResponse(**values)
+
+
+def test_summary_given_at_creation_is_user_supplied():
+    assert _response(summary="要約").summary_source is SummarySource.USER
+    assert _response().summary_source is None
+
+
+def test_content_change_discards_auto_summary():
+    response = _response(summary="古い要約", summary_source=SummarySource.AUTO)
+
+    response.update(content_md="新しい本文です。")
+
+    assert response.summary is None
+    assert response.summary_source is None
+
+
+def test_content_change_keeps_user_summary():
+    response = _response(summary="利用者の要約")
+
+    response.update(content_md="新しい本文です。")
+
+    assert response.summary == "利用者の要約"
+    assert response.summary_source is SummarySource.USER
+
+
+def test_metadata_change_keeps_auto_summary():
+    response = _response(summary="要約", summary_source=SummarySource.AUTO)
+
+    response.update(title="新しいタイトル", tags=["web"], content_md="本文です。")
+
+    assert response.summary == "要約"
+    assert response.summary_source is SummarySource.AUTO
+
+
+def test_summary_given_with_content_change_replaces_auto_summary():
+    response = _response(summary="古い要約", summary_source=SummarySource.AUTO)
+
+    response.update(content_md="新しい本文です。", summary="新しい要約")
+
+    assert response.summary == "新しい要約"
+    assert response.summary_source is SummarySource.USER
@@ -0,0 +1,175 @@
+"""
+非同期LLM応答リポジトリのテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+from app.application.use_cases.upload_response import UploadResponseUseCase
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.ports.content_storage import ContentStorage, ContentWriter
+from app.infrastructure.db.async_base import AsyncSessionLocal, async_engine
+from app.infrastructure.repositories.async_llm_response_repository_impl import (
+    AsyncLLMResponseRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.repositories.response_revision_repository_impl import (
+    ResponseRevisionRepositoryImpl,
+)
+from app.infrastructure.storage.file_content_storage import content_storage
+
+CONTENT = "# 見出し\n\n本文ストレージの本文です。\n"
+
+
+class RecordingStorage(ContentStorage):
+    """読み出し・削除を行ったスレッドを記録する本文ストレージ"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, int]] = []
+
+    def open_writer(self, max_bytes: int) -> ContentWriter:
+        return content_storage.open_writer(max_bytes)
+
+    def iter_lines(self, path: str) -> Iterator[str]:
+        return content_storage.iter_lines(path)
+
+    def read_text(self, path: str) -> str:
+        self.calls.append(("read_text", path, threading.get_ident()))
+        return content_storage.read_text(path)
+
+    def delete(self, path: str) -> None:
+        self.calls.append(("delete", path, threading.get_ident()))
+        content_storage.delete(path)
+
+
+def _upload(db) -> LLMResponse:
+    with content_storage.open_writer(1024 * 1024) as writer:
+        writer.write(CONTENT.encode())
+        stored = writer.commit()
+    return UploadResponseUseCase(
+        LLMResponseRepositoryImpl(db), content_storage
+    ).execute(
+        stored,
+        title="アップロード",
+        prompt="プロンプト",
+        model="gpt-4o",
+        provider=LLMProvider.OPENAI,
+    )
+
+
+def _run(operation):
+    """非同期リポジトリで操作を実行し、結果とイベントループのスレッドを返します。"""
+
+    async def run():
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncLLMResponseRepositoryImpl(db, storage)
+                return await operation(repository), threading.get_ident()
+        finally:
+            await async_engine.dispose()
+
+    storage = RecordingStorage()
+    result, loop_thread = asyncio.run(run())
+    return result, loop_thread, storage.calls
+
+
+def test_reads_stored_content_outside_event_loop(db):
+    uploaded = _upload(db)
+    inline = LLMResponseRepositoryImpl(db).create(
+        LLMResponse(
+            title="DB",
+            prompt="プロンプト",
+            content_md="DBの本文です。",
+            model="gpt-4o",
+            provider=LLMProvider.OPENAI,
+        )
+    )
+
+    async def operation(repository):
+        return (
+            await repository.get_by_id(uploaded.id),
+            await repository.get_many([uploaded.id, inline.id]),
+            await repository.get_projection(uploaded.id, ["content_md"]),
+            await repository.list(),
+        )
+
+    (fetched, many, projection, listed), loop_thread, calls = _run(operation)
+
+    assert fetched.content_md == CONTENT
+    assert many[uploaded.id].content_md == CONTENT
+    assert many[inline.id].content_md == "DBの本文です。"
+    # 本文を読み出すためのパスは、要求されたフィールドに含めない
+    assert projection == {"id": uploaded.id, "content_md": CONTENT}
+    assert {response.content_md for response in listed} == {CONTENT, "DBの本文です。"}
+    # 一度読み込んだ本文は読み直さない
+    assert [call[:2] for call in calls] == [("read_text", uploaded.storage_path)]
+    assert all(thread != loop_thread for *_, thread in calls)
+
+
+def test_update_deletes_stored_content_outside_event_loop(db):
+    uploaded = _upload(db)
+
+    async def operation(repository):
+        response = await repository.get_by_id(uploaded.id)
+        response.update(content_md="新しい本文です。")
+        return await repository.update(response)
+
+    updated, loop_thread, calls = _run(operation)
+
+    assert updated.content_md == "新しい本文です。"
+    assert [call[:2] for call in calls] == [
+        ("read_text", uploaded.storage_path),
+        ("delete", uploaded.storage_path),
+    ]
+    assert all(thread != loop_thread for *_, thread in calls)
+    fetched = LLMResponseRepositoryImpl(db).get_by_id(uploaded.id)
+    assert fetched.content_md == "新しい本文です。"
+    assert fetched.storage_path is None
+
+
+def test_projections_keep_requested_storage_path(db):
+    uploaded = _upload(db)
+
+    async def operation(repository):
+        return (
+            await repository.search_projection(["content_md", "storage_path"]),
+            await repository.get_many_projection([uploaded.id], ["title"]),
+        )
+
+    (searched, titles), _, calls = _run(operation)
+
+    assert searched == [
+        {
+            "id": uploaded.id,
+            "content_md": CONTENT,
+            "storage_path": uploaded.storage_path,
+        }
+    ]
+    assert titles == {uploaded.id: {"id": uploaded.id, "title": "アップロード"}}
+    assert [call[:2] for call in calls] == [("read_text", uploaded.storage_path)]
+
+
+def test_update_reads_previous_content_outside_event_loop(db):
+    uploaded = _upload(db)
+    response = LLMResponseRepositoryImpl(db).get_by_id(uploaded.id)
+    response.update(content_md="新しい本文です。")
+
+    async def operation(repository):
+        # このリポジトリでは更新前の本文をまだ読み込んでいない
+        return await repository.update(response)
+
+    _, loop_thread, calls = _run(operation)
+
+    assert [call[:2] for call in calls] == [
+        ("read_text", uploaded.storage_path),
+        ("delete", uploaded.storage_path),
+    ]
+    assert all(thread != loop_thread for *_, thread in calls)
+    revisions = ResponseRevisionRepositoryImpl(db).list(uploaded.id)
+    assert [revision.number for revision in revisions] == [1, 2]
+    assert ResponseRevisionRepositoryImpl(db).get(uploaded.id, 1).content == CONTENT
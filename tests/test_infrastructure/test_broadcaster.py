@@ -0,0 +1,117 @@
+"""
+変更通知ブロードキャスターのテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from app.infrastructure.events.broadcaster import ChangeBroadcaster
+
+
+@dataclass
+class _Notification:
+    seq: int
+
+
+class _Feed:
+    """メモリ上の変更フィード（latest_seq の呼び出し回数を数える）"""
+
+    def __init__(self) -> None:
+        self.notifications: list[_Notification] = []
+        self.latest_seq_calls = 0
+        self._lock = threading.Lock()
+
+    def add(self, seq: int) -> None:
+        with self._lock:
+            self.notifications.append(_Notification(seq))
+
+    def load(self, since: int, limit: int) -> list[_Notification]:
+        with self._lock:
+            return [n for n in self.notifications if n.seq > since][:limit]
+
+    def latest_seq(self) -> int:
+        with self._lock:
+            self.latest_seq_calls += 1
+        # 並行する購読がこの間に割り込めるよう、呼び出し元を待たせる
+        threading.Event().wait(0.05)
+        with self._lock:
+            return self.notifications[-1].seq if self.notifications else 0
+
+
+def _broadcaster(feed: _Feed) -> ChangeBroadcaster:
+    return ChangeBroadcaster(
+        feed.load, feed.latest_seq, poll_interval_seconds=10.0, queue_size=10
+    )
+
+
+def test_concurrent_subscribes_start_one_poll_task():
+    async def run() -> None:
+        feed = _Feed()
+        broadcaster = _broadcaster(feed)
+        subscriptions = await asyncio.gather(
+            *(broadcaster.subscribe() for _ in range(5))
+        )
+        try:
+            assert feed.latest_seq_calls == 1
+            feed.add(1)
+            broadcaster.wake()
+            for subscription in subscriptions:
+                assert (await subscription.get(timeout=1.0)).seq == 1
+        finally:
+            await broadcaster.close()
+
+    asyncio.run(run())
+
+
+def test_changes_before_subscribe_are_not_delivered():
+    async def run() -> None:
+        feed = _Feed()
+        feed.add(1)
+        broadcaster = _broadcaster(feed)
+        subscription = await broadcaster.subscribe()
+        try:
+            feed.add(2)
+            broadcaster.wake()
+            assert (await subscription.get(timeout=1.0)).seq == 2
+        finally:
+            await broadcaster.close()
+
+    asyncio.run(run())
+
+
+def test_overflowing_subscription_is_closed():
+    async def run() -> None:
+        feed = _Feed()
+        broadcaster = ChangeBroadcaster(
+            feed.load, feed.latest_seq, poll_interval_seconds=10.0, queue_size=2
+        )
+        slow = await broadcaster.subscribe()
+        try:
+            for seq in range(1, 4):
+                feed.add(seq)
+            broadcaster.wake()
+            assert await slow.get(timeout=1.0) is None
+            assert slow.closed
+        finally:
+            await broadcaster.close()
+
+    asyncio.run(run())
+
+
+def test_subscribe_raises_when_latest_seq_fails():
+    def fail() -> int:
+        raise RuntimeError("db down")
+
+    async def run() -> None:
+        broadcaster = ChangeBroadcaster(
+            lambda since, limit: [], fail, poll_interval_seconds=10.0, queue_size=2
+        )
+        with pytest.raises(RuntimeError):
+            await broadcaster.subscribe()
+
+    asyncio.run(run())
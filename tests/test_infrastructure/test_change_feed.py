@@ -0,0 +1,90 @@
+"""
+変更フィードの既存データの記録（seed）のテスト
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select
+
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.models import (
+    ChangeVersionORM,
+    LLMResponseORM,
+    SyncChangeORM,
+)
+from app.infrastructure.sync.change_feed import SEEDED_SCOPE, change_feed
+
+_CHANGES = SyncChangeORM.__table__
+
+
+def _insert_unrecorded_responses(db, count: int) -> list[uuid.UUID]:
+    """変更フィードの導入前に作成されたLLM応答（変更記録なし）を作成します。"""
+    started_at = datetime(2024, 1, 1)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"t{n}",
+            "content_md": "本文です。",
+            "model": "gpt-4o",
+            "provider": "openai",
+            "tags": [],
+            "storage_location": "file",
+            "created_at": started_at + timedelta(minutes=n),
+            "updated_at": started_at + timedelta(minutes=n),
+        }
+        for n in range(count)
+    ]
+    db.execute(insert(LLMResponseORM.__table__), rows)
+    db.execute(delete(ChangeVersionORM).where(ChangeVersionORM.scope == SEEDED_SCOPE))
+    db.commit()
+    return [row["id"] for row in rows]
+
+
+def test_seed_records_existing_rows_in_update_order(db):
+    ids = _insert_unrecorded_responses(db, 3)
+
+    assert change_feed.seed(db) == 3
+
+    recorded = db.execute(select(_CHANGES.c.entity_id).order_by(_CHANGES.c.seq))
+    assert list(recorded.scalars()) == ids
+
+
+def test_seed_runs_once(db):
+    _insert_unrecorded_responses(db, 3)
+    change_feed.seed(db)
+
+    db.execute(delete(_CHANGES))
+    db.commit()
+
+    assert change_feed.seed(db) == 0
+    assert db.execute(select(func.count()).select_from(_CHANGES)).scalar() == 0
+
+
+def test_concurrent_seeds_record_each_row_once(db):
+    _insert_unrecorded_responses(db, 200)
+    results: list[int] = []
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(4)
+
+    def run() -> None:
+        try:
+            with SessionLocal() as session:
+                barrier.wait()
+                results.append(change_feed.seed(session))
+        except BaseException as e:  # noqa: BLE001 スレッドの例外をテストに伝える
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(results) == [0, 0, 0, 200]
+    seqs = db.execute(select(_CHANGES.c.seq)).scalars().all()
+    assert len(seqs) == len(set(seqs)) == 200
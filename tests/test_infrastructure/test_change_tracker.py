@@ -0,0 +1,60 @@
+"""
+変更バージョンの追跡（キャッシュ整合性）のテスト
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from app.domain.models.category import Category
+from app.infrastructure.cache.category_cache import category_cache
+from app.infrastructure.cache.coherence import (
+    CATEGORIES_SCOPE,
+    ChangeTracker,
+    change_tracker,
+)
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.models import CategoryORM
+from app.infrastructure.repositories.category_repository_impl import (
+    CategoryRepositoryImpl,
+)
+
+
+def test_sync_notifies_subscribers_once_per_change(db):
+    tracker = ChangeTracker()
+    calls = []
+    tracker.subscribe("scope", lambda: calls.append("scope"))
+    tracker.sync(db)
+
+    tracker.bump(db, "scope")
+    db.commit()
+    tracker.sync(db)
+    tracker.sync(db)
+
+    assert calls == ["scope"]
+
+    tracker.bump(db, "scope")
+    tracker.bump(db, "scope")
+    db.commit()
+    tracker.sync(db)
+
+    assert calls == ["scope", "scope"]
+
+
+def test_category_cache_reloads_after_write_by_another_worker(db):
+    category = CategoryRepositoryImpl(db).create(Category(name="python"))
+    change_tracker.sync(db)
+    assert category_cache.snapshot(db)[category.id].name == "python"
+
+    # 他のワーカーの書き込み（キャッシュを直接無効化しない）
+    with SessionLocal() as other:
+        other.execute(
+            update(CategoryORM).where(CategoryORM.id == category.id).values(name="rust")
+        )
+        ChangeTracker().bump(other, CATEGORIES_SCOPE)
+        other.commit()
+
+    assert category_cache.snapshot(db)[category.id].name == "python"
+    db.rollback()  # 新しいトランザクションで最新の値を読む
+    change_tracker.sync(db)
+    assert category_cache.snapshot(db)[category.id].name == "rust"
@@ -0,0 +1,150 @@
+"""
+会話エクスポートのリーダーのテスト
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.domain.models.conversation_import import ExportFormat
+from app.domain.models.llm_response import LLMProvider
+from app.domain.ports.conversation_export import ConversationExportError
+from app.infrastructure.importers.conversation_export_reader import (
+    JsonConversationExportReader,
+)
+
+CHATGPT = [
+    {
+        "title": "ChatGPT の会話",
+        "create_time": 1735689600,
+        "default_model_slug": "gpt-4o",
+        "mapping": {
+            "root": {"parent": None, "message": None},
+            "user": {
+                "parent": "root",
+                "message": {
+                    "author": {"role": "user"},
+                    "content": {"content_type": "text", "parts": ["質問です"]},
+                },
+            },
+            "tool": {
+                "parent": "user",
+                "message": {
+                    "author": {"role": "assistant"},
+                    "recipient": "python",
+                    "content": {"content_type": "code", "text": "print(1)"},
+                },
+            },
+            "answer": {
+                "parent": "tool",
+                "message": {
+                    "author": {"role": "assistant"},
+                    "create_time": 1735689660,
+                    "metadata": {"model_slug": "gpt-4o-mini"},
+                    "content": {"content_type": "text", "parts": ["回答です"]},
+                },
+            },
+        },
+    }
+]
+
+CLAUDE = [
+    {
+        "name": "",
+        "chat_messages": [
+            {"sender": "human", "text": "最初の質問\n2行目"},
+            {
+                "sender": "assistant",
+                "created_at": "2025-01-01T00:00:00Z",
+                "content": [{"type": "text", "text": "最初の回答"}],
+            },
+            {"sender": "human", "text": "次の質問"},
+            {"sender": "assistant", "text": "次の回答"},
+        ],
+    },
+    {"name": "空の会話", "chat_messages": []},
+]
+
+
+def _write(tmp_path, conversations) -> str:
+    path = tmp_path / "conversations.json"
+    path.write_text(json.dumps(conversations, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("conversations", "expected"),
+    [
+        (CHATGPT, ExportFormat.CHATGPT),
+        (CLAUDE, ExportFormat.CLAUDE),
+        ([{"title": "Prompted 質問", "safeHtmlItem": []}], ExportFormat.GEMINI),
+        ([], None),
+    ],
+    ids=["chatgpt", "claude", "gemini", "empty"],
+)
+def test_detect_format(tmp_path, conversations, expected):
+    reader = JsonConversationExportReader(read_bytes=16)
+
+    assert reader.detect_format(_write(tmp_path, conversations)) == expected
+
+
+@pytest.mark.parametrize("conversations", [[{"unknown": 1}], {"mapping": {}}])
+def test_detect_format_rejects_unknown_files(tmp_path, conversations):
+    reader = JsonConversationExportReader()
+
+    with pytest.raises(ConversationExportError):
+        reader.detect_format(_write(tmp_path, conversations))
+
+
+def test_reads_chatgpt_assistant_messages(tmp_path):
+    reader = JsonConversationExportReader()
+
+    [(turns, _)] = reader.read(_write(tmp_path, CHATGPT), ExportFormat.CHATGPT)
+
+    # ツール宛てのメッセージは取り込まない
+    [turn] = turns
+    assert turn.title == "ChatGPT の会話"
+    assert turn.prompt == "質問です"
+    assert turn.content_md == "回答です"
+    assert turn.model == "gpt-4o-mini"
+    assert turn.provider == LLMProvider.OPENAI
+    assert turn.created_at is not None
+
+
+def test_reads_claude_turns_with_prompts(tmp_path):
+    reader = JsonConversationExportReader(read_bytes=8)
+
+    conversations = list(reader.read(_write(tmp_path, CLAUDE), ExportFormat.CLAUDE))
+
+    assert [len(turns) for turns, _ in conversations] == [2, 0]
+    first, second = conversations[0][0]
+    assert (first.prompt, first.content_md) == ("最初の質問\n2行目", "最初の回答")
+    assert (second.prompt, second.content_md) == ("次の質問", "次の回答")
+    # タイトルのない会話は、プロンプトの1行目をタイトルにする
+    assert first.title == "最初の質問"
+    assert first.model == "claude"
+    assert first.provider == LLMProvider.ANTHROPIC
+
+
+def test_read_resumes_from_offset(tmp_path):
+    reader = JsonConversationExportReader(read_bytes=8)
+    path = _write(tmp_path, CLAUDE)
+    [(_, first_offset), (_, last_offset)] = reader.read(path, ExportFormat.CLAUDE)
+
+    resumed = list(reader.read(path, ExportFormat.CLAUDE, first_offset))
+
+    assert resumed == [([], last_offset)]
+
+
+def test_read_reports_broken_files(tmp_path):
+    path = tmp_path / "conversations.json"
+    path.write_text('[{"chat_messages": []}, {"chat_messages": ', encoding="utf-8")
+    reader = JsonConversationExportReader()
+
+    conversations = reader.read(str(path), ExportFormat.CLAUDE)
+
+    assert next(conversations)[0] == []
+    with pytest.raises(ConversationExportError):
+        next(conversations)
@@ -0,0 +1,100 @@
+"""
+エンジンプロファイル（プール設定と SQLite の PRAGMA）のテスト
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+
+from app.config.settings import settings
+from app.infrastructure.db.engine_profile import (
+    engine_options,
+    install_sqlite_pragmas,
+    read_url,
+)
+
+
+def test_engine_options_use_pool_settings_for_file_database():
+    options = engine_options("sqlite:///data/app.db")
+
+    assert options == {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+@pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:"])
+def test_engine_options_are_empty_for_memory_database(url):
+    assert engine_options(url) == {}
+
+
+def test_read_url_opens_sqlite_file_read_only(tmp_path):
+    url = make_url(read_url(f"sqlite:///{tmp_path / 'app.db'}", None))
+
+    assert url.database == f"file:{tmp_path / 'app.db'}"
+    assert url.query == {"mode": "ro", "uri": "true"}
+
+
+def test_read_url_prefers_replica():
+    replica = "postgresql://reader@replica/app"
+
+    assert read_url("postgresql://writer@primary/app", replica) == replica
+
+
+@pytest.mark.parametrize("url", ["sqlite://", "postgresql://writer@primary/app"])
+def test_read_url_shares_engine_without_replica(url):
+    assert read_url(url, None) is None
+
+
+def test_pragmas_are_applied_to_each_connection(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_JOURNAL_MODE", "WAL")
+    monkeypatch.setattr(settings, "SQLITE_SYNCHRONOUS", "NORMAL")
+    monkeypatch.setattr(settings, "SQLITE_CACHE_SIZE_KIB", 4096)
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 1234)
+    monkeypatch.setattr(settings, "SQLITE_FOREIGN_KEYS", True)
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    install_sqlite_pragmas(engine)
+
+    with engine.connect() as connection:
+        values = {
+            name: connection.execute(text(f"PRAGMA {name}")).scalar()
+            for name in (
+                "journal_mode",
+                "synchronous",
+                "cache_size",
+                "busy_timeout",
+                "foreign_keys",
+            )
+        }
+    engine.dispose()
+
+    assert values == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "cache_size": -4096,
+        "busy_timeout": 1234,
+        "foreign_keys": 1,
+    }
+
+
+def test_read_only_engine_cannot_write(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(url)
+    install_sqlite_pragmas(engine)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    reader = create_engine(read_url(url, None))
+    install_sqlite_pragmas(reader, read_only=True)
+
+    with reader.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM items")).scalar() == 0
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("INSERT INTO items (id) VALUES (1)"))
+    reader.dispose()
+    engine.dispose()
@@ -0,0 +1,101 @@
+"""
+永続ジョブキューのテスト
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app.domain.models.job import JobStatus
+from app.infrastructure.db.models import JobORM
+from app.infrastructure.jobs.job_queue import JobQueue
+
+
+def _queue(max_attempts: int = 2) -> JobQueue:
+    return JobQueue(
+        max_attempts=max_attempts,
+        backoff_base_seconds=60.0,
+        backoff_max_seconds=600.0,
+        lease_seconds=300.0,
+    )
+
+
+def test_claim_takes_highest_priority_first(db):
+    queue = _queue()
+    queue.enqueue(db, "kind", {"n": 1})
+    queue.enqueue(db, "kind", {"n": 2}, priority=10)
+    queue.enqueue(db, "kind", {"n": 3})
+    db.commit()
+
+    claimed = [queue.claim(db, ["kind"]).payload["n"] for _ in range(3)]
+
+    assert claimed == [2, 1, 3]
+    assert queue.claim(db, ["kind"]) is None
+
+
+def test_claim_ignores_unregistered_kinds_and_delayed_jobs(db):
+    queue = _queue()
+    queue.enqueue(db, "other", {})
+    queue.enqueue(db, "kind", {}, delay_seconds=60)
+    db.commit()
+
+    assert queue.claim(db, ["kind"]) is None
+
+
+def test_dedupe_key_skips_queued_duplicates(db):
+    queue = _queue()
+    queue.enqueue(db, "kind", {}, dedupe_key="same")
+    queue.enqueue(db, "kind", {}, dedupe_key="same")
+    db.commit()
+    job = queue.claim(db, ["kind"])
+
+    # 実行中のジョブとは重複しない（実行中に発生した変更を取りこぼさない）
+    queue.enqueue(db, "kind", {}, dedupe_key="same")
+    db.commit()
+
+    assert job is not None
+    assert db.query(JobORM).count() == 2
+
+
+def test_failed_job_is_retried_with_backoff_then_failed(db):
+    queue = _queue(max_attempts=2)
+    queue.enqueue(db, "kind", {})
+    db.commit()
+
+    job = queue.claim(db, ["kind"])
+    queue.fail(db, job, "first")
+    stored = db.get(JobORM, job.id)
+    db.refresh(stored)
+    assert stored.status == JobStatus.QUEUED.value
+    assert stored.run_at > datetime.now() + timedelta(seconds=20)
+    assert queue.claim(db, ["kind"]) is None
+
+    db.execute(update(JobORM).values(run_at=datetime.now()))
+    db.commit()
+    job = queue.claim(db, ["kind"])
+    queue.fail(db, job, "second")
+    db.refresh(stored)
+
+    assert job.attempts == 2
+    assert stored.status == JobStatus.FAILED.value
+    assert stored.last_error == "second"
+
+
+def test_expired_lease_is_reclaimed(db):
+    queue = _queue()
+    queue.enqueue(db, "kind", {})
+    db.commit()
+    job = queue.claim(db, ["kind"])
+    db.execute(
+        update(JobORM).values(locked_until=datetime.now() - timedelta(seconds=1))
+    )
+    db.commit()
+
+    reclaimed = queue.claim(db, ["kind"])
+    queue.complete(db, job)  # 再取得された後の古い完了は反映しない
+
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+    assert db.get(JobORM, job.id).status == JobStatus.RUNNING.value
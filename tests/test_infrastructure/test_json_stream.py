@@ -0,0 +1,101 @@
+"""
+JSON 配列の逐次読み込み（iter_array_items）のテスト
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from app.infrastructure.importers.json_stream import iter_array_items
+
+ITEMS = [
+    {"title": "会話", "messages": ["こんにちは", "🌙"]},
+    12345,
+    -1.5e-10,
+    "文字列",
+    [1, [2, 3]],
+    None,
+    True,
+]
+
+
+def _items(data: bytes, start_offset: int = 0, read_bytes: int = 4096):
+    return list(iter_array_items(io.BytesIO(data), start_offset, read_bytes))
+
+
+@pytest.mark.parametrize("read_bytes", [1, 2, 3, 7, 4096])
+def test_reads_items_across_read_window(read_bytes):
+    data = json.dumps(ITEMS, ensure_ascii=False, indent=2).encode()
+
+    assert [item for item, _ in _items(data, read_bytes=read_bytes)] == ITEMS
+
+
+@pytest.mark.parametrize("read_bytes", [1, 2, 3, 4096])
+@pytest.mark.parametrize("number", ["1e-3", "1.25", "-12E+2", "1234567890123"])
+def test_numbers_split_across_read_window(read_bytes, number):
+    data = f"[{number}, {number}]".encode()
+
+    items = [item for item, _ in _items(data, read_bytes=read_bytes)]
+
+    assert items == [json.loads(number)] * 2
+
+
+def test_offsets_point_just_after_each_item():
+    data = '[ {"a": "あ"} ,\n "🌙", 10 ]'.encode()
+
+    offsets = [offset for _, offset in _items(data, read_bytes=1)]
+
+    assert [data[:offset].decode()[-1] for offset in offsets] == ["}", '"', "0"]
+
+
+@pytest.mark.parametrize("read_bytes", [1, 5, 4096])
+def test_resumes_from_returned_offsets(read_bytes):
+    data = json.dumps(ITEMS, ensure_ascii=False).encode()
+    offsets = [offset for _, offset in _items(data, read_bytes=read_bytes)]
+
+    for index, offset in enumerate(offsets):
+        resumed = _items(data, start_offset=offset, read_bytes=read_bytes)
+        assert [item for item, _ in resumed] == ITEMS[index + 1 :]
+        assert [offset for _, offset in resumed] == offsets[index + 1 :]
+
+
+def test_skips_byte_order_mark():
+    data = "\ufeff".encode() + b'[{"a": 1}]'
+
+    items = _items(data, read_bytes=1)
+
+    assert items == [({"a": 1}, len(data) - 1)]
+
+
+def test_empty_array_has_no_items():
+    assert _items(b" [ ] ") == []
+
+
+@pytest.mark.parametrize(
+    ("data", "match"),
+    [
+        (b'{"a": 1}', "配列ではありません"),
+        (b"[1, 2,]", "解析できません"),
+        (b"[1 2]", "区切りではありません"),
+        (b"[1, 2", "閉じられていません"),
+    ],
+    ids=["object", "trailing-comma", "missing-comma", "unclosed"],
+)
+def test_rejects_invalid_arrays(data, match):
+    with pytest.raises(ValueError, match=match):
+        _items(data, read_bytes=2)
+
+
+def test_rejects_items_over_max_chars():
+    data = json.dumps(["x" * 100]).encode()
+
+    with pytest.raises(ValueError, match="大きすぎる"):
+        list(iter_array_items(io.BytesIO(data), read_bytes=8, max_item_chars=50))
+
+
+def test_rejects_non_utf8():
+    with pytest.raises(UnicodeDecodeError):
+        _items('["あ"]'.encode("shift_jis"))
@@ -0,0 +1,68 @@
+"""
+LLM応答リポジトリ（行からエンティティへの変換）のテスト
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from app.domain.models.category import Category
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.domain.services.content_stats import compute_content_stats
+from app.infrastructure.repositories.category_repository_impl import (
+    CategoryRepositoryImpl,
+)
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+
+
+def _response(**overrides) -> LLMResponse:
+    values = {
+        "title": "タイトル",
+        "prompt": "プロンプト",
+        "content_md": "# 見出し\n\n```python\nprint(1)\n```\n",
+        "model": "claude-sonnet",
+        "provider": LLMProvider.ANTHROPIC,
+        "tags": ["python", "cli"],
+        "summary": "要約",
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901),
+        "updated_at": datetime(2025, 1, 3),
+    }
+    values.update(overrides)
+    response = LLMResponse(**values)
+    response.stats = compute_content_stats(response.content_md)
+    return response
+
+
+def test_entities_are_slotted():
+    assert not hasattr(_response(), "__dict__")
+    assert not hasattr(Category(name="python"), "__dict__")
+
+
+def test_get_by_id_maps_every_column(db):
+    category = CategoryRepositoryImpl(db).create(Category(name="python"))
+    repository = LLMResponseRepositoryImpl(db)
+    created = repository.create(_response(category_id=category.id))
+
+    fetched = LLMResponseRepositoryImpl(db).get_by_id(created.id)
+
+    assert fetched == created
+    assert fetched.provider is LLMProvider.ANTHROPIC
+    assert fetched.prompt_id is not None
+    assert fetched.category.name == "python"
+
+
+def test_list_and_get_many_return_the_same_entities(db):
+    repository = LLMResponseRepositoryImpl(db)
+    created = [repository.create(_response(title=f"t{n}")) for n in range(3)]
+
+    by_id = repository.get_many([response.id for response in created])
+    listed = repository.list()
+
+    assert by_id == {response.id: response for response in created}
+    assert sorted(listed, key=lambda response: response.title) == created
+
+
+def test_get_by_id_returns_none_for_unknown_id(db):
+    assert LLMResponseRepositoryImpl(db).get_by_id(_response().id) is None
@@ -0,0 +1,122 @@
+"""
+Markdown レンダラーとHTMLキャッシュのテスト
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+
+from app.infrastructure.rendering.markdown_renderer import (
+    CachedMarkdownRenderer,
+    MarkdownItRenderer,
+)
+
+
+class _CountingRenderer(MarkdownItRenderer):
+    """変換した回数を数えるレンダラー"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def render(self, content_md: str) -> str:
+        self.calls += 1
+        return super().render(content_md)
+
+
+def test_render_highlights_code_and_escapes_raw_html():
+    html = MarkdownItRenderer().render(
+        "# 見出し\n\n<script>alert(1)</script>\n\n```python\nprint(1)\n```\n"
+    )
+
+    assert "<h1>見出し</h1>" in html
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+    assert '<span class="nb">print</span>' in html
+
+
+def test_render_keeps_unknown_languages_escaped():
+    html = MarkdownItRenderer().render("```no-such-lang\n<b>\n```\n")
+
+    assert "&lt;b&gt;" in html
+
+
+def test_cache_renders_each_content_once(tmp_path):
+    renderer = _CountingRenderer()
+    cached = CachedMarkdownRenderer(renderer, cache_dir=tmp_path)
+
+    first = cached.render("# a")
+    second = cached.render("# a")
+    cached.render("# b")
+
+    assert first == second
+    assert renderer.calls == 2
+
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    CachedMarkdownRenderer(_CountingRenderer(), cache_dir=tmp_path).render("# a")
+    renderer = _CountingRenderer()
+
+    html = CachedMarkdownRenderer(renderer, cache_dir=tmp_path).render("# a")
+
+    assert html == "<h1>a</h1>\n"
+    assert renderer.calls == 0
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path):
+    renderer = _CountingRenderer()
+    cached = CachedMarkdownRenderer(renderer, cache_dir=tmp_path, max_entries=1)
+    cached.render("# a")
+    cached.render("# b")
+    for path in tmp_path.rglob("*.html"):
+        path.unlink()
+
+    cached.render("# b")
+    cached.render("# a")
+
+    assert renderer.calls == 3
+
+
+def test_disk_cache_evicts_least_recently_used_over_max_bytes(tmp_path):
+    cached = CachedMarkdownRenderer(_CountingRenderer(), cache_dir=tmp_path)
+    cached.render("# a")
+    cached.render("# b")
+    size = sum(path.stat().st_size for path in tmp_path.rglob("*.html"))
+    paths = {
+        path.read_text(encoding="utf-8"): path for path in tmp_path.rglob("*.html")
+    }
+    # 「# a」を「# b」より後に使われたものにする
+    os.utime(paths["<h1>b</h1>\n"], (1, 1))
+    os.utime(paths["<h1>a</h1>\n"], (2, 2))
+    bounded = CachedMarkdownRenderer(
+        _CountingRenderer(), cache_dir=tmp_path, max_disk_bytes=size
+    )
+
+    bounded.render("# c")
+
+    remaining = {path.read_text(encoding="utf-8") for path in tmp_path.rglob("*.html")}
+    assert remaining == {"<h1>a</h1>\n", "<h1>c</h1>\n"}
+
+
+def test_disk_cache_write_error_removes_temp_file(tmp_path, monkeypatch):
+    def replace(src, dst):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", replace)
+    cached = CachedMarkdownRenderer(_CountingRenderer(), cache_dir=tmp_path)
+
+    html = cached.render("# a")
+
+    assert html == "<h1>a</h1>\n"
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+
+def test_response_html_endpoint(client, create_response):
+    created = create_response(content_md="**太字**")
+
+    response = client.get(f"/api/v1/responses/{created['id']}/html")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "<strong>太字</strong>" in response.text
@@ -0,0 +1,71 @@
+"""
+プロンプト移行のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.column_migration import add_missing_columns
+from app.infrastructure.db.prompt_migration import migrate_prompts
+from app.infrastructure.db.uuid_migration import migrate_uuid_keys
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.repositories.prompt_repository_impl import PromptRepositoryImpl
+
+# LLM応答の ID と、応答ごとに保存されていたプロンプト
+ROWS = {uuid4(): "共通のプロンプト", uuid4(): "共通のプロンプト", uuid4(): "単独"}
+
+
+def _upgrade(engine) -> int:
+    """init_db と同じ順序で、初版のデータベースを現在のスキーマに移行します。"""
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine, Base.metadata)
+    migrate_uuid_keys(engine)
+    return migrate_prompts(engine)
+
+
+def _insert_baseline_rows(engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO llm_responses (id, title, prompt, content_md, model, "
+                "provider, tags, storage_location, created_at, updated_at) "
+                "VALUES (:id, 'title', :prompt, 'body', 'gpt-4o', 'openai', '[]', "
+                "'file', '2025-01-01', '2025-01-01')"
+            ),
+            [{"id": str(id_), "prompt": prompt} for id_, prompt in ROWS.items()],
+        )
+
+
+def test_moves_prompts_to_prompts_table(baseline_engine):
+    _insert_baseline_rows(baseline_engine)
+
+    assert _upgrade(baseline_engine) == 3
+
+    columns = inspect(baseline_engine).get_columns("llm_responses")
+    assert "prompt" not in {info["name"] for info in columns}
+    with Session(baseline_engine) as db:
+        responses = LLMResponseRepositoryImpl(db).get_many(list(ROWS))
+        prompts = PromptRepositoryImpl(db).list()
+    assert {id_: response.prompt for id_, response in responses.items()} == ROWS
+    assert [(prompt.text, prompt.response_count) for prompt in prompts] == [
+        ("共通のプロンプト", 2),
+        ("単独", 1),
+    ]
+    shared = [id_ for id_, prompt in ROWS.items() if prompt == "共通のプロンプト"]
+    assert responses[shared[0]].prompt_id == responses[shared[1]].prompt_id
+
+
+def test_migration_is_idempotent(baseline_engine):
+    _insert_baseline_rows(baseline_engine)
+    _upgrade(baseline_engine)
+
+    assert _upgrade(baseline_engine) == 0
+    with Session(baseline_engine) as db:
+        assert len(PromptRepositoryImpl(db).list()) == 2
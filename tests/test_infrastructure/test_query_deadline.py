@@ -0,0 +1,65 @@
+"""
+クエリ期限のテスト
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.deadline import (
+    QueryDeadline,
+    QueryDeadlineExceededError,
+    is_interrupted,
+    set_query_deadline,
+)
+
+
+@pytest.fixture
+def deadline_scope():
+    """テスト後に現在のコンテキストのクエリ期限を解除します。"""
+    yield
+    set_query_deadline(None)
+
+
+def test_deadline_starts_on_first_statement(_schema, deadline_scope):
+    deadline = QueryDeadline(0.05)
+    set_query_deadline(deadline)
+    # 最初の文を実行するまでの時間（待ち行列での待機など）は数えない
+    time.sleep(0.1)
+    assert not deadline.exceeded
+
+    with SessionLocal() as db:
+        assert db.execute(text("SELECT 1")).scalar() == 1
+        assert deadline.expires_at is not None
+        time.sleep(0.1)
+        assert deadline.exceeded
+        with pytest.raises(QueryDeadlineExceededError) as exc_info:
+            db.execute(text("SELECT 1"))
+
+    assert is_interrupted(exc_info.value)
+
+
+def test_cancelled_deadline_rejects_statements(_schema, deadline_scope):
+    deadline = QueryDeadline(60)
+    set_query_deadline(deadline)
+    deadline.cancel()
+
+    with SessionLocal() as db, pytest.raises(QueryDeadlineExceededError) as exc_info:
+        db.execute(text("SELECT 1"))
+
+    assert is_interrupted(exc_info.value)
+    assert "切断" in str(exc_info.value)
+
+
+def test_is_interrupted_requires_exceeded_deadline(deadline_scope):
+    deadline = QueryDeadline(60)
+    set_query_deadline(deadline)
+
+    assert not is_interrupted(RuntimeError("interrupted"))
+    deadline.cancel()
+    assert is_interrupted(RuntimeError("interrupted"))
+    assert not is_interrupted(RuntimeError("other"))
@@ -0,0 +1,101 @@
+"""
+LLM応答リビジョンの記録（record_revision）とリポジトリのテスト
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config.settings import settings
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.infrastructure.repositories.response_revision_repository_impl import (
+    ResponseRevisionRepositoryImpl,
+    record_revision,
+)
+
+# 版 n の本文（前の版に1行ずつ追加していくため、差分は小さい）
+CONTENTS = [
+    "# 見出し\n\n" + "".join(f"{index}行目の本文です。\n" for index in range(count))
+    for count in range(1, 9)
+]
+
+
+@pytest.fixture
+def response_id(db):
+    response = LLMResponseRepositoryImpl(db).create(
+        LLMResponse(
+            title="タイトル",
+            prompt="プロンプト",
+            content_md=CONTENTS[0],
+            model="gpt-4o",
+            provider=LLMProvider.OPENAI,
+        )
+    )
+    return response.id
+
+
+def _record_all(db, response_id) -> None:
+    started = datetime(2025, 1, 1)
+    for index in range(1, len(CONTENTS)):
+        record_revision(
+            db,
+            response_id,
+            CONTENTS[index - 1],
+            CONTENTS[index],
+            started + timedelta(minutes=index - 1),
+            started + timedelta(minutes=index),
+        )
+    db.commit()
+
+
+def test_restores_every_revision_across_snapshots(db, response_id, monkeypatch):
+    monkeypatch.setattr(settings, "REVISION_SNAPSHOT_INTERVAL", 3)
+    _record_all(db, response_id)
+    repository = ResponseRevisionRepositoryImpl(db)
+
+    revisions = repository.list(response_id)
+
+    assert [revision.number for revision in revisions] == list(range(1, 9))
+    # 版 1 と、REVISION_SNAPSHOT_INTERVAL 版ごと（4, 7）に本文全体を保存する
+    assert [revision.number for revision in revisions if revision.is_snapshot] == [
+        1,
+        4,
+        7,
+    ]
+    assert all(revision.content is None for revision in revisions)
+    for number, content in enumerate(CONTENTS, start=1):
+        revision = repository.get(response_id, number)
+        assert revision.content == content
+        assert revision.char_count == len(content)
+        assert revision.created_at == datetime(2025, 1, 1) + timedelta(
+            minutes=number - 1
+        )
+
+
+def test_rewritten_content_is_stored_as_snapshot(db, response_id, monkeypatch):
+    monkeypatch.setattr(settings, "REVISION_SNAPSHOT_INTERVAL", 100)
+    rewritten = "まったく別の本文です。\n" * 20
+    now = datetime.now()
+    record_revision(db, response_id, CONTENTS[0], CONTENTS[1], now, now)
+    record_revision(db, response_id, CONTENTS[1], rewritten, now, now)
+    db.commit()
+    repository = ResponseRevisionRepositoryImpl(db)
+
+    revisions = repository.list(response_id)
+
+    assert [revision.is_snapshot for revision in revisions] == [True, False, True]
+    assert repository.get(response_id, 3).content == rewritten
+
+
+def test_missing_revisions(db, response_id):
+    repository = ResponseRevisionRepositoryImpl(db)
+
+    assert repository.list(response_id) == []
+    assert repository.get(response_id, 1) is None
+    _record_all(db, response_id)
+    assert repository.get(response_id, len(CONTENTS) + 1) is None
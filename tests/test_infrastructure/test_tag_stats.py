@@ -0,0 +1,161 @@
+"""
+タグの使用状況（update_tag_stats・migrate_tag_stats）とリポジトリのテスト
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.domain.models.tag_stat import TagSortKey
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.column_migration import add_missing_columns
+from app.infrastructure.db.prompt_migration import migrate_prompts
+from app.infrastructure.db.tag_stats_migration import migrate_tag_stats
+from app.infrastructure.db.uuid_migration import migrate_uuid_keys
+from app.infrastructure.repositories.tag_stat_repository_impl import (
+    TagStatRepositoryImpl,
+    update_tag_stats,
+)
+
+JANUARY = datetime(2025, 1, 1)
+FEBRUARY = datetime(2025, 2, 1)
+
+
+def _stats(db) -> dict[str, tuple[int, datetime]]:
+    return {
+        stat.tag: (stat.response_count, stat.last_used_at)
+        for stat in TagStatRepositoryImpl(db).list()
+    }
+
+
+def test_increments_new_and_existing_tags(db):
+    update_tag_stats(db, ["python", "sql"], [], JANUARY)
+    update_tag_stats(db, ["python", "python"], [], FEBRUARY)
+    db.commit()
+
+    assert _stats(db) == {"python": (3, FEBRUARY), "sql": (1, JANUARY)}
+
+
+@pytest.fixture(params=["sqlite", "generic"])
+def dialect_db(request, db, monkeypatch):
+    """SQLite の upsert と、汎用の UPDATE・INSERT の両方で使うセッションを返します。"""
+    if request.param == "generic":
+        # _increment が方言の判定に使う引数なしの呼び出しのみを置き換える
+        get_bind = db.get_bind
+        generic = SimpleNamespace(dialect=SimpleNamespace(name="generic"))
+        monkeypatch.setattr(
+            db,
+            "get_bind",
+            lambda *args, **kwargs: (
+                get_bind(*args, **kwargs) if args or kwargs else generic
+            ),
+        )
+    return db
+
+
+def test_increment_with_older_used_at_keeps_latest(dialect_db):
+    update_tag_stats(dialect_db, ["python"], [], FEBRUARY)
+    # 取り込んだ会話など、過去の日時で付けたタグで最近の使用を戻さない
+    update_tag_stats(dialect_db, ["python", "sql"], [], JANUARY)
+    dialect_db.commit()
+
+    assert _stats(dialect_db) == {"python": (2, FEBRUARY), "sql": (1, JANUARY)}
+
+
+def test_increment_with_newer_used_at_updates_latest(dialect_db):
+    update_tag_stats(dialect_db, ["python"], [], JANUARY)
+    update_tag_stats(dialect_db, ["python"], [], FEBRUARY)
+    dialect_db.commit()
+
+    assert _stats(dialect_db) == {"python": (2, FEBRUARY)}
+
+
+def test_decrement_keeps_last_used_at(db):
+    update_tag_stats(db, ["python", "python"], [], JANUARY)
+    update_tag_stats(db, [], ["python"], FEBRUARY)
+    db.commit()
+
+    assert _stats(db) == {"python": (1, JANUARY)}
+
+
+def test_deletes_tags_no_longer_used(db):
+    update_tag_stats(db, ["python", "sql"], [], JANUARY)
+    update_tag_stats(db, [], ["python", "sql"], FEBRUARY)
+    update_tag_stats(db, ["sql"], [], FEBRUARY)
+    db.commit()
+
+    assert _stats(db) == {"sql": (1, FEBRUARY)}
+
+
+def test_added_and_removed_in_same_write_cancel_out(db):
+    update_tag_stats(db, ["python"], [], JANUARY)
+    # 付け替え（外したタグを同じ書き込みで付け直す）では使用数を変えない
+    update_tag_stats(db, ["python", "sql"], ["python"], FEBRUARY)
+    db.commit()
+
+    assert _stats(db) == {"python": (1, JANUARY), "sql": (1, FEBRUARY)}
+
+
+def test_list_and_search_prefix(db):
+    update_tag_stats(db, ["python", "python", "pytest", "Pydantic"], [], JANUARY)
+    update_tag_stats(db, ["sql"], [], FEBRUARY)
+    db.commit()
+    repository = TagStatRepositoryImpl(db)
+
+    by_count = [stat.tag for stat in repository.list(sort=TagSortKey.COUNT)]
+    recent = [stat.tag for stat in repository.list(sort=TagSortKey.RECENT, limit=2)]
+    prefixed = [stat.tag for stat in repository.search_prefix("py")]
+
+    assert by_count == ["python", "Pydantic", "pytest", "sql"]
+    assert recent == ["sql", "Pydantic"]
+    # 大文字と小文字は区別する
+    assert prefixed == ["python", "pytest"]
+    assert repository.search_prefix("python", limit=1)[0].tag == "python"
+    assert repository.search_prefix("z") == []
+
+
+def _upgrade(engine) -> int:
+    """init_db と同じ順序で、初版のデータベースを現在のスキーマに移行します。"""
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine, Base.metadata)
+    migrate_uuid_keys(engine)
+    migrate_prompts(engine)
+    return migrate_tag_stats(engine)
+
+
+def test_migrate_tag_stats_on_baseline_database(baseline_engine):
+    rows = [
+        ('["python", "sql", "python"]', "2025-01-01 00:00:00"),
+        ('["python"]', "2025-03-01 00:00:00"),
+        ("[]", "2025-04-01 00:00:00"),
+    ]
+    with baseline_engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO llm_responses (id, title, prompt, content_md, model, "
+                "provider, tags, storage_location, created_at, updated_at) "
+                "VALUES (:id, 'title', 'prompt', 'body', 'gpt-4o', 'openai', "
+                ":tags, 'file', :updated_at, :updated_at)"
+            ),
+            [
+                {"id": str(uuid4()), "tags": tags, "updated_at": updated_at}
+                for tags, updated_at in rows
+            ],
+        )
+
+    assert _upgrade(baseline_engine) == 2
+
+    with Session(baseline_engine) as db:
+        # 同じLLM応答で重複したタグは1回と数える
+        assert _stats(db) == {
+            "python": (2, datetime(2025, 3, 1)),
+            "sql": (1, datetime(2025, 1, 1)),
+        }
+    # 集計済みの場合は何もしない
+    assert migrate_tag_stats(baseline_engine) == 0
@@ -0,0 +1,76 @@
+"""
+UUID キー移行のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.infrastructure.db import uuid_migration
+from app.infrastructure.db.uuid_migration import migrate_uuid_keys
+
+
+def _insert_baseline_rows(engine, category_id: str, response_ids: list[str]) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO categories (id, name, created_at, updated_at) "
+                "VALUES (:id, 'python', '2025-01-01', '2025-01-01')"
+            ),
+            {"id": category_id},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO llm_responses (id, title, prompt, content_md, model, "
+                "provider, category_id, tags, storage_location, created_at, "
+                "updated_at) VALUES (:id, 'title', 'prompt', 'body', 'gpt-4o', "
+                "'openai', :category_id, '[]', 'file', '2025-01-01', '2025-01-01')"
+            ),
+            [{"id": id_, "category_id": category_id} for id_ in response_ids],
+        )
+
+
+def test_migrates_string_keys_to_bytes(baseline_engine):
+    category_id = uuid4()
+    response_ids = [uuid4() for _ in range(3)]
+    _insert_baseline_rows(
+        baseline_engine, str(category_id), [str(id_) for id_ in response_ids]
+    )
+
+    converted = migrate_uuid_keys(baseline_engine)
+
+    # カテゴリの ID、LLM応答の ID 3 件、LLM応答のカテゴリ ID（重複を除き 1 件）
+    assert converted == 5
+    with baseline_engine.connect() as connection:
+        categories = connection.execute(text("SELECT id FROM categories")).all()
+        responses = connection.execute(
+            text("SELECT id, category_id FROM llm_responses ORDER BY id")
+        ).all()
+        violations = connection.execute(text("PRAGMA foreign_key_check")).all()
+    assert categories == [(category_id.bytes,)]
+    assert responses == sorted((id_.bytes, category_id.bytes) for id_ in response_ids)
+    assert violations == []
+
+
+def test_migration_is_idempotent(baseline_engine):
+    _insert_baseline_rows(baseline_engine, str(uuid4()), [str(uuid4())])
+    migrate_uuid_keys(baseline_engine)
+
+    assert migrate_uuid_keys(baseline_engine) == 0
+
+
+def test_migrates_in_batches(baseline_engine, monkeypatch):
+    monkeypatch.setattr(uuid_migration, "_BATCH_SIZE", 2)
+    response_ids = [uuid4() for _ in range(5)]
+    _insert_baseline_rows(
+        baseline_engine, str(uuid4()), [str(id_) for id_ in response_ids]
+    )
+
+    assert migrate_uuid_keys(baseline_engine) == 7
+    with baseline_engine.connect() as connection:
+        remaining = connection.execute(
+            text("SELECT count(*) FROM llm_responses WHERE typeof(id) = 'text'")
+        ).scalar()
+    assert remaining == 0
@@ -0,0 +1,137 @@
+"""
+アドミッション制御のテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.config.settings import settings
+from app.presentation.api.admission import READ, AdmissionLimiter, admission_limiters
+
+
+def _limiter(max_concurrency=1, max_queue=1, timeout=1.0) -> AdmissionLimiter:
+    return AdmissionLimiter(
+        "test",
+        max_concurrency=max_concurrency,
+        max_queue=max_queue,
+        queue_timeout_seconds=timeout,
+    )
+
+
+def test_acquire_within_concurrency_does_not_wait():
+    limiter = _limiter(max_concurrency=2)
+
+    async def run():
+        return [await limiter.acquire(), await limiter.acquire()]
+
+    assert asyncio.run(run()) == [0.0, 0.0]
+    assert limiter.stats()["in_flight"] == 2
+
+
+def test_release_hands_slot_to_waiters_in_order():
+    limiter = _limiter(max_concurrency=1, max_queue=2)
+    order: list[int] = []
+
+    async def worker(n: int) -> None:
+        await limiter.acquire()
+        order.append(n)
+        await asyncio.sleep(0.01)
+        limiter.release()
+
+    async def run():
+        await limiter.acquire()
+        tasks = [asyncio.create_task(worker(n)) for n in range(2)]
+        await asyncio.sleep(0.01)
+        assert limiter.stats()["queued"] == 2
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == [0, 1]
+    stats = limiter.stats()
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+    assert stats["admitted"] == 3
+
+
+def test_acquire_rejects_when_queue_is_full():
+    limiter = _limiter(max_concurrency=1, max_queue=1)
+
+    async def run():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                await limiter.acquire()
+        finally:
+            limiter.release()
+            await waiter
+            limiter.release()
+        return exc_info.value
+
+    error = asyncio.run(run())
+
+    assert error.status_code == 503
+    assert error.headers == {"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)}
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_acquire_times_out_in_queue():
+    limiter = _limiter(max_concurrency=1, max_queue=1, timeout=0.01)
+
+    async def run():
+        await limiter.acquire()
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire()
+        limiter.release()
+        return exc_info.value
+
+    error = asyncio.run(run())
+
+    assert error.status_code == 503
+    stats = limiter.stats()
+    assert stats["timed_out"] == 1
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    limiter = _limiter(max_concurrency=1, max_queue=1)
+
+    async def run():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+    asyncio.run(run())
+
+    assert limiter.stats()["queued"] == 0
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_endpoint_returns_503_when_route_class_is_full(
+    client, create_response, monkeypatch
+):
+    created = create_response()
+    # 依存関数は admit() の時点でリミッターを束縛するため、共有の実体を変更する
+    limiter = admission_limiters[READ]
+    monkeypatch.setattr(limiter, "max_concurrency", 0)
+    monkeypatch.setattr(limiter, "max_queue", 0)
+
+    response = client.get(f"/api/v1/responses/{created['id']}")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(
+        settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
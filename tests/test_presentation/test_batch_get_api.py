@@ -0,0 +1,44 @@
+"""
+LLM応答の一括取得（POST /responses:batchGet）のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+
+def test_batch_get_keeps_request_order_and_reports_missing(client, create_response):
+    first = create_response(title="first")
+    second = create_response(title="second")
+    unknown = str(uuid4())
+
+    response = client.post(
+        "/api/v1/responses:batchGet",
+        json={"ids": [second["id"], unknown, first["id"], second["id"]]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["title"] for item in body["items"]] == ["second", "first"]
+    assert body["items"][0] == second
+    assert body["missing"] == [unknown]
+
+
+def test_batch_get_with_fields(client, create_response):
+    created = create_response(tags=["web"])
+
+    response = client.post(
+        "/api/v1/responses:batchGet",
+        json={"ids": [created["id"]], "fields": ["tags"]},
+    )
+
+    assert response.json() == {
+        "items": [{"id": created["id"], "tags": ["web"]}],
+        "missing": [],
+    }
+
+
+def test_batch_get_rejects_empty_ids(client):
+    response = client.post("/api/v1/responses:batchGet", json={"ids": []})
+
+    assert response.status_code == 422
@@ -0,0 +1,57 @@
+"""
+カテゴリ API のテスト
+"""
+
+from __future__ import annotations
+
+
+def _create_category(client, name: str) -> str:
+    response = client.post("/api/v1/categories", json={"name": name})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_response(client, category_id: str | None, tags: list[str]) -> dict:
+    response = client.post(
+        "/api/v1/responses",
+        json={
+            "title": "title",
+            "prompt": "prompt",
+            "content_md": "本文です。",
+            "model": "gpt-4o",
+            "provider": "openai",
+            "category_id": category_id,
+            "tags": tags,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_list_categories_includes_response_stats(client):
+    python = _create_category(client, "python")
+    empty = _create_category(client, "empty")
+    _create_response(client, python, ["web", "api"])
+    _create_response(client, python, ["web"])
+    latest = _create_response(client, python, ["web", "api", "cli"])
+    _create_response(client, None, ["web"])
+
+    response = client.get("/api/v1/categories", params={"top_tags": 2})
+
+    assert response.status_code == 200
+    items = {item["id"]: item for item in response.json()["items"]}
+    assert items[python]["response_count"] == 3
+    assert items[python]["top_tags"] == ["web", "api"]
+    assert items[python]["last_activity_at"] == latest["updated_at"]
+    assert items[empty]["response_count"] == 0
+    assert items[empty]["top_tags"] == []
+    assert items[empty]["last_activity_at"] is None
+
+
+def test_list_categories_without_top_tags(client):
+    category_id = _create_category(client, "python")
+    _create_response(client, category_id, ["web"])
+
+    response = client.get("/api/v1/categories", params={"top_tags": 0})
+
+    assert response.json()["items"][0]["top_tags"] == []
@@ -0,0 +1,60 @@
+"""
+LLM応答に埋め込むカテゴリ参照のテスト
+"""
+
+from __future__ import annotations
+
+
+def _create_response(client, category_id: str) -> str:
+    response = client.post(
+        "/api/v1/responses",
+        json={
+            "title": "title",
+            "prompt": "prompt",
+            "content_md": "本文です。",
+            "model": "gpt-4o",
+            "provider": "openai",
+            "category_id": category_id,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_response_embeds_category_ref(client):
+    category_id = client.post("/api/v1/categories", json={"name": "python"}).json()[
+        "id"
+    ]
+    response_id = _create_response(client, category_id)
+
+    detail = client.get(f"/api/v1/responses/{response_id}").json()
+    items = client.get("/api/v1/responses").json()["items"]
+
+    assert detail["category"] == {"id": category_id, "name": "python"}
+    assert items[0]["category"] == {"id": category_id, "name": "python"}
+
+
+def test_category_rename_is_reflected_in_responses(client):
+    category_id = client.post("/api/v1/categories", json={"name": "python"}).json()[
+        "id"
+    ]
+    response_id = _create_response(client, category_id)
+    client.get(f"/api/v1/responses/{response_id}")  # キャッシュを読み込ませる
+
+    client.put(f"/api/v1/categories/{category_id}", json={"name": "rust"})
+    detail = client.get(f"/api/v1/responses/{response_id}").json()
+
+    assert detail["category"]["name"] == "rust"
+
+
+def test_deleted_category_is_detached_from_responses(client):
+    category_id = client.post("/api/v1/categories", json={"name": "python"}).json()[
+        "id"
+    ]
+    response_id = _create_response(client, category_id)
+
+    client.delete(f"/api/v1/categories/{category_id}")
+    detail = client.get(f"/api/v1/responses/{response_id}").json()
+
+    assert detail["category_id"] is None
+    assert detail["category"] is None
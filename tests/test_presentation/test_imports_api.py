@@ -0,0 +1,107 @@
+"""
+会話エクスポートの取り込み API のテスト
+"""
+
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.storage.file_content_storage import export_storage
+from app.presentation.api.admission import WRITE, admission_limiters
+
+EXPORT = json.dumps(
+    [
+        {
+            "name": "会話",
+            "chat_messages": [
+                {"sender": "human", "text": "質問"},
+                {"sender": "assistant", "text": "回答"},
+            ],
+        }
+    ],
+    ensure_ascii=False,
+).encode()
+
+
+def _stored_files() -> set[str]:
+    return {str(path) for path in export_storage.root.rglob("*.json")}
+
+
+def _import(client, content: bytes = EXPORT, **fields):
+    return client.post(
+        "/api/v1/imports",
+        data=fields,
+        files={"file": ("conversations.json", content, "application/json")},
+    )
+
+
+@pytest.fixture
+def write_unavailable(monkeypatch):
+    """書き込みの実行枠を取得できない（待たずに 503 を返す）状態にします。"""
+    limiter = admission_limiters[WRITE]
+    monkeypatch.setattr(limiter, "max_concurrency", 0)
+    monkeypatch.setattr(limiter, "max_queue", 0)
+
+
+def test_import_registers_queued_job(client):
+    response = _import(client, tags=["imported"])
+
+    assert response.status_code == 202, response.text
+    created = response.json()
+    assert created["status"] == "queued"
+    assert created["format"] == "claude"
+    assert created["source_bytes"] == len(EXPORT)
+    assert created["tags"] == ["imported"]
+    fetched = client.get(f"/api/v1/imports/{created['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["id"] == created["id"]
+    listed = client.get("/api/v1/imports").json()
+    assert [item["id"] for item in listed["items"]] == [created["id"]]
+
+
+def test_import_uses_specified_format(client):
+    response = _import(client, format="claude")
+
+    assert response.status_code == 202, response.text
+    assert response.json()["format"] == "claude"
+
+
+def test_import_rejects_unknown_format(client):
+    before = _stored_files()
+
+    response = _import(client, content=b'[{"unknown": 1}]')
+
+    assert response.status_code == 422
+    assert _stored_files() == before
+
+
+def test_import_requires_existing_category(client):
+    before = _stored_files()
+
+    response = _import(client, category_id=str(uuid4()))
+
+    assert response.status_code == 409
+    assert _stored_files() == before
+
+
+def test_import_not_found(client):
+    assert client.get(f"/api/v1/imports/{uuid4()}").status_code == 404
+
+
+def test_import_validates_form_before_taking_write_slot(client, write_unavailable):
+    response = _import(client, format="unknown")
+
+    assert response.status_code == 422
+
+
+def test_import_without_write_slot_removes_stored_file(client, write_unavailable):
+    before = _stored_files()
+
+    response = _import(client)
+
+    assert response.status_code == 503
+    assert _stored_files() == before
+    assert client.get("/api/v1/imports").json()["items"] == []
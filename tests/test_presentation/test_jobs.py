@@ -0,0 +1,98 @@
+"""
+LLM応答の書き込みに続くジョブの登録のテスト
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from app.application.use_cases.update_response import UpdateResponseUseCase
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.infrastructure.db.models import JobORM
+from app.infrastructure.repositories.llm_response_repository_impl import (
+    LLMResponseRepositoryImpl,
+)
+from app.presentation.jobs import (
+    RENDER_HTML_JOB,
+    SUMMARIZE_BATCH_JOB,
+    SUMMARIZE_JOB,
+)
+
+
+def _response(**overrides) -> LLMResponse:
+    values = {
+        "title": "タイトル",
+        "prompt": "プロンプト",
+        "content_md": "本文です。",
+        "model": "gpt-4o",
+        "provider": LLMProvider.OPENAI,
+    }
+    values.update(overrides)
+    return LLMResponse(**values)
+
+
+def _queued(db) -> list[tuple[str, dict]]:
+    rows = db.execute(select(JobORM.kind, JobORM.payload).order_by(JobORM.id)).all()
+    return [(row.kind, row.payload) for row in rows]
+
+
+def _clear_jobs(db) -> None:
+    db.execute(JobORM.__table__.delete())
+    db.commit()
+
+
+def test_create_enqueues_render_and_summarize(db):
+    response = LLMResponseRepositoryImpl(db).create(_response())
+
+    payload = {"response_id": str(response.id)}
+    assert _queued(db) == [(RENDER_HTML_JOB, payload), (SUMMARIZE_JOB, payload)]
+
+
+def test_create_with_summary_only_enqueues_render(db):
+    LLMResponseRepositoryImpl(db).create(_response(summary="要約"))
+
+    assert [kind for kind, _ in _queued(db)] == [RENDER_HTML_JOB]
+
+
+def test_metadata_only_update_enqueues_nothing(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = repository.create(_response())
+    _clear_jobs(db)
+
+    UpdateResponseUseCase(repository).execute(
+        response.id, title="新しいタイトル", tags=["web"], content_md="本文です。"
+    )
+
+    assert _queued(db) == []
+
+
+def test_content_update_enqueues_render(db):
+    repository = LLMResponseRepositoryImpl(db)
+    response = repository.create(_response(summary="要約"))
+    _clear_jobs(db)
+
+    UpdateResponseUseCase(repository).execute(response.id, content_md="新しい本文")
+
+    assert _queued(db) == [(RENDER_HTML_JOB, {"response_id": str(response.id)})]
+
+
+def test_create_many_enqueues_one_summarize_job_per_batch(db):
+    responses = [_response(title=f"t{n}") for n in range(5)]
+    responses[1].summary = "要約"
+
+    LLMResponseRepositoryImpl(db).create_many(responses)
+
+    expected_ids = [str(response.id) for n, response in enumerate(responses) if n != 1]
+    assert _queued(db) == [(SUMMARIZE_BATCH_JOB, {"response_ids": expected_ids})]
+
+
+def test_list_jobs_filters_by_status(client, create_response):
+    create_response()
+
+    queued = client.get("/api/v1/jobs", params={"status": "queued"}).json()
+    failed = client.get("/api/v1/jobs", params={"status": "failed"}).json()
+
+    assert queued["items"]
+    assert {job["status"] for job in queued["items"]} == {"queued"}
+    assert failed["items"] == []
+    assert client.get("/api/v1/jobs", params={"status": "unknown"}).status_code == 422
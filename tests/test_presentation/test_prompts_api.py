@@ -0,0 +1,65 @@
+"""
+プロンプト API のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+
+def test_responses_with_same_prompt_share_prompt(client, create_response):
+    first = create_response(prompt="比較するプロンプト", model="gpt-4o")
+    second = create_response(prompt="比較するプロンプト", model="claude")
+    create_response(prompt="単独のプロンプト")
+
+    listed = client.get("/api/v1/prompts").json()
+    comparable = client.get("/api/v1/prompts", params={"min_responses": 2}).json()
+
+    assert [(item["text"], item["response_count"]) for item in listed["items"]] == [
+        ("比較するプロンプト", 2),
+        ("単独のプロンプト", 1),
+    ]
+    [prompt] = comparable["items"]
+    assert prompt["id"] == first["prompt_id"] == second["prompt_id"]
+
+    fetched = client.get(f"/api/v1/prompts/{prompt['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["text"] == "比較するプロンプト"
+
+
+def test_list_prompt_responses(client, create_response):
+    first = create_response(prompt="比較するプロンプト", model="gpt-4o")
+    second = create_response(prompt="比較するプロンプト", model="claude")
+
+    response = client.get(
+        f"/api/v1/prompts/{first['prompt_id']}/responses",
+        params={"fields": "id,model"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [
+        {"id": first["id"], "model": "gpt-4o"},
+        {"id": second["id"], "model": "claude"},
+    ]
+
+
+def test_updating_prompt_moves_response(client, create_response):
+    created = create_response(prompt="古いプロンプト")
+
+    updated = client.put(
+        f"/api/v1/responses/{created['id']}", json={"prompt": "新しいプロンプト"}
+    ).json()
+
+    assert updated["prompt_id"] != created["prompt_id"]
+    # 参照されなくなったプロンプトは削除される
+    old = client.get(f"/api/v1/prompts/{created['prompt_id']}")
+    assert old.status_code == 404
+    listed = client.get("/api/v1/prompts").json()
+    assert [item["text"] for item in listed["items"]] == ["新しいプロンプト"]
+
+
+def test_unknown_prompt_is_not_found(client):
+    prompt_id = uuid4()
+
+    assert client.get(f"/api/v1/prompts/{prompt_id}").status_code == 404
+    assert client.get(f"/api/v1/prompts/{prompt_id}/responses").status_code == 404
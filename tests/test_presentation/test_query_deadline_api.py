@@ -0,0 +1,25 @@
+"""
+クエリの制限時間（API）のテスト
+"""
+
+from __future__ import annotations
+
+from app.config.settings import settings
+
+
+def test_exceeded_deadline_returns_504(client, create_response, monkeypatch):
+    created = create_response()
+    monkeypatch.setattr(settings, "QUERY_TIMEOUTS", {"get_response": 1e-9})
+
+    response = client.get(f"/api/v1/responses/{created['id']}")
+
+    assert response.status_code == 504
+
+
+def test_deadline_applies_per_endpoint(client, create_response, monkeypatch):
+    created = create_response()
+    monkeypatch.setattr(settings, "QUERY_TIMEOUTS", {"list_responses": 1e-9})
+
+    response = client.get(f"/api/v1/responses/{created['id']}")
+
+    assert response.status_code == 200
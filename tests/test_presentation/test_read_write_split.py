@@ -0,0 +1,98 @@
+"""
+読み取り・書き込みエンジンの分離のテスト
+"""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure.db.base import ReadSessionLocal, read_engine
+from app.presentation.api.async_deps import (
+    get_async_database,
+    get_async_read_database,
+)
+from app.presentation.api.deps import get_database, get_read_database
+from app.presentation.api.v1 import (
+    async_categories,
+    async_responses,
+    categories,
+    imports,
+    jobs,
+    prompts,
+    responses,
+    revisions,
+    sync,
+    tags,
+)
+
+# 読み取り専用のセッションで処理する GET 以外のエンドポイント
+_READ_POSTS = {"/responses:batchGet"}
+
+
+def _dependencies(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependencies(dependency)
+
+
+_SYNC_MODULES = (categories, imports, jobs, prompts, responses, revisions, sync, tags)
+_ASYNC_MODULES = (async_categories, async_responses)
+
+
+def _routes(modules=_SYNC_MODULES):
+    for module in modules:
+        for route in module.router.routes:
+            if isinstance(route, APIRoute):
+                yield route, set(_dependencies(route.dependant))
+
+
+@pytest.mark.parametrize(
+    ("modules", "write", "read"),
+    [
+        (_SYNC_MODULES, get_database, get_read_database),
+        (_ASYNC_MODULES, get_async_database, get_async_read_database),
+    ],
+    ids=["sync", "async"],
+)
+def test_read_endpoints_do_not_open_write_sessions(modules, write, read):
+    reads = [
+        (route, calls)
+        for route, calls in _routes(modules)
+        if "GET" in route.methods or route.path in _READ_POSTS
+    ]
+
+    assert len(reads) > len(_READ_POSTS)
+    for route, calls in reads:
+        assert write not in calls, route.path
+        assert read in calls, route.path
+
+
+def test_read_post_uses_read_session():
+    calls = {
+        route.path: calls for route, calls in _routes() if route.path in _READ_POSTS
+    }
+
+    assert calls.keys() == _READ_POSTS
+    assert all(get_read_database in route_calls for route_calls in calls.values())
+
+
+def test_read_session_cannot_write(database):
+    assert read_engine.url.query.get("mode") == "ro"
+
+    with ReadSessionLocal() as db, pytest.raises(OperationalError, match="readonly"):
+        db.execute(text("DELETE FROM categories"))
+
+
+def test_reads_see_previous_writes(client, create_response):
+    created = create_response(title="書き込み直後")
+
+    fetched = client.get(f"/api/v1/responses/{created['id']}")
+    batch = client.post("/api/v1/responses:batchGet", json={"ids": [created["id"]]})
+
+    assert fetched.status_code == 200
+    assert fetched.json()["title"] == "書き込み直後"
+    assert batch.status_code == 200
+    assert [item["id"] for item in batch.json()["items"]] == [created["id"]]
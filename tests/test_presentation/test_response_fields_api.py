@@ -0,0 +1,63 @@
+"""
+LLM応答のフィールド指定（?fields=）のテスト
+"""
+
+from __future__ import annotations
+
+
+def test_get_response_returns_only_requested_fields(client, create_response):
+    created = create_response(tags=["web"])
+
+    response = client.get(
+        f"/api/v1/responses/{created['id']}", params={"fields": "title,tags"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": created["id"],
+        "title": "タイトル",
+        "tags": ["web"],
+    }
+
+
+def test_list_responses_with_fields(client, create_response):
+    created = create_response()
+
+    response = client.get(
+        "/api/v1/responses", params={"fields": "content_md, category,stats"}
+    )
+
+    (item,) = response.json()["items"]
+    assert set(item) == {"id", "content_md", "category", "stats"}
+    assert item["id"] == created["id"]
+    assert item["content_md"] == "本文です。"
+    assert item["category"] is None
+    assert item["stats"]["char_count"] == len("本文です。")
+
+
+def test_search_responses_with_fields(client, create_response):
+    create_response(title="python の話")
+    create_response(title="rust の話")
+
+    response = client.get(
+        "/api/v1/responses/search", params={"query": "python", "fields": "title"}
+    )
+
+    assert [item["title"] for item in response.json()["items"]] == ["python の話"]
+
+
+def test_unknown_field_is_rejected(client, create_response):
+    created = create_response()
+
+    response = client.get(
+        f"/api/v1/responses/{created['id']}", params={"fields": "title,password"}
+    )
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_empty_fields_are_rejected(client):
+    response = client.get("/api/v1/responses", params={"fields": " , "})
+
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+"""
+LLM応答の本文の版（リビジョン）API のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from app.config.settings import settings
+
+
+def test_updates_record_revisions(client, create_response, monkeypatch):
+    monkeypatch.setattr(settings, "REVISION_SNAPSHOT_INTERVAL", 2)
+    contents = ["版1の本文です。\n", "版1の本文です。\n版2の追記\n", "版3の本文\n"]
+    created = create_response(content_md=contents[0])
+    for content in contents[1:]:
+        response = client.put(
+            f"/api/v1/responses/{created['id']}", json={"content_md": content}
+        )
+        assert response.status_code == 200, response.text
+    # 本文を変えない更新は版を追加しない
+    client.put(f"/api/v1/responses/{created['id']}", json={"title": "新しいタイトル"})
+
+    listed = client.get(f"/api/v1/responses/{created['id']}/revisions").json()
+
+    assert listed["total"] == 3
+    assert [item["number"] for item in listed["items"]] == [1, 2, 3]
+    assert [item["is_snapshot"] for item in listed["items"]] == [True, False, True]
+    for number, content in enumerate(contents, start=1):
+        revision = client.get(f"/api/v1/responses/{created['id']}/revisions/{number}")
+        assert revision.status_code == 200
+        assert revision.json()["content"] == content
+
+
+def test_response_without_updates_has_no_revisions(client, create_response):
+    created = create_response()
+
+    listed = client.get(f"/api/v1/responses/{created['id']}/revisions")
+    missing = client.get(f"/api/v1/responses/{created['id']}/revisions/1")
+
+    assert listed.status_code == 200
+    assert listed.json()["items"] == []
+    assert missing.status_code == 404
+
+
+def test_revisions_of_unknown_response(client):
+    response = client.get(f"/api/v1/responses/{uuid4()}/revisions")
+
+    assert response.status_code == 404
+
+
+def test_revision_number_starts_at_one(client, create_response):
+    created = create_response()
+
+    response = client.get(f"/api/v1/responses/{created['id']}/revisions/0")
+
+    assert response.status_code == 422
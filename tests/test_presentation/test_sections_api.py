@@ -0,0 +1,65 @@
+"""
+LLM応答のセクション API のテスト
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+CONTENT = "# 概要\n\n最初のセクションです。\n\n## 手順\n\npip install を実行します。\n"
+
+
+def test_list_and_get_sections(client, create_response):
+    created = create_response(content_md=CONTENT)
+
+    listed = client.get(f"/api/v1/responses/{created['id']}/sections")
+    section = client.get(f"/api/v1/responses/{created['id']}/sections/1")
+
+    assert listed.status_code == 200
+    body = listed.json()
+    assert body["total"] == 2
+    assert [(item["heading"], item["heading_level"]) for item in body["items"]] == [
+        ("概要", 1),
+        ("手順", 2),
+    ]
+    assert "content" not in body["items"][0]
+    assert section.status_code == 200
+    assert section.json()["content"] == "## 手順\n\npip install を実行します。\n"
+    assert (
+        CONTENT[section.json()["start_offset"] : section.json()["end_offset"]]
+        == section.json()["content"]
+    )
+
+
+def test_sections_follow_content_updates(client, create_response):
+    created = create_response(content_md=CONTENT)
+
+    client.put(
+        f"/api/v1/responses/{created['id']}",
+        json={"content_md": "# 置き換え後\n\n本文\n"},
+    )
+
+    listed = client.get(f"/api/v1/responses/{created['id']}/sections").json()
+    assert [item["heading"] for item in listed["items"]] == ["置き換え後"]
+
+
+def test_missing_sections_return_404(client, create_response):
+    created = create_response(content_md=CONTENT)
+
+    assert client.get(f"/api/v1/responses/{uuid4()}/sections").status_code == 404
+    missing = client.get(f"/api/v1/responses/{created['id']}/sections/5")
+    assert missing.status_code == 404
+
+
+def test_search_sections_returns_snippets(client, create_response):
+    created = create_response(content_md=CONTENT)
+    create_response(content_md="# 無関係\n\n別の本文\n")
+
+    response = client.get("/api/v1/responses/search/sections", params={"query": "pip"})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["response_id"], item["position"]) for item in items] == [
+        (created["id"], 1)
+    ]
+    assert "pip install" in items[0]["snippet"]
@@ -0,0 +1,67 @@
+"""
+JSONシリアライズのテスト
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.models.category import Category
+from app.domain.models.llm_response import LLMProvider, LLMResponse
+from app.presentation.api import serialization
+from app.presentation.api.serialization import (
+    LIST_ITEM_FIELDS,
+    dumps,
+    response_dict,
+)
+from app.presentation.schemas.llm_response import (
+    LLMResponseListItem,
+    LLMResponseRead,
+)
+
+
+def _response() -> LLMResponse:
+    category = Category(name="python", created_at=datetime(2025, 1, 1))
+    return LLMResponse(
+        title="タイトル",
+        prompt="プロンプト",
+        content_md="# 見出し\n\n本文です。",
+        model="gpt-4o",
+        provider=LLMProvider.OPENAI,
+        category_id=category.id,
+        tags=["web", "api"],
+        prompt_id=uuid4(),
+        created_at=datetime(2025, 1, 2, 3, 4, 5, 678901),
+        updated_at=datetime(2025, 1, 2, 3, 4, 5),
+        category=category,
+    )
+
+
+@pytest.fixture(params=["orjson", "pydantic"])
+def json_backend(request, monkeypatch):
+    """orjson がある場合とない場合の両方で実行します。"""
+    if request.param == "pydantic":
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_read_json_matches_pydantic_schema(json_backend):
+    response = _response()
+
+    encoded = json.loads(dumps(response_dict(response)))
+
+    expected = LLMResponseRead.model_validate(response, from_attributes=True)
+    assert encoded == expected.model_dump(mode="json")
+
+
+def test_list_item_json_matches_pydantic_schema(json_backend):
+    response = _response()
+
+    encoded = json.loads(dumps(response_dict(response, LIST_ITEM_FIELDS)))
+
+    expected = LLMResponseListItem.model_validate(response, from_attributes=True)
+    assert encoded == expected.model_dump(mode="json")
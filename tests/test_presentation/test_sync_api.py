@@ -0,0 +1,56 @@
+"""
+差分同期 API のテスト
+"""
+
+from __future__ import annotations
+
+
+def test_initial_sync_returns_everything(client, create_response):
+    category = client.post("/api/v1/categories", json={"name": "python"}).json()
+    first = create_response(title="first")
+    second = create_response(title="second")
+
+    body = client.get("/api/v1/sync").json()
+
+    assert [item["id"] for item in body["categories"]] == [category["id"]]
+    assert [item["id"] for item in body["responses"]] == [first["id"], second["id"]]
+    assert body["tombstones"] == []
+    assert body["has_more"] is False
+
+
+def test_sync_since_token_returns_only_later_changes(client, create_response):
+    first = create_response(title="first")
+    second = create_response(title="second")
+    token = client.get("/api/v1/sync").json()["next_token"]
+
+    client.put(f"/api/v1/responses/{first['id']}", json={"title": "renamed"})
+    client.delete(f"/api/v1/responses/{second['id']}")
+    body = client.get("/api/v1/sync", params={"since": token}).json()
+
+    assert [item["title"] for item in body["responses"]] == ["renamed"]
+    assert [item["id"] for item in body["tombstones"]] == [second["id"]]
+    assert body["tombstones"][0]["entity_type"] == "response"
+    assert int(body["next_token"]) > int(token)
+
+    again = client.get("/api/v1/sync", params={"since": body["next_token"]}).json()
+    assert again["responses"] == [] and again["tombstones"] == []
+    assert again["next_token"] == body["next_token"]
+
+
+def test_sync_pages_with_limit(client, create_response):
+    created = [create_response(title=f"t{n}")["id"] for n in range(5)]
+
+    seen = []
+    token = None
+    while True:
+        body = client.get("/api/v1/sync", params={"since": token, "limit": 2}).json()
+        seen.extend(item["id"] for item in body["responses"])
+        token = body["next_token"]
+        if not body["has_more"]:
+            break
+
+    assert seen == created
+
+
+def test_invalid_sync_token_is_rejected(client):
+    assert client.get("/api/v1/sync", params={"since": "abc"}).status_code == 400
@@ -0,0 +1,54 @@
+"""
+タグ API のテスト
+"""
+
+from __future__ import annotations
+
+
+def _counts(client, **params) -> list[tuple[str, int]]:
+    response = client.get("/api/v1/tags", params=params)
+    assert response.status_code == 200, response.text
+    return [(item["tag"], item["response_count"]) for item in response.json()["items"]]
+
+
+def test_tag_counts_follow_response_writes(client, create_response):
+    first = create_response(tags=["python", "sql"])
+    second = create_response(tags=["python"])
+
+    assert _counts(client) == [("python", 2), ("sql", 1)]
+
+    client.put(f"/api/v1/responses/{first['id']}", json={"tags": ["python", "fastapi"]})
+    assert _counts(client) == [("python", 2), ("fastapi", 1)]
+
+    client.delete(f"/api/v1/responses/{second['id']}")
+    client.delete(f"/api/v1/responses/{first['id']}")
+    assert _counts(client) == []
+
+
+def test_list_tags_by_recent_use(client, create_response):
+    create_response(tags=["python", "sql"])
+    create_response(tags=["python"])
+    create_response(tags=["fastapi"])
+
+    recent = _counts(client, sort="recent", limit=1)
+
+    assert recent == [("fastapi", 1)]
+    assert client.get("/api/v1/tags", params={"sort": "unknown"}).status_code == 422
+
+
+def test_autocomplete_tags(client, create_response):
+    create_response(tags=["python", "pytest"])
+    create_response(tags=["python", "Pydantic"])
+
+    response = client.get("/api/v1/tags/autocomplete", params={"prefix": "py"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["prefix"] == "py"
+    assert [item["tag"] for item in body["items"]] == ["python", "pytest"]
+
+
+def test_autocomplete_requires_prefix(client):
+    response = client.get("/api/v1/tags/autocomplete", params={"prefix": ""})
+
+    assert response.status_code == 422
@@ -0,0 +1,106 @@
+"""
+LLM応答のアップロード（POST /responses:upload）のテスト
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from app.config.settings import settings
+from app.infrastructure.storage.file_content_storage import content_storage
+from app.presentation.api.admission import WRITE, admission_limiters
+
+CONTENT = "# アップロード\n\n```python\nprint(1)\n```\n\n本文です。\n"
+
+FORM = {
+    "title": "アップロード",
+    "prompt": "プロンプト",
+    "model": "gpt-4o",
+    "provider": "openai",
+}
+
+
+def _stored_files() -> set[str]:
+    return {str(path) for path in content_storage.root.rglob("*.md")}
+
+
+def _upload(client, content: str = CONTENT, **fields):
+    return client.post(
+        "/api/v1/responses:upload",
+        data={**FORM, **fields},
+        files={"content": ("response.md", content.encode(), "text/markdown")},
+    )
+
+
+@pytest.fixture
+def write_unavailable(monkeypatch):
+    """書き込みの実行枠を取得できない（待たずに 503 を返す）状態にします。"""
+    limiter = admission_limiters[WRITE]
+    monkeypatch.setattr(limiter, "max_concurrency", 0)
+    monkeypatch.setattr(limiter, "max_queue", 0)
+
+
+def test_upload_creates_response_from_stored_content(client):
+    response = _upload(client, tags=["python"])
+
+    assert response.status_code == 201, response.text
+    created = response.json()
+    assert created["content_sha256"] == hashlib.sha256(CONTENT.encode()).hexdigest()
+    fetched = client.get(f"/api/v1/responses/{created['id']}").json()
+    assert fetched["content_md"] == CONTENT
+    assert fetched["tags"] == ["python"]
+    assert fetched["stats"]["code_block_count"] == 1
+    sections = client.get(f"/api/v1/responses/{created['id']}/sections").json()
+    assert [item["heading"] for item in sections["items"]] == ["アップロード"]
+
+
+def test_upload_verifies_content_sha256(client):
+    before = _stored_files()
+
+    response = _upload(client, content_sha256="0" * 64)
+
+    assert response.status_code == 422
+    assert _stored_files() == before
+
+
+def test_upload_rejects_content_over_limit(client, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_MAX_BYTES", 16)
+    before = _stored_files()
+
+    response = _upload(client)
+
+    assert response.status_code == 413
+    assert _stored_files() == before
+
+
+def test_upload_requires_content_part(client):
+    response = client.post("/api/v1/responses:upload", data=FORM, files={"x": b"1"})
+
+    assert response.status_code == 422
+
+
+def test_upload_requires_multipart(client):
+    response = client.post("/api/v1/responses:upload", json=FORM)
+
+    assert response.status_code == 415
+
+
+def test_upload_validates_form_before_taking_write_slot(client, write_unavailable):
+    response = _upload(client, provider="unknown")
+
+    # 実行枠は本文とフィールドの受信・検証を終えてから取得する
+    assert response.status_code == 422
+
+
+def test_upload_removes_content_when_write_slot_is_unavailable(
+    client, write_unavailable
+):
+    before = _stored_files()
+
+    response = _upload(client)
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert _stored_files() == before